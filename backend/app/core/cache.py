@@ -0,0 +1,322 @@
+"""
+Tiered result cache for warehouse queries.
+
+Tier 1 is a bounded in-process LRU; tier 2 is Redis, shared by every worker.
+Results are keyed by a hash of the normalized SQL text and its parameters, so
+two repositories issuing the same statement share one entry.
+
+The TTL for an entry is chosen from the endpoint that triggered the query
+(see ``cache_scope``), falling back to ``QUERY_CACHE_TTL_SECONDS``. Keys also
+carry the data generation of each table read, so entries are invalidated as
+soon as new data lands (see ``app.core.freshness``).
+"""
+import hashlib
+import json
+import logging
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Generator, Optional
+
+from app.core.config import settings
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Path of the endpoint currently being served; used to pick a TTL.
+_cache_scope: ContextVar[Optional[str]] = ContextVar("cache_scope", default=None)
+
+# Default for configure_query_cache(redis_client=...), where None means "no Redis".
+_MISSING = object()
+
+# Whitespace runs outside single-quoted literals.
+_WHITESPACE_RE = re.compile(r"('(?:[^']|'')*')|\s+")
+
+
+def normalize_sql(query: str) -> str:
+    """Collapse insignificant whitespace so formatting changes do not split cache entries."""
+    return _WHITESPACE_RE.sub(lambda m: m.group(1) or " ", query).strip()
+
+
+def make_cache_key(
+    query: str,
+    params: Optional[dict[str, Any]] = None,
+    namespace: str = "rows",
+    generations: Optional[dict[str, int]] = None
+) -> str:
+    """
+    Build the cache key for a query.
+
+    Args:
+        query: SQL query string
+        params: Query parameters
+        namespace: Distinguishes result shapes of the same query (e.g. rows vs columns)
+        generations: Data generation of each table the query reads; a new
+            generation yields a new key (see app.core.freshness)
+
+    Returns:
+        Key of the form ``query:{namespace}:{sha256}``
+    """
+    payload = json.dumps(
+        [normalize_sql(query), params or {}, generations or {}],
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"query:{namespace}:{digest}"
+
+
+@contextmanager
+def cache_scope(endpoint: Optional[str]) -> Generator[None, None, None]:
+    """Attribute queries issued inside the block to ``endpoint`` for TTL selection."""
+    token = _cache_scope.set(endpoint)
+    try:
+        yield
+    finally:
+        _cache_scope.reset(token)
+
+
+def get_cache_scope() -> Optional[str]:
+    """Return the endpoint the current query is being issued for, if known."""
+    return _cache_scope.get()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit/miss counters for the query cache."""
+    local_hits: int
+    shared_hits: int
+    misses: int
+    stores: int
+    evictions: int
+    shared_errors: int
+    local_entries: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from either tier."""
+        lookups = self.local_hits + self.shared_hits + self.misses
+        return (self.local_hits + self.shared_hits) / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class QueryCache:
+    """
+    Two-tier query result cache.
+
+    Lookups check the local LRU first, then Redis; a Redis hit is copied into
+    the local tier. Redis failures are logged and treated as misses so the
+    cache can never take the API down.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: int = 300,
+        endpoint_ttls: Optional[dict[str, int]] = None,
+        redis_client: Any = None,
+    ):
+        self.local = LRUCache(max_entries)
+        self.shared = redis_client
+        self.default_ttl = default_ttl
+        # Longest prefix wins, so sort once up front.
+        self.endpoint_ttls = sorted(
+            (endpoint_ttls or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._lock = threading.Lock()
+        self._local_hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._shared_errors = 0
+
+    def ttl_for(self, endpoint: Optional[str]) -> int:
+        """Return the TTL configured for ``endpoint`` (longest matching prefix)."""
+        if endpoint:
+            for prefix, ttl in self.endpoint_ttls:
+                if endpoint.startswith(prefix):
+                    return ttl
+        return self.default_ttl
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for ``key``, or None on a miss."""
+        value = self.local.get(key)
+        if value is not None:
+            self._count("_local_hits")
+            return value
+
+        if self.shared is not None:
+            try:
+                payload = self.shared.get(key)
+            except Exception:
+                logger.warning("Redis read failed for %s", key, exc_info=True)
+                self._count("_shared_errors")
+                payload = None
+            if payload is not None:
+                value = pickle.loads(payload)
+                ttl = self._remaining_ttl(key)
+                self.local.set(key, value, ttl)
+                self._count("_shared_hits")
+                return value
+
+        self._count("_misses")
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store ``value`` in both tiers."""
+        ttl = ttl if ttl is not None else self.ttl_for(get_cache_scope())
+        if ttl <= 0:
+            return
+        self.local.set(key, value, ttl)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=ttl)
+            except Exception:
+                logger.warning("Redis write failed for %s", key, exc_info=True)
+                self._count("_shared_errors")
+        self._count("_stores")
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` from both tiers."""
+        self.local.delete(key)
+        if self.shared is not None:
+            try:
+                self.shared.delete(key)
+            except Exception:
+                logger.warning("Redis delete failed for %s", key, exc_info=True)
+                self._count("_shared_errors")
+
+    def clear(self) -> None:
+        """Drop every locally cached entry (the shared tier expires on its own)."""
+        self.local.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                local_hits=self._local_hits,
+                shared_hits=self._shared_hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self.local.evictions,
+                shared_errors=self._shared_errors,
+                local_entries=len(self.local),
+            )
+
+    def _remaining_ttl(self, key: str) -> int:
+        try:
+            ttl = self.shared.ttl(key)
+        except Exception:
+            ttl = -1
+        return ttl if ttl and ttl > 0 else self.default_ttl
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+_query_cache: Optional[QueryCache] = None
+_query_cache_lock = threading.RLock()
+
+
+def _default_redis_client() -> Any:
+    """Build a Redis client from settings, or None if the shared tier is disabled."""
+    if not settings.QUERY_CACHE_REDIS_ENABLED:
+        return None
+    if redis is None:
+        logger.warning("QUERY_CACHE_REDIS_ENABLED is set but the redis package is not installed")
+        return None
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=settings.QUERY_CACHE_REDIS_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.QUERY_CACHE_REDIS_TIMEOUT_SECONDS,
+    )
+
+
+def configure_query_cache(redis_client: Any = _MISSING, **options: Any) -> QueryCache:
+    """
+    (Re)create the shared query cache.
+
+    Args:
+        redis_client: Client for the shared tier. Anything with Redis
+            ``get``/``set(ex=)``/``ttl``/``delete`` works, e.g.
+            ``fakeredis.FakeRedis()`` in tests. Pass None to run local-only.
+            Defaults to a client built from settings.
+        **options: Overrides for QueryCache keyword arguments
+
+    Returns:
+        The newly created cache
+    """
+    global _query_cache
+
+    cache_options = {
+        "max_entries": settings.QUERY_CACHE_MAX_ENTRIES,
+        "default_ttl": settings.QUERY_CACHE_TTL_SECONDS,
+        "endpoint_ttls": settings.QUERY_CACHE_ENDPOINT_TTLS,
+        **options,
+    }
+    if redis_client is _MISSING:
+        redis_client = _default_redis_client()
+
+    with _query_cache_lock:
+        _query_cache = QueryCache(redis_client=redis_client, **cache_options)
+        return _query_cache
+
+
+def get_query_cache() -> QueryCache:
+    """Return the shared query cache, creating it on first use."""
+    if _query_cache is None:
+        with _query_cache_lock:
+            if _query_cache is None:
+                configure_query_cache()
+    return _query_cache
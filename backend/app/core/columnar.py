@@ -0,0 +1,144 @@
+"""
+Columnar query results.
+
+``execute_query`` materializes one dict per row, and services then call
+``dict.get`` plus ``int()``/``float()`` for every field of every row. For wide
+result sets that per-row work dominates CPU. A ``ColumnarResult`` keeps the
+result as whole columns instead: when pyarrow is installed it wraps the Arrow
+table returned by the connector's ``fetch_arrow_all`` and does null-filling
+and type coercion in Arrow compute kernels, one call per column.
+"""
+from typing import Any, Iterator, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+
+
+class ColumnarResult:
+    """
+    Query result stored column by column.
+
+    Column names are the upper-cased aliases from the SELECT, exactly as in
+    the row dicts returned by ``execute_query``.
+
+    Example:
+        result = execute_query_columns(query, params)
+        items = [
+            Item(name=name, clicks=clicks)
+            for name, clicks in zip(result.strs("NAME"), result.ints("CLICKS"))
+        ]
+    """
+
+    def __init__(self, columns: dict[str, Any], num_rows: int):
+        self._columns = columns
+        self.num_rows = num_rows
+
+    @classmethod
+    def from_arrow(cls, table: Any) -> "ColumnarResult":
+        """Wrap a ``pyarrow.Table`` (None means an empty result)."""
+        if table is None:
+            return cls({}, 0)
+        return cls({name: table.column(name) for name in table.column_names}, table.num_rows)
+
+    @classmethod
+    def from_rows(cls, names: list[str], rows: list[tuple]) -> "ColumnarResult":
+        """Build from tuple rows, for connectors without Arrow support."""
+        columns = [list(values) for values in zip(*rows)] if rows else [[] for _ in names]
+        return cls(dict(zip(names, columns)), len(rows))
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self._columns)
+
+    def raw(self, name: str) -> list[Any]:
+        """Column values as plain Python objects, without coercion."""
+        column = self._column(name)
+        if column is None:
+            return [None] * self.num_rows
+        return column.to_pylist() if _is_arrow(column) else list(column)
+
+    def ints(self, name: str, default: int = 0) -> list[int]:
+        """Column as ints; nulls become ``default`` and decimals are truncated."""
+        column = self._column(name)
+        if column is None:
+            return [default] * self.num_rows
+        if _is_arrow(column):
+            return pc.cast(pc.fill_null(column, default), pa.int64(), safe=False).to_pylist()
+        return [int(value or default) for value in column]
+
+    def floats(self, name: str, default: float = 0.0) -> list[float]:
+        """Column as floats; nulls become ``default``."""
+        column = self._column(name)
+        if column is None:
+            return [default] * self.num_rows
+        if _is_arrow(column):
+            return pc.fill_null(pc.cast(column, pa.float64(), safe=False), default).to_pylist()
+        return [float(value or default) for value in column]
+
+    def strs(self, name: str, default: str = "") -> list[str]:
+        """Column as strings; nulls and empty strings become ``default``."""
+        column = self._column(name)
+        if column is None:
+            return [default] * self.num_rows
+        if _is_arrow(column):
+            values = pc.cast(column, pa.string()).to_pylist()
+            return [value or default for value in values]
+        return [str(value or default) for value in column]
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """Convert back to row dicts (the ``execute_query`` shape)."""
+        names = self.column_names
+        columns = [self.raw(name) for name in names]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def _column(self, name: str) -> Optional[Any]:
+        return self._columns.get(name)
+
+
+def _is_arrow(column: Any) -> bool:
+    return pa is not None and isinstance(column, (pa.ChunkedArray, pa.Array))
+
+
+def fetch_columns(cursor: Any) -> ColumnarResult:
+    """
+    Fetch the executed cursor's full result as columns.
+
+    Uses the connector's Arrow fetch when both the cursor and pyarrow support
+    it, and falls back to transposing tuple rows otherwise.
+    """
+    fetch_arrow_all = getattr(cursor, "fetch_arrow_all", None)
+    if pa is not None and callable(fetch_arrow_all):
+        return ColumnarResult.from_arrow(fetch_arrow_all())
+
+    names = [column[0] for column in cursor.description or []]
+    return ColumnarResult.from_rows(names, cursor.fetchall() or [])
+
+
+def iter_column_batches(cursor: Any, batch_size: int) -> Iterator[ColumnarResult]:
+    """
+    Yield the executed cursor's result as a sequence of column batches.
+
+    Uses the connector's Arrow result batches when available (each is one
+    downloaded result chunk); otherwise falls back to ``fetchmany(batch_size)``.
+    Only one batch is held in memory at a time.
+    """
+    fetch_arrow_batches = getattr(cursor, "fetch_arrow_batches", None)
+    if pa is not None and callable(fetch_arrow_batches):
+        for table in fetch_arrow_batches():
+            if table.num_rows:
+                yield ColumnarResult.from_arrow(table)
+        return
+
+    names = [column[0] for column in cursor.description or []]
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield ColumnarResult.from_rows(names, rows)
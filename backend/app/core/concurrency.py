@@ -0,0 +1,119 @@
+"""
+Bounded executor for running blocking warehouse work off the event loop.
+
+The Snowflake connector is synchronous, so every repository call blocks the
+thread it runs on. Async route handlers hand that work to a dedicated,
+size-limited thread pool instead of calling it inline, which keeps the event
+loop free to serve other requests while a query is in flight.
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_query_executor() -> ThreadPoolExecutor:
+    """Return the shared query executor, creating it on first use."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.QUERY_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="query-worker",
+                )
+    return _executor
+
+
+def configure_query_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Replace the shared query executor with one of a different size.
+
+    The previous executor is shut down without waiting; work already
+    submitted to it still runs to completion.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="query-worker",
+        )
+        return _executor
+
+
+async def run_in_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking callable on the bounded query executor and await its result.
+
+    Context variables (request-scoped state) are copied into the worker thread.
+
+    Example:
+        return await run_in_executor(
+            overview_service.get_overview,
+            date_from=date_from,
+            date_to=date_to
+        )
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_query_executor(), call)
+
+
+def _call_name(call: Callable[..., Any]) -> str:
+    func = call.func if isinstance(call, functools.partial) else call
+    return getattr(func, "__qualname__", repr(func))
+
+
+async def fan_out(*calls: Callable[[], Any], timeout: Optional[float] = None) -> list[Any]:
+    """
+    Run independent blocking calls concurrently and return their results in order.
+
+    Each call runs on the bounded query executor (and therefore on its own
+    pooled connection), so the total latency is roughly that of the slowest
+    call rather than the sum of all of them.
+
+    Args:
+        *calls: Zero-argument callables, typically ``functools.partial`` of
+            repository methods
+        timeout: Per-call limit in seconds; defaults to QUERY_FAN_OUT_TIMEOUT_SECONDS
+
+    Returns:
+        List of results, one per call, in the order given
+
+    Raises:
+        HTTPException: 504 if any call exceeds the timeout. The query itself
+            is not cancelled; its connection returns to the pool when it ends.
+
+    Example:
+        sources, devices = await fan_out(
+            partial(self.repository.get_traffic_sources, date_from, date_to),
+            partial(self.repository.get_devices, date_from, date_to),
+        )
+    """
+    limit = settings.QUERY_FAN_OUT_TIMEOUT_SECONDS if timeout is None else timeout
+
+    async def run(call: Callable[[], Any]) -> Any:
+        try:
+            return await asyncio.wait_for(run_in_executor(call), limit)
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"{_call_name(call)} did not complete within {limit}s"
+            )
+
+    return list(await asyncio.gather(*(run(call) for call in calls)))
@@ -34,12 +34,80 @@ class Settings(BaseSettings):
     SNOWFLAKE_WAREHOUSE: str = ""
     SNOWFLAKE_ROLE: str = ""
 
+    # Snowflake connection pool
+    SNOWFLAKE_POOL_MIN_SIZE: int = 1
+    SNOWFLAKE_POOL_MAX_SIZE: int = 10
+    SNOWFLAKE_POOL_TIMEOUT_SECONDS: float = 30.0
+    SNOWFLAKE_POOL_MAX_IDLE_SECONDS: float = 600.0
+    SNOWFLAKE_POOL_MAX_LIFETIME_SECONDS: float = 3600.0
+    SNOWFLAKE_POOL_HEALTH_CHECK_SECONDS: float = 60.0
+    # How often idle connections are pruned and the pool re-warmed to min size
+    SNOWFLAKE_POOL_MAINTENANCE_SECONDS: float = 60.0
+
+    # Worker threads for blocking queries issued from async routes
+    # (keep in line with SNOWFLAKE_POOL_MAX_SIZE)
+    QUERY_EXECUTOR_MAX_WORKERS: int = 10
+    # Per-query limit for concurrent fan-out inside a service
+    QUERY_FAN_OUT_TIMEOUT_SECONDS: float = 60.0
+    # Rows per batch for streamed results (stream_query)
+    QUERY_STREAM_BATCH_SIZE: int = 5000
+
+    # Share one execution between concurrent identical queries
+    QUERY_SINGLE_FLIGHT_ENABLED: bool = True
+
     # App Database (PostgreSQL for app state)
     APP_DB_URL: Optional[str] = None
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
 
+    # Query result cache (in-process LRU + optional Redis tier)
+    QUERY_CACHE_ENABLED: bool = True
+    QUERY_CACHE_MAX_ENTRIES: int = 1024
+    # Entries are also invalidated by data freshness (below), so TTLs can be long
+    QUERY_CACHE_TTL_SECONDS: int = 3600
+    QUERY_CACHE_REDIS_ENABLED: bool = False
+    QUERY_CACHE_REDIS_TIMEOUT_SECONDS: float = 0.25
+    # Per-endpoint TTL overrides, matched by longest path prefix.
+    # Set as JSON in the environment, e.g. '{"/api/v1/thoughtlets": 600}'
+    QUERY_CACHE_ENDPOINT_TTLS: dict[str, int] = {
+        "/api/v1/thoughtlets/revenue-lifetime-value": 21600,
+    }
+
+    # Data-freshness watermarks (cache generations per analytics table)
+    FRESHNESS_TRACKING_ENABLED: bool = True
+    FRESHNESS_REFRESH_SECONDS: float = 60.0
+    FRESHNESS_INFORMATION_SCHEMA: str = "CLIENT_RARE_SEEDS_DB.INFORMATION_SCHEMA"
+
+    # Read pre-aggregated dbt rollups (marts/aggregates) instead of raw facts
+    # when they can answer a query. Queries fail while the rollups are missing,
+    # so enable only once `dbt run --select tag:aggregates` has built them
+    ROLLUP_ROUTING_ENABLED: bool = False
+
+    # Per-day additive measures composed into arbitrary date ranges
+    DAILY_CELL_CACHE_ENABLED: bool = True
+    DAILY_CELL_CACHE_MAX_DAYS: int = 1100
+
+    # Local analytics replica: Parquet snapshots of the marts (written by
+    # scripts/snapshot_replica.py after dbt runs) served by an embedded DuckDB,
+    # with Snowflake as fallback for stale tables and unsupported SQL
+    REPLICA_ENABLED: bool = False
+    REPLICA_PATH: str = str(ENV_FILE.parent / "replica")
+    REPLICA_TABLES: list[str] = ["FCT_*", "DIM_*", "AGG_*"]
+    REPLICA_REFRESH_SECONDS: float = 30.0
+    REPLICA_KEEP_SNAPSHOTS: int = 2
+
+    # Offline warehouse: serve every query from a local DuckDB file of marts
+    # (scripts/generate_marts.py) instead of Snowflake. Empty = Snowflake.
+    LOCAL_WAREHOUSE_PATH: str = ""
+
+    # Build responses from coerced warehouse rows without re-validating them,
+    # and encode them with pydantic-core (app.core.serialization)
+    FAST_JSON_ENABLED: bool = True
+
+    # Per-request latency breakdown in a Server-Timing header (and request logs)
+    SERVER_TIMING_ENABLED: bool = True
+
     # JWT
     JWT_SECRET: str = "dev-secret-change-in-production"
     JWT_ALGORITHM: str = "HS256"
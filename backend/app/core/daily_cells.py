@@ -0,0 +1,278 @@
+"""
+Additive daily-cell cache that composes arbitrary date ranges.
+
+The query cache keys on the exact SQL and parameters, so moving a date range
+by one day is a full miss. Most endpoints, though, only return sums of
+additive measures (spend, clicks, impressions, conversions, revenue) and
+ratios derived from those sums. ``DailyCells`` caches those measures per day
+and per dimension value ("cells"). A request for any range is answered by
+summing the cached cells, and only the days not yet cached are read from the
+warehouse, in one query per contiguous gap. Ratios are then recomputed from
+the summed measures with ``app.core.semantic.derive``.
+
+Cells are versioned by the table's data-freshness generation: when the
+table is reloaded, every cell of it is discarded.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Callable, Iterable, Optional
+
+from app.core.config import settings
+from app.core.database import execute_query
+from app.core.freshness import get_freshness_tracker
+from app.core.rollups import CAMPAIGN_PERFORMANCE_FACT, campaign_performance_source
+from app.core.semantic import CLICKS, CONVERSIONS, IMPRESSIONS, REVENUE, SPEND, Measure, MetricQuery
+
+logger = logging.getLogger(__name__)
+
+
+def _contiguous_runs(days: list[date]) -> list[tuple[date, date]]:
+    """Group sorted days into (first, last) runs of consecutive days."""
+    runs: list[tuple[date, date]] = []
+    for day in days:
+        if runs and day == runs[-1][1] + timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+class DailyCells:
+    """
+    Per-day, per-dimension additive measures of one fact table.
+
+    Args:
+        table: Fully qualified fact table (aliased ``f``)
+        dimensions: (expression, alias) pairs cells are keyed by
+        measures: Additive measures stored in each cell
+        max_days: Most days kept in memory; least recently used days are dropped
+        router: Optional rollup router (see ``app.core.rollups``) that may
+            substitute a pre-aggregated copy of ``table``
+
+    Example:
+        cells = DailyCells(
+            table="CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE",
+            dimensions=(("f.PLATFORM", "PLATFORM"),),
+            measures=(SPEND, REVENUE),
+        )
+        rows = cells.aggregate(date_from, date_to)  # [{"PLATFORM": ..., "SPEND": ..., "REVENUE": ...}]
+    """
+
+    def __init__(
+        self,
+        table: str,
+        dimensions: tuple[tuple[str, str], ...],
+        measures: tuple[Measure, ...],
+        max_days: Optional[int] = None,
+        router: Optional[Callable[..., str]] = None
+    ):
+        self.table = table
+        self.router = router
+        self.dimensions = dimensions
+        self.measures = measures
+        self.max_days = max_days if max_days is not None else settings.DAILY_CELL_CACHE_MAX_DAYS
+        self._days: OrderedDict[date, list[dict[str, Any]]] = OrderedDict()
+        self._generation: Optional[int] = None
+        self._lock = threading.Lock()
+        self.days_hit = 0
+        self.days_fetched = 0
+
+    @property
+    def source(self) -> str:
+        """The table cells are read from: a daily rollup when one qualifies."""
+        if self.router is None:
+            return self.table
+        columns = {measure.column for measure in self.measures} | set(self.dimension_names)
+        return self.router(columns)
+
+    @property
+    def dimension_names(self) -> tuple[str, ...]:
+        return tuple(alias for _, alias in self.dimensions)
+
+    @property
+    def measure_names(self) -> tuple[str, ...]:
+        return tuple(measure.name for measure in self.measures)
+
+    def aggregate(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        group_by: Optional[Iterable[str]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Sum the cached measures over a date range.
+
+        Args:
+            date_from: Optional start date (defaults to the first day with data)
+            date_to: Optional end date (defaults to the last day with data)
+            group_by: Dimension aliases to keep; all dimensions by default,
+                and an empty tuple gives one row of grand totals
+
+        Returns:
+            One dictionary per group with the dimension values and the
+            unrounded measure sums, in no particular order
+        """
+        group_by = self.dimension_names if group_by is None else tuple(group_by)
+        if not settings.DAILY_CELL_CACHE_ENABLED:
+            return self._query(date_from, date_to, group_by)
+
+        bounds = self._data_bounds()
+        if bounds is None:
+            return []
+        # Days outside the data are known to be empty; never fetch them.
+        first = max(date_from, bounds[0]) if date_from else bounds[0]
+        last = min(date_to, bounds[1]) if date_to else bounds[1]
+        if first > last:
+            return []
+
+        totals: dict[tuple, dict[str, Any]] = {}
+        for cells in self._cells(first, last):
+            for cell in cells:
+                key = tuple(cell.get(name) for name in group_by)
+                row = totals.get(key)
+                if row is None:
+                    row = totals[key] = {
+                        **dict(zip(group_by, key)),
+                        **{name: 0.0 for name in self.measure_names},
+                    }
+                for name in self.measure_names:
+                    row[name] += float(cell.get(name) or 0)
+        return list(totals.values())
+
+    def clear(self) -> None:
+        """Drop every cached cell."""
+        with self._lock:
+            self._days.clear()
+
+    def _cells(self, first: date, last: date) -> list[list[dict[str, Any]]]:
+        """Return the cells of every day in [first, last], fetching gaps."""
+        days = [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+        generation = self._current_generation()
+        with self._lock:
+            if generation != self._generation:
+                self._days.clear()
+                self._generation = generation
+            missing = [day for day in days if day not in self._days]
+
+        if missing:
+            fetched = self._fetch(missing)
+            with self._lock:
+                if generation == self._generation:
+                    self._days.update(fetched)
+        else:
+            fetched = {}
+
+        with self._lock:
+            result = []
+            for day in days:
+                cells = fetched.get(day)
+                if cells is None:
+                    cells = self._days.get(day, [])
+                    if day in self._days:
+                        self._days.move_to_end(day)
+                result.append(cells)
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+            self.days_hit += len(days) - len(missing)
+            self.days_fetched += len(missing)
+        return result
+
+    def _fetch(self, missing: list[date]) -> dict[date, list[dict[str, Any]]]:
+        """Read the cells of ``missing`` days, one query per contiguous run."""
+        fetched: dict[date, list[dict[str, Any]]] = {day: [] for day in missing}
+        for run_from, run_to in _contiguous_runs(missing):
+            logger.debug("Fetching daily cells of %s for %s..%s", self.source, run_from, run_to)
+            rows = execute_query(
+                self._cell_query(),
+                {"date_from": run_from.isoformat(), "date_to": run_to.isoformat()},
+                use_cache=False,
+            )
+            for row in rows:
+                fetched.setdefault(_as_date(row["DATE_DAY"]), []).append(
+                    {name: row.get(name) for name in self.dimension_names + self.measure_names}
+                )
+        return fetched
+
+    def _cell_query(self) -> str:
+        return MetricQuery(
+            source=f"{self.source} f",
+            metrics=self.measure_names,
+            dimensions=(("f.DATE_DAY", "DATE_DAY"),) + self.dimensions,
+            where=(
+                "f.DATE_DAY >= %(date_from)s",
+                "f.DATE_DAY <= %(date_to)s",
+            ),
+            rounded=False,
+        ).sql()
+
+    def _query(
+        self,
+        date_from: Optional[date],
+        date_to: Optional[date],
+        group_by: tuple[str, ...]
+    ) -> list[dict[str, Any]]:
+        """Aggregate directly in the warehouse (cell cache disabled)."""
+        conditions = []
+        params = {}
+        if date_from:
+            conditions.append("f.DATE_DAY >= %(date_from)s")
+            params["date_from"] = date_from.isoformat()
+        if date_to:
+            conditions.append("f.DATE_DAY <= %(date_to)s")
+            params["date_to"] = date_to.isoformat()
+        query = MetricQuery(
+            source=f"{self.source} f",
+            metrics=self.measure_names,
+            dimensions=tuple(dimension for dimension in self.dimensions if dimension[1] in group_by),
+            where=tuple(conditions),
+            rounded=False,
+        ).sql()
+        rows = execute_query(query, params if params else None)
+        return [
+            {**row, **{name: float(row.get(name) or 0) for name in self.measure_names}}
+            for row in rows
+        ]
+
+    def _data_bounds(self) -> Optional[tuple[date, date]]:
+        """
+        First and last day with data. MIN/MAX of the clustering date is answered
+        from micro-partition metadata, and the result is cached like any query.
+        """
+        rows = execute_query(
+            f"""
+                SELECT MIN(f.DATE_DAY) AS FIRST_DAY, MAX(f.DATE_DAY) AS LAST_DAY
+                FROM {self.source} f
+            """
+        )
+        if not rows or rows[0].get("FIRST_DAY") is None:
+            return None
+        return _as_date(rows[0]["FIRST_DAY"]), _as_date(rows[0]["LAST_DAY"])
+
+    def _current_generation(self) -> Optional[int]:
+        if not settings.FRESHNESS_TRACKING_ENABLED:
+            return None
+        table = self.source.rsplit(".", 1)[-1].upper()
+        return get_freshness_tracker().generations([table])[table]
+
+
+def sort_desc(rows: list[dict[str, Any]], key: str) -> list[dict[str, Any]]:
+    """Sort rows by ``key`` descending with NULLs first, like Snowflake's ORDER BY ... DESC."""
+    return sorted(rows, key=lambda row: (row[key] is None, row[key] or 0), reverse=True)
+
+
+def _as_date(value: Any) -> date:
+    if isinstance(value, date):
+        return value if type(value) is date else value.date()
+    return date.fromisoformat(str(value)[:10])
+
+
+# Campaign performance per platform and day: spend, ROAS and other
+# by-platform breakdowns for any date range.
+campaign_performance_by_platform = DailyCells(
+    table=CAMPAIGN_PERFORMANCE_FACT,
+    dimensions=(("f.PLATFORM", "PLATFORM"),),
+    measures=(SPEND, REVENUE, CONVERSIONS, CLICKS, IMPRESSIONS),
+    router=campaign_performance_source,
+)
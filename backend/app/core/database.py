@@ -1,9 +1,24 @@
+import logging
+import threading
+import time
 import snowflake.connector
 from snowflake.connector import DictCursor
 from contextlib import contextmanager
-from typing import Generator, Any
+from typing import Callable, Generator, Any, Iterator, Optional
 
+from app.core.cache import get_query_cache, make_cache_key
+from app.core.columnar import ColumnarResult, fetch_columns, iter_column_batches
+from app.core.concurrency import run_in_executor
 from app.core.config import settings
+from app.core.freshness import get_freshness_tracker, referenced_tables
+from app.core.instrumentation import QueryRecord, count_result, record_query
+from app.core.local_warehouse import LocalWarehouse
+from app.core.pool import ConnectionPool, PoolStats
+from app.core.query_batch import get_query_batch
+from app.core.replica import get_replica
+from app.core.singleflight import query_single_flight
+
+logger = logging.getLogger(__name__)
 
 
 def get_snowflake_connection() -> snowflake.connector.SnowflakeConnection:
@@ -19,32 +34,136 @@ def get_snowflake_connection() -> snowflake.connector.SnowflakeConnection:
     )
 
 
+def _default_connector() -> Callable[[], Any]:
+    """Snowflake, or the offline warehouse when LOCAL_WAREHOUSE_PATH is set."""
+    if settings.LOCAL_WAREHOUSE_PATH:
+        return LocalWarehouse(settings.LOCAL_WAREHOUSE_PATH).connect
+    return get_snowflake_connection
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _default_pool_options() -> dict[str, Any]:
+    """Pool sizing and recycling limits from settings."""
+    return {
+        "min_size": settings.SNOWFLAKE_POOL_MIN_SIZE,
+        "max_size": settings.SNOWFLAKE_POOL_MAX_SIZE,
+        "acquire_timeout": settings.SNOWFLAKE_POOL_TIMEOUT_SECONDS,
+        "max_idle_seconds": settings.SNOWFLAKE_POOL_MAX_IDLE_SECONDS,
+        "max_lifetime_seconds": settings.SNOWFLAKE_POOL_MAX_LIFETIME_SECONDS,
+        "health_check_interval": settings.SNOWFLAKE_POOL_HEALTH_CHECK_SECONDS,
+    }
+
+
+def configure_pool(
+    connector: Optional[Callable[[], Any]] = None,
+    **options: Any
+) -> ConnectionPool:
+    """
+    (Re)create the shared connection pool.
+
+    Any existing pool is closed first. Use this to point the application at a
+    different connector (e.g. a local stand-in for Snowflake) or to override
+    pool sizing at runtime.
+
+    Args:
+        connector: Zero-argument callable returning a DB-API connection.
+            Defaults to get_snowflake_connection, or the local warehouse
+            when LOCAL_WAREHOUSE_PATH is set.
+        **options: Overrides for ConnectionPool keyword arguments
+            (min_size, max_size, acquire_timeout, ...)
+
+    Returns:
+        The newly created pool
+    """
+    global _pool
+
+    pool_options = {**_default_pool_options(), **options}
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = ConnectionPool(connector or _default_connector(), **pool_options)
+        return _pool
+
+
+def get_pool() -> ConnectionPool:
+    """Return the shared connection pool, creating it on first use."""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(_default_connector(), **_default_pool_options())
+    return _pool
+
+
+def start_pool() -> None:
+    """
+    Open the shared pool's min_size connections and keep them open.
+
+    Called at application startup. A warehouse that cannot be reached yet
+    does not stop the app: the pool retries on its next maintenance run,
+    and requests still open connections on demand.
+    """
+    pool = get_pool()
+    pool.start_maintenance(settings.SNOWFLAKE_POOL_MAINTENANCE_SECONDS)
+    try:
+        pool.warm()
+    except Exception:
+        logger.warning("Could not warm the warehouse connection pool", exc_info=True)
+
+
+def close_pool() -> None:
+    """Close the shared pool's connections (application shutdown)."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+def get_pool_stats() -> PoolStats:
+    """Return current saturation statistics for the shared connection pool."""
+    return get_pool().stats()
+
+
 @contextmanager
 def get_db_cursor() -> Generator[Any, None, None]:
     """Context manager for database cursor with automatic cleanup."""
-    conn = get_snowflake_connection()
-    cursor = conn.cursor()
-    try:
-        yield cursor
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
+    with get_pool().connection() as conn:
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
 
 
 def execute_query(
     query: str,
-    params: dict[str, Any] | None = None
+    params: dict[str, Any] | None = None,
+    use_cache: bool = True
 ) -> list[dict[str, Any]]:
     """
     Execute a SQL query and return results as a list of dictionaries.
 
+    Results are served from the query cache when possible. On a miss,
+    concurrent callers issuing the same statement with the same parameters
+    share a single execution, which reads the local replica when it holds
+    fresh copies of every table (see app.core.replica). The connection is borrowed from the shared
+    pool and returned afterwards, so repeated queries reuse an authenticated
+    session.
+
     Args:
         query: SQL query string
         params: Optional parameters for parameterized queries (prevents SQL injection)
+        use_cache: Set to False to always read from the warehouse
 
     Returns:
         List of dictionaries, where each dict represents a row with column names as keys
@@ -59,14 +178,189 @@ def execute_query(
             params={"account_id": 123}
         )
     """
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor(DictCursor)
-        try:
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            return results if results else []
-        finally:
-            cursor.close()
-    finally:
-        conn.close()
+    return _cached_fetch(query, params, "rows", _fetch_all, use_cache)
+
+
+def execute_query_columns(
+    query: str,
+    params: dict[str, Any] | None = None,
+    use_cache: bool = True
+) -> ColumnarResult:
+    """
+    Execute a SQL query and return the result column by column.
+
+    Uses the connector's Arrow fetch, so no per-row Python dicts are built.
+    Services can then coerce whole columns at once (see ColumnarResult).
+    Caching and single-flight behave exactly as in execute_query.
+
+    Args:
+        query: SQL query string
+        params: Optional parameters for parameterized queries
+        use_cache: Set to False to always read from the warehouse
+
+    Returns:
+        ColumnarResult keyed by upper-cased column name
+    """
+    return _cached_fetch(query, params, "columns", _fetch_columns, use_cache)
+
+
+def stream_query(
+    query: str,
+    params: dict[str, Any] | None = None,
+    batch_size: Optional[int] = None
+) -> Iterator[ColumnarResult]:
+    """
+    Execute a SQL query and yield its result in column batches.
+
+    Memory stays bounded by one batch regardless of the total row count, so
+    this suits unbounded lists that are sent to the client as they arrive
+    (e.g. via FastAPI's StreamingResponse). Streams bypass the query cache and
+    single-flight layers. The pooled connection is held until the generator
+    is exhausted or closed.
+
+    Args:
+        query: SQL query string
+        params: Optional parameters for parameterized queries
+        batch_size: Rows per batch when the connector cannot stream Arrow
+            chunks; defaults to QUERY_STREAM_BATCH_SIZE
+
+    Yields:
+        ColumnarResult batches, in result order
+    """
+    with _executed_cursor(query, params) as (cursor, record):
+        batches = iter_column_batches(cursor, batch_size or settings.QUERY_STREAM_BATCH_SIZE)
+        while True:
+            # Only time the fetch itself, not the consumer's work between batches.
+            started = time.perf_counter()
+            batch = next(batches, None)
+            record.fetch += time.perf_counter() - started
+            if batch is None:
+                return
+            record.rows += len(batch)
+            yield batch
+
+
+def _cached_fetch(
+    query: str,
+    params: dict[str, Any] | None,
+    namespace: str,
+    fetch: Callable[[str, dict[str, Any] | None], Any],
+    use_cache: bool
+) -> Any:
+    """
+    Serve ``fetch(query, params)`` through the query cache and single-flight
+    layers, shared with identical reads in the current query batch if any.
+    """
+    key = _query_key(query, params, namespace)
+    batch = get_query_batch()
+    if batch is not None:
+        return batch.do(key, lambda: _shared_fetch(key, query, params, namespace, fetch, use_cache))
+    return _shared_fetch(key, query, params, namespace, fetch, use_cache)
+
+
+def _shared_fetch(
+    key: str,
+    query: str,
+    params: dict[str, Any] | None,
+    namespace: str,
+    fetch: Callable[[str, dict[str, Any] | None], Any],
+    use_cache: bool
+) -> Any:
+    """Cache lookup, then a single-flight load from the replica or warehouse."""
+    cache = get_query_cache() if use_cache and settings.QUERY_CACHE_ENABLED else None
+    if cache is not None:
+        result = cache.get(key)
+        if result is not None:
+            count_result("cache")
+            return result
+
+    def load() -> Any:
+        replica = get_replica()
+        result = replica.fetch(query, params, columns=namespace == "columns") if replica else None
+        if result is not None:
+            count_result("replica")
+        else:
+            result = fetch(query, params)
+            count_result("warehouse")
+        if cache is not None:
+            cache.set(key, result)
+        return result
+
+    if settings.QUERY_SINGLE_FLIGHT_ENABLED:
+        return query_single_flight.do(key, load)
+    return load()
+
+
+def _query_key(query: str, params: dict[str, Any] | None, namespace: str = "rows") -> str:
+    """Cache/single-flight key, versioned by the data generation of every table read."""
+    generations = None
+    if settings.FRESHNESS_TRACKING_ENABLED:
+        generations = get_freshness_tracker().generations(referenced_tables(query))
+    return make_cache_key(query, params, namespace=namespace, generations=generations)
+
+
+@contextmanager
+def _executed_cursor(
+    query: str,
+    params: dict[str, Any] | None,
+    cursor_class: Any = None
+) -> Generator[tuple[Any, QueryRecord], None, None]:
+    """
+    Borrow a pooled connection, execute ``query`` and yield the open cursor.
+
+    The connect and execute phases are timed here; the caller times its own
+    fetch and sets ``record.rows``. The record is exported on exit.
+    """
+    with record_query() as record:
+        started = time.perf_counter()
+        with get_pool().connection() as conn:
+            record.connect = time.perf_counter() - started
+            cursor = conn.cursor(cursor_class) if cursor_class else conn.cursor()
+            try:
+                started = time.perf_counter()
+                cursor.execute(query, params)
+                record.execute = time.perf_counter() - started
+                record.query_id = getattr(cursor, "sfqid", None)
+                yield cursor, record
+            finally:
+                cursor.close()
+
+
+def _fetch_all(query: str, params: dict[str, Any] | None) -> list[dict[str, Any]]:
+    """Run ``query`` on a pooled connection and fetch every row as a dict."""
+    with _executed_cursor(query, params, DictCursor) as (cursor, record):
+        started = time.perf_counter()
+        results = cursor.fetchall() or []
+        record.fetch = time.perf_counter() - started
+        record.rows = len(results)
+        return results
+
+
+def _fetch_columns(query: str, params: dict[str, Any] | None) -> ColumnarResult:
+    """Run ``query`` on a pooled connection and fetch the result as columns."""
+    with _executed_cursor(query, params) as (cursor, record):
+        started = time.perf_counter()
+        result = fetch_columns(cursor)
+        record.fetch = time.perf_counter() - started
+        record.rows = len(result)
+        return result
+
+
+async def execute_query_async(
+    query: str,
+    params: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Async variant of execute_query.
+
+    The query runs on the bounded query executor, so awaiting it does not
+    block the event loop.
+
+    Args:
+        query: SQL query string
+        params: Optional parameters for parameterized queries
+
+    Returns:
+        List of dictionaries, where each dict represents a row with column names as keys
+    """
+    return await run_in_executor(execute_query, query, params)
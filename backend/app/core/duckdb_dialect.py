@@ -0,0 +1,77 @@
+"""
+Running the repositories' Snowflake SQL on DuckDB.
+
+Shared by the local replica (``app.core.replica``) and the offline stand-in
+warehouse (``app.core.local_warehouse``). Marts are exposed under their
+Snowflake names by attaching a catalog called ``CLIENT_RARE_SEEDS_DB``, so the
+only rewrites needed are parameter markers and a few functions, provided as
+macros, plus Snowflake's NULL ordering.
+"""
+import re
+from typing import Any
+
+DATABASE = "CLIENT_RARE_SEEDS_DB"
+SCHEMA = "PUBLIC_ANALYTICS"
+
+_PARAM_RE = re.compile(r"%\((\w+)\)s")
+
+# Snowflake functions the repositories use that DuckDB lacks or spells differently.
+SNOWFLAKE_MACROS = (
+    """
+    CREATE MACRO to_char(value, format) AS strftime(
+        value,
+        replace(replace(replace(replace(format, 'YYYY', '%Y'), 'Mon', '%b'), 'MM', '%m'), 'DD', '%d')
+    )
+    """,
+    """
+    CREATE MACRO initcap(value) AS array_to_string(
+        list_transform(string_split(lower(value), ' '), word -> upper(word[1]) || word[2:]),
+        ' '
+    )
+    """,
+)
+
+# Snowflake sorts NULL as the largest value: last ascending, first descending.
+# DuckDB puts NULLs last either way unless told otherwise.
+SNOWFLAKE_SETTINGS = (
+    "SET default_null_order = 'nulls_last_on_asc_first_on_desc'",
+)
+
+# HLL sketches and bitmaps emulated over LIST columns of ids / bit positions,
+# as written by app.core.synthetic_marts. Counts are exact, not estimates.
+SKETCH_MACROS = (
+    "CREATE MACRO hll_combine(sketch) AS list_distinct(flatten(list(sketch)))",
+    "CREATE MACRO hll_estimate(sketch) AS len(sketch)",
+    "CREATE MACRO bitmap_or_agg(bitmap) AS list_distinct(flatten(list(bitmap)))",
+    "CREATE MACRO bitmap_count(bitmap) AS len(bitmap)",
+)
+
+
+def to_duckdb(query: str) -> str:
+    """Rewrite ``%(name)s`` parameters as DuckDB's ``$name``."""
+    return _PARAM_RE.sub(r"$\1", query)
+
+
+def install_macros(connection: Any, sketches: bool = False) -> None:
+    """Apply Snowflake's settings and define its compatibility macros (and sketch emulation) on a connection."""
+    for statement in SNOWFLAKE_SETTINGS:
+        connection.execute(statement)
+    for macro in SNOWFLAKE_MACROS + (SKETCH_MACROS if sketches else ()):
+        connection.execute(macro)
+
+
+def column_names(cursor: Any) -> list[str]:
+    """Result column names upper-cased, as Snowflake reports unquoted aliases."""
+    return [column[0].upper() for column in cursor.description or []]
+
+
+def fetch_rows(cursor: Any) -> list[dict[str, Any]]:
+    names = column_names(cursor)
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def fetch_arrow(cursor: Any) -> Any:
+    """The remaining result as a ``pyarrow.Table`` with upper-cased column names."""
+    fetch = getattr(cursor, "to_arrow_table", None) or cursor.fetch_arrow_table
+    table = fetch()
+    return table.rename_columns([name.upper() for name in table.column_names])
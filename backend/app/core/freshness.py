@@ -0,0 +1,158 @@
+"""
+Data-freshness watermarks for cache invalidation.
+
+Each analytics table has a watermark: the last time its contents changed.
+The watermark (in epoch milliseconds) doubles as the table's *generation*,
+and the generations of every table a query reads are folded into that
+query's cache key. When dbt or Fivetran rewrites ``FCT_GA4_TRAFFIC`` its
+generation moves, so cached GA4 results stop matching, while entries that
+only read Meta tables keep their keys and stay warm.
+
+Because the generation is derived from the warehouse rather than counted
+locally, every API worker computes the same keys without coordination.
+"""
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fully qualified mart references, e.g. CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_GA4_TRAFFIC
+_TABLE_RE = re.compile(r"\bPUBLIC_ANALYTICS\.([A-Za-z0-9_]+)", re.IGNORECASE)
+
+WatermarkLoader = Callable[[], dict[str, datetime]]
+
+
+def referenced_tables(query: str) -> tuple[str, ...]:
+    """Return the sorted, upper-cased PUBLIC_ANALYTICS tables that ``query`` reads."""
+    return tuple(sorted({name.upper() for name in _TABLE_RE.findall(query)}))
+
+
+def to_generation(watermark: datetime) -> int:
+    if watermark.tzinfo is None:
+        watermark = watermark.replace(tzinfo=timezone.utc)
+    return int(watermark.timestamp() * 1000)
+
+
+def load_warehouse_watermarks() -> dict[str, datetime]:
+    """
+    Read the last-altered time of every PUBLIC_ANALYTICS table.
+
+    INFORMATION_SCHEMA.TABLES is metadata-only, so this costs no warehouse
+    scan. Snowflake updates LAST_ALTERED on every DML, which covers both
+    incremental merges and full rebuilds by dbt.
+    """
+    # Imported here: database depends on this module for cache keys.
+    from app.core.database import execute_query
+
+    rows = execute_query(
+        f"""
+            SELECT TABLE_NAME, LAST_ALTERED
+            FROM {settings.FRESHNESS_INFORMATION_SCHEMA}.TABLES
+            WHERE TABLE_SCHEMA = 'PUBLIC_ANALYTICS'
+        """,
+        use_cache=False,
+    )
+    return {
+        str(row["TABLE_NAME"]).upper(): row["LAST_ALTERED"]
+        for row in rows
+        if row.get("LAST_ALTERED") is not None
+    }
+
+
+class FreshnessTracker:
+    """
+    Tracks per-table watermarks and exposes them as cache generations.
+
+    Watermarks are re-read at most every ``refresh_interval`` seconds, by
+    whichever caller first notices they are due. Other callers keep using the
+    previous generations meanwhile, so a refresh never blocks a request twice.
+    """
+
+    def __init__(self, loader: WatermarkLoader, refresh_interval: float = 60.0):
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self._generations: dict[str, int] = {}
+        self._watermarks: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._last_refresh: Optional[float] = None
+        self.bumps = 0
+
+    def generations(self, tables: Iterable[str]) -> dict[str, int]:
+        """Return the current generation of each table (0 if unknown)."""
+        tables = list(tables)
+        if not tables:
+            return {}
+        self._maybe_refresh()
+        with self._lock:
+            return {table: self._generations.get(table, 0) for table in tables}
+
+    def refresh(self) -> None:
+        """Reload watermarks now and bump the generation of tables that changed."""
+        watermarks = self.loader()
+        with self._lock:
+            for table, watermark in watermarks.items():
+                generation = to_generation(watermark)
+                previous = self._generations.get(table)
+                if previous is not None and generation > previous:
+                    logger.info("Data refreshed for %s; invalidating cached results", table)
+                    self.bumps += 1
+                if previous is None or generation > previous:
+                    self._generations[table] = generation
+                    self._watermarks[table] = watermark
+            self._last_refresh = time.monotonic()
+
+    def snapshot(self) -> dict[str, str]:
+        """Return the known watermark of every table as ISO-8601 strings."""
+        with self._lock:
+            return {table: watermark.isoformat() for table, watermark in sorted(self._watermarks.items())}
+
+    def _maybe_refresh(self) -> None:
+        last = self._last_refresh
+        if last is not None and time.monotonic() - last < self.refresh_interval:
+            return
+        # Non-blocking: also stops the watermark query from recursing into itself.
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            self.refresh()
+        except Exception:
+            logger.warning("Could not refresh data-freshness watermarks", exc_info=True)
+            # Back off for a full interval rather than retrying on every query.
+            self._last_refresh = time.monotonic()
+        finally:
+            self._refresh_lock.release()
+
+
+_tracker: Optional[FreshnessTracker] = None
+_tracker_lock = threading.RLock()
+
+
+def configure_freshness_tracker(
+    loader: Optional[WatermarkLoader] = None,
+    refresh_interval: Optional[float] = None
+) -> FreshnessTracker:
+    """(Re)create the shared tracker, optionally with a custom watermark source."""
+    global _tracker
+
+    with _tracker_lock:
+        _tracker = FreshnessTracker(
+            loader or load_warehouse_watermarks,
+            refresh_interval if refresh_interval is not None else settings.FRESHNESS_REFRESH_SECONDS,
+        )
+        return _tracker
+
+
+def get_freshness_tracker() -> FreshnessTracker:
+    """Return the shared tracker, creating it on first use."""
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                configure_freshness_tracker()
+    return _tracker
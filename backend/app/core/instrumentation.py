@@ -0,0 +1,196 @@
+"""
+Per-query instrumentation exported as Prometheus metrics.
+
+Every warehouse round trip is timed in three phases - ``connect`` (borrowing
+a pooled connection), ``execute`` (``cursor.execute``) and ``fetch`` (reading
+the result) - and labelled with the repository method that issued it. The
+Snowflake query ID is logged with each timing, so a slow histogram bucket
+can be traced to the query profile in Snowsight.
+
+Pool, cache, single-flight and freshness state are exported as gauges that
+are read at scrape time, so they cost nothing on the request path.
+"""
+import logging
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Optional
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+logger = logging.getLogger(__name__)
+
+QUERY_PHASE_SECONDS = Histogram(
+    "warehouse_query_phase_seconds",
+    "Wall time of each warehouse query phase",
+    ["query", "phase"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+QUERY_ROWS = Histogram(
+    "warehouse_query_rows",
+    "Rows returned per warehouse query",
+    ["query"],
+    buckets=(0, 1, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000, 500000),
+)
+QUERY_TOTAL = Counter(
+    "warehouse_queries_total",
+    "Warehouse queries executed",
+    ["query", "outcome"],
+)
+QUERY_RESULTS = Counter(
+    "warehouse_query_results_total",
+    "Query results served, by where they came from",
+    ["source"],
+)
+
+# Frames from these modules are plumbing, not the caller we want to label.
+_PLUMBING_MODULES = (
+    "app.core.instrumentation",
+    "app.core.database",
+    "app.core.query_batch",
+    "app.core.replica",
+    "app.core.singleflight",
+    "app.core.shared_scan",
+    "contextlib",
+)
+
+
+@dataclass
+class QueryRecord:
+    """Timing and outcome of a single warehouse query."""
+    name: str
+    connect: float = 0.0
+    execute: float = 0.0
+    fetch: float = 0.0
+    rows: int = 0
+    query_id: Optional[str] = None
+    error: bool = False
+
+    @property
+    def total(self) -> float:
+        return self.connect + self.execute + self.fetch
+
+
+# Called with every finished QueryRecord (e.g. per-request timing collectors).
+_listeners: list[Callable[[QueryRecord], None]] = []
+
+
+def add_query_listener(listener: Callable[[QueryRecord], None]) -> None:
+    """Register a callback invoked with each finished QueryRecord."""
+    _listeners.append(listener)
+
+
+def caller_name() -> str:
+    """
+    Name the function that issued the current query, e.g.
+    ``KeywordPerformanceRepository.get_keyword_performance``.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(_PLUMBING_MODULES):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return "unknown"
+
+
+@contextmanager
+def record_query(name: Optional[str] = None) -> Generator[QueryRecord, None, None]:
+    """
+    Time a warehouse query; phases are filled in by the caller.
+
+    The record is exported when the block exits, whether it succeeds or not.
+    """
+    record = QueryRecord(name=name or caller_name())
+    try:
+        yield record
+    except BaseException:
+        record.error = True
+        raise
+    finally:
+        _observe(record)
+
+
+def count_result(source: str) -> None:
+    """Count a query result served from ``source`` (warehouse, cache, ...)."""
+    QUERY_RESULTS.labels(source=source).inc()
+
+
+def _observe(record: QueryRecord) -> None:
+    QUERY_PHASE_SECONDS.labels(record.name, "connect").observe(record.connect)
+    QUERY_PHASE_SECONDS.labels(record.name, "execute").observe(record.execute)
+    QUERY_PHASE_SECONDS.labels(record.name, "fetch").observe(record.fetch)
+    QUERY_ROWS.labels(record.name).observe(record.rows)
+    QUERY_TOTAL.labels(record.name, "error" if record.error else "ok").inc()
+    logger.debug(
+        "query=%s sfqid=%s connect=%.4f execute=%.4f fetch=%.4f rows=%d error=%s",
+        record.name, record.query_id, record.connect, record.execute,
+        record.fetch, record.rows, record.error,
+    )
+    for listener in _listeners:
+        try:
+            listener(record)
+        except Exception:
+            logger.debug("Query listener failed", exc_info=True)
+
+
+class RuntimeStateCollector:
+    """Exports pool, cache, single-flight and freshness state at scrape time."""
+
+    def describe(self) -> list:
+        # Keeps REGISTRY.register from calling collect() during import.
+        return []
+
+    def collect(self) -> Any:
+        # Imported here: database imports this module.
+        from app.core.cache import get_query_cache
+        from app.core.database import get_pool_stats
+        from app.core.freshness import get_freshness_tracker
+        from app.core.replica import get_replica
+        from app.core.singleflight import query_single_flight
+
+        pool = get_pool_stats()
+        for name, value, help_text in (
+            ("warehouse_pool_size", pool.size, "Open pooled connections"),
+            ("warehouse_pool_in_use", pool.in_use, "Pooled connections checked out"),
+            ("warehouse_pool_idle", pool.idle, "Idle pooled connections"),
+            ("warehouse_pool_waiting", pool.waiting, "Threads waiting for a pooled connection"),
+            ("warehouse_pool_max_size", pool.max_size, "Configured maximum pool size"),
+            ("warehouse_pool_saturation", pool.saturation, "Fraction of the pool checked out"),
+        ):
+            yield GaugeMetricFamily(name, help_text, value=value)
+        for name, value, help_text in (
+            ("warehouse_pool_connections_created", pool.created_total, "Connections opened"),
+            ("warehouse_pool_connections_recycled", pool.recycled_total, "Connections closed by the pool"),
+            ("warehouse_pool_timeouts", pool.timeouts, "Borrows that timed out"),
+            ("warehouse_pool_wait_seconds", pool.wait_seconds_total, "Time spent waiting to borrow"),
+        ):
+            yield CounterMetricFamily(name, help_text, value=value)
+
+        cache = get_query_cache().stats()
+        lookups = CounterMetricFamily("query_cache_lookups", "Query cache lookups", labels=["result"])
+        lookups.add_metric(["local_hit"], cache.local_hits)
+        lookups.add_metric(["shared_hit"], cache.shared_hits)
+        lookups.add_metric(["miss"], cache.misses)
+        yield lookups
+        yield GaugeMetricFamily("query_cache_local_entries", "Entries in the in-process cache", value=cache.local_entries)
+        yield CounterMetricFamily("query_cache_evictions", "In-process cache LRU evictions", value=cache.evictions)
+
+        flights = query_single_flight.stats()
+        yield CounterMetricFamily("query_single_flight_executions", "Queries executed by a single-flight leader", value=flights.executions)
+        yield CounterMetricFamily("query_single_flight_coalesced", "Queries answered by another caller's execution", value=flights.coalesced)
+
+        freshness = get_freshness_tracker()
+        yield CounterMetricFamily("data_freshness_generation_bumps", "Cache generations bumped by new data", value=freshness.bumps)
+
+        replica = get_replica()
+        if replica is not None:
+            state = replica.stats()
+            yield GaugeMetricFamily("replica_tables", "Tables in the published replica snapshot", value=state.tables)
+            yield CounterMetricFamily("replica_queries_served", "Queries answered by the local replica", value=state.served)
+            yield CounterMetricFamily("replica_fallbacks", "Queries passed to Snowflake by the replica", value=state.fallbacks)
+            yield CounterMetricFamily("replica_stale_fallbacks", "Fallbacks because a table changed since its snapshot", value=state.stale_fallbacks)
+
+
+REGISTRY.register(RuntimeStateCollector())
@@ -0,0 +1,180 @@
+"""
+Offline stand-in for Snowflake: the marts in a local DuckDB file.
+
+``LocalWarehouse`` opens a database written by ``app.core.synthetic_marts``
+(or any DuckDB file with a ``PUBLIC_ANALYTICS`` schema) and hands out
+connections that look like ``snowflake.connector`` connections to
+``app.core.database``: ``cursor(DictCursor)`` returns dict rows, and
+``fetch_arrow_all`` / ``fetch_arrow_batches`` return Arrow tables. Every
+repository, the query cache, single-flight, rollup routing and freshness
+tracking then run unchanged, without credentials or network.
+
+Set ``LOCAL_WAREHOUSE_PATH`` to make the application use it, or call
+``use_local_warehouse`` from a script or benchmark:
+
+    python scripts/generate_marts.py --scale small
+    LOCAL_WAREHOUSE_PATH=backend/local/marts.duckdb uvicorn app.main:app
+"""
+import itertools
+import re
+import threading
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from app.core.duckdb_dialect import DATABASE, column_names, fetch_arrow, install_macros, to_duckdb
+
+try:
+    import duckdb
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    duckdb = None
+    pa = None
+
+# Table watermarks live in LOCAL_METADATA.TABLES, since DuckDB's own
+# INFORMATION_SCHEMA has no LAST_ALTERED column.
+METADATA_SCHEMA = "LOCAL_METADATA"
+_INFORMATION_SCHEMA_RE = re.compile(r"\b(?:\w+\.)?INFORMATION_SCHEMA\.TABLES\b", re.IGNORECASE)
+
+# Rows per Arrow batch for streamed results
+ARROW_BATCH_ROWS = 100_000
+
+_query_ids = itertools.count(1)
+
+
+class LocalWarehouse:
+    """
+    A read-only DuckDB database of marts, shared by every pooled connection.
+
+    Args:
+        path: DuckDB database file
+        threads: DuckDB worker threads per query; None for DuckDB's default
+            (all cores)
+    """
+
+    def __init__(self, path: Path | str, threads: Optional[int] = None):
+        if duckdb is None:
+            raise RuntimeError("duckdb and pyarrow are required for the local warehouse")
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"No local warehouse at {self.path}; run scripts/generate_marts.py")
+        self._database = duckdb.connect()
+        if threads is not None:
+            self._database.execute(f"SET threads = {int(threads)}")
+        escaped = str(self.path).replace("'", "''")
+        self._database.execute(f"ATTACH '{escaped}' AS {DATABASE} (READ_ONLY)")
+        # Macros live in the in-memory default catalog, visible to every cursor.
+        install_macros(self._database, sketches=True)
+        self._lock = threading.Lock()
+
+    def connect(self) -> "LocalConnection":
+        """New connection to the shared database (DuckDB cursors are per-thread)."""
+        with self._lock:
+            return LocalConnection(self._database.cursor())
+
+    def tables(self) -> dict[str, int]:
+        """Row count of every mart, by upper-cased table name."""
+        with self.connect() as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                f"SELECT TABLE_NAME, ROW_COUNT FROM {DATABASE}.{METADATA_SCHEMA}.TABLES ORDER BY TABLE_NAME"
+            )
+            return {name: rows for name, rows in cursor.fetchall()}
+
+
+class LocalConnection:
+    """DB-API connection over one DuckDB cursor, shaped like a Snowflake connection."""
+
+    def __init__(self, connection: Any):
+        self._connection = connection
+        self._closed = False
+
+    def cursor(self, cursor_class: Any = None) -> "LocalCursor":
+        # Any cursor class (snowflake's DictCursor) asks for dict rows.
+        return LocalCursor(self._connection, dict_rows=cursor_class is not None)
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._connection.close()
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def __enter__(self) -> "LocalConnection":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class LocalCursor:
+    """Cursor with the parts of the Snowflake cursor API the backend uses."""
+
+    def __init__(self, connection: Any, dict_rows: bool = False):
+        self._connection = connection
+        self._dict_rows = dict_rows
+        self.description: Optional[list[tuple]] = None
+        self.sfqid: Optional[str] = None
+
+    def execute(self, query: str, params: dict[str, Any] | None = None) -> "LocalCursor":
+        query = _INFORMATION_SCHEMA_RE.sub(f"{DATABASE}.{METADATA_SCHEMA}.TABLES", to_duckdb(query))
+        self._connection.execute(query, params or None)
+        self.description = self._connection.description
+        self.sfqid = f"local-{next(_query_ids)}"
+        return self
+
+    def fetchall(self) -> list[Any]:
+        rows = self._connection.fetchall()
+        if not self._dict_rows:
+            return rows
+        names = column_names(self)
+        return [dict(zip(names, row)) for row in rows]
+
+    def fetchone(self) -> Any:
+        row = self._connection.fetchone()
+        if row is None or not self._dict_rows:
+            return row
+        return dict(zip(column_names(self), row))
+
+    def fetchmany(self, size: int = 1) -> list[Any]:
+        rows = self._connection.fetchmany(size)
+        if not self._dict_rows:
+            return rows
+        names = column_names(self)
+        return [dict(zip(names, row)) for row in rows]
+
+    def fetch_arrow_all(self) -> Any:
+        return fetch_arrow(self._connection)
+
+    def fetch_arrow_batches(self) -> Iterator[Any]:
+        names = column_names(self)
+        for batch in self._connection.fetch_record_batch(ARROW_BATCH_ROWS):
+            yield pa.Table.from_batches([batch]).rename_columns(names)
+
+    def close(self) -> None:
+        pass
+
+
+def use_local_warehouse(path: Path | str, **pool_options: Any) -> LocalWarehouse:
+    """
+    Point ``app.core.database`` at a local warehouse file.
+
+    Args:
+        path: DuckDB database file
+        **pool_options: Overrides for the connection pool (max_size, ...)
+
+    Returns:
+        The opened LocalWarehouse
+    """
+    # Imported here: database imports this module for LOCAL_WAREHOUSE_PATH.
+    from app.core.database import configure_pool
+
+    warehouse = LocalWarehouse(path)
+    configure_pool(warehouse.connect, **pool_options)
+    return warehouse
@@ -0,0 +1,153 @@
+"""
+Keyset (cursor) pagination for ranked lists.
+
+``LIMIT/OFFSET`` makes page N aggregate the whole list again and then skip
+N x page_size rows. Keyset pagination instead remembers the sort key of the
+last row served and asks for the rows strictly after it:
+
+    ORDER BY IMPRESSIONS DESC, CREATIVE_ID ASC
+    WHERE IMPRESSIONS < :impressions
+       OR (IMPRESSIONS = :impressions AND CREATIVE_ID > :creative_id)
+
+The position is handed to clients as an opaque cursor token (URL-safe
+base64 JSON), bound to the filters it was issued for. Sort keys must never
+be NULL (COALESCE them) and the last key must be unique, so the order is
+total and no row is skipped or repeated between pages.
+"""
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+
+class InvalidCursor(ValueError):
+    """The cursor token is malformed or was issued for different filters."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """A column of the ranked list's ORDER BY (its output alias)."""
+    column: str
+    descending: bool = False
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Decoded cursor: sort-key values of the last row served and its page."""
+    values: tuple[Any, ...]
+    page: int
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """
+    Total order of a ranked list.
+
+    Example:
+        keyset = Keyset((SortKey("IMPRESSIONS", descending=True), SortKey("CREATIVE_ID")))
+        cursor = keyset.decode(token, scope) if token else None
+        query, page_params = keyset.paginate(ranked_sql, cursor, page_size)
+        rows = execute_query(query, {**params, **page_params})
+        page, next_token = keyset.page(rows, page_size, cursor, scope)
+    """
+    keys: tuple[SortKey, ...]
+
+    def order_by(self) -> str:
+        return ", ".join(f"{key.column} {'DESC' if key.descending else 'ASC'}" for key in self.keys)
+
+    def paginate(
+        self,
+        ranked_sql: str,
+        cursor: Optional[Cursor],
+        page_size: int
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Wrap an unordered, unlimited ranked-list query into one page of it.
+
+        One row more than ``page_size`` is fetched to tell whether another
+        page follows.
+
+        Returns:
+            (query, params) where params hold the page size and cursor values
+        """
+        params: dict[str, Any] = {"page_limit": page_size + 1}
+        where = ""
+        if cursor is not None:
+            alternatives = []
+            for index, key in enumerate(self.keys):
+                terms = [f"{previous.column} = %(after_{i})s" for i, previous in enumerate(self.keys[:index])]
+                terms.append(f"{key.column} {'<' if key.descending else '>'} %(after_{index})s")
+                alternatives.append("(" + " AND ".join(terms) + ")")
+            where = "WHERE " + "\n                OR ".join(alternatives)
+            params.update({f"after_{i}": value for i, value in enumerate(cursor.values)})
+
+        query = f"""
+            SELECT *
+            FROM (
+                {ranked_sql.strip()}
+            ) ranked
+            {where}
+            ORDER BY {self.order_by()}
+            LIMIT %(page_limit)s
+        """
+        return query, params
+
+    def page(
+        self,
+        rows: list[dict[str, Any]],
+        page_size: int,
+        cursor: Optional[Cursor],
+        scope: dict[str, Any]
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """Trim the look-ahead row and return (rows, next cursor token or None)."""
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        page = (cursor.page if cursor else 0) + 1
+        return rows, self.encode(rows[-1], page, scope)
+
+    def encode(self, row: dict[str, Any], page: int, scope: dict[str, Any]) -> str:
+        payload = {
+            "v": [_json_value(row[key.column]) for key in self.keys],
+            "p": page,
+            "s": _scope_hash(scope),
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode(self, token: str, scope: dict[str, Any]) -> Cursor:
+        """
+        Decode a cursor token.
+
+        Raises:
+            InvalidCursor: if the token is malformed or was issued for other filters
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw)
+            values, page, scope_hash = payload["v"], int(payload["p"]), payload["s"]
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidCursor("Malformed cursor") from None
+        if not isinstance(values, list) or len(values) != len(self.keys) or page < 1:
+            raise InvalidCursor("Malformed cursor")
+        if scope_hash != _scope_hash(scope):
+            raise InvalidCursor("Cursor was issued for different filters")
+        return Cursor(values=tuple(values), page=page)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        # Kept as text: a float would not compare equal to the NUMBER it came from.
+        return int(value) if value == value.to_integral_value() else str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _scope_hash(scope: dict[str, Any]) -> str:
+    canonical = json.dumps(scope, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
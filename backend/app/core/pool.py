@@ -0,0 +1,353 @@
+"""
+Thread-safe connection pool for warehouse connections.
+
+The pool is connector-agnostic: it is built around a zero-argument callable
+that opens a new DB-API connection, so the same pool can front Snowflake in
+production and a local stand-in in development and tests.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no connection becomes available within the acquire timeout."""
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time snapshot of pool usage."""
+    min_size: int
+    max_size: int
+    size: int
+    in_use: int
+    idle: int
+    waiting: int
+    peak_in_use: int
+    created_total: int
+    borrowed_total: int
+    recycled_total: int
+    failed_health_checks: int
+    timeouts: int
+    wait_seconds_total: float
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of the maximum pool size currently checked out (0.0 - 1.0)."""
+        return self.in_use / self.max_size if self.max_size else 0.0
+
+
+class _PooledConnection:
+    """A raw connection plus the bookkeeping needed to recycle it."""
+
+    __slots__ = ("raw", "created_at", "last_used_at")
+
+    def __init__(self, raw: Any):
+        now = time.monotonic()
+        self.raw = raw
+        self.created_at = now
+        self.last_used_at = now
+
+
+class ConnectionPool:
+    """
+    Bounded pool of reusable connections.
+
+    Connections are created on demand up to ``max_size``. Idle connections
+    beyond ``min_size`` are closed after ``max_idle_seconds``; every connection
+    is closed after ``max_lifetime_seconds`` regardless of use. A connection
+    that has been idle longer than ``health_check_interval`` is pinged before
+    it is handed out, and discarded if the ping fails.
+
+    ``warm`` opens the first ``min_size`` connections up front, and
+    ``start_maintenance`` prunes and re-warms the pool periodically, so
+    ``min_size`` connections stay open while traffic is quiet.
+    """
+
+    def __init__(
+        self,
+        connector: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 30.0,
+        max_idle_seconds: float = 600.0,
+        max_lifetime_seconds: float = 3600.0,
+        health_check_interval: float = 60.0,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if not 0 <= min_size <= max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+
+        self._connector = connector
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_idle_seconds = max_idle_seconds
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self.health_check_interval = health_check_interval
+
+        self._idle: deque[_PooledConnection] = deque()
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+        self._maintenance: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+        self._peak_in_use = 0
+        self._created_total = 0
+        self._borrowed_total = 0
+        self._recycled_total = 0
+        self._failed_health_checks = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    @contextmanager
+    def connection(self) -> Generator[Any, None, None]:
+        """Borrow a connection for the duration of the ``with`` block."""
+        pooled = self.acquire()
+        discard = False
+        try:
+            yield pooled.raw
+        except Exception:
+            discard = self._is_closed(pooled.raw)
+            raise
+        finally:
+            self.release(pooled, discard=discard)
+
+    def acquire(self) -> _PooledConnection:
+        """
+        Borrow a healthy connection, opening a new one if the pool has room.
+
+        Raises:
+            PoolExhaustedError: if the pool stays at ``max_size`` for longer
+                than ``acquire_timeout`` seconds
+        """
+        started = time.monotonic()
+        deadline = started + self.acquire_timeout
+
+        while True:
+            create = False
+            with self._cond:
+                self._check_open()
+                self._waiting += 1
+                try:
+                    while not self._idle and self._size >= self.max_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._timeouts += 1
+                            raise PoolExhaustedError(
+                                f"No connection available within {self.acquire_timeout}s "
+                                f"(max_size={self.max_size})"
+                            )
+                        self._cond.wait(remaining)
+                        self._check_open()
+                finally:
+                    self._waiting -= 1
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    # Reserve the slot now; the connect happens outside the lock.
+                    pooled = None
+                    self._size += 1
+                    create = True
+                self._mark_borrowed()
+
+            if create:
+                try:
+                    pooled = _PooledConnection(self._connector())
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._created_total += 1
+                    self._wait_seconds_total += time.monotonic() - started
+                return pooled
+
+            if self._is_usable(pooled):
+                with self._cond:
+                    self._wait_seconds_total += time.monotonic() - started
+                return pooled
+
+            # Stale or broken: drop it and try again.
+            self._discard(pooled, in_use=True)
+
+    def release(self, pooled: _PooledConnection, discard: bool = False) -> None:
+        """Return a borrowed connection to the pool (or close it if ``discard``)."""
+        if discard or self._closed or self._expired(pooled, time.monotonic()):
+            self._discard(pooled, in_use=True)
+            return
+
+        pooled.last_used_at = time.monotonic()
+        with self._cond:
+            self._in_use -= 1
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    def warm(self) -> None:
+        """Open connections until at least ``min_size`` are available."""
+        while True:
+            with self._cond:
+                self._check_open()
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                pooled = _PooledConnection(self._connector())
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                raise
+            with self._cond:
+                self._created_total += 1
+                self._idle.append(pooled)
+                self._cond.notify()
+
+    def prune(self) -> None:
+        """Close idle connections that have outlived their idle or lifetime limit."""
+        now = time.monotonic()
+        expired = []
+        with self._cond:
+            keep: deque[_PooledConnection] = deque()
+            # Oldest first, so the most recently used connections survive.
+            for pooled in self._idle:
+                over_min = self._size - len(expired) > self.min_size
+                idle_too_long = now - pooled.last_used_at > self.max_idle_seconds
+                if self._too_old(pooled, now) or (over_min and idle_too_long):
+                    expired.append(pooled)
+                else:
+                    keep.append(pooled)
+            self._idle = keep
+        for pooled in expired:
+            self._discard(pooled, in_use=False)
+
+    def start_maintenance(self, interval: float) -> None:
+        """
+        Prune and re-warm the pool every ``interval`` seconds on a daemon
+        thread, until the pool is closed. Calling it again is a no-op.
+        """
+        with self._cond:
+            self._check_open()
+            if self._maintenance is not None:
+                return
+            self._maintenance = threading.Thread(
+                target=self._maintain, args=(interval,), name="connection-pool-maintenance", daemon=True
+            )
+        self._maintenance.start()
+
+    def stats(self) -> PoolStats:
+        """Return a snapshot of pool size, usage and lifetime counters."""
+        with self._cond:
+            return PoolStats(
+                min_size=self.min_size,
+                max_size=self.max_size,
+                size=self._size,
+                in_use=self._in_use,
+                idle=len(self._idle),
+                waiting=self._waiting,
+                peak_in_use=self._peak_in_use,
+                created_total=self._created_total,
+                borrowed_total=self._borrowed_total,
+                recycled_total=self._recycled_total,
+                failed_health_checks=self._failed_health_checks,
+                timeouts=self._timeouts,
+                wait_seconds_total=self._wait_seconds_total,
+            )
+
+    def close(self) -> None:
+        """Close all idle connections and refuse further borrows."""
+        self._stopping.set()
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled, in_use=False)
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise PoolExhaustedError("Connection pool is closed")
+
+    def _mark_borrowed(self) -> None:
+        self._in_use += 1
+        self._borrowed_total += 1
+        self._peak_in_use = max(self._peak_in_use, self._in_use)
+
+    def _maintain(self, interval: float) -> None:
+        while not self._stopping.wait(interval):
+            try:
+                self.prune()
+                self.warm()
+            except PoolExhaustedError:
+                return
+            except Exception:
+                logger.warning("Connection pool maintenance failed", exc_info=True)
+
+    def _too_old(self, pooled: _PooledConnection, now: float) -> bool:
+        return now - pooled.created_at > self.max_lifetime_seconds
+
+    def _expired(self, pooled: _PooledConnection, now: float) -> bool:
+        if self._too_old(pooled, now):
+            return True
+        # The first min_size connections are kept however long they sit idle.
+        return self._size > self.min_size and now - pooled.last_used_at > self.max_idle_seconds
+
+    def _is_usable(self, pooled: _PooledConnection) -> bool:
+        now = time.monotonic()
+        if self._expired(pooled, now) or self._is_closed(pooled.raw):
+            return False
+        if now - pooled.last_used_at < self.health_check_interval:
+            return True
+        try:
+            cursor = pooled.raw.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            logger.warning("Discarding pooled connection that failed its health check", exc_info=True)
+            with self._cond:
+                self._failed_health_checks += 1
+            return False
+
+    @staticmethod
+    def _is_closed(raw: Any) -> bool:
+        is_closed = getattr(raw, "is_closed", None)
+        try:
+            return bool(is_closed()) if callable(is_closed) else False
+        except Exception:
+            return True
+
+    def _discard(self, pooled: _PooledConnection, in_use: bool) -> None:
+        try:
+            pooled.raw.close()
+        except Exception:
+            logger.debug("Error while closing pooled connection", exc_info=True)
+        with self._cond:
+            self._size -= 1
+            self._recycled_total += 1
+            if in_use:
+                self._in_use -= 1
+            self._cond.notify()
@@ -0,0 +1,105 @@
+"""
+Request-scoped batching of warehouse reads.
+
+A batch endpoint runs many services concurrently, and those services often
+issue the very same statement: overviews and trends that project the same
+shared scan (see ``app.core.shared_scan``), or two widgets backed by one
+repository. Inside ``query_batch()`` the first read of a key executes and
+every other read of it waits for and reuses that result. Unlike the query
+cache this holds with caching disabled or expired, and unlike single-flight
+it still applies once the first read has finished. Nothing outlives the
+block.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class QueryBatchStats:
+    """Reads requested inside a batch, and how many actually ran."""
+    requested: int
+    executed: int
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of reads answered by another read in the same batch."""
+        return 1 - self.executed / self.requested if self.requested else 0.0
+
+
+class _Read:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class QueryBatch:
+    """Runs each distinct read once and shares its outcome with every caller."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reads: dict[str, _Read] = {}
+        self._requested = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Return the batch's result for ``key``, running ``fn`` on first use."""
+        with self._lock:
+            self._requested += 1
+            read = self._reads.get(key)
+            leader = read is None
+            if leader:
+                read = self._reads[key] = _Read()
+
+        if not leader:
+            read.done.wait()
+            if read.error is not None:
+                raise read.error
+            return read.result
+
+        try:
+            read.result = fn()
+            return read.result
+        except BaseException as exc:
+            read.error = exc
+            raise
+        finally:
+            read.done.set()
+
+    def stats(self) -> QueryBatchStats:
+        with self._lock:
+            return QueryBatchStats(requested=self._requested, executed=len(self._reads))
+
+
+_current_batch: ContextVar[Optional[QueryBatch]] = ContextVar("query_batch", default=None)
+
+
+@contextmanager
+def query_batch(batch: Optional[QueryBatch] = None) -> Generator[QueryBatch, None, None]:
+    """
+    Share warehouse reads issued inside the block (and in tasks or executor
+    work started from it, which inherit the context).
+
+    Example:
+        with query_batch() as batch:
+            tasks = [asyncio.create_task(load()) for load in loaders]
+        await asyncio.gather(*tasks)
+        batch.stats()
+    """
+    batch = batch or QueryBatch()
+    token = _current_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _current_batch.reset(token)
+
+
+def get_query_batch() -> Optional[QueryBatch]:
+    """Return the batch the current read belongs to, if any."""
+    return _current_batch.get()
@@ -0,0 +1,320 @@
+"""
+Local analytics replica: Parquet snapshots of the marts served in-process.
+
+The marts only change when dbt runs, yet every dashboard read is a Snowflake
+query. ``snapshot_marts`` copies the API-facing marts (``REPLICA_TABLES``) to
+Parquet after a dbt run; ``LocalReplica`` exposes the latest snapshot through
+an embedded DuckDB under the same ``CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS``
+names, so repositories run unchanged and a read costs milliseconds and no
+warehouse credits.
+
+A query is served from the replica only when every table it reads is in the
+snapshot and has not changed in Snowflake since it was copied: the snapshot
+records each table's data-freshness generation, and a newer generation from
+``app.core.freshness`` means the copy is stale. Anything else - stale or
+missing tables, Snowflake-only functions such as ``HLL_ESTIMATE`` - goes to
+Snowflake as before.
+
+Snapshot layout (``REPLICA_PATH``):
+
+    CURRENT                      name of the published snapshot
+    20240601T060512Z/
+        manifest.json            {"tables": {"FCT_GA4_TRAFFIC": {"file", "rows", "generation"}}}
+        FCT_GA4_TRAFFIC.parquet
+
+Usage:
+    python scripts/snapshot_replica.py     # after `dbt run`
+    REPLICA_ENABLED=true uvicorn app.main:app
+"""
+import fnmatch
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from app.core.columnar import ColumnarResult
+from app.core.config import settings
+from app.core.duckdb_dialect import DATABASE, SCHEMA, fetch_arrow, fetch_rows, install_macros, to_duckdb
+from app.core.freshness import get_freshness_tracker, load_warehouse_watermarks, referenced_tables, to_generation
+from app.core.instrumentation import caller_name, record_query
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - optional dependency
+    duckdb = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+
+# Query shapes DuckDB failed on; bounded so ad-hoc SQL cannot grow it forever.
+_MAX_UNSUPPORTED = 1024
+
+
+@dataclass
+class Snapshot:
+    """A published snapshot opened in an in-memory DuckDB."""
+    name: str
+    tables: dict[str, dict[str, Any]]
+    connection: Any = field(repr=False)
+
+
+@dataclass
+class ReplicaStats:
+    """Counters of queries the replica served or passed to Snowflake."""
+    snapshot: Optional[str]
+    tables: int
+    served: int
+    fallbacks: int
+    stale_fallbacks: int
+    unsupported_queries: int
+
+
+class LocalReplica:
+    """
+    Serves queries from the latest Parquet snapshot under ``root``.
+
+    The published snapshot is re-checked at most every ``refresh_interval``
+    seconds, so a new snapshot is picked up without a restart; queries
+    already running keep the connection they started on.
+    """
+
+    def __init__(self, root: Path, refresh_interval: float = 30.0):
+        self.root = Path(root)
+        self.refresh_interval = refresh_interval
+        self._snapshot: Optional[Snapshot] = None
+        self._checked: Optional[float] = None
+        self._lock = threading.Lock()
+        self._unsupported: set[str] = set()
+        self.served = 0
+        self.fallbacks = 0
+        self.stale_fallbacks = 0
+
+    def fetch(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        columns: bool = False
+    ) -> Any:
+        """
+        Run ``query`` on the replica.
+
+        Args:
+            query: Snowflake SQL with ``%(name)s`` parameters
+            params: Query parameters
+            columns: Return a ColumnarResult instead of row dicts
+
+        Returns:
+            Rows (or columns) with upper-cased names as Snowflake returns
+            them, or None when the query must go to Snowflake
+        """
+        tables = referenced_tables(query)
+        if not tables:
+            # Metadata and other non-mart queries are not the replica's to serve.
+            return None
+        snapshot = self._current()
+        if snapshot is None or query in self._unsupported:
+            return self._fall_back()
+        if any(table not in snapshot.tables for table in tables):
+            return self._fall_back()
+        if self._stale(snapshot, tables):
+            self.stale_fallbacks += 1
+            return self._fall_back()
+
+        with record_query(f"replica:{caller_name()}") as record:
+            cursor = snapshot.connection.cursor()
+            try:
+                started = time.perf_counter()
+                cursor.execute(to_duckdb(query), params or None)
+                record.execute = time.perf_counter() - started
+                started = time.perf_counter()
+                result = ColumnarResult.from_arrow(fetch_arrow(cursor)) if columns else fetch_rows(cursor)
+                record.fetch = time.perf_counter() - started
+                record.rows = len(result)
+            except duckdb.Error as exc:
+                record.error = True
+                logger.info("Replica cannot run query from %s, using Snowflake: %s", record.name, exc)
+                if len(self._unsupported) < _MAX_UNSUPPORTED:
+                    self._unsupported.add(query)
+                return self._fall_back()
+            finally:
+                cursor.close()
+        self.served += 1
+        return result
+
+    def stats(self) -> ReplicaStats:
+        snapshot = self._snapshot
+        return ReplicaStats(
+            snapshot=snapshot.name if snapshot else None,
+            tables=len(snapshot.tables) if snapshot else 0,
+            served=self.served,
+            fallbacks=self.fallbacks,
+            stale_fallbacks=self.stale_fallbacks,
+            unsupported_queries=len(self._unsupported),
+        )
+
+    def _fall_back(self) -> None:
+        self.fallbacks += 1
+        return None
+
+    def _stale(self, snapshot: Snapshot, tables: Iterable[str]) -> bool:
+        """True if any table changed in Snowflake after it was copied."""
+        if not settings.FRESHNESS_TRACKING_ENABLED:
+            return False
+        current = get_freshness_tracker().generations(tables)
+        return any(current[table] > snapshot.tables[table]["generation"] for table in tables)
+
+    def _current(self) -> Optional[Snapshot]:
+        """The published snapshot, reopened when CURRENT has moved on."""
+        checked = self._checked
+        if checked is not None and time.monotonic() - checked < self.refresh_interval:
+            return self._snapshot
+        with self._lock:
+            if self._checked is not None and time.monotonic() - self._checked < self.refresh_interval:
+                return self._snapshot
+            self._checked = time.monotonic()
+            try:
+                name = (self.root / CURRENT_FILE).read_text().strip()
+            except FileNotFoundError:
+                return self._snapshot
+            if self._snapshot is None or self._snapshot.name != name:
+                try:
+                    self._snapshot = _open_snapshot(self.root / name)
+                    self._unsupported.clear()
+                    logger.info("Serving replica snapshot %s (%d tables)", name, len(self._snapshot.tables))
+                except Exception:
+                    logger.warning("Could not open replica snapshot %s", name, exc_info=True)
+            return self._snapshot
+
+
+def _open_snapshot(directory: Path) -> Snapshot:
+    manifest = json.loads((directory / MANIFEST_FILE).read_text())
+    connection = duckdb.connect()
+    connection.execute(f"ATTACH ':memory:' AS {DATABASE}")
+    connection.execute(f"CREATE SCHEMA {DATABASE}.{SCHEMA}")
+    install_macros(connection)
+    for table, entry in manifest["tables"].items():
+        path = str(directory / entry["file"]).replace("'", "''")
+        connection.execute(f"CREATE VIEW {DATABASE}.{SCHEMA}.{table} AS SELECT * FROM read_parquet('{path}')")
+    return Snapshot(name=directory.name, tables=manifest["tables"], connection=connection)
+
+
+def snapshot_marts(
+    root: Optional[Path] = None,
+    patterns: Optional[Iterable[str]] = None,
+    keep: Optional[int] = None
+) -> Path:
+    """
+    Copy the API-facing marts from Snowflake to a new Parquet snapshot and publish it.
+
+    Each table's watermark is read before it is copied, so a table dbt
+    rewrites during the copy is recorded with an older generation and
+    treated as stale until the next snapshot.
+
+    Args:
+        root: Snapshot directory; defaults to REPLICA_PATH
+        patterns: Table name globs to copy; defaults to REPLICA_TABLES
+        keep: Snapshots to retain, including the new one; defaults to
+            REPLICA_KEEP_SNAPSHOTS (older ones may still be open in a worker)
+
+    Returns:
+        Directory of the published snapshot
+    """
+    # Imported here: database imports this module to serve reads.
+    from app.core.database import get_db_cursor
+
+    if pq is None:
+        raise RuntimeError("pyarrow is required to write replica snapshots")
+    root = Path(root or settings.REPLICA_PATH)
+    patterns = tuple(patterns or settings.REPLICA_TABLES)
+    keep = keep if keep is not None else settings.REPLICA_KEEP_SNAPSHOTS
+
+    watermarks = {
+        table: watermark
+        for table, watermark in load_warehouse_watermarks().items()
+        if any(fnmatch.fnmatchcase(table, pattern) for pattern in patterns)
+    }
+    name = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    directory = root / name
+    directory.mkdir(parents=True)
+
+    tables: dict[str, dict[str, Any]] = {}
+    for table, watermark in sorted(watermarks.items()):
+        file_name = f"{table}.parquet"
+        with get_db_cursor() as cursor:
+            cursor.execute(f"SELECT * FROM {DATABASE}.{SCHEMA}.{table}")
+            rows = _write_parquet(cursor, directory / file_name)
+        if rows is None:
+            # No Arrow schema for an empty result; leave the table to Snowflake.
+            logger.info("Skipping empty table %s", table)
+            continue
+        tables[table] = {"file": file_name, "rows": rows, "generation": to_generation(watermark)}
+        logger.info("Snapshotted %s (%d rows)", table, rows)
+
+    (directory / MANIFEST_FILE).write_text(json.dumps({"created_at": name, "tables": tables}, indent=2))
+    pointer = root / f"{CURRENT_FILE}.tmp"
+    pointer.write_text(name)
+    os.replace(pointer, root / CURRENT_FILE)
+
+    snapshots = sorted(path for path in root.iterdir() if path.is_dir())
+    for old in snapshots[:-keep] if keep > 0 else []:
+        shutil.rmtree(old, ignore_errors=True)
+    return directory
+
+
+def _write_parquet(cursor: Any, path: Path) -> Optional[int]:
+    """Stream the cursor's Arrow batches into one Parquet file; None if there were none."""
+    writer = None
+    rows = 0
+    try:
+        for batch in cursor.fetch_arrow_batches():
+            if writer is None:
+                writer = pq.ParquetWriter(str(path), batch.schema)
+            writer.write(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows if writer is not None else None
+
+
+_replica: Optional[LocalReplica] = None
+_replica_lock = threading.RLock()
+
+
+def configure_replica(
+    root: Optional[Path] = None,
+    refresh_interval: Optional[float] = None
+) -> LocalReplica:
+    """(Re)create the shared replica, optionally over a different snapshot directory."""
+    global _replica
+
+    with _replica_lock:
+        _replica = LocalReplica(
+            Path(root or settings.REPLICA_PATH),
+            refresh_interval if refresh_interval is not None else settings.REPLICA_REFRESH_SECONDS,
+        )
+        return _replica
+
+
+def get_replica() -> Optional[LocalReplica]:
+    """Return the shared replica, or None when disabled or DuckDB is not installed."""
+    if not settings.REPLICA_ENABLED or duckdb is None:
+        return None
+    if _replica is None:
+        with _replica_lock:
+            if _replica is None:
+                return configure_replica()
+    return _replica
@@ -0,0 +1,118 @@
+"""
+Routing of campaign-performance queries to pre-aggregated rollups.
+
+``FCT_CAMPAIGN_PERFORMANCE`` is stored at date x campaign x device x ad
+network grain, but most endpoints only need totals per day, platform or
+month. dbt maintains three rollups of it (``dbt/models/marts/aggregates``),
+each keeping the fact's column names:
+
+- ``AGG_MONTHLY_PERFORMANCE``: month x platform (``DATE_DAY`` = month start)
+- ``AGG_DAILY_PERFORMANCE``: day x platform
+- ``AGG_DAILY_CAMPAIGN_PERFORMANCE``: day x platform x campaign
+
+``campaign_performance_source`` returns the coarsest of them that has every
+column a query reads, so a repository swaps only its FROM clause.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+from app.core.config import settings
+
+_SCHEMA = "CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS"
+
+CAMPAIGN_PERFORMANCE_FACT = f"{_SCHEMA}.FCT_CAMPAIGN_PERFORMANCE"
+
+_MEASURES = frozenset({
+    "IMPRESSIONS", "CLICKS", "SPEND", "CONVERSIONS", "CONVERSION_VALUE", "VIEW_THROUGH_CONVERSIONS",
+})
+
+
+@dataclass(frozen=True)
+class Rollup:
+    """A pre-aggregated copy of a fact table at a coarser grain."""
+    table: str
+    columns: frozenset[str]
+    monthly: bool = False
+
+    def can_answer(
+        self,
+        columns: frozenset[str],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        needs_days: bool
+    ) -> bool:
+        if not columns <= self.columns:
+            return False
+        if self.monthly:
+            # Monthly rows cannot be cut mid-month, or counted per day.
+            return not needs_days and _month_aligned(date_from, date_to)
+        return True
+
+
+# Coarsest first
+CAMPAIGN_PERFORMANCE_ROLLUPS: tuple[Rollup, ...] = (
+    Rollup(
+        table=f"{_SCHEMA}.AGG_MONTHLY_PERFORMANCE",
+        columns=_MEASURES | {"DATE_DAY", "DATE_MONTH", "PLATFORM", "ACTIVE_DAYS", "MONTH_ACTIVE_DAYS"},
+        monthly=True,
+    ),
+    Rollup(
+        table=f"{_SCHEMA}.AGG_DAILY_PERFORMANCE",
+        columns=_MEASURES | {"DATE_DAY", "PLATFORM", "ACTIVE_CAMPAIGNS"},
+    ),
+    Rollup(
+        table=f"{_SCHEMA}.AGG_DAILY_CAMPAIGN_PERFORMANCE",
+        columns=_MEASURES | {
+            "DATE_DAY", "PLATFORM", "ACCOUNT_ID", "CAMPAIGN_ID", "CAMPAIGN_NAME", "STATUS", "CAMPAIGN_TYPE",
+        },
+    ),
+)
+
+
+def _month_aligned(date_from: Optional[date], date_to: Optional[date]) -> bool:
+    """True if the range starts on a month's first day and ends on a month's last day."""
+    if date_from and date_from.day != 1:
+        return False
+    if date_to and (date_to + timedelta(days=1)).day != 1:
+        return False
+    return True
+
+
+def campaign_performance_source(
+    columns: Iterable[str],
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    needs_days: bool = True
+) -> str:
+    """
+    Pick the coarsest table that can answer a campaign-performance query.
+
+    Args:
+        columns: Columns the query reads (DATE_DAY is implied)
+        date_from: Optional start date of the query's window
+        date_to: Optional end date of the query's window
+        needs_days: False if the query only uses dates at month grain
+            (``DATE_TRUNC('MONTH', DATE_DAY)``, month labels), which lets a
+            month-aligned window read the monthly rollup
+
+    Returns:
+        Fully qualified table name; the fact table if no rollup qualifies
+        or rollup routing is disabled
+
+    Example:
+        source = campaign_performance_source({"PLATFORM", "SPEND"}, date_from, date_to)
+        query = f"SELECT PLATFORM, SUM(SPEND) AS SPEND FROM {source} f ..."
+    """
+    if not settings.ROLLUP_ROUTING_ENABLED:
+        return CAMPAIGN_PERFORMANCE_FACT
+    wanted = frozenset(column.upper() for column in columns) | {"DATE_DAY"}
+    for rollup in CAMPAIGN_PERFORMANCE_ROLLUPS:
+        if rollup.can_answer(wanted, date_from, date_to, needs_days):
+            return rollup.table
+    return CAMPAIGN_PERFORMANCE_FACT
+
+
+def is_monthly_rollup(table: str) -> bool:
+    """True if ``table`` is a rollup with one row per month (and platform)."""
+    return any(rollup.monthly and rollup.table == table for rollup in CAMPAIGN_PERFORMANCE_ROLLUPS)
@@ -0,0 +1,225 @@
+"""
+Metric registry: one definition per marketing metric.
+
+Metrics come in two kinds:
+
+- ``Measure``: an additive aggregate of a fact column (impressions, clicks,
+  spend, ...). Measures can be summed across days, campaigns or cache cells.
+- ``Ratio``: a derived metric computed from two measures (CTR, CPC, ROAS,
+  CPM, conversion rate, ...). Ratios are never summed; they are recomputed
+  from the summed measures.
+
+Each definition renders both to SQL and to Python, with the same canonical
+rounding, so an endpoint that asks the warehouse for CTR and one that rolls
+CTR up from cached measures produce identical numbers.
+
+``MetricQuery`` compiles N metrics by M dimensions into one grouped query,
+selecting each underlying measure once:
+
+    query = MetricQuery(
+        source="CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f",
+        metrics=("IMPRESSIONS", "CLICKS", "CTR", "CPC"),
+        dimensions=(("k.KEYWORD_TEXT", "KEYWORD"),),
+        where=("f.PLATFORM = 'google_ads'",),
+        order_by="IMPRESSIONS DESC",
+    ).sql()
+"""
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Iterable, Mapping, Optional, Union
+
+
+@dataclass(frozen=True)
+class Measure:
+    """
+    Additive aggregate of a fact-table column.
+
+    ``month_column`` names the monthly rollup's per-month value of a measure
+    that cannot be summed from its platform rows (a distinct count); it is
+    read by queries grouped by month (see ``month_sql``).
+    """
+    name: str
+    column: str
+    aggregate: str = "SUM"
+    digits: Optional[int] = None
+    month_column: Optional[str] = None
+
+    @property
+    def dependencies(self) -> tuple["Measure", ...]:
+        return (self,)
+
+    def raw_sql(self, alias: str = "f") -> str:
+        """Unrounded aggregate, as used inside ratios."""
+        if self.aggregate == "COUNT_DISTINCT":
+            return f"COUNT(DISTINCT {alias}.{self.column})"
+        return f"{self.aggregate}({alias}.{self.column})"
+
+    def month_sql(self, alias: str = "f") -> str:
+        """Unrounded aggregate over the monthly rollup, in a query grouped by month."""
+        if self.month_column is None:
+            return self.raw_sql(alias)
+        # Repeated on every platform row of the month
+        return f"MAX({alias}.{self.month_column})"
+
+    def sql(self, alias: str = "f") -> str:
+        expression = self.raw_sql(alias)
+        return expression if self.digits is None else f"ROUND({expression}, {self.digits})"
+
+    def compute(self, values: Mapping[str, Any]) -> Optional[float]:
+        """Read the summed measure from ``values`` and apply canonical rounding."""
+        value = values.get(self.name)
+        if value is None:
+            return None
+        return float(value) if self.digits is None else sql_round(value, self.digits)
+
+
+@dataclass(frozen=True)
+class Ratio:
+    """Derived metric: ``numerator * scale / denominator``."""
+    name: str
+    numerator: Measure
+    denominator: Measure
+    scale: float = 1.0
+    digits: int = 2
+
+    @property
+    def dependencies(self) -> tuple[Measure, ...]:
+        return (self.numerator, self.denominator)
+
+    def sql(self, alias: str = "f") -> str:
+        numerator = self.numerator.raw_sql(alias)
+        if self.scale != 1.0:
+            numerator = f"{numerator} * {self.scale!r}"
+        return f"ROUND({numerator} / NULLIF({self.denominator.raw_sql(alias)}, 0), {self.digits})"
+
+    def compute(self, values: Mapping[str, Any]) -> Optional[float]:
+        """Recompute from summed measures; None (SQL NULL) when dividing by zero."""
+        numerator = values.get(self.numerator.name)
+        denominator = values.get(self.denominator.name)
+        return sql_round(ratio(float(numerator or 0), float(denominator or 0), self.scale), self.digits)
+
+
+Metric = Union[Measure, Ratio]
+
+IMPRESSIONS = Measure("IMPRESSIONS", "IMPRESSIONS")
+CLICKS = Measure("CLICKS", "CLICKS")
+SPEND = Measure("SPEND", "SPEND", digits=2)
+REVENUE = Measure("REVENUE", "CONVERSION_VALUE", digits=2)
+CONVERSIONS = Measure("CONVERSIONS", "CONVERSIONS")
+ACTIVE_DAYS = Measure("ACTIVE_DAYS", "DATE_DAY", aggregate="COUNT_DISTINCT", month_column="MONTH_ACTIVE_DAYS")
+
+CTR = Ratio("CTR", CLICKS, IMPRESSIONS, scale=100.0)
+CPC = Ratio("CPC", SPEND, CLICKS)
+CPM = Ratio("CPM", SPEND, IMPRESSIONS, scale=1000.0)
+ROAS = Ratio("ROAS", REVENUE, SPEND)
+CONV_RATE = Ratio("CONV_RATE", CONVERSIONS, CLICKS, scale=100.0)
+COST_PER_CONVERSION = Ratio("COST_PER_CONVERSION", SPEND, CONVERSIONS)
+AVG_DAILY_SPEND = Ratio("AVG_DAILY_SPEND", SPEND, ACTIVE_DAYS)
+
+METRICS: dict[str, Metric] = {
+    metric.name: metric
+    for metric in (
+        IMPRESSIONS, CLICKS, SPEND, REVENUE, CONVERSIONS, ACTIVE_DAYS,
+        CTR, CPC, CPM, ROAS, CONV_RATE, COST_PER_CONVERSION, AVG_DAILY_SPEND,
+    )
+}
+
+
+def get_metric(name: str) -> Metric:
+    """Look up a registered metric by name."""
+    try:
+        return METRICS[name]
+    except KeyError:
+        raise ValueError(f"Unknown metric: {name}") from None
+
+
+def base_measures(metrics: Iterable[str]) -> tuple[Measure, ...]:
+    """The distinct measures needed to compute ``metrics``, in first-use order."""
+    measures: dict[str, Measure] = {}
+    for name in metrics:
+        for measure in get_metric(name).dependencies:
+            measures.setdefault(measure.name, measure)
+    return tuple(measures.values())
+
+
+def derive(
+    values: Mapping[str, Any],
+    metrics: Iterable[str],
+    aliases: Optional[Mapping[str, str]] = None
+) -> dict[str, Optional[float]]:
+    """
+    Compute ``metrics`` from a row of summed (unrounded) measures.
+
+    Example:
+        totals = {"CLICKS": 120, "IMPRESSIONS": 4000, "SPEND": 310.5}
+        derive(totals, ("CTR", "CPC"))  # {"CTR": 3.0, "CPC": 2.59}
+    """
+    aliases = aliases or {}
+    return {aliases.get(name, name): get_metric(name).compute(values) for name in metrics}
+
+
+@dataclass(frozen=True)
+class MetricQuery:
+    """
+    Grouped query for a set of registered metrics.
+
+    Attributes:
+        source: FROM clause, including joins; the fact table is aliased ``f``
+        metrics: Metric names to select, in output order
+        dimensions: (expression, alias) pairs to select and group by
+        where: Conditions, joined with AND (may contain bind parameters)
+        order_by: Optional ORDER BY clause body
+        limit: Optional LIMIT clause body, e.g. ``"%(limit)s"``
+        aliases: Optional output alias per metric name, e.g. {"CONV_RATE": "CVR"}
+        rounded: Set to False to select measures unrounded, for results that
+            are summed further (ratios cannot be selected then)
+    """
+    source: str
+    metrics: tuple[str, ...]
+    dimensions: tuple[tuple[str, str], ...] = ()
+    where: tuple[str, ...] = ()
+    order_by: Optional[str] = None
+    limit: Optional[str] = None
+    aliases: Optional[Mapping[str, str]] = None
+    rounded: bool = True
+
+    def sql(self) -> str:
+        aliases = self.aliases or {}
+        select = [f"{expression} AS {alias}" for expression, alias in self.dimensions]
+        select += [f"{self._metric_sql(name)} AS {aliases.get(name, name)}" for name in self.metrics]
+        clauses = [
+            "SELECT\n                " + ",\n                ".join(select),
+            f"FROM {self.source.strip()}",
+        ]
+        if self.where:
+            clauses.append("WHERE " + "\n                AND ".join(self.where))
+        if self.dimensions:
+            clauses.append("GROUP BY " + ", ".join(expression for expression, _ in self.dimensions))
+        if self.order_by:
+            clauses.append(f"ORDER BY {self.order_by}")
+        if self.limit:
+            clauses.append(f"LIMIT {self.limit}")
+        return "\n            ".join(clauses)
+
+    def _metric_sql(self, name: str) -> str:
+        metric = get_metric(name)
+        if self.rounded:
+            return metric.sql()
+        if not isinstance(metric, Measure):
+            raise ValueError(f"{name} is a ratio; only measures can be selected unrounded")
+        return metric.raw_sql()
+
+
+def ratio(numerator: float, denominator: float, scale: float = 1.0) -> Optional[float]:
+    """``numerator * scale / denominator``, or None (SQL NULL) when dividing by zero."""
+    if not denominator:
+        return None
+    return numerator * scale / denominator
+
+
+def sql_round(value: Optional[float], digits: int = 0) -> Optional[float]:
+    """Round like Snowflake's ROUND (half away from zero), not banker's rounding."""
+    if value is None:
+        return None
+    exponent = Decimal(1).scaleb(-digits)
+    return float(Decimal(str(value)).quantize(exponent, rounding=ROUND_HALF_UP))
@@ -0,0 +1,98 @@
+"""
+Fast response path for trusted warehouse rows.
+
+Services coerce every column of every row with ``int()``/``float()``/``str()``
+and then construct a Pydantic model per row, which validates the same values
+again. FastAPI then validates the returned model against the route's
+``response_model``, converts it to plain Python objects and encodes those
+with the stdlib ``json`` module. For lists of thousands of keywords or
+creatives that Python work costs more than the query.
+
+Values a service has already coerced to the field types can be trusted:
+
+- ``construct(Model, **values)`` builds a model without running validation
+  (what ``model_construct`` does, without its per-field default handling)
+- ``fast_response(result)`` returns a ``FastJSONResponse``, encoded in one
+  call to pydantic-core's Rust serializer. Endpoints that return a
+  ``Response`` skip FastAPI's response-model validation and encoding; the
+  ``response_model`` still documents the schema. Encoding then happens in
+  the endpoint, so Server-Timing reports it under ``mapping``.
+
+``python -m benchmarks.serialization`` reports the per-row cost of both
+stages before and after. FAST_JSON_ENABLED=false restores the validated path.
+"""
+import functools
+from typing import Any, TypeVar
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.core.config import settings
+
+M = TypeVar("M", bound=BaseModel)
+
+_set = object.__setattr__
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded by pydantic-core (models, dates and decimals included)."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return to_json(content)
+
+
+def fast_response(content: Any) -> Any:
+    """
+    Wrap an endpoint's result in a FastJSONResponse.
+
+    Returned unchanged when FAST_JSON_ENABLED is off, so FastAPI validates and
+    encodes it as usual.
+
+    Example:
+        return fast_response(await run_in_executor(
+            keywords_service.get_keywords_performance,
+            date_from=date_from,
+            date_to=date_to
+        ))
+    """
+    if not settings.FAST_JSON_ENABLED:
+        return content
+    return FastJSONResponse(content)
+
+
+def construct(model: type[M], **values: Any) -> M:
+    """
+    Build ``model`` from values already coerced to its field types.
+
+    Nothing is validated, so only pass values of the declared types: ``str``,
+    ``int`` and ``float`` for scalar fields, ``None`` only where the field is
+    Optional, and models built the same way for nested fields. Models with
+    private attributes or extra fields, or calls that leave fields to their
+    defaults, go through ``model_construct``. With FAST_JSON_ENABLED off the
+    model is validated as usual.
+
+    Example:
+        construct(DeviceItem, device_category=str(row.get("DEVICE_CATEGORY") or "unknown"), users=...)
+    """
+    if not settings.FAST_JSON_ENABLED:
+        return model(**values)
+    if len(values) != _field_count(model):
+        return model.model_construct(**values)
+
+    instance = model.__new__(model)
+    _set(instance, "__dict__", values)
+    _set(instance, "__pydantic_fields_set__", set(values))
+    _set(instance, "__pydantic_extra__", None)
+    _set(instance, "__pydantic_private__", None)
+    return instance
+
+
+@functools.lru_cache(maxsize=None)
+def _field_count(model: type[BaseModel]) -> int:
+    """Number of fields ``construct`` must be given, or -1 to always use model_construct."""
+    if model.__private_attributes__ or model.model_config.get("extra") == "allow":
+        return -1
+    return len(model.model_fields)
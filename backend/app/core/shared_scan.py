@@ -0,0 +1,159 @@
+"""
+Shared scans: one warehouse query serving several compatible aggregations.
+
+Several endpoints aggregate the same fact table at the same grain over the
+same date window and differ only in which measures they select - e.g. the
+monthly revenue-vs-spend, conversions and spend trends all run
+``GROUP BY DATE_TRUNC('MONTH', DATE_DAY)`` over ``FCT_CAMPAIGN_PERFORMANCE``.
+A ``SharedScan`` declares that aggregation once with the superset of their
+measures. Every repository then issues the byte-identical query for a given
+window and projects out the columns it needs, so the query cache and
+single-flight collapse a dashboard's worth of requests into one scan.
+
+Measures must be additive across groups (sums, or distinct counts of a key
+that never spans two groups), so ungrouped totals - the overviews - can be
+rolled up from the same rows.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Optional
+
+from app.core.database import execute_query
+from app.core.rollups import CAMPAIGN_PERFORMANCE_FACT, campaign_performance_source, is_monthly_rollup
+from app.core.semantic import ACTIVE_DAYS, CLICKS, CONVERSIONS, IMPRESSIONS, REVENUE, SPEND, Measure
+
+
+@dataclass(frozen=True)
+class SharedScan:
+    """
+    Grouped aggregation of one table, shared by every repository that reads it.
+
+    Attributes:
+        table: Fully qualified table name (aliased ``f`` in the query)
+        group_by: SQL expression rows are grouped (and ordered) by
+        key: Select expression for the group label, including its alias
+        measures: Registered additive measures, selected unrounded
+        date_column: Column the date window filters on
+        router: Optional rollup router (see ``app.core.rollups``) that may
+            substitute a pre-aggregated copy of ``table`` per date window
+        monthly: True if ``group_by`` is the calendar month, so month-aligned
+            windows may read a monthly rollup
+    """
+    table: str
+    group_by: str
+    key: str
+    measures: tuple[Measure, ...]
+    date_column: str = "f.DATE_DAY"
+    router: Optional[Callable[..., str]] = None
+    monthly: bool = False
+
+    @property
+    def measure_names(self) -> tuple[str, ...]:
+        return tuple(measure.name for measure in self.measures)
+
+    def build_query(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the shared query for a date window; identical for every caller."""
+        date_conditions = []
+        params = {}
+
+        if date_from:
+            date_conditions.append(f"{self.date_column} >= %(date_from)s")
+            params["date_from"] = date_from.isoformat()
+
+        if date_to:
+            date_conditions.append(f"{self.date_column} <= %(date_to)s")
+            params["date_to"] = date_to.isoformat()
+
+        date_filter = ""
+        if date_conditions:
+            date_filter = "WHERE " + " AND ".join(date_conditions)
+
+        table = self.table
+        if self.router is not None:
+            table = self.router(
+                {measure.column for measure in self.measures},
+                date_from,
+                date_to,
+                needs_days=not self.monthly
+            )
+
+        if is_monthly_rollup(table):
+            sql = [measure.month_sql() for measure in self.measures]
+        else:
+            sql = [measure.raw_sql() for measure in self.measures]
+        measures = ",\n                ".join(
+            f"{expression} AS {measure.name}" for expression, measure in zip(sql, self.measures)
+        )
+        query = f"""
+            SELECT
+                {self.key},
+                {measures}
+            FROM {table} f
+            {date_filter}
+            GROUP BY {self.group_by}
+            ORDER BY {self.group_by}
+        """
+        return query, params
+
+    def rows(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        measures: tuple[str, ...] = ()
+    ) -> list[dict]:
+        """
+        Fetch grouped rows, keeping the group label and the requested measures.
+
+        Args:
+            date_from: Optional start date
+            date_to: Optional end date
+            measures: Measure aliases to keep; all measures when empty
+
+        Returns:
+            One dictionary per group, in group order
+        """
+        wanted = self._check(measures)
+        query, params = self.build_query(date_from, date_to)
+        results = execute_query(query, params if params else None) or []
+        return [
+            {name: value for name, value in row.items() if name not in self.measure_names or name in wanted}
+            for row in results
+        ]
+
+    def totals(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> dict[str, float]:
+        """
+        Roll every measure up across all groups of the window (unrounded;
+        derive ratios from these with ``app.core.semantic.derive``).
+        """
+        results = self.rows(date_from, date_to)
+        return {
+            name: sum(float(row.get(name) or 0) for row in results)
+            for name in self.measure_names
+        }
+
+    def _check(self, measures: tuple[str, ...]) -> tuple[str, ...]:
+        unknown = set(measures) - set(self.measure_names)
+        if unknown:
+            raise ValueError(f"Unknown measures for shared scan of {self.table}: {sorted(unknown)}")
+        return measures or self.measure_names
+
+
+# Monthly campaign performance across all platforms: revenue vs spend,
+# conversions trend, monthly spend trend and the core / spend overviews.
+campaign_performance_monthly = SharedScan(
+    table=CAMPAIGN_PERFORMANCE_FACT,
+    group_by="DATE_TRUNC('MONTH', f.DATE_DAY)",
+    key="TO_CHAR(DATE_TRUNC('MONTH', f.DATE_DAY), 'Mon YYYY') AS MONTH",
+    # Days never span months, so per-month ACTIVE_DAYS add up too.
+    measures=(REVENUE, SPEND, CONVERSIONS, CLICKS, IMPRESSIONS, ACTIVE_DAYS),
+    router=campaign_performance_source,
+    monthly=True,
+)
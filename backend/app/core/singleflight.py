@@ -0,0 +1,94 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+When several threads ask for the same key at the same time, only the first
+(the leader) runs the work; the others block until it finishes and receive
+the same result or exception. Nothing is remembered once the call completes,
+so this complements the query cache rather than replacing it.
+"""
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Counters for coalesced calls."""
+    executions: int
+    coalesced: int
+    in_flight: int
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of calls that were answered by another caller's execution."""
+        calls = self.executions + self.coalesced
+        return self.coalesced / calls if calls else 0.0
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` unless a call for ``key`` is already in flight, in which
+        case wait for that call and return its outcome.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            logger.debug("Coalesced onto in-flight call %s", key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                self._executions += 1
+            call.done.set()
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                executions=self._executions,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls),
+            )
+
+
+# Shared instance used by execute_query
+query_single_flight = SingleFlight()
@@ -0,0 +1,17 @@
+"""
+Approximate distinct counts from HyperLogLog sketches.
+
+Some marts store one ``HLL_ACCUMULATE`` state per day (for example
+``AGG_SEGMENT_DAILY_SKETCHES``). Endpoints that accept ``approx=true`` merge
+the states of a date range with ``HLL_COMBINE`` and count them with
+``HLL_ESTIMATE``, instead of counting distinct IDs exactly. Responses report
+``HLL_ERROR_PCT`` as the error bound of such counts.
+"""
+
+# Average relative error of Snowflake's HyperLogLog estimates, in percent
+HLL_ERROR_PCT = 1.62
+
+
+def hll_estimate_sql(sketch_column: str) -> str:
+    """Aggregate expression estimating distinct values across sketch rows."""
+    return f"HLL_ESTIMATE(HLL_COMBINE({sketch_column}))"
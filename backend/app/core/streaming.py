@@ -0,0 +1,20 @@
+"""
+Helpers for streaming large responses.
+"""
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_lines(batches: Iterable[list[BaseModel]]) -> Iterator[bytes]:
+    """
+    Encode batches of models as newline-delimited JSON.
+
+    One chunk is emitted per batch, so the client starts receiving data as soon
+    as the first batch is mapped while the server holds only that batch.
+    """
+    for batch in batches:
+        if batch:
+            yield b"".join(item.model_dump_json().encode("utf-8") + b"\n" for item in batch)
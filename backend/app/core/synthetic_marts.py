@@ -0,0 +1,1112 @@
+"""
+Synthetic marts for the offline warehouse (``app.core.local_warehouse``).
+
+``generate_marts`` writes every ``PUBLIC_ANALYTICS`` table the repositories
+read into a DuckDB file, with the dbt models' column names and plausible
+values: Google Ads campaigns, ad groups, keywords and ads; Meta campaigns,
+ad sets, ads and creatives; GA4 traffic, pages, geography, devices and
+events; Magento orders and Klaviyo customers with the cohort and segment
+aggregates; and the campaign-performance rollups used by rollup routing.
+
+All values are derived from hashes of (seed, key), so a given scale, seed and
+end date always produce the same data. Generation runs inside DuckDB and
+takes seconds for ``small`` and minutes for ``large``.
+
+Example:
+    generate_marts("backend/local/marts.duckdb", SCALES["medium"])
+"""
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from app.core.duckdb_dialect import DATABASE, SCHEMA
+from app.core.local_warehouse import METADATA_SCHEMA
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - optional dependency
+    duckdb = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Scale:
+    """
+    Size of the generated marts.
+
+    Attributes:
+        days: Days of history, ending on the end date
+        campaigns: Campaigns, alternating Google Ads and Meta
+        ad_groups: Ad groups (Google) or ad sets (Meta) per campaign
+        keywords: Keywords per Google ad group
+        ads: Ads per ad group / ad set
+        customers: Klaviyo profiles, each with one to six Magento orders
+        pages: Distinct GA4 page paths
+        items: Distinct GA4 ecommerce items
+        hourly_days: Most recent days with hourly campaign rows
+    """
+    days: int
+    campaigns: int
+    ad_groups: int
+    keywords: int
+    ads: int
+    customers: int
+    pages: int
+    items: int
+    hourly_days: int = 90
+
+
+SCALES: dict[str, Scale] = {
+    "tiny": Scale(days=60, campaigns=6, ad_groups=2, keywords=5, ads=2, customers=500, pages=20, items=10),
+    "small": Scale(days=365, campaigns=40, ad_groups=4, keywords=15, ads=2, customers=5_000, pages=100, items=50),
+    # ~6.5M keyword-days
+    "medium": Scale(days=730, campaigns=300, ad_groups=6, keywords=20, ads=3, customers=50_000, pages=1_000, items=300),
+    # ~55M keyword-days, 3 years of GA4
+    "large": Scale(days=1095, campaigns=2_000, ad_groups=5, keywords=10, ads=2, customers=500_000, pages=5_000, items=2_000),
+}
+
+DEFAULT_END_DATE = date(2024, 12, 31)
+
+GA4_PROPERTY = "properties/312345678"
+GOOGLE_ADS_ACCOUNT = "1234567890"
+META_ACCOUNT = "act_987654321"
+
+# Helpers defined on the generating connection. rnd(...) is uniform in [0, 1).
+_MACROS = (
+    "CREATE MACRO rnd(a, b) AS (hash(getvariable('seed'), a, b) % 1000003)::DOUBLE / 1000003",
+    "CREATE MACRO pick(options, a, b) AS options[1 + (hash(getvariable('seed'), a, b) % len(options))::INT]",
+    "CREATE MACRO sk(a, b, c) AS md5(concat_ws('|', a, b, c))",
+    # Weekly and yearly seasonality around 1.0
+    "CREATE MACRO season(d) AS (1 + 0.25 * sin(2 * pi() * dayofyear(d) / 365.0)) * (CASE WHEN dayofweek(d) IN (0, 6) THEN 0.8 ELSE 1.05 END)",
+    "CREATE MACRO money(x) AS round(x, 2)::DECIMAL(18, 2)",
+)
+
+# Key dimension tables, built first; facts join them.
+_DIMENSIONS = """
+CREATE TEMP TABLE days AS
+SELECT (getvariable('end_date')::DATE - i::INT) AS date_day, i AS day_index
+FROM range(getvariable('days')) t(i);
+
+CREATE TEMP TABLE campaigns AS
+SELECT
+    i AS n,
+    CASE WHEN i % 2 = 0 THEN 'google_ads' ELSE 'meta' END AS platform,
+    CASE WHEN i % 2 = 0 THEN '{google_account}' ELSE '{meta_account}' END AS account_id,
+    (20000000 + i)::VARCHAR AS campaign_id,
+    CASE WHEN i % 2 = 0
+        THEN pick(['SEARCH', 'SEARCH', 'PERFORMANCE_MAX', 'SHOPPING', 'DISPLAY', 'VIDEO'], i, 'type')
+        ELSE pick(['OUTCOME_SALES', 'OUTCOME_TRAFFIC', 'OUTCOME_AWARENESS', 'OUTCOME_ENGAGEMENT'], i, 'type')
+    END AS campaign_type,
+    CASE WHEN rnd(i, 'status') < 0.8
+        THEN CASE WHEN i % 2 = 0 THEN 'ENABLED' ELSE 'ACTIVE' END
+        ELSE 'PAUSED'
+    END AS status,
+    0.2 + 1.8 * rnd(i, 'weight') AS weight
+FROM range(getvariable('campaigns')) t(i);
+
+CREATE TEMP TABLE ad_groups AS
+SELECT
+    c.*,
+    c.campaign_id || lpad(g::VARCHAR, 3, '0') AS ad_group_id,
+    c.weight * (0.3 + rnd(c.campaign_id, g)) / getvariable('ad_groups') AS group_weight,
+    g
+FROM campaigns c, range(getvariable('ad_groups')) t(g);
+
+CREATE TEMP TABLE keywords AS
+SELECT
+    a.ad_group_id,
+    a.campaign_id,
+    a.ad_group_id || lpad(k::VARCHAR, 3, '0') AS keyword_id,
+    pick(['heirloom', 'organic', 'rare', 'bulk', 'non gmo', 'open pollinated', 'hybrid', 'dwarf'], a.ad_group_id, k)
+        || ' ' || pick(['tomato', 'pepper', 'squash', 'bean', 'lettuce', 'flower', 'herb', 'melon', 'corn', 'garlic'], k, a.ad_group_id)
+        || ' seeds' AS keyword_text,
+    ['EXACT', 'PHRASE', 'BROAD'][1 + k % 3] AS match_type,
+    a.group_weight * (0.1 + 2 * rnd(a.ad_group_id, k) ^ 2) / getvariable('keywords') AS keyword_weight,
+    k
+FROM ad_groups a, range(getvariable('keywords')) t(k)
+WHERE a.platform = 'google_ads';
+
+CREATE TEMP TABLE ads AS
+SELECT
+    a.*,
+    a.ad_group_id || lpad(x::VARCHAR, 2, '0') AS ad_id,
+    a.group_weight * (0.5 + rnd(a.ad_group_id, x)) / getvariable('ads') AS ad_weight,
+    x
+FROM ad_groups a, range(getvariable('ads')) t(x);
+
+CREATE TEMP TABLE people AS
+SELECT
+    i + 1 AS person_number,
+    'kl_' || lpad(i::VARCHAR, 8, '0') AS person_id,
+    rnd(i, 'churn') AS churn_probability,
+    round(1200 * rnd(i, 'clv') ^ 2, 2) AS total_clv,
+    1 + floor(6 * rnd(i, 'orders') ^ 3)::INT AS order_count,
+    (getvariable('end_date')::DATE - floor(getvariable('days') * rnd(i, 'first'))::INT) AS first_order_date
+FROM range(getvariable('customers')) t(i);
+
+CREATE TEMP TABLE orders AS
+SELECT
+    p.person_id,
+    p.person_number,
+    100000000 + p.person_number * 10 + k AS order_id,
+    (p.first_order_date + (k * (20 + 70 * rnd(p.person_id, k)))::INT) AS order_day,
+    round(20 + 380 * rnd(p.person_id, k * 7) ^ 2, 2) AS subtotal,
+    k
+FROM people p, range(6) t(k)
+WHERE k < p.order_count
+  AND p.first_order_date + (k * (20 + 70 * rnd(p.person_id, k)))::INT <= getvariable('end_date')::DATE;
+
+CREATE TEMP TABLE sources AS
+SELECT * FROM (VALUES
+    ('google', 'organic', 1.00), ('(direct)', '(none)', 0.80), ('google', 'cpc', 0.60),
+    ('facebook', 'paid', 0.40), ('instagram', 'social', 0.30), ('klaviyo', 'email', 0.25),
+    ('bing', 'organic', 0.12), ('pinterest', 'social', 0.10), ('seedsavers.org', 'referral', 0.08),
+    ('facebook', 'social', 0.15), ('tiktok', 'display', 0.05), ('(not set)', '(not set)', 0.03)
+) t(source, medium, share);
+"""
+
+# One statement per mart; {schema} is the target schema.
+_MARTS: dict[str, str] = {
+    "DIM_PLATFORM": """
+        SELECT * FROM (VALUES
+            ('google_ads', 'Google Ads', 'Google Ads', TRUE, FALSE, FALSE),
+            ('meta', 'Meta Ads', 'Meta (Facebook & Instagram)', TRUE, FALSE, FALSE),
+            ('ga4', 'Google Analytics 4', 'Google Analytics', FALSE, TRUE, FALSE),
+            ('klaviyo', 'Klaviyo', 'Klaviyo', FALSE, FALSE, TRUE),
+            ('magento', 'Magento', 'Magento Commerce', FALSE, FALSE, FALSE)
+        ) t(platform_code, platform_name, platform_display_name, is_advertising, is_analytics, is_email)
+    """,
+    "DIM_HOUR": """
+        SELECT
+            h AS hour_key,
+            h AS hour_of_day,
+            CASE WHEN h BETWEEN 0 AND 5 THEN 'Night' WHEN h BETWEEN 6 AND 11 THEN 'Morning'
+                 WHEN h BETWEEN 12 AND 17 THEN 'Afternoon' ELSE 'Evening' END AS day_part,
+            h BETWEEN 9 AND 17 AS is_business_hours,
+            lpad(h::VARCHAR, 2, '0') || ':00' AS hour_label,
+            CASE WHEN h = 0 THEN '12 AM' WHEN h < 12 THEN h || ' AM' WHEN h = 12 THEN '12 PM' ELSE (h - 12) || ' PM' END AS hour_label_12h
+        FROM range(24) t(h)
+    """,
+    "DIM_CAMPAIGN": """
+        SELECT
+            sk(platform, campaign_id, NULL) AS campaign_sk,
+            platform, campaign_id, account_id,
+            replace(campaign_type, '_', ' ') || ' | ' || pick(['Tomatoes', 'Peppers', 'Flowers', 'Herbs', 'Bulk Seeds', 'Brand', 'Holiday'], n, 'name') || ' #' || n AS campaign_name,
+            status, campaign_type,
+            NULL::VARCHAR AS campaign_subtype,
+            getvariable('end_date')::DATE - getvariable('days')::INT AS start_date,
+            NULL::DATE AS end_date,
+            money(20 + 480 * weight) AS daily_budget,
+            NULL::DECIMAL(18, 2) AS lifetime_budget,
+            CASE WHEN platform = 'meta' THEN campaign_type END AS objective,
+            TRUE AS is_current,
+            getvariable('generated_at')::TIMESTAMP AS valid_from,
+            NULL::TIMESTAMP AS valid_to,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM campaigns
+    """,
+    "DIM_AD_GROUP": """
+        SELECT
+            sk(platform, ad_group_id, NULL) AS ad_group_sk,
+            platform, ad_group_id, campaign_id,
+            'Ad group ' || g || ' - ' || campaign_type AS ad_group_name,
+            status,
+            CASE WHEN campaign_type = 'SHOPPING' THEN 'SHOPPING_PRODUCT_ADS' ELSE 'SEARCH_STANDARD' END AS ad_group_type,
+            'OPTIMIZE' AS ad_rotation_mode,
+            TRUE AS is_current,
+            getvariable('generated_at')::TIMESTAMP AS valid_from,
+            NULL::TIMESTAMP AS valid_to,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM ad_groups
+        WHERE platform = 'google_ads'
+    """,
+    "DIM_KEYWORD": """
+        SELECT
+            sk('google_ads', keyword_id, NULL) AS keyword_sk,
+            'google_ads' AS platform,
+            keyword_id, ad_group_id, keyword_text, match_type,
+            CASE WHEN rnd(keyword_id, 'status') < 0.85 THEN 'ENABLED' ELSE 'PAUSED' END AS status,
+            FALSE AS is_negative,
+            1 + floor(10 * rnd(keyword_id, 'qs'))::INT AS quality_score,
+            pick(['ABOVE_AVERAGE', 'AVERAGE', 'BELOW_AVERAGE'], keyword_id, 'cq') AS creative_quality,
+            pick(['ABOVE_AVERAGE', 'AVERAGE', 'BELOW_AVERAGE'], keyword_id, 'pq') AS post_click_quality,
+            pick(['ABOVE_AVERAGE', 'AVERAGE', 'BELOW_AVERAGE'], keyword_id, 'ec') AS expected_ctr,
+            money(0.2 + 2.5 * rnd(keyword_id, 'bid')) AS cpc_bid,
+            money(0.1 + 1.5 * rnd(keyword_id, 'fp')) AS first_page_cpc,
+            money(0.5 + 3.0 * rnd(keyword_id, 'pos')) AS first_position_cpc,
+            money(0.3 + 2.0 * rnd(keyword_id, 'top')) AS top_of_page_cpc,
+            'https://www.rareseeds.com/' AS final_urls,
+            TRUE AS is_current,
+            getvariable('generated_at')::TIMESTAMP AS valid_from,
+            NULL::TIMESTAMP AS valid_to,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM keywords
+    """,
+    "DIM_AD": """
+        SELECT
+            sk(platform, ad_id, NULL) AS ad_sk,
+            platform, ad_id,
+            CASE WHEN platform = 'google_ads' THEN ad_group_id END AS ad_group_id,
+            CASE WHEN platform = 'meta' THEN ad_group_id END AS ad_set_id,
+            campaign_id,
+            'Ad ' || x || ' - ' || campaign_type AS ad_name,
+            status,
+            CASE WHEN platform = 'google_ads' THEN 'RESPONSIVE_SEARCH_AD' ELSE pick(['IMAGE', 'VIDEO', 'CAROUSEL'], ad_id, 'type') END AS ad_type,
+            CASE WHEN platform = 'google_ads' THEN 'rareseeds.com' END AS display_url,
+            'https://www.rareseeds.com/' AS final_urls,
+            CASE WHEN platform = 'meta' THEN 'cr_' || ad_id END AS creative_id,
+            TRUE AS is_current,
+            getvariable('generated_at')::TIMESTAMP AS valid_from,
+            NULL::TIMESTAMP AS valid_to,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM ads
+    """,
+    "DIM_CREATIVE": """
+        SELECT
+            sk('meta', 'cr_' || ad_id, NULL) AS creative_sk,
+            'meta' AS platform,
+            'cr_' || ad_id AS creative_id,
+            account_id,
+            'Creative ' || ad_id AS creative_name,
+            pick(['Grow your own heirlooms', 'Rare seeds, shipped free', 'Spring planting starts now', 'Over 1,800 varieties'], ad_id, 'headline') AS headline,
+            pick(['Pure, natural, non-GMO seeds from the world''s largest heirloom collection.', 'Plant something rare this season.', 'Our catalog is here - order yours today.'], ad_id, 'body') AS body_copy,
+            pick(['SHOP_NOW', 'LEARN_MORE', 'SIGN_UP', 'ORDER_NOW'], ad_id, 'cta') AS call_to_action_type,
+            pick(['IMAGE', 'VIDEO', 'CAROUSEL', 'DYNAMIC'], ad_id, 'ctype') AS creative_type,
+            status,
+            md5(ad_id) AS image_hash,
+            'https://cdn.example.com/' || ad_id || '.jpg' AS image_url,
+            NULL::VARCHAR AS video_id,
+            NULL::VARCHAR AS thumbnail_url,
+            'https://www.rareseeds.com/' AS link_url,
+            'rareseeds.com' AS link_destination_display_url,
+            NULL::VARCHAR AS instagram_permalink_url,
+            NULL::VARCHAR AS instagram_user_id,
+            NULL::VARCHAR AS object_story_id,
+            FALSE AS enable_direct_install,
+            TRUE AS has_image,
+            FALSE AS has_video,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM ads
+        WHERE platform = 'meta'
+    """,
+    "DIM_PERSON": """
+        SELECT
+            sk('klaviyo', p.person_id, NULL) AS person_sk,
+            'klaviyo' AS platform,
+            p.person_id,
+            p.person_id || '@example.com' AS email,
+            pick(['Ava', 'Liam', 'Noah', 'Emma', 'Mia', 'Ethan', 'Ruth', 'Omar'], p.person_id, 'first') AS first_name,
+            pick(['Baker', 'Gill', 'Nguyen', 'Garcia', 'Smith', 'Olsen', 'Patel'], p.person_id, 'last') AS last_name,
+            pick(['Mansfield', 'Springfield', 'Portland', 'Austin', 'Denver', 'Madison'], p.person_id, 'city') AS city,
+            pick(['MO', 'OR', 'TX', 'CO', 'WI', 'CA', 'NY'], p.person_id, 'region') AS region,
+            'US' AS country,
+            money(p.total_clv * 0.6) AS predicted_clv,
+            money(p.total_clv * 0.4) AS historic_clv,
+            money(p.total_clv) AS total_clv,
+            round(p.churn_probability, 4) AS churn_probability,
+            CASE WHEN p.churn_probability >= 0.7 THEN 'High Risk' WHEN p.churn_probability >= 0.4 THEN 'Medium Risk'
+                 WHEN p.churn_probability >= 0.1 THEN 'Low Risk' ELSE 'Healthy' END AS churn_risk_segment,
+            CASE WHEN p.total_clv >= 500 THEN 'High Value' WHEN p.total_clv >= 200 THEN 'Medium Value'
+                 WHEN p.total_clv >= 50 THEN 'Low Value' ELSE 'New/Minimal' END AS clv_segment,
+            money(40 + 60 * rnd(p.person_id, 'aov')) AS predicted_aov,
+            coalesce(o.orders, 0) AS historic_order_count,
+            round(3 * rnd(p.person_id, 'pred'), 2) AS predicted_order_count,
+            round(20 + 100 * rnd(p.person_id, 'gap'), 1) AS avg_days_between_orders,
+            o.last_order_date + 45 AS expected_next_order_date,
+            coalesce(o.orders, 0) AS custom_order_count,
+            money(o.revenue / nullif(o.orders, 0)) AS custom_aov,
+            o.first_order_date,
+            o.last_order_date,
+            money(o.last_order_value) AS last_order_value,
+            p.first_order_date::TIMESTAMP AS created_at,
+            getvariable('generated_at')::TIMESTAMP AS updated_at,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM people p
+        LEFT JOIN (
+            SELECT person_id, count(*) AS orders, sum(subtotal) AS revenue,
+                   min(order_day) AS first_order_date, max(order_day) AS last_order_date,
+                   arg_max(subtotal, order_day) AS last_order_value
+            FROM orders GROUP BY person_id
+        ) o ON o.person_id = p.person_id
+    """,
+    "FCT_CAMPAIGN_PERFORMANCE": """
+        SELECT
+            sk(d.date_day, c.campaign_id, v.device) AS performance_sk,
+            d.date_day, c.platform, c.account_id, c.campaign_id,
+            dc.campaign_name, c.status, c.campaign_type,
+            v.device,
+            CASE WHEN c.platform = 'google_ads' THEN 'SEARCH' END AS ad_network_type,
+            floor(c.weight * v.share * season(d.date_day) * (2000 + 3000 * rnd(c.campaign_id, d.date_day || v.device)))::BIGINT AS impressions,
+            floor(impressions * (0.01 + 0.05 * rnd(c.campaign_id, d.date_day || 'ctr')))::BIGINT AS clicks,
+            money(clicks * (0.3 + 1.7 * rnd(c.campaign_id, 'cpc'))) AS spend,
+            round(clicks * (0.01 + 0.06 * rnd(c.campaign_id, d.date_day || 'cvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (35 + 60 * rnd(c.campaign_id, 'aov'))) AS conversion_value,
+            floor(conversions * 0.2)::BIGINT AS view_through_conversions,
+            clicks / nullif(impressions, 0) AS ctr,
+            spend / nullif(clicks, 0) AS cpc,
+            spend * 1000 / nullif(impressions, 0) AS cpm,
+            conversion_value / nullif(spend, 0) AS roas,
+            spend / nullif(conversions, 0) AS cpa,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN campaigns c
+        JOIN {schema}.DIM_CAMPAIGN dc ON dc.campaign_id = c.campaign_id
+        JOIN (VALUES
+            ('google_ads', 'MOBILE', 0.55), ('google_ads', 'DESKTOP', 0.35), ('google_ads', 'TABLET', 0.10),
+            ('meta', 'ALL', 1.0)
+        ) v(platform, device, share) ON v.platform = c.platform
+    """,
+    "FCT_AD_GROUP_PERFORMANCE": """
+        SELECT
+            sk(d.date_day, a.ad_group_id, NULL) AS ad_group_performance_sk,
+            'google_ads' AS platform, d.date_day, a.ad_group_id, a.campaign_id, a.account_id,
+            pick(['MOBILE', 'DESKTOP', 'TABLET'], a.ad_group_id, d.date_day) AS device,
+            'SEARCH' AS ad_network_type,
+            floor(a.group_weight * season(d.date_day) * (2000 + 3000 * rnd(a.ad_group_id, d.date_day)))::BIGINT AS impressions,
+            floor(impressions * (0.01 + 0.05 * rnd(a.ad_group_id, d.date_day || 'ctr')))::BIGINT AS clicks,
+            money(clicks * (0.3 + 1.7 * rnd(a.ad_group_id, 'cpc'))) AS spend,
+            round(clicks * (0.01 + 0.06 * rnd(a.ad_group_id, d.date_day || 'cvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (35 + 60 * rnd(a.ad_group_id, 'aov'))) AS conversion_value,
+            floor(clicks * 1.1)::BIGINT AS interactions,
+            floor(conversions * 0.2)::BIGINT AS view_through_conversions,
+            floor(impressions * 0.6)::BIGINT AS active_view_impressions,
+            0.6 AS active_view_viewability,
+            clicks / nullif(impressions, 0) AS ctr,
+            spend / nullif(clicks, 0) AS cpc,
+            spend * 1000 / nullif(impressions, 0) AS cpm,
+            conversion_value / nullif(spend, 0) AS roas,
+            spend / nullif(conversions, 0) AS cpa,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d CROSS JOIN ad_groups a
+        WHERE a.platform = 'google_ads'
+    """,
+    "FCT_KEYWORD_PERFORMANCE": """
+        SELECT
+            sk(d.date_day, k.keyword_id, NULL) AS keyword_performance_sk,
+            'google_ads' AS platform, d.date_day, k.keyword_id, k.ad_group_id, k.campaign_id,
+            '{google_account}' AS account_id,
+            pick(['MOBILE', 'DESKTOP', 'TABLET'], k.keyword_id, d.date_day) AS device,
+            'SEARCH' AS ad_network_type,
+            floor(k.keyword_weight * season(d.date_day) * (1500 + 3000 * rnd(k.keyword_id, d.date_day)))::BIGINT AS impressions,
+            floor(impressions * (0.01 + 0.08 * rnd(k.keyword_id, 'ctr')))::BIGINT AS clicks,
+            money(clicks * (0.2 + 2.0 * rnd(k.keyword_id, 'cpc'))) AS spend,
+            round(clicks * (0.005 + 0.08 * rnd(k.keyword_id, d.date_day || 'cvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (30 + 60 * rnd(k.keyword_id, 'aov'))) AS conversion_value,
+            clicks AS interactions,
+            0::BIGINT AS view_through_conversions,
+            clicks / nullif(impressions, 0) AS ctr,
+            spend / nullif(clicks, 0) AS cpc,
+            spend * 1000 / nullif(impressions, 0) AS cpm,
+            conversion_value / nullif(spend, 0) AS roas,
+            spend / nullif(conversions, 0) AS cpa,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d CROSS JOIN keywords k
+    """,
+    "FCT_CAMPAIGN_HOURLY": """
+        SELECT
+            sk(d.date_day, c.campaign_id, h) AS hourly_performance_sk,
+            'google_ads' AS platform, d.date_day, h AS hour, c.campaign_id, c.account_id,
+            pick(['MOBILE', 'DESKTOP', 'TABLET'], c.campaign_id, d.date_day || h) AS device,
+            'SEARCH' AS ad_network_type,
+            floor(c.weight * (0.3 + sin(pi() * greatest(h - 5, 0) / 19.0)) * (80 + 150 * rnd(c.campaign_id, d.date_day || h)))::BIGINT AS impressions,
+            floor(impressions * (0.01 + 0.05 * rnd(c.campaign_id, h)))::BIGINT AS clicks,
+            money(clicks * (0.3 + 1.7 * rnd(c.campaign_id, 'cpc'))) AS spend,
+            round(clicks * (0.01 + 0.06 * rnd(c.campaign_id, d.date_day || h || 'cvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (35 + 60 * rnd(c.campaign_id, 'aov'))) AS conversion_value,
+            clicks AS interactions,
+            clicks / nullif(impressions, 0) AS ctr,
+            spend / nullif(clicks, 0) AS cpc,
+            spend * 1000 / nullif(impressions, 0) AS cpm,
+            conversion_value / nullif(spend, 0) AS roas,
+            spend / nullif(conversions, 0) AS cpa,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d CROSS JOIN campaigns c CROSS JOIN range(24) t(h)
+        WHERE c.platform = 'google_ads' AND d.day_index < getvariable('hourly_days')
+    """,
+    "FCT_AD_PERFORMANCE": """
+        SELECT
+            sk(d.date_day, a.ad_id, NULL) AS ad_performance_sk,
+            d.date_day, a.platform, a.account_id, a.campaign_id,
+            CASE WHEN a.platform = 'google_ads' THEN a.ad_group_id END AS ad_group_id,
+            CASE WHEN a.platform = 'meta' THEN a.ad_group_id END AS ad_set_id,
+            a.ad_id,
+            'Ad ' || a.x || ' - ' || a.campaign_type AS ad_name,
+            CASE WHEN a.platform = 'google_ads' THEN 'RESPONSIVE_SEARCH_AD' ELSE pick(['IMAGE', 'VIDEO', 'CAROUSEL'], a.ad_id, 'type') END AS ad_type,
+            a.status,
+            CASE WHEN a.platform = 'google_ads' THEN 'rareseeds.com' END AS display_url,
+            CASE WHEN a.platform = 'google_ads' THEN pick(['MOBILE', 'DESKTOP', 'TABLET'], a.ad_id, d.date_day) END AS device,
+            CASE WHEN a.platform = 'google_ads' THEN 'SEARCH' END AS ad_network_type,
+            floor(a.ad_weight * season(d.date_day) * (2000 + 4000 * rnd(a.ad_id, d.date_day)))::BIGINT AS impressions,
+            floor(impressions * (0.005 + 0.04 * rnd(a.ad_id, 'ctr')))::BIGINT AS clicks,
+            money(clicks * (0.3 + 1.5 * rnd(a.ad_id, 'cpc'))) AS spend,
+            round(clicks * (0.01 + 0.06 * rnd(a.ad_id, d.date_day || 'cvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (35 + 60 * rnd(a.ad_id, 'aov'))) AS conversion_value,
+            floor(conversions * 0.2)::BIGINT AS view_through_conversions,
+            clicks / nullif(impressions, 0) AS ctr,
+            spend / nullif(clicks, 0) AS cpc,
+            spend * 1000 / nullif(impressions, 0) AS cpm,
+            conversion_value / nullif(spend, 0) AS roas,
+            spend / nullif(conversions, 0) AS cpa,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d CROSS JOIN ads a
+    """,
+    "FCT_AD_SET_PERFORMANCE": """
+        SELECT
+            sk(d.date_day, a.ad_group_id, NULL) AS ad_set_performance_sk,
+            'meta' AS platform, d.date_day, a.ad_group_id AS ad_set_id, a.account_id,
+            'Ad set ' || a.g || ' - ' || a.campaign_type AS ad_set_name,
+            dc.campaign_name,
+            floor(a.group_weight * season(d.date_day) * (3000 + 5000 * rnd(a.ad_group_id, d.date_day)))::BIGINT AS impressions,
+            floor(impressions / (1.2 + 0.8 * rnd(a.ad_group_id, 'freq')))::BIGINT AS reach,
+            floor(impressions * (0.005 + 0.03 * rnd(a.ad_group_id, 'ctr')))::BIGINT AS clicks,
+            money(impressions * (4 + 10 * rnd(a.ad_group_id, 'cpm')) / 1000) AS spend,
+            impressions / nullif(reach, 0) AS frequency,
+            spend / nullif(clicks, 0) AS cpc,
+            spend * 1000 / nullif(impressions, 0) AS cpm,
+            100.0 * clicks / nullif(impressions, 0) AS ctr,
+            clicks / nullif(impressions, 0) AS calculated_ctr,
+            spend / nullif(clicks, 0) AS calculated_cpc,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN ad_groups a
+        JOIN {schema}.DIM_CAMPAIGN dc ON dc.campaign_id = a.campaign_id
+        WHERE a.platform = 'meta'
+    """,
+    "FCT_META_CONVERSION": """
+        SELECT
+            sk(d.date_day, a.ad_id, NULL) AS meta_conversion_sk,
+            'meta' AS platform, a.ad_id, d.date_day,
+            floor(a.ad_weight * season(d.date_day) * (40 + 80 * rnd(a.ad_id, d.date_day)))::BIGINT AS view_content,
+            floor(view_content * (0.1 + 0.2 * rnd(a.ad_id, 'atc')))::BIGINT AS add_to_cart,
+            floor(add_to_cart * (0.3 + 0.3 * rnd(a.ad_id, 'ic')))::BIGINT AS initiate_checkout,
+            floor(initiate_checkout * (0.4 + 0.4 * rnd(a.ad_id, 'p')))::BIGINT AS purchases,
+            floor(purchases * 0.8)::BIGINT AS purchases_7d_click,
+            floor(purchases * 0.2)::BIGINT AS purchases_1d_view,
+            floor(view_content * 1.5)::BIGINT AS link_clicks,
+            floor(view_content * 3)::BIGINT AS post_engagements,
+            floor(view_content * 0.5)::BIGINT AS page_engagements,
+            floor(view_content * 0.3)::BIGINT AS post_reactions,
+            view_content + add_to_cart + initiate_checkout + purchases + link_clicks AS total_actions,
+            add_to_cart / nullif(view_content, 0) AS view_to_cart_rate,
+            initiate_checkout / nullif(add_to_cart, 0) AS cart_to_checkout_rate,
+            purchases / nullif(initiate_checkout, 0) AS checkout_to_purchase_rate,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d CROSS JOIN ads a
+        WHERE a.platform = 'meta'
+    """,
+    "FCT_META_DELIVERY": """
+        SELECT
+            sk(d.date_day, v.dimension_type, v.dimension_value) AS delivery_sk,
+            'meta' AS platform, '{meta_account}' AS account_id, d.date_day,
+            v.dimension_type, v.dimension_value, v.display_name AS dimension_display_name,
+            floor(v.share * season(d.date_day) * getvariable('campaigns') * (800 + 800 * rnd(v.dimension_value, d.date_day)))::BIGINT AS impressions,
+            floor(impressions / (1.3 + 0.5 * rnd(v.dimension_value, 'freq')))::BIGINT AS reach,
+            floor(impressions * (0.005 + 0.02 * rnd(v.dimension_value, 'ctr')))::BIGINT AS clicks,
+            money(impressions * (5 + 8 * rnd(v.dimension_value, 'cpm')) / 1000) AS spend,
+            impressions / nullif(reach, 0) AS frequency,
+            spend / nullif(clicks, 0) AS cpc,
+            spend * 1000 / nullif(impressions, 0) AS cpm,
+            100.0 * clicks / nullif(impressions, 0) AS ctr,
+            clicks / nullif(impressions, 0) AS calculated_ctr,
+            spend / nullif(clicks, 0) AS calculated_cpc,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN (VALUES
+            ('device', 'mobile_app', 'Mobile App', 0.6), ('device', 'mobile_web', 'Mobile Web', 0.25),
+            ('device', 'desktop', 'Desktop', 0.15),
+            ('platform', 'facebook', 'Facebook', 0.55), ('platform', 'instagram', 'Instagram', 0.38),
+            ('platform', 'audience_network', 'Audience Network', 0.05), ('platform', 'messenger', 'Messenger', 0.02)
+        ) v(dimension_type, dimension_value, display_name, share)
+    """,
+    "FCT_META_DEMOGRAPHICS": """
+        SELECT
+            sk(d.date_day, v.age_bracket, v.gender) AS demographics_sk,
+            'meta' AS platform, '{meta_account}' AS account_id, d.date_day,
+            v.age_bracket, v.gender, v.demographic_type,
+            floor(v.share * season(d.date_day) * getvariable('campaigns') * (800 + 800 * rnd(coalesce(v.age_bracket, v.gender), d.date_day)))::BIGINT AS impressions,
+            floor(impressions / (1.3 + 0.5 * rnd(coalesce(v.age_bracket, v.gender), 'freq')))::BIGINT AS reach,
+            floor(impressions * (0.005 + 0.02 * rnd(coalesce(v.age_bracket, v.gender), 'ctr')))::BIGINT AS clicks,
+            money(impressions * (5 + 8 * rnd(coalesce(v.age_bracket, v.gender), 'cpm')) / 1000) AS spend,
+            impressions / nullif(reach, 0) AS frequency,
+            spend / nullif(clicks, 0) AS cpc,
+            spend * 1000 / nullif(impressions, 0) AS cpm,
+            100.0 * clicks / nullif(impressions, 0) AS ctr,
+            clicks / nullif(impressions, 0) AS calculated_ctr,
+            spend / nullif(clicks, 0) AS calculated_cpc,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN (VALUES
+            ('18-24', NULL, 'age', 0.08), ('25-34', NULL, 'age', 0.18), ('35-44', NULL, 'age', 0.22),
+            ('45-54', NULL, 'age', 0.22), ('55-64', NULL, 'age', 0.18), ('65+', NULL, 'age', 0.12),
+            (NULL, 'female', 'gender', 0.62), (NULL, 'male', 'gender', 0.35), (NULL, 'unknown', 'gender', 0.03)
+        ) v(age_bracket, gender, demographic_type, share)
+    """,
+    "FCT_GA4_TRAFFIC": """
+        SELECT
+            sk(d.date_day, s.source, s.medium) AS ga4_traffic_sk,
+            'ga4' AS platform, d.date_day, '{ga4_property}' AS property,
+            s.source, s.medium, s.source || ' / ' || s.medium AS source_medium,
+            floor(s.share * season(d.date_day) * getvariable('sessions_per_day') * (0.7 + 0.6 * rnd(s.source || s.medium, d.date_day)))::BIGINT AS sessions,
+            floor(sessions * (0.4 + 0.4 * rnd(s.source || s.medium, 'eng')))::BIGINT AS engaged_sessions,
+            floor(sessions * (0.7 + 0.2 * rnd(s.source || s.medium, 'users')))::BIGINT AS total_users,
+            floor(sessions * (4 + 6 * rnd(s.source || s.medium, 'events')))::BIGINT AS event_count,
+            round(sessions * (0.005 + 0.03 * rnd(s.source || s.medium, d.date_day || 'cvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (40 + 50 * rnd(s.source || s.medium, 'aov'))) AS revenue,
+            engaged_sessions / nullif(sessions, 0) AS engagement_rate,
+            event_count / nullif(sessions, 0) AS events_per_session,
+            round(engaged_sessions * (60 + 120 * rnd(s.source || s.medium, 'dur')), 0) AS user_engagement_duration,
+            engaged_sessions / nullif(sessions, 0) AS calculated_engagement_rate,
+            sessions / nullif(total_users, 0) AS sessions_per_user,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d CROSS JOIN sources s
+    """,
+    "FCT_GA4_SESSIONS": """
+        SELECT
+            ga4_traffic_sk AS ga4_session_sk,
+            platform, date_day,
+            date_trunc('week', date_day)::DATE AS date_week,
+            date_trunc('month', date_day)::DATE AS date_month,
+            dayname(date_day) AS day_of_week,
+            source AS session_source, medium AS session_medium, source_medium,
+            sessions AS total_sessions, engaged_sessions, sessions - engaged_sessions AS non_engaged_sessions,
+            total_users,
+            round(100.0 * engagement_rate, 2) AS engagement_rate_pct,
+            round(100.0 * (1 - engagement_rate), 2) AS bounce_proxy_pct,
+            round(events_per_session, 2) AS avg_events_per_session,
+            round(user_engagement_duration / nullif(sessions, 0), 1) AS avg_engagement_duration_sec,
+            round(user_engagement_duration / nullif(sessions, 0) / 60, 2) AS avg_engagement_duration_min,
+            event_count AS total_events,
+            conversions AS total_key_events,
+            round(100.0 * conversions / nullif(sessions, 0), 2) AS key_event_rate_pct,
+            revenue AS total_revenue,
+            round(revenue / nullif(sessions, 0), 2) AS revenue_per_session,
+            round(100 * engagement_rate * least(events_per_session / 10, 1), 1) AS session_quality_score,
+            CASE WHEN engagement_rate >= 0.7 AND events_per_session >= 5 THEN 'High Quality'
+                 WHEN engagement_rate >= 0.5 AND events_per_session >= 3 THEN 'Medium Quality'
+                 WHEN engagement_rate >= 0.3 THEN 'Low Quality' ELSE 'Poor Quality' END AS session_quality_category,
+            CASE WHEN medium = 'organic' THEN 'Organic Search' WHEN medium = 'cpc' THEN 'Paid Search'
+                 WHEN medium = 'email' THEN 'Email' WHEN medium = 'social' THEN 'Social'
+                 WHEN medium = 'referral' THEN 'Referral' WHEN medium = '(none)' THEN 'Direct'
+                 WHEN medium = 'display' THEN 'Display' ELSE 'Other' END AS traffic_channel
+        FROM {schema}.FCT_GA4_TRAFFIC
+    """,
+    "FCT_GA4_FIRST_TOUCH": """
+        SELECT
+            sk(d.date_day, s.source, s.medium) AS first_touch_sk,
+            'ga4' AS platform, d.date_day, '{ga4_property}' AS ga4_property,
+            s.source AS first_user_source, s.medium AS first_user_medium,
+            s.source || ' / ' || s.medium AS source_medium,
+            CASE WHEN s.medium = 'organic' THEN 'Organic Search' WHEN s.medium IN ('cpc', 'ppc', 'paid') THEN 'Paid Search'
+                 WHEN s.medium IN ('cpm', 'display', 'banner') THEN 'Display'
+                 WHEN s.source LIKE '%facebook%' OR s.source LIKE '%instagram%' THEN 'Paid Social'
+                 WHEN s.medium = 'email' THEN 'Email' WHEN s.medium = 'referral' THEN 'Referral'
+                 WHEN s.source = '(direct)' OR s.medium = '(none)' THEN 'Direct' ELSE 'Other' END AS channel_grouping,
+            floor(s.share * season(d.date_day) * getvariable('sessions_per_day') * 0.6 * (0.7 + 0.6 * rnd(s.source || s.medium, d.date_day || 'ft')))::BIGINT AS users,
+            floor(users * (0.5 + 0.4 * rnd(s.source || s.medium, 'new')))::BIGINT AS new_users,
+            floor(users * (0.5 + 0.3 * rnd(s.source || s.medium, 'eng')))::BIGINT AS engaged_sessions,
+            engaged_sessions / nullif(users, 0) AS engagement_rate,
+            round(engaged_sessions * (60 + 120 * rnd(s.source || s.medium, 'dur')), 0) AS engagement_duration_seconds,
+            floor(users * (5 + 5 * rnd(s.source || s.medium, 'events')))::BIGINT AS events,
+            round(users * (0.005 + 0.03 * rnd(s.source || s.medium, d.date_day || 'ftcvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (40 + 50 * rnd(s.source || s.medium, 'aov'))) AS revenue,
+            conversions / nullif(users, 0) AS conversion_rate,
+            revenue / nullif(users, 0) AS revenue_per_user,
+            revenue / nullif(new_users, 0) AS revenue_per_new_user,
+            engagement_duration_seconds / nullif(users, 0) AS avg_engagement_per_user,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d CROSS JOIN sources s
+    """,
+    "FCT_GA4_PAGES": """
+        SELECT
+            sk(d.date_day, p.page_path, NULL) AS ga4_page_sk,
+            'ga4' AS platform, d.date_day, '{ga4_property}' AS ga4_property,
+            p.page_path, p.page_path AS page_path_clean,
+            CASE WHEN p.page_path = '/' THEN 'Homepage' WHEN p.page_path LIKE '/product%' THEN 'Product Page'
+                 WHEN p.page_path LIKE '/collection%' THEN 'Collection Page' WHEN p.page_path LIKE '/cart%' THEN 'Cart'
+                 WHEN p.page_path LIKE '/checkout%' THEN 'Checkout' WHEN p.page_path LIKE '/account%' THEN 'Account'
+                 WHEN p.page_path LIKE '/blog%' THEN 'Blog' WHEN p.page_path LIKE '/search%' THEN 'Search' ELSE 'Other' END AS page_type,
+            floor(p.weight * season(d.date_day) * getvariable('sessions_per_day') * 3 * (0.6 + 0.8 * rnd(p.page_path, d.date_day)))::BIGINT AS page_views,
+            floor(page_views * (0.6 + 0.3 * rnd(p.page_path, 'users')))::BIGINT AS users,
+            floor(users * (0.2 + 0.4 * rnd(p.page_path, 'new')))::BIGINT AS new_users,
+            floor(page_views * (2 + 3 * rnd(p.page_path, 'events')))::BIGINT AS events,
+            round(users * 0.02 * rnd(p.page_path, d.date_day || 'cvr'), 2)::DECIMAL(18, 2) AS conversions,
+            round(users * (20 + 60 * rnd(p.page_path, 'dur')), 0) AS engagement_duration_seconds,
+            money(conversions * 60) AS revenue,
+            page_views / nullif(users, 0) AS pages_per_user,
+            engagement_duration_seconds / nullif(users, 0) AS avg_engagement_per_user,
+            conversions / nullif(users, 0) AS conversion_rate,
+            revenue / nullif(users, 0) AS revenue_per_user,
+            revenue / nullif(page_views, 0) AS revenue_per_pageview,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN (
+            SELECT
+                CASE
+                    WHEN i = 0 THEN '/'
+                    WHEN i = 1 THEN '/cart'
+                    WHEN i = 2 THEN '/checkout'
+                    WHEN i = 3 THEN '/account/login'
+                    WHEN i = 4 THEN '/search'
+                    ELSE ['/products/', '/products/', '/collections/', '/blog/'][1 + i % 4] || 'page-' || i
+                END AS page_path,
+                CASE WHEN i < 3 THEN 1.0 ELSE 0.5 / (1 + i / 10.0) END AS weight
+            FROM range(getvariable('pages')) t(i)
+        ) p
+    """,
+    "FCT_GA4_GEO": """
+        SELECT
+            sk(d.date_day, g.geo_level, g.location_value) AS ga4_geo_sk,
+            'ga4' AS source_platform, d.date_day,
+            date_trunc('week', d.date_day)::DATE AS date_week,
+            date_trunc('month', d.date_day)::DATE AS date_month,
+            '{ga4_property}' AS ga4_property,
+            g.geo_level, g.location_value,
+            CASE WHEN g.geo_level <> 'country' THEN NULL
+                 WHEN g.location_value = 'United States' THEN 'Domestic'
+                 WHEN g.location_value = 'Canada' THEN 'North America'
+                 WHEN g.location_value IN ('United Kingdom', 'Germany', 'France', 'Netherlands') THEN 'Europe'
+                 WHEN g.location_value IN ('Australia', 'New Zealand') THEN 'APAC' ELSE 'Other International' END AS region_classification,
+            floor(g.share * season(d.date_day) * getvariable('sessions_per_day') * (0.7 + 0.6 * rnd(g.location_value, d.date_day)))::BIGINT AS users,
+            floor(users * (0.3 + 0.4 * rnd(g.location_value, 'new')))::BIGINT AS new_users,
+            floor(users * (0.5 + 0.3 * rnd(g.location_value, 'eng')))::BIGINT AS engaged_sessions,
+            engaged_sessions / nullif(users, 0) AS engagement_rate,
+            floor(users * (5 + 5 * rnd(g.location_value, 'events')))::BIGINT AS events,
+            round(users * (0.005 + 0.03 * rnd(g.location_value, d.date_day || 'cvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (40 + 50 * rnd(g.location_value, 'aov'))) AS revenue,
+            new_users / nullif(users, 0) AS new_user_rate,
+            engaged_sessions / nullif(users, 0) AS engaged_sessions_per_user,
+            conversions / nullif(users, 0) AS conversion_rate,
+            revenue / nullif(users, 0) AS revenue_per_user,
+            revenue / nullif(conversions, 0) AS revenue_per_conversion,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN (VALUES
+            ('country', 'United States', 0.82), ('country', 'Canada', 0.06), ('country', 'United Kingdom', 0.03),
+            ('country', 'Australia', 0.02), ('country', 'Germany', 0.015), ('country', 'France', 0.01),
+            ('country', 'Netherlands', 0.008), ('country', 'New Zealand', 0.006), ('country', 'Mexico', 0.006),
+            ('country', 'Japan', 0.005),
+            ('region', 'California', 0.12), ('region', 'Texas', 0.09), ('region', 'Missouri', 0.06),
+            ('region', 'New York', 0.06), ('region', 'Florida', 0.06), ('region', 'Oregon', 0.04),
+            ('region', 'Ontario', 0.03), ('region', 'Washington', 0.04),
+            ('city', 'Los Angeles', 0.03), ('city', 'Houston', 0.02), ('city', 'Springfield', 0.02),
+            ('city', 'Portland', 0.02), ('city', 'New York', 0.03), ('city', 'Toronto', 0.015),
+            ('city', 'Mansfield', 0.01), ('city', 'Austin', 0.015)
+        ) g(geo_level, location_value, share)
+    """,
+    "FCT_GA4_DEVICE_BROWSER": """
+        SELECT
+            sk(d.date_day, v.dimension_type, v.dimension_value) AS device_browser_sk,
+            'ga4' AS source_platform, d.date_day,
+            date_trunc('week', d.date_day)::DATE AS date_week,
+            date_trunc('month', d.date_day)::DATE AS date_month,
+            '{ga4_property}' AS ga4_property,
+            v.dimension_type, v.dimension_value,
+            CASE WHEN v.dimension_type = 'device' THEN v.dimension_value END AS device_category,
+            CASE WHEN v.dimension_type = 'browser' THEN v.dimension_value END AS browser,
+            CASE WHEN v.dimension_type = 'platform' THEN v.dimension_value END AS platform,
+            CASE WHEN v.dimension_type = 'device' THEN upper(v.dimension_value[1]) || v.dimension_value[2:] END AS device_category_display,
+            CASE WHEN v.dimension_type = 'browser' THEN v.dimension_value END AS browser_group,
+            floor(v.share * season(d.date_day) * getvariable('sessions_per_day') * (0.7 + 0.6 * rnd(v.dimension_value, d.date_day)))::BIGINT AS users,
+            floor(users * (0.3 + 0.4 * rnd(v.dimension_value, 'new')))::BIGINT AS new_users,
+            floor(users * (0.5 + 0.3 * rnd(v.dimension_value, 'eng')))::BIGINT AS engaged_sessions,
+            engaged_sessions / nullif(users, 0) AS engagement_rate,
+            floor(users * (5 + 5 * rnd(v.dimension_value, 'events')))::BIGINT AS events,
+            round(users * (0.005 + 0.03 * rnd(v.dimension_value, d.date_day || 'cvr')), 2)::DECIMAL(18, 2) AS conversions,
+            money(conversions * (40 + 50 * rnd(v.dimension_value, 'aov'))) AS revenue,
+            new_users / nullif(users, 0) AS new_user_rate,
+            engaged_sessions / nullif(users, 0) AS engaged_sessions_per_user,
+            conversions / nullif(users, 0) AS conversion_rate,
+            revenue / nullif(users, 0) AS revenue_per_user,
+            revenue / nullif(conversions, 0) AS revenue_per_conversion,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN (VALUES
+            ('device', 'mobile', 0.62), ('device', 'desktop', 0.33), ('device', 'tablet', 0.05),
+            ('browser', 'Chrome', 0.48), ('browser', 'Safari', 0.38), ('browser', 'Edge', 0.06),
+            ('browser', 'Firefox', 0.04), ('browser', 'Samsung Internet', 0.04),
+            ('platform', 'web', 0.92), ('platform', 'iOS', 0.05), ('platform', 'Android', 0.03)
+        ) v(dimension_type, dimension_value, share)
+    """,
+    "FCT_GA4_CONVERSIONS": """
+        SELECT
+            sk(d.date_day, e.event_name, NULL) AS ga4_conversion_sk,
+            'ga4' AS platform, d.date_day, '{ga4_property}' AS property,
+            e.event_name AS conversion_event,
+            floor(e.share * season(d.date_day) * getvariable('sessions_per_day') * (0.7 + 0.6 * rnd(e.event_name, d.date_day)))::BIGINT AS total_users,
+            round(total_users * (1 + 0.3 * rnd(e.event_name, 'per')), 2)::DECIMAL(18, 2) AS conversions,
+            CASE WHEN e.event_name = 'purchase' THEN money(conversions * (45 + 30 * rnd(e.event_name, d.date_day || 'aov'))) ELSE 0::DECIMAL(18, 2) END AS revenue,
+            conversions / nullif(total_users, 0) AS conversion_rate,
+            revenue / nullif(conversions, 0) AS revenue_per_conversion,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN (VALUES
+            ('purchase', 0.02), ('add_to_cart', 0.08), ('begin_checkout', 0.04), ('sign_up', 0.01), ('generate_lead', 0.005)
+        ) e(event_name, share)
+    """,
+    "FCT_GA4_EVENTS": """
+        SELECT
+            sk(d.date_day, e.event_name, NULL) AS ga4_event_sk,
+            'ga4' AS platform, d.date_day, '{ga4_property}' AS ga4_property,
+            e.event_name,
+            CASE WHEN e.event_name IN ('purchase', 'add_to_cart', 'begin_checkout') THEN 'Ecommerce'
+                 WHEN e.event_name IN ('page_view', 'scroll', 'click', 'view_item') THEN 'Engagement'
+                 WHEN e.event_name IN ('sign_up', 'generate_lead') THEN 'Conversion'
+                 WHEN e.event_name IN ('session_start', 'first_visit', 'user_engagement') THEN 'Session'
+                 ELSE 'Other' END AS event_category,
+            e.event_name IN ('purchase', 'sign_up', 'generate_lead') AS is_key_event,
+            floor(e.share * season(d.date_day) * getvariable('sessions_per_day') * (0.7 + 0.6 * rnd(e.event_name, d.date_day)))::BIGINT AS event_count,
+            floor(event_count / (1.2 + 2 * rnd(e.event_name, 'per')))::BIGINT AS users,
+            event_count / nullif(users, 0) AS event_count_per_user,
+            CASE WHEN e.event_name = 'purchase' THEN money(event_count * (45 + 30 * rnd(e.event_name, d.date_day || 'aov'))) ELSE 0::DECIMAL(18, 2) END AS revenue,
+            revenue / nullif(users, 0) AS revenue_per_user,
+            revenue / nullif(event_count, 0) AS revenue_per_event,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN (VALUES
+            ('page_view', 3.5), ('session_start', 1.0), ('user_engagement', 0.8), ('scroll', 1.2),
+            ('first_visit', 0.45), ('view_item', 0.9), ('click', 0.4), ('add_to_cart', 0.08),
+            ('begin_checkout', 0.04), ('purchase', 0.02), ('sign_up', 0.01), ('generate_lead', 0.005)
+        ) e(event_name, share)
+    """,
+    "FCT_ECOMMERCE_ITEM": """
+        SELECT
+            sk(d.date_day, i.item_name, NULL) AS ecommerce_item_sk,
+            'ga4' AS platform, d.date_day, '{ga4_property}' AS property,
+            i.item_name,
+            floor(i.weight * season(d.date_day) * getvariable('sessions_per_day') * 0.2 * (0.6 + 0.8 * rnd(i.item_name, d.date_day)))::BIGINT AS items_viewed,
+            floor(items_viewed * (0.05 + 0.15 * rnd(i.item_name, 'cart')))::BIGINT AS items_added_to_cart,
+            floor(items_added_to_cart * (0.3 + 0.4 * rnd(i.item_name, d.date_day || 'buy')))::BIGINT AS items_purchased,
+            money(items_purchased * (3 + 6 * rnd(i.item_name, 'price'))) AS revenue,
+            items_added_to_cart / nullif(items_viewed, 0) AS cart_to_view_rate,
+            items_purchased / nullif(items_viewed, 0) AS purchase_to_view_rate,
+            items_added_to_cart / nullif(items_viewed, 0) AS calculated_cart_rate,
+            items_purchased / nullif(items_added_to_cart, 0) AS cart_to_purchase_rate,
+            revenue / nullif(items_purchased, 0) AS avg_item_revenue,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM days d
+        CROSS JOIN (
+            SELECT
+                pick(['Cherokee Purple', 'Moon and Stars', 'Dragon Tongue', 'Glass Gem', 'Black Krim', 'Lemon Drop', 'Blue Hubbard'], i, 'variety')
+                    || ' ' || pick(['Tomato', 'Watermelon', 'Bean', 'Corn', 'Pepper', 'Squash'], i, 'crop') || ' #' || i AS item_name,
+                1.0 / (1 + i / 5.0) AS weight
+            FROM range(getvariable('items')) t(i)
+        ) i
+    """,
+    "FCT_MAGENTO_ORDER": """
+        SELECT
+            sk('magento', o.order_id, NULL) AS order_sk,
+            o.order_id,
+            o.order_id::VARCHAR AS increment_id,
+            1 AS store_id,
+            o.person_number AS customer_id,
+            1 AS customer_group_id,
+            o.person_id || '@example.com' AS customer_email,
+            'Customer ' || o.person_number AS customer_full_name,
+            FALSE AS is_guest_order,
+            o.order_id AS quote_id,
+            pick(['complete', 'complete', 'complete', 'complete', 'processing', 'canceled'], o.order_id, 'status') AS status,
+            CASE WHEN status = 'canceled' THEN 'canceled' ELSE 'complete' END AS state,
+            o.order_day + INTERVAL (floor(86399 * rnd(o.order_id, 'time'))::INT) SECOND AS order_date,
+            o.order_day AS order_date_day,
+            date_trunc('week', o.order_day)::DATE AS order_date_week,
+            date_trunc('month', o.order_day)::DATE AS order_date_month,
+            order_date AS updated_at,
+            money(o.subtotal) AS subtotal,
+            money(o.subtotal * 0.07) AS tax_amount,
+            money(CASE WHEN o.subtotal >= 75 THEN 0 ELSE 7.95 END) AS shipping_amount,
+            money(CASE WHEN rnd(o.order_id, 'disc') < 0.2 THEN -0.1 * o.subtotal ELSE 0 END) AS discount_amount,
+            subtotal + tax_amount + shipping_amount + discount_amount AS grand_total,
+            subtotal AS base_subtotal,
+            tax_amount AS base_tax_amount,
+            shipping_amount AS base_shipping_amount,
+            discount_amount AS base_discount_amount,
+            grand_total AS base_grand_total,
+            grand_total AS base_total_invoiced,
+            grand_total AS base_total_paid,
+            0::DECIMAL(18, 2) AS base_total_refunded,
+            subtotal + discount_amount AS net_revenue,
+            1 + floor(8 * rnd(o.order_id, 'qty'))::INT AS total_qty_ordered,
+            total_qty_ordered AS total_item_count,
+            'flatrate_flatrate' AS shipping_method,
+            'Standard Shipping' AS shipping_description,
+            round(0.1 * total_qty_ordered, 2) AS total_weight,
+            FALSE AS is_virtual_order,
+            pick(['braintree', 'paypal_express', 'checkmo'], o.order_id, 'pay') AS payment_method,
+            NULL::VARCHAR AS credit_card_type,
+            CASE WHEN discount_amount < 0 THEN 'SPRING10' END AS coupon_code,
+            NULL::VARCHAR AS applied_rule_ids,
+            CASE WHEN discount_amount < 0 THEN 'Spring 10% off' END AS coupon_rule_name,
+            discount_amount < 0 AS has_coupon,
+            discount_amount < 0 AS has_discount,
+            'USD' AS order_currency_code,
+            'USD' AS base_currency_code,
+            o.order_id AS billing_address_id,
+            o.order_id AS shipping_address_id,
+            CASE WHEN base_grand_total < 50 THEN 'Under $50' WHEN base_grand_total < 100 THEN '$50-$100'
+                 WHEN base_grand_total < 250 THEN '$100-$250' WHEN base_grand_total < 500 THEN '$250-$500'
+                 ELSE '$500+' END AS order_value_segment,
+            round(subtotal / total_qty_ordered, 2) AS avg_item_value
+        FROM orders o
+    """,
+    "FCT_CUSTOMER_METRICS": """
+        WITH firsts AS (
+            SELECT person_id, min(order_day) AS first_day, date_trunc('month', min(order_day))::DATE AS cohort_month
+            FROM orders GROUP BY person_id
+        ),
+        per_person AS (
+            SELECT
+                f.person_id, f.cohort_month,
+                count(*) AS orders,
+                sum(o.subtotal) AS revenue,
+                max(CASE WHEN o.order_day > f.first_day AND o.order_day <= f.first_day + 30 THEN 1 ELSE 0 END) AS r30,
+                max(CASE WHEN o.order_day > f.first_day AND o.order_day <= f.first_day + 60 THEN 1 ELSE 0 END) AS r60,
+                max(CASE WHEN o.order_day > f.first_day AND o.order_day <= f.first_day + 90 THEN 1 ELSE 0 END) AS r90
+            FROM firsts f JOIN orders o ON o.person_id = f.person_id
+            GROUP BY f.person_id, f.cohort_month
+        ),
+        spend AS (
+            SELECT
+                date_trunc('month', date_day)::DATE AS month,
+                sum(CASE WHEN platform = 'google_ads' THEN spend END) AS google_spend,
+                sum(CASE WHEN platform = 'meta' THEN spend END) AS meta_spend
+            FROM {schema}.FCT_CAMPAIGN_PERFORMANCE GROUP BY 1
+        )
+        SELECT
+            sk(p.cohort_month, NULL, NULL) AS customer_metrics_sk,
+            p.cohort_month,
+            count(*) AS new_customers,
+            count(*) FILTER (WHERE p.orders > 1) AS repeat_customers,
+            count(*) FILTER (WHERE p.orders = 1) AS one_time_customers,
+            round(100.0 * repeat_customers / new_customers, 2) AS repeat_purchase_rate,
+            sum(p.orders) AS total_orders,
+            round(total_orders / new_customers, 2) AS avg_orders_per_customer,
+            money(sum(p.revenue)) AS total_revenue,
+            money(total_revenue / new_customers) AS avg_customer_ltv,
+            money(total_revenue / new_customers) AS revenue_per_customer,
+            money(coalesce(any_value(s.google_spend), 0)) AS google_ads_spend,
+            money(coalesce(any_value(s.meta_spend), 0)) AS meta_ads_spend,
+            google_ads_spend + meta_ads_spend AS total_ad_spend,
+            money(total_ad_spend / new_customers) AS cac,
+            money(google_ads_spend / new_customers) AS cac_google,
+            money(meta_ads_spend / new_customers) AS cac_meta,
+            round(total_ad_spend / nullif(total_revenue, 0), 4) AS cac_to_revenue_ratio,
+            sum(p.r30) AS retained_30d_count,
+            sum(p.r60) AS retained_60d_count,
+            sum(p.r90) AS retained_90d_count,
+            round(100.0 * retained_30d_count / new_customers, 2) AS retention_rate_30d,
+            round(100.0 * retained_60d_count / new_customers, 2) AS retention_rate_60d,
+            round(100.0 * retained_90d_count / new_customers, 2) AS retention_rate_90d,
+            round(avg_customer_ltv / nullif(cac, 0), 2) AS ltv_cac_ratio
+        FROM per_person p
+        LEFT JOIN spend s ON s.month = p.cohort_month
+        GROUP BY p.cohort_month
+    """,
+    "AGG_COHORT_RETENTION": """
+        WITH activity AS (
+            SELECT
+                person_id,
+                date_trunc('month', order_day)::DATE AS activity_month,
+                min(date_trunc('month', order_day)::DATE) OVER (PARTITION BY person_id) AS cohort_month,
+                count(*) AS orders,
+                sum(subtotal) AS revenue
+            FROM orders
+            GROUP BY person_id, date_trunc('month', order_day)
+        ),
+        cells AS (
+            SELECT
+                cohort_month,
+                datediff('month', cohort_month, activity_month) AS months_since,
+                count(DISTINCT person_id) AS active_customers,
+                sum(orders) AS orders,
+                sum(revenue) AS revenue
+            FROM activity
+            GROUP BY 1, 2
+        )
+        SELECT
+            sk(cohort_month, months_since, NULL) AS cohort_retention_sk,
+            cohort_month, months_since,
+            max(active_customers) FILTER (WHERE months_since = 0) OVER (PARTITION BY cohort_month) AS cohort_size,
+            active_customers,
+            round(100.0 * active_customers / cohort_size, 2) AS retention_rate,
+            orders,
+            money(revenue) AS revenue,
+            getvariable('generated_at')::TIMESTAMP AS last_synced
+        FROM cells
+    """,
+    "AGG_SEGMENT_DAILY_ACTIVITY": """
+        SELECT
+            o.order_day AS date_day,
+            p.churn_risk_segment, p.clv_segment,
+            (o.person_number - 1) // 32768 + 1 AS bitmap_bucket,
+            list(DISTINCT (o.person_number - 1) % 32768) AS active_people,
+            count(DISTINCT o.person_id) AS active_customers
+        FROM orders o
+        JOIN {schema}.DIM_PERSON p ON p.person_id = o.person_id
+        GROUP BY 1, 2, 3, 4
+    """,
+    "AGG_SEGMENT_DAILY_SKETCHES": """
+        SELECT
+            o.order_day AS date_day,
+            p.churn_risk_segment, p.clv_segment,
+            list(DISTINCT o.person_id) AS active_people_sketch,
+            count(DISTINCT o.person_id) AS active_customers
+        FROM orders o
+        JOIN {schema}.DIM_PERSON p ON p.person_id = o.person_id
+        GROUP BY 1, 2, 3
+    """,
+    "AGG_DAILY_CAMPAIGN_PERFORMANCE": """
+        SELECT
+            sk(date_day, platform, campaign_id) AS daily_campaign_performance_sk,
+            date_day, platform, account_id, campaign_id, campaign_name, status, campaign_type,
+            sum(impressions) AS impressions,
+            sum(clicks) AS clicks,
+            sum(spend) AS spend,
+            sum(conversions) AS conversions,
+            sum(conversion_value) AS conversion_value,
+            sum(view_through_conversions) AS view_through_conversions,
+            count(*) AS source_rows,
+            max(last_synced) AS last_synced
+        FROM {schema}.FCT_CAMPAIGN_PERFORMANCE
+        GROUP BY date_day, platform, account_id, campaign_id, campaign_name, status, campaign_type
+    """,
+    "AGG_DAILY_PERFORMANCE": """
+        SELECT
+            sk(date_day, platform, NULL) AS daily_performance_sk,
+            date_day, platform,
+            sum(impressions) AS impressions,
+            sum(clicks) AS clicks,
+            sum(spend) AS spend,
+            sum(conversions) AS conversions,
+            sum(conversion_value) AS conversion_value,
+            sum(view_through_conversions) AS view_through_conversions,
+            count(DISTINCT campaign_id) AS active_campaigns,
+            sum(source_rows) AS source_rows,
+            max(last_synced) AS last_synced
+        FROM {schema}.AGG_DAILY_CAMPAIGN_PERFORMANCE
+        GROUP BY date_day, platform
+    """,
+    "AGG_MONTHLY_PERFORMANCE": """
+        SELECT
+            sk(date_trunc('month', date_day), platform, NULL) AS monthly_performance_sk,
+            date_trunc('month', date_day)::DATE AS date_month,
+            date_trunc('month', date_day)::DATE AS date_day,
+            platform,
+            sum(impressions) AS impressions,
+            sum(clicks) AS clicks,
+            sum(spend) AS spend,
+            sum(conversions) AS conversions,
+            sum(conversion_value) AS conversion_value,
+            sum(view_through_conversions) AS view_through_conversions,
+            count(DISTINCT date_day) AS active_days,
+            max(month_active_days) AS month_active_days,
+            max(date_day) AS last_date_day,
+            max(last_synced) AS last_synced
+        FROM (
+            SELECT
+                *,
+                count(DISTINCT date_day) OVER (PARTITION BY date_trunc('month', date_day)) AS month_active_days
+            FROM {schema}.AGG_DAILY_PERFORMANCE
+        )
+        GROUP BY date_trunc('month', date_day), platform
+    """,
+}
+
+# Facts are clustered on these in Snowflake; sorting gives DuckDB the same zone-map pruning.
+_SORT_KEYS = {
+    "FCT_CAMPAIGN_PERFORMANCE": "platform, date_day",
+    "FCT_KEYWORD_PERFORMANCE": "date_day",
+    "FCT_AD_PERFORMANCE": "platform, date_day",
+    "FCT_GA4_GEO": "geo_level, date_day",
+    "FCT_META_DELIVERY": "dimension_type, date_day",
+    "FCT_MAGENTO_ORDER": "order_date_day",
+    "AGG_DAILY_CAMPAIGN_PERFORMANCE": "platform, date_day",
+}
+
+
+def generate_marts(
+    path: Path | str,
+    scale: Scale,
+    seed: int = 0,
+    end_date: date = DEFAULT_END_DATE,
+    sessions_per_day: Optional[int] = None
+) -> dict[str, int]:
+    """
+    Write synthetic marts to a DuckDB file, replacing any existing file.
+
+    Args:
+        path: Database file to create
+        scale: Size of the data (see SCALES)
+        seed: Changes every generated value; same seed, same data
+        end_date: Last day of history
+        sessions_per_day: GA4 sessions per day; defaults to 50 per campaign
+
+    Returns:
+        Row count per table
+    """
+    if duckdb is None:
+        raise RuntimeError("duckdb is required to generate synthetic marts")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    # Morning after the last day, like a nightly dbt run; fixed so reruns match.
+    generated_at = datetime(end_date.year, end_date.month, end_date.day, 6) + timedelta(days=1)
+
+    connection = duckdb.connect()
+    try:
+        escaped = str(path).replace("'", "''")
+        connection.execute(f"ATTACH '{escaped}' AS {DATABASE}")
+        connection.execute(f"CREATE SCHEMA {DATABASE}.{SCHEMA}")
+        connection.execute(f"CREATE SCHEMA {DATABASE}.{METADATA_SCHEMA}")
+        for name, value in {
+            "seed": seed,
+            "end_date": end_date.isoformat(),
+            "generated_at": generated_at.isoformat(),
+            "days": scale.days,
+            "campaigns": scale.campaigns,
+            "ad_groups": scale.ad_groups,
+            "keywords": scale.keywords,
+            "ads": scale.ads,
+            "customers": scale.customers,
+            "pages": scale.pages,
+            "items": scale.items,
+            "hourly_days": scale.hourly_days,
+            "sessions_per_day": sessions_per_day or 50 * scale.campaigns,
+        }.items():
+            connection.execute(f"SET VARIABLE {name} = ?", [value])
+        for macro in _MACROS:
+            connection.execute(macro)
+
+        placeholders = {
+            "schema": f"{DATABASE}.{SCHEMA}",
+            "google_account": GOOGLE_ADS_ACCOUNT,
+            "meta_account": META_ACCOUNT,
+            "ga4_property": GA4_PROPERTY,
+        }
+        connection.execute(_DIMENSIONS.format(**placeholders))
+
+        counts = {}
+        for table, select in _MARTS.items():
+            started = time.perf_counter()
+            order_by = f" ORDER BY {_SORT_KEYS[table]}" if table in _SORT_KEYS else ""
+            connection.execute(
+                f"CREATE TABLE {DATABASE}.{SCHEMA}.{table} AS SELECT * FROM ({select.format(**placeholders)}){order_by}"
+            )
+            counts[table] = connection.execute(f"SELECT count(*) FROM {DATABASE}.{SCHEMA}.{table}").fetchone()[0]
+            logger.info("Generated %s: %d rows in %.1fs", table, counts[table], time.perf_counter() - started)
+
+        connection.execute(
+            f"CREATE TABLE {DATABASE}.{METADATA_SCHEMA}.TABLES "
+            "(TABLE_SCHEMA VARCHAR, TABLE_NAME VARCHAR, LAST_ALTERED TIMESTAMPTZ, ROW_COUNT BIGINT)"
+        )
+        connection.executemany(
+            f"INSERT INTO {DATABASE}.{METADATA_SCHEMA}.TABLES VALUES (?, ?, ?, ?)",
+            [[SCHEMA, table, generated_at.replace(tzinfo=timezone.utc), rows] for table, rows in counts.items()],
+        )
+        connection.execute(f"DETACH {DATABASE}")
+    finally:
+        connection.close()
+    return counts
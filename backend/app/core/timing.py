@@ -0,0 +1,210 @@
+"""
+Per-request latency breakdown, reported as a ``Server-Timing`` header.
+
+A request's wall time is split into phases:
+
+- ``validate``: parsing and validating query parameters (FastAPI dependencies)
+- ``db``: warehouse queries, with one ``q<n>`` entry per query
+- ``mapping``: the rest of the endpoint (service logic and model mapping)
+- ``serialize``: response-model validation and JSON encoding
+- ``total``: everything, as seen by the middleware
+
+Browsers show the header in the network panel, and load-test tools can read
+it, so a slow endpoint can be told apart as warehouse-bound or Python-bound
+without a profiler. The same breakdown is logged once per request.
+
+Routes get the validate/mapping/serialize split by using ``TimedRoute``:
+
+    router = APIRouter(route_class=TimedRoute)
+"""
+import functools
+import inspect
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+from app.core.instrumentation import QueryRecord, add_query_listener
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestTiming:
+    """Phase timestamps and warehouse queries of one request."""
+    started: float = field(default_factory=time.perf_counter)
+    handler_started: Optional[float] = None
+    endpoint_started: Optional[float] = None
+    endpoint_finished: Optional[float] = None
+    handler_finished: Optional[float] = None
+    queries: list[QueryRecord] = field(default_factory=list)
+    # (start, end) of each query; fanned-out queries overlap
+    intervals: list[tuple[float, float]] = field(default_factory=list)
+
+    def add_query(self, record: QueryRecord) -> None:
+        finished = time.perf_counter()
+        self.queries.append(record)
+        self.intervals.append((finished - record.total, finished))
+
+    @property
+    def db(self) -> float:
+        """Wall time with at least one query in flight (not the sum of queries)."""
+        busy = 0.0
+        current_start = current_end = None
+        for start, end in sorted(self.intervals):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    busy += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            busy += current_end - current_start
+        return busy
+
+    def phases(self, now: Optional[float] = None) -> dict[str, float]:
+        """Return the duration of each known phase in seconds."""
+        now = time.perf_counter() if now is None else now
+        phases: dict[str, float] = {}
+        if self.handler_started is not None and self.endpoint_started is not None:
+            phases["validate"] = self.endpoint_started - self.handler_started
+        phases["db"] = self.db
+        if self.endpoint_started is not None and self.endpoint_finished is not None:
+            # Queries run inside the endpoint; what remains is Python-side work.
+            endpoint = self.endpoint_finished - self.endpoint_started
+            phases["mapping"] = max(endpoint - self.db, 0.0)
+        if self.endpoint_finished is not None and self.handler_finished is not None:
+            phases["serialize"] = self.handler_finished - self.endpoint_finished
+        phases["total"] = now - self.started
+        return phases
+
+    def header(self, now: Optional[float] = None) -> str:
+        """Format the breakdown as a ``Server-Timing`` header value (in ms)."""
+        entries = []
+        for name, seconds in self.phases(now).items():
+            if name == "db":
+                entries.append(f'db;dur={seconds * 1000:.1f};desc="{len(self.queries)} queries"')
+            else:
+                entries.append(f"{name};dur={seconds * 1000:.1f}")
+        for index, query in enumerate(self.queries, start=1):
+            entries.append(f'q{index};dur={query.total * 1000:.1f};desc="{query.name}"')
+        return ", ".join(entries)
+
+
+_request_timing: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def current_request_timing() -> Optional[RequestTiming]:
+    """Return the timing of the request being served, if any."""
+    return _request_timing.get()
+
+
+def _collect_query(record: QueryRecord) -> None:
+    # Runs on the query worker thread; run_in_executor copies the request context.
+    timing = _request_timing.get()
+    if timing is not None:
+        timing.add_query(record)
+
+
+add_query_listener(_collect_query)
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap ``endpoint`` so its start and end are recorded on the request timing."""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            timing = _request_timing.get()
+            if timing is None:
+                return await endpoint(*args, **kwargs)
+            timing.endpoint_started = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                timing.endpoint_finished = time.perf_counter()
+        return timed
+
+    @functools.wraps(endpoint)
+    def timed_sync(*args: Any, **kwargs: Any) -> Any:
+        timing = _request_timing.get()
+        if timing is None:
+            return endpoint(*args, **kwargs)
+        timing.endpoint_started = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            timing.endpoint_finished = time.perf_counter()
+    return timed_sync
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute that records when validation, the endpoint and serialization
+    start and finish, so ``ServerTimingMiddleware`` can report them separately.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            timing = _request_timing.get()
+            if timing is None:
+                return await handler(request)
+            timing.handler_started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                timing.handler_finished = time.perf_counter()
+
+        return timed_handler
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware that adds a ``Server-Timing`` header to HTTP responses and
+    logs the same breakdown when the response completes.
+
+    For streaming responses the header only covers work done before the first
+    byte; the log line covers the whole request.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or not settings.SERVER_TIMING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _request_timing.set(timing)
+        status_code = 500
+
+        async def send_with_timing(message: dict) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.header().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timing.reset(token)
+            phases = timing.phases()
+            logger.info(
+                "request method=%s path=%s status=%d %s queries=%d",
+                scope["method"], scope["path"], status_code,
+                " ".join(f"{name}_ms={seconds * 1000:.1f}" for name, seconds in phases.items()),
+                len(timing.queries),
+            )
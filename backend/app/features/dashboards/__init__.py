@@ -0,0 +1,6 @@
+"""
+Dashboards feature module - Every widget of a dashboard in one request.
+"""
+from .router import router
+
+__all__ = ["router"]
@@ -0,0 +1,68 @@
+"""
+Dashboards - Pydantic models (DTOs).
+"""
+from datetime import date
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class WidgetInfo(BaseModel):
+    """A widget of a dashboard."""
+    widget: str = Field(..., description="Widget identifier, unique within the dashboard")
+    title: str = Field(..., description="Display title")
+    endpoint: str = Field(..., description="Standalone endpoint serving the same data")
+
+
+class DashboardInfo(BaseModel):
+    """A dashboard and its widgets."""
+    dashboard_id: str = Field(..., description="Dashboard identifier")
+    title: str = Field(..., description="Display title")
+    description: str = Field(..., description="What the dashboard is for")
+    widgets: list[WidgetInfo] = Field(..., description="Widgets in display order")
+
+
+class DashboardListResponse(BaseModel):
+    """Response model for the list of dashboards."""
+    dashboards: list[DashboardInfo] = Field(..., description="Available dashboards")
+    total: int = Field(..., description="Number of dashboards")
+
+
+class WidgetError(BaseModel):
+    """Why a widget could not be loaded."""
+    status_code: int = Field(..., description="HTTP status the standalone endpoint would have returned")
+    detail: str = Field(..., description="Error message")
+
+
+class WidgetResult(BaseModel):
+    """One widget's data, or its error."""
+    widget: str = Field(..., description="Widget identifier")
+    title: str = Field(..., description="Display title")
+    data: Optional[Any] = Field(None, description="The standalone endpoint's response body; null on error")
+    error: Optional[WidgetError] = Field(None, description="Set when the widget failed")
+    elapsed_ms: float = Field(..., description="Time taken to load the widget in milliseconds")
+
+
+class DashboardStats(BaseModel):
+    """How a dashboard request was executed."""
+    widgets: int = Field(..., description="Widgets rendered")
+    calls: int = Field(..., description="Distinct service calls after deduplicating widgets")
+    queries_requested: int = Field(..., description="Warehouse reads issued by the widgets")
+    queries_executed: int = Field(..., description="Distinct reads actually run after sharing identical ones")
+    elapsed_ms: float = Field(..., description="Total time in milliseconds")
+
+
+class DashboardResponse(BaseModel):
+    """Response model for a dashboard with every widget's data."""
+    dashboard_id: str = Field(..., description="Dashboard identifier")
+    title: str = Field(..., description="Display title")
+    date_from: Optional[date] = Field(None, description="Start of the date filter")
+    date_to: Optional[date] = Field(None, description="End of the date filter")
+    widgets: list[WidgetResult] = Field(..., description="Widget results in display order")
+    stats: DashboardStats = Field(..., description="Execution statistics")
+
+
+class DashboardStreamEnd(BaseModel):
+    """Final line of a streamed dashboard, after every widget line."""
+    dashboard_id: str = Field(..., description="Dashboard identifier")
+    stats: DashboardStats = Field(..., description="Execution statistics")
@@ -0,0 +1,374 @@
+"""
+Dashboards registry - the widgets each dashboard in docs/AGENT_DASHBOARD_MAPPING.md renders.
+
+Every widget is served by an existing feature service, so a dashboard
+returns exactly what the widget's standalone endpoint would for the same
+date range. Klaviyo and Magento have no dedicated features yet; their
+dashboards use the widgets that read the Klaviyo profile (DIM_PERSON) and
+order marts until they do.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.features.marketing_platforms.ga4_analytics.conversion_funnel.service import ga4_conversion_funnel_service
+from app.features.marketing_platforms.ga4_analytics.daily_traffic_trend.service import ga4_daily_traffic_trend_service
+from app.features.marketing_platforms.ga4_analytics.geographic_performance.service import ga4_geographic_performance_service
+from app.features.marketing_platforms.ga4_analytics.hourly_traffic_pattern.service import ga4_hourly_traffic_pattern_service
+from app.features.marketing_platforms.ga4_analytics.landing_pages.service import ga4_landing_pages_service
+from app.features.marketing_platforms.ga4_analytics.overview.service import ga4_overview_service
+from app.features.marketing_platforms.ga4_analytics.technology_breakdown.service import ga4_technology_breakdown_service
+from app.features.marketing_platforms.ga4_analytics.top_pages.service import ga4_top_pages_service
+from app.features.marketing_platforms.ga4_analytics.traffic_sources.service import ga4_traffic_sources_service
+from app.features.marketing_platforms.google_ads.account_health.service import account_health_service
+from app.features.marketing_platforms.google_ads.ad_group_performance.service import ad_group_performance_service
+from app.features.marketing_platforms.google_ads.campaign_performance.service import campaign_performance_service
+from app.features.marketing_platforms.google_ads.daily_performance_trend.service import daily_performance_trend_service
+from app.features.marketing_platforms.google_ads.overview.service import google_ads_overview_service
+from app.features.marketing_platforms.google_ads.spend_by_campaign_type.service import spend_by_campaign_type_service
+from app.features.marketing_platforms.google_ads.top_keywords.service import (
+    top_keywords_service as google_ads_top_keywords_service
+)
+from app.features.marketing_platforms.meta_ads.ad_creatives.service import meta_ads_creative_service
+from app.features.marketing_platforms.meta_ads.ad_sets.service import meta_ads_ad_set_service
+from app.features.marketing_platforms.meta_ads.campaigns.service import meta_ads_campaigns_service
+from app.features.marketing_platforms.meta_ads.daily_performance.service import meta_ads_daily_performance_service
+from app.features.marketing_platforms.meta_ads.demographics_age.service import meta_ads_demographics_age_service
+from app.features.marketing_platforms.meta_ads.demographics_gender.service import meta_ads_demographics_gender_service
+from app.features.marketing_platforms.meta_ads.device.service import meta_ads_device_service
+from app.features.marketing_platforms.meta_ads.engagement.service import meta_ads_engagement_service
+from app.features.marketing_platforms.meta_ads.overview.service import meta_ads_overview_service
+from app.features.marketing_platforms.meta_ads.placements.service import meta_ads_placements_service
+from app.features.thoughtlets.audience_behavioral.engagement_funnel.service import engagement_funnel_service
+from app.features.thoughtlets.audience_behavioral.geographic_performance.service import geographic_performance_service
+from app.features.thoughtlets.audience_behavioral.overview.service import audience_behavioral_overview_service
+from app.features.thoughtlets.audience_behavioral.top_pages.service import top_pages_service
+from app.features.thoughtlets.audience_behavioral.traffic_by_source.service import traffic_by_source_service
+from app.features.thoughtlets.audience_behavioral.users_by_country.service import users_by_country_service
+from app.features.thoughtlets.audience_behavioral.users_by_device.service import users_by_device_service
+from app.features.thoughtlets.core_performance.conversions_trend.service import conversions_trend_service
+from app.features.thoughtlets.core_performance.overview.service import core_performance_overview_service
+from app.features.thoughtlets.core_performance.revenue_vs_spend.service import revenue_vs_spend_service
+from app.features.thoughtlets.core_performance.roas_by_platform.service import (
+    roas_by_platform_service as core_roas_by_platform_service
+)
+from app.features.thoughtlets.creative_messaging.ad_set_performance.service import ad_set_performance_service
+from app.features.thoughtlets.creative_messaging.creative_type_distribution.service import (
+    creative_type_distribution_service
+)
+from app.features.thoughtlets.creative_messaging.creatives.service import creatives_service
+from app.features.thoughtlets.creative_messaging.cta_types.service import cta_types_service
+from app.features.thoughtlets.creative_messaging.ctr_by_campaign.service import ctr_by_campaign_service
+from app.features.thoughtlets.creative_messaging.impressions_by_campaign.service import impressions_by_campaign_service
+from app.features.thoughtlets.creative_messaging.overview.service import overview_service as creative_overview_service
+from app.features.thoughtlets.funnel_attribution.conversions_by_channel.service import conversions_by_channel_service
+from app.features.thoughtlets.funnel_attribution.ecommerce_funnel.service import ecommerce_funnel_service
+from app.features.thoughtlets.funnel_attribution.meta_ads_funnel.service import meta_ads_funnel_service
+from app.features.thoughtlets.funnel_attribution.monthly_conversions.service import monthly_conversions_service
+from app.features.thoughtlets.funnel_attribution.overview.service import funnel_attribution_overview_service
+from app.features.thoughtlets.funnel_attribution.traffic_source_attribution.service import (
+    traffic_source_attribution_service
+)
+from app.features.thoughtlets.revenue_lifetime_value.cac_metrics.service import cac_metrics_service
+from app.features.thoughtlets.revenue_lifetime_value.churn_distribution.service import churn_distribution_service
+from app.features.thoughtlets.revenue_lifetime_value.clv_breakdown.service import clv_breakdown_service
+from app.features.thoughtlets.revenue_lifetime_value.cohort_retention.service import cohort_retention_service
+from app.features.thoughtlets.revenue_lifetime_value.customer_segments.service import customer_segments_service
+from app.features.thoughtlets.revenue_lifetime_value.customer_types.service import customer_types_service
+from app.features.thoughtlets.revenue_lifetime_value.overview.service import revenue_overview_service
+from app.features.thoughtlets.revenue_lifetime_value.retention.service import retention_service
+from app.features.thoughtlets.search_keywords.keywords.service import keywords_service
+from app.features.thoughtlets.search_keywords.match_type.service import match_type_service
+from app.features.thoughtlets.search_keywords.overview.service import search_keywords_overview_service
+from app.features.thoughtlets.search_keywords.search_campaigns.service import search_campaigns_service
+from app.features.thoughtlets.search_keywords.top_keywords.service import top_keywords_service
+from app.features.thoughtlets.spend_and_budget.monthly_spend_trend.service import monthly_spend_trend_service
+from app.features.thoughtlets.spend_and_budget.overview.service import spend_and_budget_overview_service
+from app.features.thoughtlets.spend_and_budget.roas_by_platform.service import roas_by_platform_service
+from app.features.thoughtlets.spend_and_budget.spend_by_ad_group.service import spend_by_ad_group_service
+from app.features.thoughtlets.spend_and_budget.spend_by_campaign.service import spend_by_campaign_service
+from app.features.thoughtlets.spend_and_budget.spend_by_platform.service import spend_by_platform_service
+
+THOUGHTLETS = "/api/v1/thoughtlets"
+GA4 = "/api/v1/marketing-platforms/ga4-analytics"
+GOOGLE_ADS = "/api/v1/marketing-platforms/google-ads"
+META_ADS = "/api/v1/marketing-platforms/meta-ads"
+
+
+@dataclass(frozen=True)
+class Widget:
+    """
+    One panel of a dashboard.
+
+    Attributes:
+        id: Widget identifier, unique within its dashboard
+        title: Display title
+        endpoint: Standalone endpoint serving the same data (also selects
+            the query cache TTL)
+        load: Service method returning the widget's response model; sync
+            or async
+        dated: Whether ``load`` accepts the date_from/date_to filter
+    """
+    id: str
+    title: str
+    endpoint: str
+    load: Callable[..., Any]
+    dated: bool = True
+
+
+@dataclass(frozen=True)
+class Dashboard:
+    """A dashboard and its widgets, in display order."""
+    id: str
+    title: str
+    description: str
+    widgets: tuple[Widget, ...]
+
+
+CORE_PERFORMANCE_WIDGETS = (
+    Widget("overview", "KPI Summary", f"{THOUGHTLETS}/core-performance/overview",
+           core_performance_overview_service.get_overview),
+    Widget("conversions_trend", "Conversions Trend", f"{THOUGHTLETS}/core-performance/conversions-trend",
+           conversions_trend_service.get_conversions_trend),
+    Widget("revenue_vs_spend", "Revenue vs Spend", f"{THOUGHTLETS}/core-performance/revenue-vs-spend",
+           revenue_vs_spend_service.get_revenue_vs_spend),
+    Widget("roas_by_platform", "ROAS by Platform", f"{THOUGHTLETS}/core-performance/roas-by-platform",
+           core_roas_by_platform_service.get_roas_by_platform),
+)
+
+SPEND_AND_BUDGET_WIDGETS = (
+    Widget("overview", "Spend Summary", f"{THOUGHTLETS}/spend-and-budget/overview",
+           spend_and_budget_overview_service.get_overview),
+    Widget("spend_by_platform", "Spend by Platform", f"{THOUGHTLETS}/spend-and-budget/spend-by-platform",
+           spend_by_platform_service.get_spend_by_platform),
+    Widget("spend_by_campaign", "Spend by Campaign", f"{THOUGHTLETS}/spend-and-budget/spend-by-campaign",
+           spend_by_campaign_service.get_spend_by_campaign),
+    Widget("spend_by_ad_group", "Spend by Ad Group", f"{THOUGHTLETS}/spend-and-budget/spend-by-ad-group",
+           spend_by_ad_group_service.get_spend_by_ad_group),
+    Widget("roas_by_platform", "ROAS by Platform", f"{THOUGHTLETS}/spend-and-budget/roas-by-platform",
+           roas_by_platform_service.get_roas_by_platform),
+    Widget("monthly_spend_trend", "Monthly Spend Trend", f"{THOUGHTLETS}/spend-and-budget/monthly-spend-trend",
+           monthly_spend_trend_service.get_monthly_spend_trend),
+)
+
+AUDIENCE_BEHAVIORAL_WIDGETS = (
+    Widget("overview", "Audience Summary", f"{THOUGHTLETS}/audience-behavioral/overview",
+           audience_behavioral_overview_service.get_overview),
+    Widget("users_by_device", "Users by Device", f"{THOUGHTLETS}/audience-behavioral/users-by-device",
+           users_by_device_service.get_users_by_device),
+    Widget("users_by_country", "Users by Country", f"{THOUGHTLETS}/audience-behavioral/users-by-country",
+           users_by_country_service.get_users_by_country),
+    Widget("geographic_performance", "Geographic Performance",
+           f"{THOUGHTLETS}/audience-behavioral/geographic-performance",
+           geographic_performance_service.get_geographic_performance),
+    Widget("traffic_by_source", "Traffic by Source", f"{THOUGHTLETS}/audience-behavioral/traffic-by-source",
+           traffic_by_source_service.get_traffic_by_source),
+    Widget("top_pages", "Top Pages", f"{THOUGHTLETS}/audience-behavioral/top-pages",
+           top_pages_service.get_top_pages),
+    Widget("engagement_funnel", "Engagement Funnel", f"{THOUGHTLETS}/audience-behavioral/engagement-funnel",
+           engagement_funnel_service.get_engagement_funnel),
+)
+
+FUNNEL_ATTRIBUTION_WIDGETS = (
+    Widget("overview", "Funnel Summary", f"{THOUGHTLETS}/funnel-attribution/overview",
+           funnel_attribution_overview_service.get_overview),
+    Widget("ecommerce_funnel", "E-commerce Funnel", f"{THOUGHTLETS}/funnel-attribution/ecommerce-funnel",
+           ecommerce_funnel_service.get_funnel),
+    Widget("meta_ads_funnel", "Meta Ads Funnel", f"{THOUGHTLETS}/funnel-attribution/meta-ads-funnel",
+           meta_ads_funnel_service.get_funnel),
+    Widget("conversions_by_channel", "Conversions by Channel",
+           f"{THOUGHTLETS}/funnel-attribution/conversions-by-channel",
+           conversions_by_channel_service.get_conversions_by_channel),
+    Widget("traffic_source_attribution", "Traffic Source Attribution",
+           f"{THOUGHTLETS}/funnel-attribution/traffic-source-attribution",
+           traffic_source_attribution_service.get_traffic_source_attribution),
+    Widget("monthly_conversions", "Monthly Conversions", f"{THOUGHTLETS}/funnel-attribution/monthly-conversions",
+           monthly_conversions_service.get_monthly_conversions),
+)
+
+CREATIVE_MESSAGING_WIDGETS = (
+    Widget("overview", "Creative Summary", f"{THOUGHTLETS}/creative-messaging/overview",
+           creative_overview_service.get_overview_metrics),
+    Widget("creatives", "Top Creatives", f"{THOUGHTLETS}/creative-messaging/creatives",
+           creatives_service.get_creatives),
+    Widget("creative_type_distribution", "Creative Type Distribution",
+           f"{THOUGHTLETS}/creative-messaging/creative-type-distribution",
+           creative_type_distribution_service.get_creative_type_distribution),
+    Widget("cta_types", "CTA Types", f"{THOUGHTLETS}/creative-messaging/cta-types",
+           cta_types_service.get_cta_types),
+    Widget("ctr_by_campaign", "CTR by Campaign", f"{THOUGHTLETS}/creative-messaging/ctr-by-campaign",
+           ctr_by_campaign_service.get_ctr_by_campaign),
+    Widget("impressions_by_campaign", "Impressions by Campaign",
+           f"{THOUGHTLETS}/creative-messaging/impressions-by-campaign",
+           impressions_by_campaign_service.get_impressions_by_campaign),
+    Widget("ad_set_performance", "Ad Set Performance", f"{THOUGHTLETS}/creative-messaging/ad-set-performance",
+           ad_set_performance_service.get_ad_set_performance),
+)
+
+SEARCH_KEYWORDS_WIDGETS = (
+    Widget("overview", "Search Summary", f"{THOUGHTLETS}/search-keywords/overview",
+           search_keywords_overview_service.get_overview),
+    Widget("top_keywords", "Top Keywords", f"{THOUGHTLETS}/search-keywords/top-keywords",
+           top_keywords_service.get_top_keywords),
+    Widget("keywords", "Keyword Performance", f"{THOUGHTLETS}/search-keywords/keywords",
+           keywords_service.get_keywords_performance),
+    Widget("match_type", "Match Type Distribution", f"{THOUGHTLETS}/search-keywords/match-type",
+           match_type_service.get_match_type_distribution),
+    Widget("search_campaigns", "Search Campaigns", f"{THOUGHTLETS}/search-keywords/search-campaigns",
+           search_campaigns_service.get_search_campaigns),
+)
+
+REVENUE_LIFETIME_VALUE_WIDGETS = (
+    Widget("overview", "Revenue Summary", f"{THOUGHTLETS}/revenue-lifetime-value/overview",
+           revenue_overview_service.get_overview),
+    Widget("cac_metrics", "CAC Metrics", f"{THOUGHTLETS}/revenue-lifetime-value/cac-metrics",
+           cac_metrics_service.get_cac_metrics),
+    Widget("clv_breakdown", "CLV Breakdown", f"{THOUGHTLETS}/revenue-lifetime-value/clv-breakdown",
+           clv_breakdown_service.get_clv_breakdown, dated=False),
+    Widget("churn_distribution", "Churn Distribution", f"{THOUGHTLETS}/revenue-lifetime-value/churn-distribution",
+           churn_distribution_service.get_churn_distribution),
+    Widget("customer_segments", "Customer Segments", f"{THOUGHTLETS}/revenue-lifetime-value/customer-segments",
+           customer_segments_service.get_customer_segments),
+    Widget("customer_types", "Customer Types", f"{THOUGHTLETS}/revenue-lifetime-value/customer-types",
+           customer_types_service.get_customer_types),
+    Widget("retention", "Retention", f"{THOUGHTLETS}/revenue-lifetime-value/retention",
+           retention_service.get_retention),
+    Widget("cohort_retention", "Cohort Retention", f"{THOUGHTLETS}/revenue-lifetime-value/cohort-retention",
+           cohort_retention_service.get_cohort_retention),
+)
+
+GA4_WIDGETS = (
+    Widget("overview", "GA4 Summary", f"{GA4}/overview", ga4_overview_service.get_overview),
+    Widget("daily_traffic_trend", "Users Over Time", f"{GA4}/daily-traffic-trend",
+           ga4_daily_traffic_trend_service.get_daily_traffic_trend),
+    Widget("traffic_sources", "Traffic by Source", f"{GA4}/traffic-sources",
+           ga4_traffic_sources_service.get_traffic_sources),
+    Widget("top_pages", "Top Pages", f"{GA4}/top-pages", ga4_top_pages_service.get_top_pages),
+    Widget("landing_pages", "Landing Pages", f"{GA4}/landing-pages", ga4_landing_pages_service.get_landing_pages),
+    Widget("conversion_funnel", "Conversion Funnel", f"{GA4}/conversion-funnel",
+           ga4_conversion_funnel_service.get_conversion_funnel),
+    Widget("geographic_performance", "Geographic Performance", f"{GA4}/geographic-performance",
+           ga4_geographic_performance_service.get_geographic_performance),
+    Widget("technology_breakdown", "Device Breakdown", f"{GA4}/technology-breakdown",
+           ga4_technology_breakdown_service.get_technology_breakdown),
+    Widget("hourly_traffic_pattern", "Hourly Traffic Pattern", f"{GA4}/hourly-traffic-pattern",
+           ga4_hourly_traffic_pattern_service.get_hourly_traffic_pattern),
+)
+
+GOOGLE_ADS_WIDGETS = (
+    Widget("overview", "Google Ads Summary", f"{GOOGLE_ADS}/overview", google_ads_overview_service.get_overview),
+    Widget("daily_performance_trend", "Spend vs Conversions", f"{GOOGLE_ADS}/daily-performance-trend",
+           daily_performance_trend_service.get_daily_performance_trend),
+    Widget("campaign_performance", "Campaign Performance", f"{GOOGLE_ADS}/campaign-performance",
+           campaign_performance_service.get_campaign_performance),
+    Widget("ad_group_performance", "Ad Group Performance", f"{GOOGLE_ADS}/ad-group-performance",
+           ad_group_performance_service.get_ad_group_performance),
+    Widget("top_keywords", "Keyword Performance", f"{GOOGLE_ADS}/top-keywords",
+           google_ads_top_keywords_service.get_top_keywords),
+    Widget("spend_by_campaign_type", "Spend by Campaign Type", f"{GOOGLE_ADS}/spend-by-campaign-type",
+           spend_by_campaign_type_service.get_spend_by_campaign_type),
+    Widget("account_health", "Account Health", f"{GOOGLE_ADS}/account-health",
+           account_health_service.get_account_health),
+)
+
+META_ADS_WIDGETS = (
+    Widget("overview", "Meta Ads Summary", f"{META_ADS}/overview", meta_ads_overview_service.get_overview),
+    Widget("daily_performance", "Reach vs Frequency", f"{META_ADS}/daily-performance",
+           meta_ads_daily_performance_service.get_daily_performance),
+    Widget("placements", "Performance by Placement", f"{META_ADS}/placements",
+           meta_ads_placements_service.get_placements),
+    Widget("ad_creatives", "Ad Creative Performance", f"{META_ADS}/ad-creatives",
+           meta_ads_creative_service.get_creatives),
+    Widget("demographics_age", "Audience by Age", f"{META_ADS}/demographics/age",
+           meta_ads_demographics_age_service.get_demographics_age),
+    Widget("demographics_gender", "Audience by Gender", f"{META_ADS}/demographics/gender",
+           meta_ads_demographics_gender_service.get_demographics_gender),
+    Widget("device", "Device Breakdown", f"{META_ADS}/device", meta_ads_device_service.get_devices),
+    Widget("campaigns", "Spend Distribution", f"{META_ADS}/campaigns", meta_ads_campaigns_service.get_campaigns),
+    Widget("ad_sets", "Ad Set Performance", f"{META_ADS}/ad-sets", meta_ads_ad_set_service.get_ad_sets),
+    Widget("engagement", "Engagement", f"{META_ADS}/engagement", meta_ads_engagement_service.get_engagement),
+)
+
+# Klaviyo profiles (DIM_PERSON) back the customer value and segment widgets.
+KLAVIYO_WIDGETS = (
+    Widget("overview", "Subscriber Revenue Summary", f"{THOUGHTLETS}/revenue-lifetime-value/overview",
+           revenue_overview_service.get_overview),
+    Widget("customer_segments", "Subscriber Segments", f"{THOUGHTLETS}/revenue-lifetime-value/customer-segments",
+           customer_segments_service.get_customer_segments),
+    Widget("churn_distribution", "Churn Distribution", f"{THOUGHTLETS}/revenue-lifetime-value/churn-distribution",
+           churn_distribution_service.get_churn_distribution),
+    Widget("clv_breakdown", "CLV Breakdown", f"{THOUGHTLETS}/revenue-lifetime-value/clv-breakdown",
+           clv_breakdown_service.get_clv_breakdown, dated=False),
+)
+
+# Order marts (FCT_MAGENTO_ORDER, FCT_ORDER_DETAILS, FCT_ECOMMERCE_ITEM) back the store widgets.
+MAGENTO_WIDGETS = (
+    Widget("overview", "Store Summary", f"{THOUGHTLETS}/funnel-attribution/overview",
+           funnel_attribution_overview_service.get_overview),
+    Widget("ecommerce_funnel", "Order Funnel", f"{THOUGHTLETS}/funnel-attribution/ecommerce-funnel",
+           ecommerce_funnel_service.get_funnel),
+    Widget("customer_types", "New vs Returning Customers", f"{THOUGHTLETS}/revenue-lifetime-value/customer-types",
+           customer_types_service.get_customer_types),
+    Widget("cohort_retention", "Customer Cohort", f"{THOUGHTLETS}/revenue-lifetime-value/cohort-retention",
+           cohort_retention_service.get_cohort_retention),
+)
+
+OVERALL_PERFORMANCE_WIDGETS = (
+    Widget("overview", "KPI Summary", f"{THOUGHTLETS}/core-performance/overview",
+           core_performance_overview_service.get_overview),
+    Widget("spend_overview", "Spend Summary", f"{THOUGHTLETS}/spend-and-budget/overview",
+           spend_and_budget_overview_service.get_overview),
+    Widget("ga4_overview", "Website Summary", f"{GA4}/overview", ga4_overview_service.get_overview),
+    Widget("revenue_vs_spend", "Spend vs Revenue", f"{THOUGHTLETS}/core-performance/revenue-vs-spend",
+           revenue_vs_spend_service.get_revenue_vs_spend),
+    Widget("roas_by_platform", "Platform ROAS Comparison", f"{THOUGHTLETS}/core-performance/roas-by-platform",
+           core_roas_by_platform_service.get_roas_by_platform),
+    Widget("spend_by_platform", "Marketing Mix", f"{THOUGHTLETS}/spend-and-budget/spend-by-platform",
+           spend_by_platform_service.get_spend_by_platform),
+    Widget("conversions_by_channel", "Channel Performance", f"{THOUGHTLETS}/funnel-attribution/conversions-by-channel",
+           conversions_by_channel_service.get_conversions_by_channel),
+)
+
+DASHBOARDS: dict[str, Dashboard] = {
+    dashboard.id: dashboard
+    for dashboard in (
+        Dashboard("core-performance", "Core Performance Metrics",
+                  "Primary KPIs to determine if campaigns are winning or losing",
+                  CORE_PERFORMANCE_WIDGETS),
+        Dashboard("spend-and-budget", "Spend & Budget Control",
+                  "Spending, budget allocation and ROI optimization",
+                  SPEND_AND_BUDGET_WIDGETS),
+        Dashboard("audience-behavioral", "Audience & Behavioral",
+                  "Who the audience is and how they engage",
+                  AUDIENCE_BEHAVIORAL_WIDGETS),
+        Dashboard("funnel-attribution", "Funnel & Attribution",
+                  "Conversion funnel stages and channel attribution",
+                  FUNNEL_ATTRIBUTION_WIDGETS),
+        Dashboard("creative-messaging", "Creative & Messaging",
+                  "Ad creative and messaging effectiveness",
+                  CREATIVE_MESSAGING_WIDGETS),
+        Dashboard("search-keywords", "Search Intent & Keyword",
+                  "Search keyword performance and match types",
+                  SEARCH_KEYWORDS_WIDGETS),
+        Dashboard("revenue-lifetime-value", "Revenue & Lifetime Value",
+                  "Customer value, acquisition cost and retention",
+                  REVENUE_LIFETIME_VALUE_WIDGETS),
+        Dashboard("ga4", "Google Analytics 4 (GA4)",
+                  "Website traffic, user behavior and conversion analytics from GA4",
+                  GA4_WIDGETS),
+        Dashboard("google-ads", "Google Ads",
+                  "Paid search and display advertising performance from Google Ads",
+                  GOOGLE_ADS_WIDGETS),
+        Dashboard("meta-ads", "Meta Ads (Facebook/Instagram)",
+                  "Social media advertising performance from Meta Ads",
+                  META_ADS_WIDGETS),
+        Dashboard("klaviyo", "Klaviyo (Email Marketing)",
+                  "Subscriber value and engagement from Klaviyo profiles",
+                  KLAVIYO_WIDGETS),
+        Dashboard("magento", "Magento (E-commerce)",
+                  "Store orders, funnel and customer cohorts",
+                  MAGENTO_WIDGETS),
+        Dashboard("overall-performance", "Overall Performance",
+                  "Unified cross-platform marketing performance overview",
+                  OVERALL_PERFORMANCE_WIDGETS),
+    )
+}
@@ -0,0 +1,78 @@
+"""
+Dashboards router - API endpoints for loading a whole dashboard in one request.
+"""
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Path, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.serialization import fast_response
+from app.core.streaming import NDJSON_MEDIA_TYPE
+from app.core.timing import TimedRoute
+from .service import dashboard_service
+from .models import DashboardListResponse, DashboardResponse
+
+router = APIRouter(prefix="/dashboards", tags=["Dashboards"], route_class=TimedRoute)
+
+
+@router.get(
+    "",
+    response_model=DashboardListResponse,
+    summary="List dashboards",
+    description="List every dashboard and the widgets it renders."
+)
+async def list_dashboards():
+    """
+    List the dashboards from docs/AGENT_DASHBOARD_MAPPING.md.
+
+    Each widget names the standalone endpoint that serves the same data.
+    """
+    return dashboard_service.list_dashboards()
+
+
+@router.get(
+    "/{dashboard_id}",
+    response_model=DashboardResponse,
+    summary="Get every widget of a dashboard",
+    description="Load all widgets of a dashboard concurrently for one date range. With stream=true, widgets are sent as newline-delimited JSON as they complete."
+)
+async def get_dashboard(
+    dashboard_id: str = Path(
+        ...,
+        description="Dashboard identifier, e.g. core-performance (see GET /dashboards)",
+        example="core-performance"
+    ),
+    date_from: Optional[date] = Query(
+        default=None,
+        description="Start date for every widget (YYYY-MM-DD format). If not provided, no start date filter.",
+        example="2024-01-01"
+    ),
+    date_to: Optional[date] = Query(
+        default=None,
+        description="End date for every widget (YYYY-MM-DD format). If not provided, no end date filter.",
+        example="2024-12-31"
+    ),
+    stream: bool = Query(
+        default=False,
+        description="Stream one WidgetResult line per widget as it completes, then a DashboardStreamEnd line."
+    ),
+):
+    """
+    Get a dashboard in one request instead of one request per widget.
+
+    Widgets backed by the same service are loaded once, identical warehouse
+    reads across widgets (e.g. the shared campaign scans behind overviews and
+    trends) run once, and everything runs concurrently. A failing widget
+    carries its own error and does not fail the dashboard.
+    """
+    if not stream:
+        return fast_response(await dashboard_service.get_dashboard(dashboard_id, date_from, date_to))
+
+    # Plan before streaming starts, so an unknown dashboard or bad date range is still a 404/400.
+    dashboard, plan = dashboard_service.get_plan(dashboard_id, date_from, date_to)
+
+    async def lines():
+        async for item in dashboard_service.stream_dashboard(dashboard, plan, date_from, date_to):
+            yield item.model_dump_json().encode("utf-8") + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
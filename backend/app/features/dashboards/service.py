@@ -0,0 +1,257 @@
+"""
+Dashboards service - Business logic layer for loading a dashboard in one request.
+"""
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, AsyncIterator, Callable, Optional
+from fastapi import HTTPException, status
+
+from app.core.cache import cache_scope
+from app.core.concurrency import run_in_executor
+from app.core.config import settings
+from app.core.query_batch import QueryBatch, query_batch
+from .registry import DASHBOARDS, Dashboard, Widget
+from .models import (
+    DashboardInfo,
+    DashboardListResponse,
+    DashboardResponse,
+    DashboardStats,
+    DashboardStreamEnd,
+    WidgetError,
+    WidgetInfo,
+    WidgetResult
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WidgetCall:
+    """One service call of a dashboard plan, serving every widget that needs it."""
+    load: Callable[..., Any]
+    dated: bool
+    endpoint: str
+    widgets: tuple[Widget, ...]
+
+
+class DashboardService:
+    """Service class for dashboard business logic."""
+
+    def __init__(self, dashboards: dict[str, Dashboard] = DASHBOARDS):
+        self.dashboards = dashboards
+
+    def list_dashboards(self) -> DashboardListResponse:
+        """
+        List every dashboard and its widgets.
+
+        Returns:
+            DashboardListResponse with the dashboards in registry order
+        """
+        dashboards = [self._map_to_info(dashboard) for dashboard in self.dashboards.values()]
+        return DashboardListResponse(dashboards=dashboards, total=len(dashboards))
+
+    def get_plan(
+        self,
+        dashboard_id: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> tuple[Dashboard, list[WidgetCall]]:
+        """
+        Validate a dashboard request and plan its service calls.
+
+        Widgets backed by the same service method share one call. Reads the
+        remaining calls have in common (shared scans, daily cells, the same
+        statement from two repositories) are shared at execution time by the
+        query batch the calls run in.
+
+        Args:
+            dashboard_id: Dashboard identifier
+            date_from: Optional start date for every widget
+            date_to: Optional end date for every widget
+
+        Returns:
+            The dashboard and its distinct calls, in widget order
+
+        Raises:
+            HTTPException: 404 if the dashboard does not exist,
+                400 if date_from > date_to
+        """
+        dashboard = self.dashboards.get(dashboard_id)
+        if dashboard is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Unknown dashboard '{dashboard_id}'"
+            )
+
+        # Validate date range once, rather than once per widget
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="date_from must be less than or equal to date_to"
+            )
+
+        calls: dict[tuple[Callable[..., Any], bool], list[Widget]] = {}
+        for widget in dashboard.widgets:
+            calls.setdefault((widget.load, widget.dated), []).append(widget)
+
+        plan = [
+            WidgetCall(load=load, dated=dated, endpoint=widgets[0].endpoint, widgets=tuple(widgets))
+            for (load, dated), widgets in calls.items()
+        ]
+        return dashboard, plan
+
+    async def get_dashboard(
+        self,
+        dashboard_id: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> DashboardResponse:
+        """
+        Load every widget of a dashboard concurrently.
+
+        A widget that fails does not fail the dashboard; its result carries
+        the error its standalone endpoint would have returned.
+
+        Args:
+            dashboard_id: Dashboard identifier
+            date_from: Optional start date for every widget
+            date_to: Optional end date for every widget
+
+        Returns:
+            DashboardResponse with widget results in display order
+
+        Raises:
+            HTTPException: 404 if the dashboard does not exist,
+                400 if date_from > date_to
+        """
+        dashboard, plan = self.get_plan(dashboard_id, date_from, date_to)
+
+        results: dict[str, WidgetResult] = {}
+        stats = None
+        async for item in self.stream_dashboard(dashboard, plan, date_from, date_to):
+            if isinstance(item, WidgetResult):
+                results[item.widget] = item
+            else:
+                stats = item.stats
+
+        return DashboardResponse(
+            dashboard_id=dashboard.id,
+            title=dashboard.title,
+            date_from=date_from,
+            date_to=date_to,
+            widgets=[results[widget.id] for widget in dashboard.widgets],
+            stats=stats
+        )
+
+    async def stream_dashboard(
+        self,
+        dashboard: Dashboard,
+        plan: list[WidgetCall],
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> AsyncIterator[WidgetResult | DashboardStreamEnd]:
+        """
+        Run a planned dashboard and yield widget results as they complete.
+
+        Every call starts at once inside one query batch, so identical
+        warehouse reads run once for the whole dashboard. Each call is
+        attributed to its widget's endpoint for query cache TTLs.
+
+        Args:
+            dashboard: Dashboard from get_plan
+            plan: Calls from get_plan
+            date_from: Optional start date for every widget
+            date_to: Optional end date for every widget
+
+        Yields:
+            A WidgetResult per widget in completion order, then a
+            DashboardStreamEnd with the execution statistics
+        """
+        started = time.perf_counter()
+        batch = QueryBatch()
+
+        # Tasks copy the context they are created in: the batch and the cache scope.
+        tasks = []
+        with query_batch(batch):
+            for call in plan:
+                with cache_scope(call.endpoint):
+                    tasks.append(asyncio.create_task(self._run_call(call, date_from, date_to)))
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        batch_stats = batch.stats()
+        yield DashboardStreamEnd(
+            dashboard_id=dashboard.id,
+            stats=DashboardStats(
+                widgets=len(dashboard.widgets),
+                calls=len(plan),
+                queries_requested=batch_stats.requested,
+                queries_executed=batch_stats.executed,
+                elapsed_ms=round((time.perf_counter() - started) * 1000, 2)
+            )
+        )
+
+    async def _run_call(
+        self,
+        call: WidgetCall,
+        date_from: Optional[date],
+        date_to: Optional[date]
+    ) -> list[WidgetResult]:
+        """Run one planned call and map its outcome to each widget it serves."""
+        kwargs = {"date_from": date_from, "date_to": date_to} if call.dated else {}
+        limit = settings.QUERY_FAN_OUT_TIMEOUT_SECONDS
+
+        started = time.perf_counter()
+        data = None
+        error = None
+        try:
+            if inspect.iscoroutinefunction(call.load):
+                data = await asyncio.wait_for(call.load(**kwargs), limit)
+            else:
+                data = await asyncio.wait_for(run_in_executor(call.load, **kwargs), limit)
+        except HTTPException as exc:
+            error = WidgetError(status_code=exc.status_code, detail=str(exc.detail))
+        except asyncio.TimeoutError:
+            error = WidgetError(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"{call.endpoint} did not complete within {limit}s"
+            )
+        except Exception:
+            logger.exception("Dashboard widget %s failed", call.endpoint)
+            error = WidgetError(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal Server Error"
+            )
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        return [
+            WidgetResult(widget=widget.id, title=widget.title, data=data, error=error, elapsed_ms=elapsed_ms)
+            for widget in call.widgets
+        ]
+
+    @staticmethod
+    def _map_to_info(dashboard: Dashboard) -> DashboardInfo:
+        """Map a registry dashboard to its response model."""
+        return DashboardInfo(
+            dashboard_id=dashboard.id,
+            title=dashboard.title,
+            description=dashboard.description,
+            widgets=[
+                WidgetInfo(widget=widget.id, title=widget.title, endpoint=widget.endpoint)
+                for widget in dashboard.widgets
+            ]
+        )
+
+
+# Singleton instance for dependency injection
+dashboard_service = DashboardService()
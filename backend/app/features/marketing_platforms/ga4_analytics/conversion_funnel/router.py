@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ga4_conversion_funnel_service
 from .models import ConversionFunnelResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_conversion_funnel(
 
     These metrics represent the user journey from session to purchase.
     """
-    return ga4_conversion_funnel_service.get_conversion_funnel(
+    return await run_in_executor(
+        ga4_conversion_funnel_service.get_conversion_funnel,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ga4_daily_traffic_trend_service
 from .models import DailyTrafficTrendResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_daily_traffic_trend(
 
     Results are ordered by date in ascending order (oldest first) for chart rendering.
     """
-    return ga4_daily_traffic_trend_service.get_daily_traffic_trend(
+    return await run_in_executor(
+        ga4_daily_traffic_trend_service.get_daily_traffic_trend,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ga4_hourly_traffic_pattern_service
 from .models import HourlyTrafficPatternResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_hourly_traffic_pattern(
 
     Results are ordered by hour in ascending order (0-23) for chart rendering.
     """
-    return ga4_hourly_traffic_pattern_service.get_hourly_traffic_pattern(
+    return await run_in_executor(
+        ga4_hourly_traffic_pattern_service.get_hourly_traffic_pattern,
         date_from=date_from,
         date_to=date_to
     )
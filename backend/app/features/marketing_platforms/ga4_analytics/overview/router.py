@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ga4_overview_service
 from .models import GA4OverviewResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -40,7 +42,8 @@ async def get_ga4_overview(
     - Revenue
     - Conversion Value
     """
-    return ga4_overview_service.get_overview(
+    return await run_in_executor(
+        ga4_overview_service.get_overview,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.serialization import fast_response
+from app.core.timing import TimedRoute
 from .service import ga4_technology_breakdown_service
 from .models import TechnologyBreakdownResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_technology_breakdown(
 
     Results are ordered by count in descending order for each category.
     """
-    return ga4_technology_breakdown_service.get_technology_breakdown(
+    result = await ga4_technology_breakdown_service.get_technology_breakdown(
         date_from=date_from,
         date_to=date_to
     )
+    return fast_response(result)
@@ -2,9 +2,12 @@
 GA4 Analytics Technology Breakdown service - Business logic layer for technology operations.
 """
 from datetime import date
+from functools import partial
 from typing import Optional
 from fastapi import HTTPException, status
 
+from app.core.concurrency import fan_out
+from app.core.serialization import construct
 from .repository import ga4_technology_breakdown_repository
 from .models import (
     TrafficSourceItem,
@@ -20,7 +23,7 @@ class GA4TechnologyBreakdownService:
     def __init__(self, repository=ga4_technology_breakdown_repository):
         self.repository = repository
 
-    def get_technology_breakdown(
+    async def get_technology_breakdown(
         self,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None
@@ -36,7 +39,7 @@ class GA4TechnologyBreakdownService:
             TechnologyBreakdownResponse with traffic sources, devices, and browsers
 
         Raises:
-            HTTPException: 400 if date_from > date_to
+            HTTPException: 400 if date_from > date_to, 504 if a query times out
         """
         # Validate date range if both dates are provided
         if date_from and date_to and date_from > date_to:
@@ -45,13 +48,16 @@ class GA4TechnologyBreakdownService:
                 detail="date_from must be less than or equal to date_to"
             )
 
-        # Fetch all breakdowns from repository
-        traffic_sources = self.repository.get_traffic_sources(date_from, date_to)
-        devices = self.repository.get_devices(date_from, date_to)
-        browsers = self.repository.get_browsers(date_from, date_to)
+        # Fetch all breakdowns from repository concurrently
+        traffic_sources, devices, browsers = await fan_out(
+            partial(self.repository.get_traffic_sources, date_from, date_to),
+            partial(self.repository.get_devices, date_from, date_to),
+            partial(self.repository.get_browsers, date_from, date_to),
+        )
 
         # Map database results to response models
-        return TechnologyBreakdownResponse(
+        return construct(
+            TechnologyBreakdownResponse,
             traffic_sources=[self._map_to_traffic_source(row) for row in traffic_sources],
             devices=[self._map_to_device(row) for row in devices],
             browsers=[self._map_to_browser(row) for row in browsers]
@@ -60,7 +66,8 @@ class GA4TechnologyBreakdownService:
     @staticmethod
     def _map_to_traffic_source(data: dict) -> TrafficSourceItem:
         """Map database row to TrafficSourceItem."""
-        return TrafficSourceItem(
+        return construct(
+            TrafficSourceItem,
             source=str(data.get("SOURCE") or "unknown"),
             sessions=int(data.get("SESSIONS") or 0),
             percentage=float(data.get("PERCENTAGE") or 0)
@@ -69,7 +76,8 @@ class GA4TechnologyBreakdownService:
     @staticmethod
     def _map_to_device(data: dict) -> DeviceItem:
         """Map database row to DeviceItem."""
-        return DeviceItem(
+        return construct(
+            DeviceItem,
             device_category=str(data.get("DEVICE_CATEGORY") or "unknown"),
             users=int(data.get("USERS") or 0),
             percentage=float(data.get("PERCENTAGE") or 0)
@@ -78,7 +86,8 @@ class GA4TechnologyBreakdownService:
     @staticmethod
     def _map_to_browser(data: dict) -> BrowserItem:
         """Map database row to BrowserItem."""
-        return BrowserItem(
+        return construct(
+            BrowserItem,
             browser=str(data.get("BROWSER") or "unknown"),
             users=int(data.get("USERS") or 0),
             percentage=float(data.get("PERCENTAGE") or 0)
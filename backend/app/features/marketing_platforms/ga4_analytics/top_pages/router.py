@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ga4_top_pages_service
 from .models import TopPagesResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_top_pages(
 
     Results are ordered by page views in descending order.
     """
-    return ga4_top_pages_service.get_top_pages(
+    return await run_in_executor(
+        ga4_top_pages_service.get_top_pages,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ga4_traffic_sources_service
 from .models import TrafficSourcesListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_traffic_sources(
 
     Results are ordered by sessions in descending order.
     """
-    return ga4_traffic_sources_service.get_traffic_sources(
+    return await run_in_executor(
+        ga4_traffic_sources_service.get_traffic_sources,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import account_health_service
 from .models import AccountHealthResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -36,7 +38,8 @@ async def get_account_health(
     - Average ROAS (Return on Ad Spend)
     - Total Keywords
     """
-    return account_health_service.get_account_health(
+    return await run_in_executor(
+        account_health_service.get_account_health,
         date_from=date_from,
         date_to=date_to
     )
@@ -4,6 +4,7 @@ Google Ads Ad Group Performance repository - Data access layer for ad group perf
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.semantic import MetricQuery
 
 
 class AdGroupPerformanceRepository:
@@ -36,35 +37,30 @@ class AdGroupPerformanceRepository:
             conditions.append("f.DATE_DAY <= %(date_to)s")
             params["date_to"] = date_to.isoformat()
 
-        # Build the filter clause
-        filter_clause = ""
-        if conditions:
-            filter_clause = "AND " + " AND ".join(conditions)
-
-        query = f"""
-            SELECT
-                ag.AD_GROUP_NAME AS "AD_GROUP",
-                c.CAMPAIGN_NAME AS "CAMPAIGN",
-                SUM(f.IMPRESSIONS) AS "IMPRESSIONS",
-                SUM(f.CLICKS) AS "CLICKS",
-                ROUND(SUM(f.CLICKS) * 100.0 / NULLIF(SUM(f.IMPRESSIONS), 0), 1) AS "CTR",
-                ROUND(SUM(f.SPEND) / NULLIF(SUM(f.CLICKS), 0), 0) AS "CPC",
-                ROUND(SUM(f.CONVERSIONS), 0) AS "CONVERSIONS",
-                ROUND(SUM(f.CONVERSIONS) * 100.0 / NULLIF(SUM(f.CLICKS), 0), 1) AS "CVR"
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_AD_GROUP_PERFORMANCE f
-            JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_AD_GROUP ag
-                ON f.AD_GROUP_ID = ag.AD_GROUP_ID
-                AND f.PLATFORM = ag.PLATFORM
-                AND ag.IS_CURRENT = TRUE
-            JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_CAMPAIGN c
-                ON f.CAMPAIGN_ID = c.CAMPAIGN_ID
-                AND f.PLATFORM = c.PLATFORM
-                AND c.IS_CURRENT = TRUE
-            WHERE f.PLATFORM = 'google_ads'
-                {filter_clause}
-            GROUP BY ag.AD_GROUP_NAME, c.CAMPAIGN_NAME
-            ORDER BY "IMPRESSIONS" DESC
-        """
+        query = MetricQuery(
+            source="""
+                CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_AD_GROUP_PERFORMANCE f
+                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_AD_GROUP ag
+                    ON f.AD_GROUP_ID = ag.AD_GROUP_ID
+                    AND f.PLATFORM = ag.PLATFORM
+                    AND ag.IS_CURRENT = TRUE
+                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_CAMPAIGN c
+                    ON f.CAMPAIGN_ID = c.CAMPAIGN_ID
+                    AND f.PLATFORM = c.PLATFORM
+                    AND c.IS_CURRENT = TRUE
+            """,
+            metrics=("IMPRESSIONS", "CLICKS", "CTR", "CPC", "CONVERSIONS", "CONV_RATE"),
+            dimensions=(
+                ("ag.AD_GROUP_NAME", "AD_GROUP"),
+                ("c.CAMPAIGN_NAME", "CAMPAIGN"),
+            ),
+            where=(
+                "f.PLATFORM = 'google_ads'",
+                *conditions,
+            ),
+            order_by="IMPRESSIONS DESC",
+            aliases={"CONV_RATE": "CVR"},
+        ).sql()
 
         results = execute_query(query, params if params else None)
         return results if results else []
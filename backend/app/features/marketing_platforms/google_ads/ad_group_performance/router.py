@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ad_group_performance_service
 from .models import AdGroupPerformanceResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -40,7 +42,8 @@ async def get_ad_group_performance(
     - Conversions
     - CVR (Conversion Rate)
     """
-    return ad_group_performance_service.get_ad_group_performance(
+    return await run_in_executor(
+        ad_group_performance_service.get_ad_group_performance,
         date_from=date_from,
         date_to=date_to
     )
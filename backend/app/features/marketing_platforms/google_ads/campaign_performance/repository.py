@@ -4,6 +4,7 @@ Google Ads Campaign Performance repository - Data access layer for campaign perf
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.semantic import MetricQuery
 
 
 class CampaignPerformanceRepository:
@@ -42,32 +43,25 @@ class CampaignPerformanceRepository:
             conditions.append("c.STATUS = %(status)s")
             params["status"] = status
 
-        # Build the filter clause
-        filter_clause = ""
-        if conditions:
-            filter_clause = "AND " + " AND ".join(conditions)
-
-        query = f"""
-            SELECT
-                c.CAMPAIGN_NAME AS "CAMPAIGN",
-                c.STATUS AS "STATUS",
-                ROUND(SUM(f.SPEND), 0) AS "SPEND",
-                ROUND(SUM(f.CONVERSION_VALUE), 0) AS "REVENUE",
-                ROUND(SUM(f.CONVERSION_VALUE) / NULLIF(SUM(f.SPEND), 0), 1) AS "ROAS",
-                ROUND(SUM(f.CONVERSIONS)) AS "CONVERSIONS",
-                ROUND(SUM(f.CLICKS) * 100.0 / NULLIF(SUM(f.IMPRESSIONS), 0), 1) AS "CTR",
-                ROUND(SUM(f.SPEND) / NULLIF(SUM(f.CLICKS), 0)) AS "CPC"
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE f
-            JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_CAMPAIGN c
-                ON f.CAMPAIGN_ID = c.CAMPAIGN_ID
-                AND f.PLATFORM = c.PLATFORM
-                AND c.IS_CURRENT = TRUE
-            WHERE f.PLATFORM = 'google_ads'
-                {filter_clause}
-            GROUP BY c.CAMPAIGN_NAME, c.STATUS
-            ORDER BY "SPEND" DESC
-        """
-        print(query)
+        query = MetricQuery(
+            source="""
+                CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE f
+                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_CAMPAIGN c
+                    ON f.CAMPAIGN_ID = c.CAMPAIGN_ID
+                    AND f.PLATFORM = c.PLATFORM
+                    AND c.IS_CURRENT = TRUE
+            """,
+            metrics=("SPEND", "REVENUE", "ROAS", "CONVERSIONS", "CTR", "CPC"),
+            dimensions=(
+                ("c.CAMPAIGN_NAME", "CAMPAIGN"),
+                ("c.STATUS", "STATUS"),
+            ),
+            where=(
+                "f.PLATFORM = 'google_ads'",
+                *conditions,
+            ),
+            order_by="SPEND DESC",
+        ).sql()
 
         results = execute_query(query, params if params else None)
         return results if results else []
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import campaign_performance_service
 from .models import CampaignPerformanceListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -45,7 +47,8 @@ async def get_campaign_performance(
     - CTR (Click-Through Rate)
     - CPC (Cost Per Click)
     """
-    return campaign_performance_service.get_campaign_performance(
+    return await run_in_executor(
+        campaign_performance_service.get_campaign_performance,
         date_from=date_from,
         date_to=date_to,
         campaign_status=status
@@ -4,6 +4,7 @@ Google Ads Daily Performance Trend repository - Data access layer for daily perf
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.rollups import campaign_performance_source
 
 
 class DailyPerformanceTrendRepository:
@@ -41,6 +42,13 @@ class DailyPerformanceTrendRepository:
         if conditions:
             filter_clause = "AND " + " AND ".join(conditions)
 
+        # Per-day platform totals: read the daily rollup instead of the raw fact.
+        source = campaign_performance_source(
+            {"PLATFORM", "CONVERSIONS", "SPEND"},
+            date_from,
+            date_to
+        )
+
         query = f"""
             SELECT
                 CASE DAYOFWEEK(DATE_DAY)
@@ -58,7 +66,7 @@ class DailyPerformanceTrendRepository:
                 END AS "DAY_ORDER",
                 SUM(CONVERSIONS) AS "TOTAL_CONVERSIONS",
                 SUM(SPEND) AS "TOTAL_SPEND"
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
+            FROM {source}
             WHERE PLATFORM = 'google_ads'
                 {filter_clause}
             GROUP BY DAYOFWEEK(DATE_DAY)
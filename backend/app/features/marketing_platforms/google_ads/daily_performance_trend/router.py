@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import daily_performance_trend_service
 from .models import DailyPerformanceTrendResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -36,7 +38,8 @@ async def get_daily_performance_trend(
     - Total Conversions
     - Total Spend
     """
-    return daily_performance_trend_service.get_daily_performance_trend(
+    return await run_in_executor(
+        daily_performance_trend_service.get_daily_performance_trend,
         date_from=date_from,
         date_to=date_to
     )
@@ -2,8 +2,10 @@
 Google Ads Keyword Performance repository - Data access layer for keyword performance metrics.
 """
 from datetime import date
-from typing import Optional
-from app.core.database import execute_query
+from typing import Iterator, Optional
+from app.core.columnar import ColumnarResult
+from app.core.database import execute_query_columns, stream_query
+from app.core.semantic import MetricQuery
 
 
 class KeywordPerformanceRepository:
@@ -13,17 +15,47 @@ class KeywordPerformanceRepository:
     def get_keyword_performance(
         date_from: Optional[date] = None,
         date_to: Optional[date] = None
-    ) -> list[dict]:
+    ) -> ColumnarResult:
         """
         Fetch Google Ads keyword performance metrics with optional date filters.
 
+        The result can span every keyword ever served, so it is fetched in
+        columnar form rather than as one dict per row.
+
         Args:
             date_from: Optional start date for the metrics
             date_to: Optional end date for the metrics
 
         Returns:
-            List of dictionaries with keyword performance metrics
+            ColumnarResult with keyword performance metrics
         """
+        query, params = KeywordPerformanceRepository._build_query(date_from, date_to)
+        return execute_query_columns(query, params if params else None)
+
+    @staticmethod
+    def stream_keyword_performance(
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> Iterator[ColumnarResult]:
+        """
+        Stream Google Ads keyword performance metrics in column batches.
+
+        Args:
+            date_from: Optional start date for the metrics
+            date_to: Optional end date for the metrics
+
+        Yields:
+            ColumnarResult batches, ordered by impressions descending
+        """
+        query, params = KeywordPerformanceRepository._build_query(date_from, date_to)
+        yield from stream_query(query, params if params else None)
+
+    @staticmethod
+    def _build_query(
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> tuple[str, dict]:
+        """Build the keyword performance query and its parameters."""
         # Build filter conditions
         conditions = []
         params = {}
@@ -36,34 +68,28 @@ class KeywordPerformanceRepository:
             conditions.append("f.DATE_DAY <= %(date_to)s")
             params["date_to"] = date_to.isoformat()
 
-        # Build the filter clause
-        filter_clause = ""
-        if conditions:
-            filter_clause = "AND " + " AND ".join(conditions)
-
-        query = f"""
-            SELECT
-                k.KEYWORD_TEXT AS "KEYWORD",
-                k.MATCH_TYPE AS "MATCH",
-                SUM(f.IMPRESSIONS) AS "IMPRESSIONS",
-                SUM(f.CLICKS) AS "CLICKS",
-                ROUND(SUM(f.CLICKS) * 100.0 / NULLIF(SUM(f.IMPRESSIONS), 0), 1) AS "CTR",
-                ROUND(SUM(f.SPEND) / NULLIF(SUM(f.CLICKS), 0), 0) AS "CPC",
-                ROUND(SUM(f.CONVERSIONS), 0) AS "CONVERSIONS",
-                ROUND(SUM(f.SPEND), 0) AS "COST"
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f
-            JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_KEYWORD k
-                ON f.KEYWORD_ID = k.KEYWORD_ID
-                AND f.PLATFORM = k.PLATFORM
-                AND k.IS_CURRENT = TRUE
-            WHERE f.PLATFORM = 'google_ads'
-                {filter_clause}
-            GROUP BY k.KEYWORD_TEXT, k.MATCH_TYPE
-            ORDER BY "IMPRESSIONS" DESC
-        """
+        query = MetricQuery(
+            source="""
+                CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f
+                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_KEYWORD k
+                    ON f.KEYWORD_ID = k.KEYWORD_ID
+                    AND f.PLATFORM = k.PLATFORM
+                    AND k.IS_CURRENT = TRUE
+            """,
+            metrics=("IMPRESSIONS", "CLICKS", "CTR", "CPC", "CONVERSIONS", "SPEND"),
+            dimensions=(
+                ("k.KEYWORD_TEXT", "KEYWORD"),
+                ("k.MATCH_TYPE", "MATCH"),
+            ),
+            where=(
+                "f.PLATFORM = 'google_ads'",
+                *conditions,
+            ),
+            order_by="IMPRESSIONS DESC",
+            aliases={"SPEND": "COST"},
+        ).sql()
 
-        results = execute_query(query, params if params else None)
-        return results if results else []
+        return query, params
 
 
 # Singleton instance for dependency injection
@@ -4,11 +4,16 @@ Google Ads Keyword Performance router - API endpoints for keyword performance op
 from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
+from app.core.concurrency import run_in_executor
+from app.core.serialization import fast_response
+from app.core.streaming import NDJSON_MEDIA_TYPE, ndjson_lines
+from app.core.timing import TimedRoute
 from .service import keyword_performance_service
 from .models import KeywordPerformanceResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -40,7 +45,41 @@ async def get_keyword_performance(
     - Conversions
     - Cost (Total Spend)
     """
-    return keyword_performance_service.get_keyword_performance(
+    result = await run_in_executor(
+        keyword_performance_service.get_keyword_performance,
         date_from=date_from,
         date_to=date_to
     )
+    return fast_response(result)
+
+
+@router.get(
+    "/keyword-performance/stream",
+    response_class=StreamingResponse,
+    summary="Stream Google Ads keyword performance",
+    description="Stream every keyword's performance metrics as newline-delimited JSON (one KeywordPerformanceItem per line), with optional date range filters."
+)
+async def stream_keyword_performance(
+    date_from: Optional[date] = Query(
+        default=None,
+        description="Start date for metrics (YYYY-MM-DD format). If not provided, no start date filter.",
+        example="2024-01-01"
+    ),
+    date_to: Optional[date] = Query(
+        default=None,
+        description="End date for metrics (YYYY-MM-DD format). If not provided, no end date filter.",
+        example="2024-12-31"
+    ),
+):
+    """
+    Stream Google Ads keyword performance metrics.
+
+    Unlike /keyword-performance, rows are sent as they are read from the
+    warehouse, so the first keywords arrive immediately and server memory
+    stays flat no matter how many keywords there are.
+    """
+    batches = keyword_performance_service.stream_keyword_performance(
+        date_from=date_from,
+        date_to=date_to
+    )
+    return StreamingResponse(ndjson_lines(batches), media_type=NDJSON_MEDIA_TYPE)
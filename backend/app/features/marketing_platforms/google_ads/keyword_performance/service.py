@@ -2,9 +2,11 @@
 Google Ads Keyword Performance service - Business logic layer for keyword performance operations.
 """
 from datetime import date
-from typing import Optional
+from typing import Iterator, Optional
 from fastapi import HTTPException, status
 
+from app.core.columnar import ColumnarResult
+from app.core.serialization import construct
 from .repository import keyword_performance_repository
 from .models import KeywordPerformanceItem, KeywordPerformanceResponse
 
@@ -46,27 +48,74 @@ class KeywordPerformanceService:
             date_to=date_to
         )
 
-        # Map database results to response model
-        items = [self._map_to_item(keyword) for keyword in keywords]
+        # Map database columns to response model
+        items = self._map_to_items(keywords)
 
-        return KeywordPerformanceResponse(
+        return construct(
+            KeywordPerformanceResponse,
             items=items,
             total=len(items)
         )
 
-    @staticmethod
-    def _map_to_item(data: dict) -> KeywordPerformanceItem:
-        """Map database row (uppercase keys) to response model."""
-        return KeywordPerformanceItem(
-            keyword=str(data.get("KEYWORD") or ""),
-            match=str(data.get("MATCH") or ""),
-            impressions=int(data.get("IMPRESSIONS") or 0),
-            clicks=int(data.get("CLICKS") or 0),
-            ctr=float(data.get("CTR") or 0),
-            cpc=float(data.get("CPC") or 0),
-            conversions=int(data.get("CONVERSIONS") or 0),
-            cost=float(data.get("COST") or 0)
+    def stream_keyword_performance(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> Iterator[list[KeywordPerformanceItem]]:
+        """
+        Stream Google Ads keyword performance metrics batch by batch.
+
+        The date range is validated before anything is fetched, so errors are
+        raised eagerly rather than midway through a streamed response.
+
+        Args:
+            date_from: Optional start date for the metrics
+            date_to: Optional end date for the metrics
+
+        Returns:
+            Iterator over lists of KeywordPerformanceItem
+
+        Raises:
+            HTTPException: 400 if date_from > date_to
+        """
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="date_from must be less than or equal to date_to"
+            )
+
+        batches = self.repository.stream_keyword_performance(
+            date_from=date_from,
+            date_to=date_to
         )
+        return (self._map_to_items(batch) for batch in batches)
+
+    @staticmethod
+    def _map_to_items(data: ColumnarResult) -> list[KeywordPerformanceItem]:
+        """Map database columns (uppercase names) to response models."""
+        return [
+            construct(
+                KeywordPerformanceItem,
+                keyword=keyword,
+                match=match,
+                impressions=impressions,
+                clicks=clicks,
+                ctr=ctr,
+                cpc=cpc,
+                conversions=conversions,
+                cost=cost
+            )
+            for keyword, match, impressions, clicks, ctr, cpc, conversions, cost in zip(
+                data.strs("KEYWORD"),
+                data.strs("MATCH"),
+                data.ints("IMPRESSIONS"),
+                data.ints("CLICKS"),
+                data.floats("CTR"),
+                data.floats("CPC"),
+                data.ints("CONVERSIONS"),
+                data.floats("COST")
+            )
+        ]
 
 
 # Singleton instance for dependency injection
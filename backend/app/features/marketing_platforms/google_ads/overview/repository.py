@@ -4,6 +4,7 @@ Google Ads Overview repository - Data access layer for overview metrics.
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.rollups import campaign_performance_source
 
 
 class GoogleAdsOverviewRepository:
@@ -41,6 +42,14 @@ class GoogleAdsOverviewRepository:
         if date_conditions:
             date_filter = "AND " + " AND ".join(date_conditions)
 
+        # Totals only: read the coarsest rollup that covers the range.
+        source = campaign_performance_source(
+            {"PLATFORM", "SPEND", "CONVERSIONS", "CONVERSION_VALUE", "IMPRESSIONS", "CLICKS"},
+            date_from,
+            date_to,
+            needs_days=False
+        )
+
         query = f"""
             SELECT
                 perf.TOTAL_SPEND,
@@ -58,7 +67,7 @@ class GoogleAdsOverviewRepository:
                     CASE WHEN SUM(f.SPEND) > 0 THEN SUM(f.CONVERSION_VALUE) / SUM(f.SPEND) ELSE 0 END AS ROAS,
                     CASE WHEN SUM(f.IMPRESSIONS) > 0 THEN (SUM(f.CLICKS) / SUM(f.IMPRESSIONS)) * 100 ELSE 0 END AS CTR,
                     CASE WHEN SUM(f.CLICKS) > 0 THEN SUM(f.SPEND) / SUM(f.CLICKS) ELSE 0 END AS CPC
-                FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE f
+                FROM {source} f
                 JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_PLATFORM p ON f.PLATFORM = p.PLATFORM_CODE
                 WHERE p.PLATFORM_CODE = 'google_ads'
                     {date_filter}
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import google_ads_overview_service
 from .models import GoogleAdsOverviewResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -39,7 +41,8 @@ async def get_google_ads_overview(
     - CPC (Cost Per Click)
     - Average Quality Score
     """
-    return google_ads_overview_service.get_overview(
+    return await run_in_executor(
+        google_ads_overview_service.get_overview,
         date_from=date_from,
         date_to=date_to
     )
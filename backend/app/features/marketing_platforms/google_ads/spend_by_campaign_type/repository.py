@@ -4,6 +4,7 @@ Google Ads Spend by Campaign Type repository - Data access layer for spend break
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.rollups import campaign_performance_source
 
 
 class SpendByCampaignTypeRepository:
@@ -41,6 +42,13 @@ class SpendByCampaignTypeRepository:
         if conditions:
             filter_clause = "AND " + " AND ".join(conditions)
 
+        # Campaign-level totals: read the daily campaign rollup instead of the raw fact.
+        source = campaign_performance_source(
+            {"PLATFORM", "CAMPAIGN_TYPE", "SPEND"},
+            date_from,
+            date_to
+        )
+
         query = f"""
             SELECT
                 CASE CAMPAIGN_TYPE
@@ -54,7 +62,7 @@ class SpendByCampaignTypeRepository:
                 END AS "CAMPAIGN_TYPE",
                 SUM(SPEND) AS "TOTAL_SPEND",
                 SUM(SPEND) * 100.0 / SUM(SUM(SPEND)) OVER() AS "SPEND_PERCENTAGE"
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
+            FROM {source}
             WHERE PLATFORM = 'google_ads'
                 {filter_clause}
             GROUP BY CAMPAIGN_TYPE
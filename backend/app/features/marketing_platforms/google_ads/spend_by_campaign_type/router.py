@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import spend_by_campaign_type_service
 from .models import SpendByCampaignTypeResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -35,7 +37,8 @@ async def get_spend_by_campaign_type(
     - Total Spend
     - Spend Percentage (of total Google Ads spend)
     """
-    return spend_by_campaign_type_service.get_spend_by_campaign_type(
+    return await run_in_executor(
+        spend_by_campaign_type_service.get_spend_by_campaign_type,
         date_from=date_from,
         date_to=date_to
     )
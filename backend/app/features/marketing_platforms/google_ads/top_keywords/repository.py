@@ -4,6 +4,7 @@ Google Ads Top Keywords repository - Data access layer for top keywords metrics.
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.semantic import MetricQuery
 
 
 class TopKeywordsRepository:
@@ -36,30 +37,26 @@ class TopKeywordsRepository:
             conditions.append("f.DATE_DAY <= %(date_to)s")
             params["date_to"] = date_to.isoformat()
 
-        # Build the filter clause
-        filter_clause = ""
-        if conditions:
-            filter_clause = "AND " + " AND ".join(conditions)
-
-        query = f"""
-            SELECT
-                k.KEYWORD_TEXT AS "KEYWORD",
-                k.MATCH_TYPE AS "MATCH_TYPE",
-                SUM(f.IMPRESSIONS) AS "IMPRESSIONS",
-                SUM(f.CLICKS) AS "CLICKS",
-                ROUND(SUM(f.CLICKS) * 100.0 / NULLIF(SUM(f.IMPRESSIONS), 0), 1) AS "CTR",
-                ROUND(SUM(f.CONVERSIONS), 0) AS "CONVERSIONS",
-                ROUND(SUM(f.SPEND), 0) AS "COST"
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f
-            JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_KEYWORD k
-                ON f.KEYWORD_ID = k.KEYWORD_ID
-                AND f.PLATFORM = k.PLATFORM
-                AND k.IS_CURRENT = TRUE
-            WHERE f.PLATFORM = 'google_ads'
-                {filter_clause}
-            GROUP BY k.KEYWORD_TEXT, k.MATCH_TYPE
-            ORDER BY "IMPRESSIONS" DESC
-        """
+        query = MetricQuery(
+            source="""
+                CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f
+                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_KEYWORD k
+                    ON f.KEYWORD_ID = k.KEYWORD_ID
+                    AND f.PLATFORM = k.PLATFORM
+                    AND k.IS_CURRENT = TRUE
+            """,
+            metrics=("IMPRESSIONS", "CLICKS", "CTR", "CONVERSIONS", "SPEND"),
+            dimensions=(
+                ("k.KEYWORD_TEXT", "KEYWORD"),
+                ("k.MATCH_TYPE", "MATCH_TYPE"),
+            ),
+            where=(
+                "f.PLATFORM = 'google_ads'",
+                *conditions,
+            ),
+            order_by="IMPRESSIONS DESC",
+            aliases={"SPEND": "COST"},
+        ).sql()
 
         results = execute_query(query, params if params else None)
         return results if results else []
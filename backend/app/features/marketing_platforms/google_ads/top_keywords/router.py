@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import top_keywords_service
 from .models import TopKeywordsResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -39,7 +41,8 @@ async def get_top_keywords(
     - Conversions
     - Cost (Total Spend)
     """
-    return top_keywords_service.get_top_keywords(
+    return await run_in_executor(
+        top_keywords_service.get_top_keywords,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,13 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.serialization import fast_response
+from app.core.timing import TimedRoute
 from .service import meta_ads_creative_service
 from .models import MetaAdsCreativeListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -46,8 +49,10 @@ async def get_meta_ads_creatives(
     - CTR (Click-Through Rate)
     - CPC (Cost Per Click)
     """
-    return meta_ads_creative_service.get_creatives(
+    result = await run_in_executor(
+        meta_ads_creative_service.get_creatives,
         date_from=date_from,
         date_to=date_to,
         ad_id=ad_id
     )
+    return fast_response(result)
@@ -5,6 +5,7 @@ from datetime import date
 from typing import Optional
 from fastapi import HTTPException, status as http_status
 
+from app.core.serialization import construct
 from .repository import meta_ads_creative_repository
 from .models import MetaAdsCreativeResponse, MetaAdsCreativeListResponse
 
@@ -48,7 +49,8 @@ class MetaAdsCreativeService:
         # Map database results to response models
         creatives = [self._map_to_response(row) for row in creatives_data]
 
-        return MetaAdsCreativeListResponse(
+        return construct(
+            MetaAdsCreativeListResponse,
             creatives=creatives,
             total_count=len(creatives)
         )
@@ -56,10 +58,11 @@ class MetaAdsCreativeService:
     @staticmethod
     def _map_to_response(data: dict) -> MetaAdsCreativeResponse:
         """Map database row (uppercase keys) to response model."""
-        return MetaAdsCreativeResponse(
+        return construct(
+            MetaAdsCreativeResponse,
             ad_id=str(data.get("AD_ID") or ""),
             ad_name=str(data.get("AD_NAME") or ""),
-            ad_type=data.get("AD_TYPE"),
+            ad_type=str(data.get("AD_TYPE")) if data.get("AD_TYPE") is not None else None,
             spend=float(data.get("TOTAL_SPEND") or 0),
             impressions=int(data.get("TOTAL_IMPRESSIONS") or 0),
             clicks=int(data.get("TOTAL_CLICKS") or 0),
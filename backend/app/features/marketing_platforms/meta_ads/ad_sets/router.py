@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import meta_ads_ad_set_service
 from .models import MetaAdsAdSetListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -45,7 +47,8 @@ async def get_meta_ads_ad_sets(
     - CTR (Click-Through Rate)
     - CPC (Cost Per Click)
     """
-    return meta_ads_ad_set_service.get_ad_sets(
+    return await run_in_executor(
+        meta_ads_ad_set_service.get_ad_sets,
         date_from=date_from,
         date_to=date_to,
         ad_set_id=ad_set_id
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import meta_ads_campaigns_service
 from .models import MetaAdsCampaignsListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -48,7 +50,8 @@ async def get_meta_ads_campaigns(
     - CPM (Cost Per Mille)
     - ROAS (Return on Ad Spend)
     """
-    return meta_ads_campaigns_service.get_campaigns(
+    return await run_in_executor(
+        meta_ads_campaigns_service.get_campaigns,
         date_from=date_from,
         date_to=date_to,
         status=status
@@ -4,6 +4,7 @@ Meta Ads Daily Performance repository - Data access layer for daily metrics.
 from datetime import date
 from typing import Optional, List
 from app.core.database import execute_query
+from app.core.rollups import campaign_performance_source
 
 
 class MetaAdsDailyPerformanceRepository:
@@ -47,6 +48,13 @@ class MetaAdsDailyPerformanceRepository:
         if conditions:
             filter_clause = "AND " + " AND ".join(conditions)
 
+        # Per-day platform totals: read the daily rollup instead of the raw fact.
+        source = campaign_performance_source(
+            {"PLATFORM", "SPEND", "IMPRESSIONS", "CLICKS", "CONVERSIONS", "CONVERSION_VALUE"},
+            date_from,
+            date_to
+        )
+
         query = f"""
             SELECT
                 DATE_DAY,
@@ -57,7 +65,7 @@ class MetaAdsDailyPerformanceRepository:
                 COALESCE(SUM(CONVERSION_VALUE), 0) AS DAILY_REVENUE,
                 CASE WHEN SUM(IMPRESSIONS) > 0 THEN (SUM(CLICKS) / SUM(IMPRESSIONS)) * 100 ELSE 0 END AS CTR,
                 CASE WHEN SUM(CLICKS) > 0 THEN SUM(SPEND) / SUM(CLICKS) ELSE 0 END AS CPC
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
+            FROM {source}
             WHERE PLATFORM = 'meta'
                 {filter_clause}
             GROUP BY DATE_DAY
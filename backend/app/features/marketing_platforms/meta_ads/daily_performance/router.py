@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import meta_ads_daily_performance_service
 from .models import MetaAdsDailyPerformanceListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -45,7 +47,8 @@ async def get_meta_ads_daily_performance(
     - CTR (Click-Through Rate)
     - CPC (Cost Per Click)
     """
-    return meta_ads_daily_performance_service.get_daily_performance(
+    return await run_in_executor(
+        meta_ads_daily_performance_service.get_daily_performance,
         date_from=date_from,
         date_to=date_to,
         campaign_id=campaign_id
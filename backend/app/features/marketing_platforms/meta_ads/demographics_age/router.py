@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import meta_ads_demographics_age_service
 from .models import MetaAdsDemographicsAgeListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -44,7 +46,8 @@ async def get_meta_ads_demographics_age(
     - CTR (Click-Through Rate)
     - CPC (Cost Per Click)
     """
-    return meta_ads_demographics_age_service.get_demographics_age(
+    return await run_in_executor(
+        meta_ads_demographics_age_service.get_demographics_age,
         date_from=date_from,
         date_to=date_to,
         age_bracket=age_bracket
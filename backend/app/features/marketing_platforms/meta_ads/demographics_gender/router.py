@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import meta_ads_demographics_gender_service
 from .models import MetaAdsDemographicsGenderListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -44,7 +46,8 @@ async def get_meta_ads_demographics_gender(
     - CTR (Click-Through Rate)
     - CPC (Cost Per Click)
     """
-    return meta_ads_demographics_gender_service.get_demographics_gender(
+    return await run_in_executor(
+        meta_ads_demographics_gender_service.get_demographics_gender,
         date_from=date_from,
         date_to=date_to,
         gender=gender
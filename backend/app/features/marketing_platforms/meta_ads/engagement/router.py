@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import meta_ads_engagement_service
 from .models import MetaAdsEngagementResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -44,7 +46,8 @@ async def get_meta_ads_engagement(
     - Cart to Checkout Rate
     - Checkout to Purchase Rate
     """
-    return meta_ads_engagement_service.get_engagement(
+    return await run_in_executor(
+        meta_ads_engagement_service.get_engagement,
         date_from=date_from,
         date_to=date_to
     )
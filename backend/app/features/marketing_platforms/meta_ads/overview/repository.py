@@ -4,6 +4,7 @@ Meta Ads Overview repository - Data access layer for overview metrics.
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.rollups import campaign_performance_source
 
 
 class MetaAdsOverviewRepository:
@@ -52,6 +53,14 @@ class MetaAdsOverviewRepository:
         if delivery_date_conditions:
             delivery_date_filter = "AND " + " AND ".join(delivery_date_conditions)
 
+        # Totals only: read the coarsest rollup that covers the range.
+        source = campaign_performance_source(
+            {"PLATFORM", "SPEND", "IMPRESSIONS", "CLICKS", "CONVERSIONS", "CONVERSION_VALUE"},
+            date_from,
+            date_to,
+            needs_days=False
+        )
+
         query = f"""
             SELECT
                 perf.TOTAL_SPEND,
@@ -73,7 +82,7 @@ class MetaAdsOverviewRepository:
                     CASE WHEN SUM(f.IMPRESSIONS) > 0 THEN (SUM(f.CLICKS) / SUM(f.IMPRESSIONS)) * 100 ELSE 0 END AS CTR,
                     CASE WHEN SUM(f.CLICKS) > 0 THEN SUM(f.SPEND) / SUM(f.CLICKS) ELSE 0 END AS CPC,
                     CASE WHEN SUM(f.IMPRESSIONS) > 0 THEN (SUM(f.SPEND) / SUM(f.IMPRESSIONS)) * 1000 ELSE 0 END AS CPM
-                FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE f
+                FROM {source} f
                 WHERE f.PLATFORM = 'meta'
                     {perf_date_filter}
             ) perf
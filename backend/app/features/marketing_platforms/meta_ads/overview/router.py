@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import meta_ads_overview_service
 from .models import MetaAdsOverviewResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -41,7 +43,8 @@ async def get_meta_ads_overview(
     - CPM (Cost Per Mille)
     - ROAS (Return on Ad Spend)
     """
-    return meta_ads_overview_service.get_overview(
+    return await run_in_executor(
+        meta_ads_overview_service.get_overview,
         date_from=date_from,
         date_to=date_to
     )
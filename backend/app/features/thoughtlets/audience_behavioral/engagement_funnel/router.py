@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import engagement_funnel_service
 from .models import EngagementFunnelResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_engagement_funnel(
 
     Data is sourced from GA4 analytics.
     """
-    return engagement_funnel_service.get_engagement_funnel(
+    return await run_in_executor(
+        engagement_funnel_service.get_engagement_funnel,
         date_from=date_from,
         date_to=date_to
     )
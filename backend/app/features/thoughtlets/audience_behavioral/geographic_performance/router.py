@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import geographic_performance_service
 from .models import GeographicPerformanceResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -39,7 +41,8 @@ async def get_geographic_performance(
 
     Data is sourced from GA4 analytics.
     """
-    return geographic_performance_service.get_geographic_performance(
+    return await run_in_executor(
+        geographic_performance_service.get_geographic_performance,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import audience_behavioral_overview_service
 from .models import AudienceBehavioralOverviewResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -40,7 +42,8 @@ async def get_audience_behavioral_overview(
     - Sessions per User
     - Conversion Rate
     """
-    return audience_behavioral_overview_service.get_overview(
+    return await run_in_executor(
+        audience_behavioral_overview_service.get_overview,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import traffic_by_source_service
 from .models import TrafficBySourceResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_traffic_by_source(
 
     Data is sourced from GA4 analytics.
     """
-    return traffic_by_source_service.get_traffic_by_source(
+    return await run_in_executor(
+        traffic_by_source_service.get_traffic_by_source,
         date_from=date_from,
         date_to=date_to
     )
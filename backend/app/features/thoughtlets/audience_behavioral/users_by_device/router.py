@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import users_by_device_service
 from .models import UsersByDeviceResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_users_by_device(
 
     Data is sourced from GA4 analytics.
     """
-    return users_by_device_service.get_users_by_device(
+    return await run_in_executor(
+        users_by_device_service.get_users_by_device,
         date_from=date_from,
         date_to=date_to
     )
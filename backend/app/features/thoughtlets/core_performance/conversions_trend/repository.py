@@ -3,7 +3,7 @@ Thoughtlets Core Performance Conversions Trend repository - Data access layer fo
 """
 from datetime import date
 from typing import Optional
-from app.core.database import execute_query
+from app.core.shared_scan import campaign_performance_monthly
 
 
 class ConversionsTrendRepository:
@@ -24,33 +24,13 @@ class ConversionsTrendRepository:
         Returns:
             List of dictionaries with monthly conversion data
         """
-        date_conditions = []
-        params = {}
-
-        if date_from:
-            date_conditions.append("DATE_DAY >= %(date_from)s")
-            params["date_from"] = date_from.isoformat()
-
-        if date_to:
-            date_conditions.append("DATE_DAY <= %(date_to)s")
-            params["date_to"] = date_to.isoformat()
-
-        date_filter = ""
-        if date_conditions:
-            date_filter = "WHERE " + " AND ".join(date_conditions)
-
-        query = f"""
-            SELECT
-                TO_CHAR(DATE_TRUNC('MONTH', DATE_DAY), 'Mon YYYY') AS MONTH,
-                SUM(CONVERSIONS) AS CONVERSIONS
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
-            {date_filter}
-            GROUP BY DATE_TRUNC('MONTH', DATE_DAY)
-            ORDER BY DATE_TRUNC('MONTH', DATE_DAY)
-        """
-
-        results = execute_query(query, params if params else None)
-        return results if results else []
+        # Shares one monthly scan of FCT_CAMPAIGN_PERFORMANCE with the other
+        # monthly trends and the overviews (see app.core.shared_scan).
+        return campaign_performance_monthly.rows(
+            date_from,
+            date_to,
+            measures=("CONVERSIONS",)
+        )
 
 
 # Singleton instance for dependency injection
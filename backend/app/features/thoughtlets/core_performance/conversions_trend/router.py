@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import conversions_trend_service
 from .models import ConversionsTrendResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_conversions_trend(
     Data is aggregated from all advertising platforms (Google Ads, Meta, etc.).
     Results are ordered chronologically.
     """
-    return conversions_trend_service.get_conversions_trend(
+    return await run_in_executor(
+        conversions_trend_service.get_conversions_trend,
         date_from=date_from,
         date_to=date_to
     )
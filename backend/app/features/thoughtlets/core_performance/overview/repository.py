@@ -3,7 +3,9 @@ Thoughtlets Core Performance Overview repository - Data access layer for aggrega
 """
 from datetime import date
 from typing import Optional
-from app.core.database import execute_query
+from app.core.semantic import derive
+from app.core.semantic import derive
+from app.core.shared_scan import campaign_performance_monthly
 
 
 class CorePerformanceOverviewRepository:
@@ -24,37 +26,13 @@ class CorePerformanceOverviewRepository:
         Returns:
             Dictionary with aggregated performance metrics
         """
-        date_conditions = []
-        params = {}
-
-        if date_from:
-            date_conditions.append("DATE_DAY >= %(date_from)s")
-            params["date_from"] = date_from.isoformat()
-
-        if date_to:
-            date_conditions.append("DATE_DAY <= %(date_to)s")
-            params["date_to"] = date_to.isoformat()
-
-        date_filter = ""
-        if date_conditions:
-            date_filter = "WHERE " + " AND ".join(date_conditions)
-
-        query = f"""
-            SELECT
-                SUM(CONVERSIONS) AS CONVERSIONS,
-                SUM(CONVERSIONS) * 100.0 / NULLIF(SUM(CLICKS), 0) AS CONVERSION_RATE,
-                SUM(SPEND) / NULLIF(SUM(CONVERSIONS), 0) AS COST_PER_CONVERSION,
-                SUM(CONVERSION_VALUE) AS REVENUE,
-                SUM(CONVERSION_VALUE) / NULLIF(SUM(SPEND), 0) AS ROAS,
-                SUM(CLICKS) * 100.0 / NULLIF(SUM(IMPRESSIONS), 0) AS CTR,
-                SUM(SPEND) / NULLIF(SUM(CLICKS), 0) AS CPC,
-                SUM(IMPRESSIONS) AS IMPRESSIONS
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
-            {date_filter}
-        """
-
-        results = execute_query(query, params if params else None)
-        return results[0] if results else {}
+        # Rolled up from the monthly scan shared with the trend endpoints.
+        totals = campaign_performance_monthly.totals(date_from, date_to)
+        return derive(
+            totals,
+            ("CONVERSIONS", "CONV_RATE", "COST_PER_CONVERSION", "REVENUE", "ROAS", "CTR", "CPC", "IMPRESSIONS"),
+            aliases={"CONV_RATE": "CONVERSION_RATE"}
+        )
 
 
 # Singleton instance for dependency injection
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import revenue_vs_spend_service
 from .models import RevenueVsSpendResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_revenue_vs_spend(
     Data is aggregated from all advertising platforms.
     Results are ordered chronologically.
     """
-    return revenue_vs_spend_service.get_revenue_vs_spend(
+    return await run_in_executor(
+        revenue_vs_spend_service.get_revenue_vs_spend,
         date_from=date_from,
         date_to=date_to
     )
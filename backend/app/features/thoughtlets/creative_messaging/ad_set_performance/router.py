@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ad_set_performance_service
 from .models import AdSetPerformanceResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -17,12 +19,13 @@ router = APIRouter()
     summary="Get ad set performance",
     description="Returns ad set performance metrics for table visualization."
 )
-def get_ad_set_performance(
+async def get_ad_set_performance(
     date_from: Optional[date] = Query(None, description="Start date for filtering (YYYY-MM-DD)"),
     date_to: Optional[date] = Query(None, description="End date for filtering (YYYY-MM-DD)")
 ) -> AdSetPerformanceResponse:
     """Get ad set performance data for table."""
-    return ad_set_performance_service.get_ad_set_performance(
+    return await run_in_executor(
+        ad_set_performance_service.get_ad_set_performance,
         date_from=date_from,
         date_to=date_to
     )
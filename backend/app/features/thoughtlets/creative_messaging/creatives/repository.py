@@ -4,35 +4,24 @@ Creative & Messaging - Creatives repository - Data access layer.
 from datetime import date
 from typing import Optional, List, Tuple
 from app.core.database import execute_query
+from app.core.pagination import Cursor, Keyset, SortKey
+
+
+# Ranked by impressions; CREATIVE_ID breaks ties so the order is total.
+CREATIVES_KEYSET = Keyset((SortKey("IMPRESSIONS", descending=True), SortKey("CREATIVE_ID")))
 
 
 class CreativesRepository:
     """Repository for creatives data access operations."""
 
     @staticmethod
-    def get_creatives(
+    def _creative_stats(
         date_from: Optional[date] = None,
-        date_to: Optional[date] = None,
-        page: int = 1,
-        page_size: int = 10
-    ) -> Tuple[List[dict], int]:
-        """
-        Fetch paginated creatives with performance data.
-
-        Args:
-            date_from: Optional start date for filtering
-            date_to: Optional end date for filtering
-            page: Page number (1-indexed)
-            page_size: Number of items per page
-
-        Returns:
-            Tuple of (list of creative records, total count)
-        """
+        date_to: Optional[date] = None
+    ) -> Tuple[str, dict]:
+        """Build the unordered per-creative aggregate shared by pages and the count."""
         date_conditions = []
-        params = {
-            "page_size": page_size,
-            "offset": (page - 1) * page_size
-        }
+        params = {}
 
         if date_from:
             date_conditions.append("p.date_day >= %(date_from)s::DATE")
@@ -47,47 +36,70 @@ class CreativesRepository:
             date_filter = "AND " + " AND ".join(date_conditions)
 
         query = f"""
-            WITH creative_stats AS (
-                SELECT
-                    c.creative_id,
-                    c.creative_name,
-                    c.creative_type AS TYPE,
-                    c.headline,
-                    AVG(p.ctr) AS CTR,
-                    SUM(p.impressions) AS IMPRESSIONS,
-                    c.body_copy AS PRIMARY_TEXT,
-                    c.status
-                FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_CREATIVE c
-                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_AD a ON c.creative_id = a.creative_id
-                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_AD_PERFORMANCE p ON a.ad_id = p.ad_id
-                WHERE a.platform = 'meta'
-                {date_filter}
-                GROUP BY c.creative_id, c.creative_name, c.creative_type, c.headline, c.body_copy, c.status
-            ),
-            total_count AS (
-                SELECT COUNT(*) AS TOTAL FROM creative_stats
-            )
             SELECT
-                cs.creative_name AS CREATIVE_NAME,
-                cs.TYPE,
-                cs.headline AS HEADLINE,
-                cs.CTR,
-                cs.IMPRESSIONS,
-                cs.PRIMARY_TEXT,
-                cs.status AS STATUS,
-                tc.TOTAL AS TOTAL_COUNT
-            FROM creative_stats cs, total_count tc
-            ORDER BY cs.IMPRESSIONS DESC NULLS LAST
-            LIMIT %(page_size)s OFFSET %(offset)s
+                c.creative_id AS CREATIVE_ID,
+                c.creative_name AS CREATIVE_NAME,
+                c.creative_type AS TYPE,
+                c.headline AS HEADLINE,
+                AVG(p.ctr) AS CTR,
+                COALESCE(SUM(p.impressions), 0) AS IMPRESSIONS,
+                c.body_copy AS PRIMARY_TEXT,
+                c.status AS STATUS
+            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_CREATIVE c
+            JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_AD a ON c.creative_id = a.creative_id
+            JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_AD_PERFORMANCE p ON a.ad_id = p.ad_id
+            WHERE a.platform = 'meta'
+            {date_filter}
+            GROUP BY c.creative_id, c.creative_name, c.creative_type, c.headline, c.body_copy, c.status
+        """
+        return query, params
+
+    @staticmethod
+    def get_creatives(
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        page_size: int = 10,
+        cursor: Optional[Cursor] = None
+    ) -> List[dict]:
         """
+        Fetch one page of creatives with performance data, by impressions.
 
-        results = execute_query(query, params)
+        Args:
+            date_from: Optional start date for filtering
+            date_to: Optional end date for filtering
+            page_size: Number of items per page
+            cursor: Position after the previous page; None for the first page
+
+        Returns:
+            Up to page_size + 1 creative records (the extra row signals a next page)
+        """
+        ranked, params = CreativesRepository._creative_stats(date_from, date_to)
+        query, page_params = CREATIVES_KEYSET.paginate(ranked, cursor, page_size)
 
-        if not results:
-            return [], 0
+        results = execute_query(query, {**params, **page_params})
+        return results if results else []
+
+    @staticmethod
+    def count_creatives(
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> int:
+        """
+        Count the creatives in a date range.
+
+        Issued separately from the pages with only the date parameters, so the
+        query cache keeps one count per date range and data generation.
+        """
+        ranked, params = CreativesRepository._creative_stats(date_from, date_to)
+        query = f"""
+            SELECT COUNT(*) AS TOTAL_COUNT
+            FROM (
+                {ranked.strip()}
+            ) creative_stats
+        """
 
-        total = int(results[0].get("TOTAL_COUNT", 0)) if results else 0
-        return results, total
+        results = execute_query(query, params if params else None)
+        return int(results[0].get("TOTAL_COUNT") or 0) if results else 0
 
 
 # Singleton instance for dependency injection
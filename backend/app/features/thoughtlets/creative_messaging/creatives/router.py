@@ -5,28 +5,31 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import creatives_service
 from .models import CreativesResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
     "/creatives",
     response_model=CreativesResponse,
     summary="Get all creatives (paginated)",
-    description="Returns paginated list of creatives with performance metrics."
+    description="Returns creatives with performance metrics by impressions, paginated with an opaque cursor."
 )
-def get_creatives(
+async def get_creatives(
     date_from: Optional[date] = Query(None, description="Start date for filtering (YYYY-MM-DD)"),
     date_to: Optional[date] = Query(None, description="End date for filtering (YYYY-MM-DD)"),
-    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
-    page_size: int = Query(10, ge=1, le=100, description="Number of items per page")
+    page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; omit for the first page")
 ) -> CreativesResponse:
     """Get paginated creatives with performance data."""
-    return creatives_service.get_creatives(
+    return await run_in_executor(
+        creatives_service.get_creatives,
         date_from=date_from,
         date_to=date_to,
-        page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor
     )
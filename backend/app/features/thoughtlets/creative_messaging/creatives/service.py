@@ -6,7 +6,9 @@ from datetime import date
 from typing import Optional
 from fastapi import HTTPException, status
 
-from .repository import creatives_repository
+from app.core.pagination import InvalidCursor
+
+from .repository import CREATIVES_KEYSET, creatives_repository
 from .models import CreativesResponse, CreativeItem
 
 
@@ -20,23 +22,23 @@ class CreativesService:
         self,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
-        page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        cursor: Optional[str] = None
     ) -> CreativesResponse:
         """
-        Get paginated creatives with performance data.
+        Get one page of creatives with performance data.
 
         Args:
             date_from: Optional start date for filtering
             date_to: Optional end date for filtering
-            page: Page number (1-indexed)
             page_size: Number of items per page
+            cursor: Opaque cursor from the previous page's next_cursor
 
         Returns:
             CreativesResponse with paginated data
 
         Raises:
-            HTTPException: 400 if date_from > date_to
+            HTTPException: 400 if date_from > date_to or the cursor is invalid
         """
         # Validate date range if both dates are provided
         if date_from and date_to and date_from > date_to:
@@ -45,14 +47,27 @@ class CreativesService:
                 detail="date_from must be less than or equal to date_to"
             )
 
+        # Cursors are only valid for the date range they were issued for
+        scope = {"date_from": date_from, "date_to": date_to}
+        try:
+            position = CREATIVES_KEYSET.decode(cursor, scope) if cursor else None
+        except InvalidCursor as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc)
+            )
+
         # Fetch data from repository
-        data, total = self.repository.get_creatives(date_from, date_to, page, page_size)
+        rows = self.repository.get_creatives(date_from, date_to, page_size, position)
+        data, next_cursor = CREATIVES_KEYSET.page(rows, page_size, position, scope)
+        total = self.repository.count_creatives(date_from, date_to)
 
         # Calculate total pages
         total_pages = math.ceil(total / page_size) if total > 0 else 0
+        page = (position.page if position else 0) + 1
 
         # Map database results to response model
-        return self._map_to_response(data, total, page, page_size, total_pages)
+        return self._map_to_response(data, total, page, page_size, total_pages, next_cursor)
 
     @staticmethod
     def _map_to_response(
@@ -60,7 +75,8 @@ class CreativesService:
         total: int,
         page: int,
         page_size: int,
-        total_pages: int
+        total_pages: int,
+        next_cursor: Optional[str] = None
     ) -> CreativesResponse:
         """Map database rows to CreativesResponse."""
         items = [
@@ -80,7 +96,8 @@ class CreativesService:
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
 
 
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import cta_types_service
 from .models import CTATypesResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -17,12 +19,13 @@ router = APIRouter()
     summary="Get CTA type distribution",
     description="Returns call-to-action type distribution for bar chart visualization."
 )
-def get_cta_types(
+async def get_cta_types(
     date_from: Optional[date] = Query(None, description="Start date for filtering (YYYY-MM-DD)"),
     date_to: Optional[date] = Query(None, description="End date for filtering (YYYY-MM-DD)")
 ) -> CTATypesResponse:
     """Get CTA type distribution for bar chart."""
-    return cta_types_service.get_cta_types(
+    return await run_in_executor(
+        cta_types_service.get_cta_types,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import overview_service
 from .models import OverviewResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -41,7 +43,8 @@ async def get_overview_metrics(
 
     Data is aggregated from creatives with performance data in the date range.
     """
-    return overview_service.get_overview_metrics(
+    return await run_in_executor(
+        overview_service.get_overview_metrics,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import conversions_by_channel_service
 from .models import ConversionsByChannelResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -42,7 +44,8 @@ async def get_conversions_by_channel(
 
     Each channel includes total conversions and revenue.
     """
-    return conversions_by_channel_service.get_conversions_by_channel(
+    return await run_in_executor(
+        conversions_by_channel_service.get_conversions_by_channel,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import ecommerce_funnel_service
 from .models import EcommerceFunnelResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_ecommerce_funnel(
 
     This represents the View → Cart → Purchase journey.
     """
-    return ecommerce_funnel_service.get_funnel(
+    return await run_in_executor(
+        ecommerce_funnel_service.get_funnel,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import meta_ads_funnel_service
 from .models import MetaAdsFunnelResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_meta_ads_funnel(
 
     This represents the Meta pixel conversion events funnel.
     """
-    return meta_ads_funnel_service.get_funnel(
+    return await run_in_executor(
+        meta_ads_funnel_service.get_funnel,
         date_from=date_from,
         date_to=date_to
     )
@@ -4,6 +4,7 @@ Monthly Conversions repository - Data access layer for monthly conversion metric
 from datetime import date
 from typing import Optional, List
 from app.core.database import execute_query
+from app.core.rollups import campaign_performance_source
 
 
 class MonthlyConversionsRepository:
@@ -39,12 +40,20 @@ class MonthlyConversionsRepository:
         if date_conditions:
             date_filter = "WHERE " + " AND ".join(date_conditions)
 
+        # Monthly totals only: a month-aligned range reads the monthly rollup.
+        source = campaign_performance_source(
+            {"CONVERSIONS"},
+            date_from,
+            date_to,
+            needs_days=False
+        )
+
         query = f"""
             SELECT
                 TO_CHAR(DATE_DAY, 'Mon YYYY') AS MONTH,
                 TO_CHAR(DATE_TRUNC('month', DATE_DAY), 'YYYY-MM') AS MONTH_SORT,
                 ROUND(SUM(CONVERSIONS), 2) AS CONVERSIONS
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
+            FROM {source}
             {date_filter}
             GROUP BY TO_CHAR(DATE_DAY, 'Mon YYYY'), TO_CHAR(DATE_TRUNC('month', DATE_DAY), 'YYYY-MM')
             ORDER BY MONTH_SORT
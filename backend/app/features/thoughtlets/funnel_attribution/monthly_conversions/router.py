@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import monthly_conversions_service
 from .models import MonthlyConversionsResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_monthly_conversions(
 
     Data is aggregated from campaign performance metrics.
     """
-    return monthly_conversions_service.get_monthly_conversions(
+    return await run_in_executor(
+        monthly_conversions_service.get_monthly_conversions,
         date_from=date_from,
         date_to=date_to
     )
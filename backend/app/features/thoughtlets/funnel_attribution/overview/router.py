@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import funnel_attribution_overview_service
 from .models import FunnelAttributionOverviewResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -42,7 +44,8 @@ async def get_overview(
 
     Data is aggregated from GA4 sessions, ecommerce, and order data.
     """
-    return funnel_attribution_overview_service.get_overview(
+    return await run_in_executor(
+        funnel_attribution_overview_service.get_overview,
         date_from=date_from,
         date_to=date_to
     )
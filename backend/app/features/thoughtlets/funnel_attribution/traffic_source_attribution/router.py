@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import traffic_source_attribution_service
 from .models import TrafficSourceAttributionResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -40,7 +42,8 @@ async def get_traffic_source_attribution(
 
     Data is aggregated from GA4 traffic metrics.
     """
-    return traffic_source_attribution_service.get_traffic_source_attribution(
+    return await run_in_executor(
+        traffic_source_attribution_service.get_traffic_source_attribution,
         date_from=date_from,
         date_to=date_to
     )
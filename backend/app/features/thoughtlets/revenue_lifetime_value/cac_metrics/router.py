@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import cac_metrics_service
 from .models import CACMetricsResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_cac_metrics(
 
     Data is aggregated from cohort metrics.
     """
-    return cac_metrics_service.get_cac_metrics(
+    return await run_in_executor(
+        cac_metrics_service.get_cac_metrics,
         date_from=date_from,
         date_to=date_to
     )
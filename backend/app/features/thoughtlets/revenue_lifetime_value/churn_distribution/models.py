@@ -1,7 +1,7 @@
 """
 Revenue & Lifetime Value - Churn Distribution Pydantic models (DTOs).
 """
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -17,3 +17,7 @@ class ChurnDistributionItem(BaseModel):
 class ChurnDistributionResponse(BaseModel):
     """Response model for churn risk distribution."""
     distribution: List[ChurnDistributionItem] = Field(..., description="List of churn risk distribution by level")
+    approximate: bool = Field(False, description="True if customer counts are HyperLogLog estimates")
+    error_bound_pct: Optional[float] = Field(
+        None, description="Average relative error of approximate counts, in percent (null when exact)"
+    )
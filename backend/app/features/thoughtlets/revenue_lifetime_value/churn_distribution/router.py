@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import churn_distribution_service
 from .models import ChurnDistributionResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -28,6 +30,10 @@ async def get_churn_distribution(
         description="End date for filtering customers by first order date (YYYY-MM-DD format).",
         example="2024-12-31"
     ),
+    approx: bool = Query(
+        default=False,
+        description="Estimate date-range counts from HyperLogLog sketches (faster, ~1.62% error)"
+    ),
 ):
     """
     Get churn risk distribution:
@@ -38,7 +44,9 @@ async def get_churn_distribution(
 
     Returns customer count for each risk level.
     """
-    return churn_distribution_service.get_churn_distribution(
+    return await run_in_executor(
+        churn_distribution_service.get_churn_distribution,
         date_from=date_from,
-        date_to=date_to
+        date_to=date_to,
+        approx=approx
     )
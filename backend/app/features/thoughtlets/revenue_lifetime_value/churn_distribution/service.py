@@ -5,6 +5,8 @@ from datetime import date
 from typing import Optional
 from fastapi import HTTPException, status
 
+from app.core.sketches import HLL_ERROR_PCT
+
 from .repository import churn_distribution_repository
 from .models import ChurnDistributionResponse, ChurnDistributionItem
 
@@ -18,7 +20,8 @@ class ChurnDistributionService:
     def get_churn_distribution(
         self,
         date_from: Optional[date] = None,
-        date_to: Optional[date] = None
+        date_to: Optional[date] = None,
+        approx: bool = False
     ) -> ChurnDistributionResponse:
         """
         Get churn risk distribution.
@@ -26,6 +29,7 @@ class ChurnDistributionService:
         Args:
             date_from: Optional start date for filtering
             date_to: Optional end date for filtering
+            approx: Estimate date-range counts from HyperLogLog sketches
 
         Returns:
             ChurnDistributionResponse with list of risk levels and customer counts
@@ -41,13 +45,14 @@ class ChurnDistributionService:
             )
 
         # Fetch data from repository
-        data = self.repository.get_churn_distribution(date_from, date_to)
+        data = self.repository.get_churn_distribution(date_from, date_to, approx)
 
-        # Map database results to response model
-        return self._map_to_response(data)
+        # Map database results to response model; counts without a date
+        # range are always exact.
+        return self._map_to_response(data, approximate=approx and bool(date_from or date_to))
 
     @staticmethod
-    def _map_to_response(data: list[dict]) -> ChurnDistributionResponse:
+    def _map_to_response(data: list[dict], approximate: bool = False) -> ChurnDistributionResponse:
         """Map database rows to ChurnDistributionResponse."""
         distribution = [
             ChurnDistributionItem(
@@ -56,7 +61,11 @@ class ChurnDistributionService:
             )
             for row in data
         ]
-        return ChurnDistributionResponse(distribution=distribution)
+        return ChurnDistributionResponse(
+            distribution=distribution,
+            approximate=approximate,
+            error_bound_pct=HLL_ERROR_PCT if approximate else None
+        )
 
 
 # Singleton instance for dependency injection
@@ -3,10 +3,12 @@ Revenue & Lifetime Value - CLV Breakdown router - API endpoints.
 """
 from fastapi import APIRouter
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import clv_breakdown_service
 from .models import CLVBreakdownResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -24,4 +26,4 @@ async def get_clv_breakdown():
 
     Note: CLV values are customer-level metrics and are not filtered by date.
     """
-    return clv_breakdown_service.get_clv_breakdown()
+    return await run_in_executor(clv_breakdown_service.get_clv_breakdown)
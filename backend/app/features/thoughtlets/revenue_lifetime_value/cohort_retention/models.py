@@ -18,6 +18,20 @@ class CohortRetentionItem(BaseModel):
         from_attributes = True
 
 
+class CohortRetentionRow(BaseModel):
+    """One cohort's row of the retention matrix."""
+    cohort_month: date = Field(..., description="Cohort month (first order month)")
+    initial_size: int = Field(..., description="Initial cohort size (new customers)")
+    active_customers: List[int] = Field(
+        ..., description="Customers active per month since cohort start (index = months since)"
+    )
+    retention_rates: List[float] = Field(
+        ..., description="Retention rate percentage per month since cohort start (index = months since)"
+    )
+
+
 class CohortRetentionResponse(BaseModel):
     """Response model for cohort retention table."""
     cohorts: List[CohortRetentionItem] = Field(..., description="List of cohort retention data")
+    matrix: List[CohortRetentionRow] = Field(..., description="Cohort x months-since matrix, most recent cohort first")
+    max_months_since: int = Field(..., description="Largest month offset in the matrix (number of columns - 1)")
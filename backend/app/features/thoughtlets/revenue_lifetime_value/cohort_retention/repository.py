@@ -16,75 +16,55 @@ class CohortRetentionRepository:
         limit: int = 12
     ) -> list[dict]:
         """
-        Fetch cohort retention data calculated from FCT_ORDER_DETAILS.
+        Fetch the cohort retention matrix from AGG_COHORT_RETENTION.
 
-        Calculates monthly cohort retention by:
-        1. Determining each customer's cohort (month of first order)
-        2. Tracking which months they placed subsequent orders
-        3. Calculating retention rate for each month since cohort start
+        The dbt mart keeps one cell per cohort (month of first order) and
+        month offset, rebuilt in full on each run from the incrementally
+        maintained AGG_CUSTOMER_MONTH_ACTIVITY, so this reads precomputed
+        cells instead of self-joining FCT_ORDER_DETAILS.
 
         Args:
             date_from: Optional start date for filtering cohorts
             date_to: Optional end date for filtering cohorts
-            limit: Number of cohorts to return (default: 12)
+            limit: Number of most recent cohorts to return (default: 12)
 
         Returns:
-            List of dictionaries with cohort retention data
+            List of dictionaries, one per cohort x month offset, most recent
+            cohort first
         """
         cohort_conditions = []
         params = {"limit": limit}
 
         if date_from:
-            cohort_conditions.append("cohort_month >= DATE_TRUNC('MONTH', %(date_from)s::DATE)")
+            cohort_conditions.append("COHORT_MONTH >= DATE_TRUNC('MONTH', %(date_from)s::DATE)")
             params["date_from"] = date_from.isoformat()
 
         if date_to:
-            cohort_conditions.append("cohort_month <= DATE_TRUNC('MONTH', %(date_to)s::DATE)")
+            cohort_conditions.append("COHORT_MONTH <= DATE_TRUNC('MONTH', %(date_to)s::DATE)")
             params["date_to"] = date_to.isoformat()
 
         cohort_filter = ""
         if cohort_conditions:
             cohort_filter = "WHERE " + " AND ".join(cohort_conditions)
 
+        # LIMIT applies to cohorts, not cells, so every returned cohort is complete.
         query = f"""
-            WITH cohort_base AS (
-                SELECT
-                    PERSON_ID,
-                    DATE_TRUNC('MONTH', MIN(ORDER_DATE)) AS cohort_month
-                FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_ORDER_DETAILS
-                GROUP BY PERSON_ID
-            ),
-            cohort_activity AS (
-                SELECT
-                    c.cohort_month,
-                    DATEDIFF('MONTH', c.cohort_month, DATE_TRUNC('MONTH', o.ORDER_DATE)) AS months_since,
-                    COUNT(DISTINCT c.PERSON_ID) AS active_customers
-                FROM cohort_base c
-                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_ORDER_DETAILS o
-                    ON c.PERSON_ID = o.PERSON_ID
-                GROUP BY c.cohort_month, months_since
-            ),
-            cohort_initial AS (
-                SELECT cohort_month, active_customers AS initial_size
-                FROM cohort_activity
-                WHERE months_since = 0
-            ),
-            filtered_cohorts AS (
-                SELECT DISTINCT cohort_month
-                FROM cohort_activity
+            WITH latest_cohorts AS (
+                SELECT DISTINCT COHORT_MONTH
+                FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.AGG_COHORT_RETENTION
                 {cohort_filter}
+                ORDER BY COHORT_MONTH DESC
+                LIMIT %(limit)s
             )
             SELECT
-                ca.cohort_month AS COHORT_MONTH,
-                ci.initial_size AS INITIAL_SIZE,
-                ca.months_since AS MONTHS_SINCE,
-                ca.active_customers AS ACTIVE_CUSTOMERS,
-                ROUND(ca.active_customers * 100.0 / ci.initial_size, 2) AS RETENTION_RATE
-            FROM cohort_activity ca
-            JOIN cohort_initial ci ON ca.cohort_month = ci.cohort_month
-            WHERE ca.cohort_month IN (SELECT cohort_month FROM filtered_cohorts)
-            ORDER BY ca.cohort_month DESC, ca.months_since ASC
-            LIMIT %(limit)s
+                r.COHORT_MONTH,
+                r.COHORT_SIZE AS INITIAL_SIZE,
+                r.MONTHS_SINCE,
+                r.ACTIVE_CUSTOMERS,
+                r.RETENTION_RATE
+            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.AGG_COHORT_RETENTION r
+            JOIN latest_cohorts c ON r.COHORT_MONTH = c.COHORT_MONTH
+            ORDER BY r.COHORT_MONTH DESC, r.MONTHS_SINCE ASC
         """
 
         results = execute_query(query, params)
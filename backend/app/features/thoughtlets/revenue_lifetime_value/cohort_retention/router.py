@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import cohort_retention_service
 from .models import CohortRetentionResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -39,12 +41,13 @@ async def get_cohort_retention(
     Get cohort retention data for the table:
     - Cohort month
     - Initial size (new customers)
-    - Retained counts at 30, 60, 90 days
-    - Retention rates at 30, 60, 90 days
+    - Active customers and retention rate per month since cohort start
+    - The same cells pivoted into a cohort x month matrix
 
-    Returns the most recent cohorts first.
+    Returns the most recent `limit` cohorts first, each with all its months.
     """
-    return cohort_retention_service.get_cohort_retention(
+    return await run_in_executor(
+        cohort_retention_service.get_cohort_retention,
         date_from=date_from,
         date_to=date_to,
         limit=limit
@@ -6,7 +6,7 @@ from typing import Optional
 from fastapi import HTTPException, status
 
 from .repository import cohort_retention_repository
-from .models import CohortRetentionResponse, CohortRetentionItem
+from .models import CohortRetentionResponse, CohortRetentionItem, CohortRetentionRow
 
 
 class CohortRetentionService:
@@ -27,10 +27,10 @@ class CohortRetentionService:
         Args:
             date_from: Optional start date for the cohorts
             date_to: Optional end date for the cohorts
-            limit: Number of cohorts to return (default: 12)
+            limit: Number of most recent cohorts to return (default: 12)
 
         Returns:
-            CohortRetentionResponse with list of cohort data
+            CohortRetentionResponse with the cohort cells and the cohort x month matrix
 
         Raises:
             HTTPException: 400 if date_from > date_to
@@ -61,7 +61,28 @@ class CohortRetentionService:
             )
             for row in data
         ]
-        return CohortRetentionResponse(cohorts=cohorts)
+
+        # Pivot cells into rows; months without active customers have no cell.
+        rows: dict[date, CohortRetentionRow] = {}
+        for item in cohorts:
+            row = rows.get(item.cohort_month)
+            if row is None:
+                row = rows[item.cohort_month] = CohortRetentionRow(
+                    cohort_month=item.cohort_month,
+                    initial_size=item.initial_size,
+                    active_customers=[],
+                    retention_rates=[]
+                )
+            gap = item.months_since - len(row.active_customers)
+            row.active_customers.extend([0] * gap + [item.active_customers])
+            row.retention_rates.extend([0.0] * gap + [item.retention_rate])
+
+        matrix = list(rows.values())
+        return CohortRetentionResponse(
+            cohorts=cohorts,
+            matrix=matrix,
+            max_months_since=max((len(row.active_customers) - 1 for row in matrix), default=0)
+        )
 
 
 # Singleton instance for dependency injection
@@ -1,7 +1,7 @@
 """
 Revenue & Lifetime Value - Customer Segments Pydantic models (DTOs).
 """
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -17,3 +17,7 @@ class CustomerSegmentItem(BaseModel):
 class CustomerSegmentsResponse(BaseModel):
     """Response model for customer segments distribution."""
     segments: List[CustomerSegmentItem] = Field(..., description="List of customer segments with counts")
+    approximate: bool = Field(False, description="True if customer counts are HyperLogLog estimates")
+    error_bound_pct: Optional[float] = Field(
+        None, description="Average relative error of approximate counts, in percent (null when exact)"
+    )
@@ -4,6 +4,7 @@ Revenue & Lifetime Value - Customer Segments repository - Data access layer.
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.sketches import hll_estimate_sql
 
 
 class CustomerSegmentsRepository:
@@ -12,14 +13,18 @@ class CustomerSegmentsRepository:
     @staticmethod
     def get_customer_segments(
         date_from: Optional[date] = None,
-        date_to: Optional[date] = None
+        date_to: Optional[date] = None,
+        approx: bool = False
     ) -> list[dict]:
         """
-        Fetch customer count by CLV segment from DIM_PERSON.
+        Fetch customer count by CLV segment from DIM_PERSON (all customers) or
+        AGG_SEGMENT_DAILY_ACTIVITY (customers active in a date range).
 
         Args:
-            date_from: Optional start date (filter by ORDER_DATE via FCT_ORDER_DETAILS)
-            date_to: Optional end date (filter by ORDER_DATE via FCT_ORDER_DETAILS)
+            date_from: Optional start date (customers with an order on or after it)
+            date_to: Optional end date (customers with an order on or before it)
+            approx: Estimate date-range counts from HyperLogLog sketches
+                (AGG_SEGMENT_DAILY_SKETCHES) instead of exact bitmaps
 
         Returns:
             List of dictionaries with segment name and customer count
@@ -30,26 +35,46 @@ class CustomerSegmentsRepository:
             params = {}
 
             if date_from:
-                date_conditions.append("o.ORDER_DATE >= %(date_from)s")
+                date_conditions.append("DATE_DAY >= %(date_from)s")
                 params["date_from"] = date_from.isoformat()
 
             if date_to:
-                date_conditions.append("o.ORDER_DATE <= %(date_to)s")
+                date_conditions.append("DATE_DAY <= %(date_to)s")
                 params["date_to"] = date_to.isoformat()
 
             date_filter = "WHERE " + " AND ".join(date_conditions)
 
-            query = f"""
-                SELECT
-                    p.CLV_SEGMENT AS SEGMENT_NAME,
-                    COUNT(DISTINCT p.PERSON_ID) AS CUSTOMER_COUNT
-                FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_PERSON p
-                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_ORDER_DETAILS o
-                    ON p.PERSON_ID = o.PERSON_ID
-                {date_filter}
-                GROUP BY p.CLV_SEGMENT
-                ORDER BY CUSTOMER_COUNT DESC
-            """
+            if approx:
+                # Approximate distinct customers: merge the daily HLL sketches.
+                query = f"""
+                    SELECT
+                        CLV_SEGMENT AS SEGMENT_NAME,
+                        ROUND({hll_estimate_sql("ACTIVE_PEOPLE_SKETCH")}) AS CUSTOMER_COUNT
+                    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.AGG_SEGMENT_DAILY_SKETCHES
+                    {date_filter}
+                    GROUP BY CLV_SEGMENT
+                    ORDER BY CUSTOMER_COUNT DESC
+                """
+            else:
+                # Distinct customers active in the range: OR the daily activity
+                # bitmaps per bucket, then count bits - no join over order history.
+                query = f"""
+                    WITH active AS (
+                        SELECT
+                            CLV_SEGMENT,
+                            BITMAP_BUCKET,
+                            BITMAP_OR_AGG(ACTIVE_PEOPLE) AS ACTIVE_PEOPLE
+                        FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.AGG_SEGMENT_DAILY_ACTIVITY
+                        {date_filter}
+                        GROUP BY CLV_SEGMENT, BITMAP_BUCKET
+                    )
+                    SELECT
+                        CLV_SEGMENT AS SEGMENT_NAME,
+                        SUM(BITMAP_COUNT(ACTIVE_PEOPLE)) AS CUSTOMER_COUNT
+                    FROM active
+                    GROUP BY CLV_SEGMENT
+                    ORDER BY CUSTOMER_COUNT DESC
+                """
 
             results = execute_query(query, params)
         else:
@@ -5,6 +5,8 @@ from datetime import date
 from typing import Optional
 from fastapi import HTTPException, status
 
+from app.core.sketches import HLL_ERROR_PCT
+
 from .repository import customer_segments_repository
 from .models import CustomerSegmentsResponse, CustomerSegmentItem
 
@@ -18,7 +20,8 @@ class CustomerSegmentsService:
     def get_customer_segments(
         self,
         date_from: Optional[date] = None,
-        date_to: Optional[date] = None
+        date_to: Optional[date] = None,
+        approx: bool = False
     ) -> CustomerSegmentsResponse:
         """
         Get customer distribution by CLV segment.
@@ -26,6 +29,7 @@ class CustomerSegmentsService:
         Args:
             date_from: Optional start date for filtering
             date_to: Optional end date for filtering
+            approx: Estimate date-range counts from HyperLogLog sketches
 
         Returns:
             CustomerSegmentsResponse with list of segments and customer counts
@@ -41,13 +45,14 @@ class CustomerSegmentsService:
             )
 
         # Fetch data from repository
-        data = self.repository.get_customer_segments(date_from, date_to)
+        data = self.repository.get_customer_segments(date_from, date_to, approx)
 
-        # Map database results to response model
-        return self._map_to_response(data)
+        # Map database results to response model; counts without a date
+        # range are always exact.
+        return self._map_to_response(data, approximate=approx and bool(date_from or date_to))
 
     @staticmethod
-    def _map_to_response(data: list[dict]) -> CustomerSegmentsResponse:
+    def _map_to_response(data: list[dict], approximate: bool = False) -> CustomerSegmentsResponse:
         """Map database rows to CustomerSegmentsResponse."""
         segments = [
             CustomerSegmentItem(
@@ -56,7 +61,11 @@ class CustomerSegmentsService:
             )
             for row in data
         ]
-        return CustomerSegmentsResponse(segments=segments)
+        return CustomerSegmentsResponse(
+            segments=segments,
+            approximate=approximate,
+            error_bound_pct=HLL_ERROR_PCT if approximate else None
+        )
 
 
 # Singleton instance for dependency injection
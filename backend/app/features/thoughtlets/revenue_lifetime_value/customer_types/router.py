@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import customer_types_service
 from .models import CustomerTypesResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_customer_types(
 
     Returns customer count for each type.
     """
-    return customer_types_service.get_customer_types(
+    return await run_in_executor(
+        customer_types_service.get_customer_types,
         date_from=date_from,
         date_to=date_to
     )
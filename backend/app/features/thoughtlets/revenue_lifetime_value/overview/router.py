@@ -5,10 +5,11 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.timing import TimedRoute
 from .service import revenue_overview_service
 from .models import RevenueOverviewResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -40,7 +41,7 @@ async def get_overview(
     - Average AOV (Average Order Value)
     - Churn Risk percentage
     """
-    return revenue_overview_service.get_overview(
+    return await revenue_overview_service.get_overview(
         date_from=date_from,
         date_to=date_to
     )
@@ -2,9 +2,11 @@
 Revenue & Lifetime Value Overview service - Business logic layer for CLV metrics.
 """
 from datetime import date
+from functools import partial
 from typing import Optional
 from fastapi import HTTPException, status
 
+from app.core.concurrency import fan_out
 from .repository import revenue_overview_repository
 from .models import RevenueOverviewResponse
 
@@ -15,7 +17,7 @@ class RevenueOverviewService:
     def __init__(self, repository=revenue_overview_repository):
         self.repository = repository
 
-    def get_overview(
+    async def get_overview(
         self,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None
@@ -31,7 +33,7 @@ class RevenueOverviewService:
             RevenueOverviewResponse with aggregated metrics
 
         Raises:
-            HTTPException: 400 if date_from > date_to
+            HTTPException: 400 if date_from > date_to, 504 if a query times out
         """
         # Validate date range if both dates are provided
         if date_from and date_to and date_from > date_to:
@@ -40,9 +42,11 @@ class RevenueOverviewService:
                 detail="date_from must be less than or equal to date_to"
             )
 
-        # Fetch data from repository (two separate queries)
-        metrics_data = self.repository.get_metrics_data(date_from, date_to)
-        clv_data = self.repository.get_clv_data()
+        # Fetch data from repository (two independent queries, run concurrently)
+        metrics_data, clv_data = await fan_out(
+            partial(self.repository.get_metrics_data, date_from, date_to),
+            self.repository.get_clv_data,
+        )
 
         # Combine and map to response model
         return self._map_to_response(metrics_data, clv_data)
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import retention_service
 from .models import RetentionResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_retention(
 
     Data is aggregated from cohort metrics.
     """
-    return retention_service.get_retention(
+    return await run_in_executor(
+        retention_service.get_retention,
         date_from=date_from,
         date_to=date_to
     )
@@ -25,3 +25,6 @@ class KeywordsListResponse(BaseModel):
     """Response model for keywords list."""
     keywords: List[KeywordPerformanceItem] = Field(..., description="List of keyword performance data")
     total_count: int = Field(..., description="Total number of keywords returned")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page; null on the last page"
+    )
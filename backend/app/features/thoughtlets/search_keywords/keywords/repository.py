@@ -4,6 +4,12 @@ Search & Keywords - Keywords Performance repository - Data access layer.
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.pagination import Cursor, Keyset, SortKey
+from app.core.semantic import MetricQuery
+
+
+# Ranked by impressions; (KEYWORD, MATCH) is the group key and breaks ties.
+KEYWORDS_KEYSET = Keyset((SortKey("IMPRESSIONS", descending=True), SortKey("KEYWORD"), SortKey("MATCH")))
 
 
 class KeywordsRepository:
@@ -14,7 +20,8 @@ class KeywordsRepository:
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
         match_type: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[Cursor] = None
     ) -> list[dict]:
         """
         Fetch all keywords with performance metrics.
@@ -24,12 +31,13 @@ class KeywordsRepository:
             date_to: Optional end date for the metrics
             match_type: Optional filter by match type (EXACT, PHRASE, BROAD)
             limit: Number of results to return
+            cursor: Position after the previous page; None for the first page
 
         Returns:
-            List of dictionaries with keyword performance data
+            Up to limit + 1 keyword records (the extra row signals a next page)
         """
         conditions = []
-        params = {"limit": limit}
+        params = {}
 
         if date_from:
             conditions.append("f.DATE_DAY >= %(date_from)s")
@@ -43,32 +51,34 @@ class KeywordsRepository:
             conditions.append("k.MATCH_TYPE = %(match_type)s")
             params["match_type"] = match_type.upper()
 
-        filter_clause = ""
-        if conditions:
-            filter_clause = "AND " + " AND ".join(conditions)
-
-        query = f"""
+        metrics = MetricQuery(
+            source="""
+                CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f
+                JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_KEYWORD k
+                    ON f.KEYWORD_ID = k.KEYWORD_ID AND k.IS_CURRENT = TRUE
+            """,
+            metrics=("IMPRESSIONS", "CLICKS", "CTR", "CPC", "SPEND", "CONVERSIONS", "CONV_RATE"),
+            dimensions=(
+                ("COALESCE(k.KEYWORD_TEXT, '')", "KEYWORD"),
+                ("COALESCE(k.MATCH_TYPE, '')", "MATCH"),
+            ),
+            where=(
+                "f.PLATFORM = 'google_ads'",
+                *conditions,
+            ),
+        ).sql()
+        # Sort keys must not be NULL for the keyset comparison
+        ranked = f"""
             SELECT
-                k.KEYWORD_TEXT AS KEYWORD,
-                k.MATCH_TYPE AS MATCH,
-                SUM(f.IMPRESSIONS) AS IMPRESSIONS,
-                SUM(f.CLICKS) AS CLICKS,
-                ROUND(SUM(f.CLICKS) * 100.0 / NULLIF(SUM(f.IMPRESSIONS), 0), 1) AS CTR,
-                ROUND(SUM(f.SPEND) / NULLIF(SUM(f.CLICKS), 0), 2) AS CPC,
-                SUM(f.SPEND) AS SPEND,
-                SUM(f.CONVERSIONS) AS CONVERSIONS,
-                ROUND(SUM(f.CONVERSIONS) * 100.0 / NULLIF(SUM(f.CLICKS), 0), 2) AS CONV_RATE
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f
-            JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_KEYWORD k
-                ON f.KEYWORD_ID = k.KEYWORD_ID AND k.IS_CURRENT = TRUE
-            WHERE f.PLATFORM = 'google_ads'
-                {filter_clause}
-            GROUP BY k.KEYWORD_TEXT, k.MATCH_TYPE
-            ORDER BY IMPRESSIONS DESC
-            LIMIT %(limit)s
+                KEYWORD, MATCH, COALESCE(IMPRESSIONS, 0) AS IMPRESSIONS,
+                CLICKS, CTR, CPC, SPEND, CONVERSIONS, CONV_RATE
+            FROM (
+                {metrics}
+            ) keyword_metrics
         """
+        query, page_params = KEYWORDS_KEYSET.paginate(ranked, cursor, limit)
 
-        results = execute_query(query, params)
+        results = execute_query(query, {**params, **page_params})
         return results if results else []
 
 
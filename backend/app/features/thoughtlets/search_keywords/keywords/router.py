@@ -5,10 +5,13 @@ from datetime import date
 from typing import Optional, Literal
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.serialization import fast_response
+from app.core.timing import TimedRoute
 from .service import keywords_service
 from .models import KeywordsListResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,6 +41,10 @@ async def get_keywords_performance(
         le=500,
         description="Number of keywords to return (1-500)"
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor of the previous page; omit for the first page"
+    ),
 ):
     """
     Get all keywords with performance metrics for the table view:
@@ -47,9 +54,12 @@ async def get_keywords_performance(
     - CPC, Spend
     - Conversions, Conversion Rate
     """
-    return keywords_service.get_keywords_performance(
+    result = await run_in_executor(
+        keywords_service.get_keywords_performance,
         date_from=date_from,
         date_to=date_to,
         match_type=match_type,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
+    return fast_response(result)
@@ -5,7 +5,10 @@ from datetime import date
 from typing import Optional
 from fastapi import HTTPException, status
 
-from .repository import keywords_repository
+from app.core.pagination import InvalidCursor
+from app.core.serialization import construct
+
+from .repository import KEYWORDS_KEYSET, keywords_repository
 from .models import KeywordsListResponse, KeywordPerformanceItem
 
 
@@ -20,7 +23,8 @@ class KeywordsService:
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
         match_type: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None
     ) -> KeywordsListResponse:
         """
         Get all keywords with performance metrics.
@@ -30,12 +34,13 @@ class KeywordsService:
             date_to: Optional end date for the metrics
             match_type: Optional filter by match type
             limit: Number of results to return
+            cursor: Opaque cursor from the previous page's next_cursor
 
         Returns:
             KeywordsListResponse with list of keyword performance data
 
         Raises:
-            HTTPException: 400 if date_from > date_to
+            HTTPException: 400 if date_from > date_to or the cursor is invalid
         """
         # Validate date range if both dates are provided
         if date_from and date_to and date_from > date_to:
@@ -44,17 +49,29 @@ class KeywordsService:
                 detail="date_from must be less than or equal to date_to"
             )
 
+        # Cursors are only valid for the filters they were issued for
+        scope = {"date_from": date_from, "date_to": date_to, "match_type": match_type}
+        try:
+            position = KEYWORDS_KEYSET.decode(cursor, scope) if cursor else None
+        except InvalidCursor as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc)
+            )
+
         # Fetch data from repository
-        data = self.repository.get_keywords_performance(date_from, date_to, match_type, limit)
+        rows = self.repository.get_keywords_performance(date_from, date_to, match_type, limit, position)
+        data, next_cursor = KEYWORDS_KEYSET.page(rows, limit, position, scope)
 
         # Map database results to response model
-        return self._map_to_response(data)
+        return self._map_to_response(data, next_cursor)
 
     @staticmethod
-    def _map_to_response(data: list[dict]) -> KeywordsListResponse:
-        """Map database rows to KeywordsListResponse."""
+    def _map_to_response(data: list[dict], next_cursor: Optional[str] = None) -> KeywordsListResponse:
+        """Map database rows to KeywordsListResponse; values are coerced here, so not re-validated."""
         keywords = [
-            KeywordPerformanceItem(
+            construct(
+                KeywordPerformanceItem,
                 keyword=str(row.get("KEYWORD") or ""),
                 match_type=str(row.get("MATCH") or "UNKNOWN"),
                 impressions=int(row.get("IMPRESSIONS") or 0),
@@ -67,7 +84,7 @@ class KeywordsService:
             )
             for row in data
         ]
-        return KeywordsListResponse(keywords=keywords, total_count=len(keywords))
+        return construct(KeywordsListResponse, keywords=keywords, total_count=len(keywords), next_cursor=next_cursor)
 
 
 # Singleton instance for dependency injection
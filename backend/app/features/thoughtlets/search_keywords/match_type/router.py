@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import match_type_service
 from .models import MatchTypeResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -36,7 +38,8 @@ async def get_match_type_distribution(
 
     Returns data for EXACT, PHRASE, and BROAD match types.
     """
-    return match_type_service.get_match_type_distribution(
+    return await run_in_executor(
+        match_type_service.get_match_type_distribution,
         date_from=date_from,
         date_to=date_to
     )
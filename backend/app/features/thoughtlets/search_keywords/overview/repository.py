@@ -4,6 +4,7 @@ Search & Keywords Overview repository - Data access layer for keyword metrics.
 from datetime import date
 from typing import Optional
 from app.core.database import execute_query
+from app.core.semantic import CPC, CTR
 
 
 class SearchKeywordsOverviewRepository:
@@ -45,8 +46,8 @@ class SearchKeywordsOverviewRepository:
                 COUNT(DISTINCT CASE WHEN k.MATCH_TYPE = 'EXACT' THEN k.KEYWORD_ID END) AS EXACT_MATCH,
                 COUNT(DISTINCT CASE WHEN k.MATCH_TYPE = 'PHRASE' THEN k.KEYWORD_ID END) AS PHRASE_MATCH,
                 COUNT(DISTINCT CASE WHEN k.MATCH_TYPE = 'BROAD' THEN k.KEYWORD_ID END) AS BROAD_MATCH,
-                ROUND(SUM(f.CLICKS) * 100.0 / NULLIF(SUM(f.IMPRESSIONS), 0), 1) AS AVG_CTR,
-                ROUND(SUM(f.SPEND) / NULLIF(SUM(f.CLICKS), 0), 2) AS AVG_CPC,
+                {CTR.sql()} AS AVG_CTR,
+                {CPC.sql()} AS AVG_CPC,
                 SUM(f.CONVERSIONS) AS CONVERSIONS,
                 SUM(f.SPEND) AS TOTAL_SPEND
             FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f
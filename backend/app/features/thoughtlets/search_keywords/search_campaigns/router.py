@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import search_campaigns_service
 from .models import SearchCampaignsResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_search_campaigns(
     - Impressions, Clicks, CTR
     - Spend, Conversions, ROAS
     """
-    return search_campaigns_service.get_search_campaigns(
+    return await run_in_executor(
+        search_campaigns_service.get_search_campaigns,
         date_from=date_from,
         date_to=date_to
     )
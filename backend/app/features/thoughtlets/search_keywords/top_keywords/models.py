@@ -1,7 +1,7 @@
 """
 Search & Keywords Top Keywords - Pydantic models (DTOs).
 """
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -18,3 +18,6 @@ class TopKeywordItem(BaseModel):
 class TopKeywordsResponse(BaseModel):
     """Response model for top keywords list."""
     keywords: List[TopKeywordItem] = Field(..., description="List of top keywords")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next keywords; null when there are no more"
+    )
@@ -4,6 +4,14 @@ Search & Keywords Top Keywords repository - Data access layer for top keywords.
 from datetime import date
 from typing import Optional, Literal
 from app.core.database import execute_query
+from app.core.pagination import Cursor, Keyset, SortKey
+
+
+# Ranked by the sort metric; KEYWORD (the group key) breaks ties.
+TOP_KEYWORDS_KEYSETS = {
+    "conversions": Keyset((SortKey("CONVERSIONS", descending=True), SortKey("KEYWORD"))),
+    "clicks": Keyset((SortKey("CLICKS", descending=True), SortKey("KEYWORD"))),
+}
 
 
 class TopKeywordsRepository:
@@ -14,7 +22,8 @@ class TopKeywordsRepository:
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
         sort_by: Literal["conversions", "clicks"] = "conversions",
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[Cursor] = None
     ) -> list[dict]:
         """
         Fetch top keywords by conversions or clicks.
@@ -24,12 +33,13 @@ class TopKeywordsRepository:
             date_to: Optional end date for the metrics
             sort_by: Sort by 'conversions' or 'clicks'
             limit: Number of results to return
+            cursor: Position after the previous page; None for the top
 
         Returns:
-            List of dictionaries with top keyword data
+            Up to limit + 1 keyword records (the extra row signals a next page)
         """
         date_conditions = []
-        params = {"limit": limit}
+        params = {}
 
         if date_from:
             date_conditions.append("f.DATE_DAY >= %(date_from)s")
@@ -43,25 +53,21 @@ class TopKeywordsRepository:
         if date_conditions:
             date_filter = "AND " + " AND ".join(date_conditions)
 
-        # Determine sort column
-        sort_column = "CONVERSIONS" if sort_by == "conversions" else "CLICKS"
-
-        query = f"""
+        ranked = f"""
             SELECT
-                k.KEYWORD_TEXT AS KEYWORD,
-                SUM(f.CONVERSIONS) AS CONVERSIONS,
-                SUM(f.CLICKS) AS CLICKS
+                COALESCE(k.KEYWORD_TEXT, '') AS KEYWORD,
+                COALESCE(SUM(f.CONVERSIONS), 0) AS CONVERSIONS,
+                COALESCE(SUM(f.CLICKS), 0) AS CLICKS
             FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE f
             JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_KEYWORD k
                 ON f.KEYWORD_ID = k.KEYWORD_ID AND k.IS_CURRENT = TRUE
             WHERE f.PLATFORM = 'google_ads'
                 {date_filter}
             GROUP BY k.KEYWORD_TEXT
-            ORDER BY {sort_column} DESC
-            LIMIT %(limit)s
         """
+        query, page_params = TOP_KEYWORDS_KEYSETS[sort_by].paginate(ranked, cursor, limit)
 
-        results = execute_query(query, params)
+        results = execute_query(query, {**params, **page_params})
         return results if results else []
 
 
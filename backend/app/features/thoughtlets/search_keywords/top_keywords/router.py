@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional, Literal
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import top_keywords_service
 from .models import TopKeywordsResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,17 +40,24 @@ async def get_top_keywords(
         le=100,
         description="Number of top keywords to return (1-100)"
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor of the previous response, to fetch the following keywords"
+    ),
 ):
     """
     Get top keywords for bar chart visualizations:
     - Top Keywords by Conversions
     - Top Keywords by Clicks
 
-    Use the `sort_by` parameter to switch between the two views.
+    Use the `sort_by` parameter to switch between the two views, and `cursor`
+    to page past the first `limit` keywords.
     """
-    return top_keywords_service.get_top_keywords(
+    return await run_in_executor(
+        top_keywords_service.get_top_keywords,
         date_from=date_from,
         date_to=date_to,
         sort_by=sort_by,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
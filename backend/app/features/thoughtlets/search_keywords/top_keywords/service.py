@@ -5,7 +5,9 @@ from datetime import date
 from typing import Optional, Literal
 from fastapi import HTTPException, status
 
-from .repository import top_keywords_repository
+from app.core.pagination import InvalidCursor
+
+from .repository import TOP_KEYWORDS_KEYSETS, top_keywords_repository
 from .models import TopKeywordsResponse, TopKeywordItem
 
 
@@ -20,7 +22,8 @@ class TopKeywordsService:
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
         sort_by: Literal["conversions", "clicks"] = "conversions",
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[str] = None
     ) -> TopKeywordsResponse:
         """
         Get top keywords by conversions or clicks.
@@ -30,12 +33,13 @@ class TopKeywordsService:
             date_to: Optional end date for the metrics
             sort_by: Sort by 'conversions' or 'clicks'
             limit: Number of results to return
+            cursor: Opaque cursor from the previous response's next_cursor
 
         Returns:
             TopKeywordsResponse with list of top keywords
 
         Raises:
-            HTTPException: 400 if date_from > date_to
+            HTTPException: 400 if date_from > date_to or the cursor is invalid
         """
         # Validate date range if both dates are provided
         if date_from and date_to and date_from > date_to:
@@ -44,14 +48,26 @@ class TopKeywordsService:
                 detail="date_from must be less than or equal to date_to"
             )
 
+        # Cursors are only valid for the ranking and date range they were issued for
+        keyset = TOP_KEYWORDS_KEYSETS[sort_by]
+        scope = {"date_from": date_from, "date_to": date_to, "sort_by": sort_by}
+        try:
+            position = keyset.decode(cursor, scope) if cursor else None
+        except InvalidCursor as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc)
+            )
+
         # Fetch data from repository
-        data = self.repository.get_top_keywords(date_from, date_to, sort_by, limit)
+        rows = self.repository.get_top_keywords(date_from, date_to, sort_by, limit, position)
+        data, next_cursor = keyset.page(rows, limit, position, scope)
 
         # Map database results to response model
-        return self._map_to_response(data)
+        return self._map_to_response(data, next_cursor)
 
     @staticmethod
-    def _map_to_response(data: list[dict]) -> TopKeywordsResponse:
+    def _map_to_response(data: list[dict], next_cursor: Optional[str] = None) -> TopKeywordsResponse:
         """Map database rows to TopKeywordsResponse."""
         keywords = [
             TopKeywordItem(
@@ -61,7 +77,7 @@ class TopKeywordsService:
             )
             for row in data
         ]
-        return TopKeywordsResponse(keywords=keywords)
+        return TopKeywordsResponse(keywords=keywords, next_cursor=next_cursor)
 
 
 # Singleton instance for dependency injection
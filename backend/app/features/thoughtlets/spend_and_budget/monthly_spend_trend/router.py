@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import monthly_spend_trend_service
 from .models import MonthlySpendTrendResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -36,7 +38,8 @@ async def get_monthly_spend_trend(
 
     Data is aggregated from all advertising platforms (Google Ads, Meta Ads, etc.).
     """
-    return monthly_spend_trend_service.get_monthly_spend_trend(
+    return await run_in_executor(
+        monthly_spend_trend_service.get_monthly_spend_trend,
         date_from=date_from,
         date_to=date_to
     )
@@ -3,7 +3,8 @@ Thoughtlets Spend and Budget Overview repository - Data access layer for spend/b
 """
 from datetime import date
 from typing import Optional
-from app.core.database import execute_query
+from app.core.semantic import derive
+from app.core.shared_scan import campaign_performance_monthly
 
 
 class SpendAndBudgetOverviewRepository:
@@ -24,37 +25,19 @@ class SpendAndBudgetOverviewRepository:
         Returns:
             Dictionary with aggregated spend and budget metrics
         """
-        date_conditions = []
-        params = {}
-
-        if date_from:
-            date_conditions.append("DATE_DAY >= %(date_from)s")
-            params["date_from"] = date_from.isoformat()
-
-        if date_to:
-            date_conditions.append("DATE_DAY <= %(date_to)s")
-            params["date_to"] = date_to.isoformat()
-
-        date_filter = ""
-        if date_conditions:
-            date_filter = "WHERE " + " AND ".join(date_conditions)
-
-        query = f"""
-            SELECT
-                ROUND(SUM(SPEND), 2) AS TOTAL_SPEND,
-                ROUND(SUM(CONVERSION_VALUE), 2) AS TOTAL_REVENUE,
-                ROUND(SUM(CONVERSION_VALUE) / NULLIF(SUM(SPEND), 0), 3) AS OVERALL_ROAS,
-                ROUND(SUM(SPEND) / NULLIF(SUM(CONVERSIONS), 0), 2) AS COST_PER_CONVERSION,
-                ROUND(SUM(SPEND) / NULLIF(SUM(CLICKS), 0), 2) AS AVG_CPC,
-                ROUND(SUM(SPEND) / NULLIF(COUNT(DISTINCT DATE_DAY), 0), 2) AS AVG_DAILY_SPEND,
-                SUM(IMPRESSIONS) AS TOTAL_IMPRESSIONS,
-                ROUND(SUM(CONVERSIONS), 0) AS CONVERSIONS
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
-            {date_filter}
-        """
-
-        results = execute_query(query, params if params else None)
-        return results[0] if results else {}
+        # Rolled up from the monthly scan shared with the trend endpoints.
+        totals = campaign_performance_monthly.totals(date_from, date_to)
+        return derive(
+            totals,
+            ("SPEND", "REVENUE", "ROAS", "COST_PER_CONVERSION", "CPC", "AVG_DAILY_SPEND", "IMPRESSIONS", "CONVERSIONS"),
+            aliases={
+                "SPEND": "TOTAL_SPEND",
+                "REVENUE": "TOTAL_REVENUE",
+                "ROAS": "OVERALL_ROAS",
+                "CPC": "AVG_CPC",
+                "IMPRESSIONS": "TOTAL_IMPRESSIONS",
+            }
+        )
 
 
 # Singleton instance for dependency injection
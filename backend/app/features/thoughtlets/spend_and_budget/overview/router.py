@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import spend_and_budget_overview_service
 from .models import SpendAndBudgetOverviewResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -42,7 +44,8 @@ async def get_overview(
 
     Data is aggregated from all advertising platforms (Google Ads, Meta, etc.).
     """
-    return spend_and_budget_overview_service.get_overview(
+    return await run_in_executor(
+        spend_and_budget_overview_service.get_overview,
         date_from=date_from,
         date_to=date_to
     )
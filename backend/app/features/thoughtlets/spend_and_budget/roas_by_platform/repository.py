@@ -3,7 +3,8 @@ Thoughtlets Spend and Budget - ROAS by Platform repository - Data access layer.
 """
 from datetime import date
 from typing import Optional
-from app.core.database import execute_query
+from app.core.daily_cells import campaign_performance_by_platform, sort_desc
+from app.core.semantic import ratio
 
 
 class ROASByPlatformRepository:
@@ -24,33 +25,13 @@ class ROASByPlatformRepository:
         Returns:
             List of dictionaries with platform and ROAS data
         """
-        date_conditions = []
-        params = {}
-
-        if date_from:
-            date_conditions.append("DATE_DAY >= %(date_from)s")
-            params["date_from"] = date_from.isoformat()
-
-        if date_to:
-            date_conditions.append("DATE_DAY <= %(date_to)s")
-            params["date_to"] = date_to.isoformat()
-
-        date_filter = ""
-        if date_conditions:
-            date_filter = "WHERE " + " AND ".join(date_conditions)
-
-        query = f"""
-            SELECT
-                PLATFORM,
-                SUM(CONVERSION_VALUE) / NULLIF(SUM(SPEND), 0) AS ROAS
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
-            {date_filter}
-            GROUP BY PLATFORM
-            ORDER BY ROAS DESC
-        """
-
-        results = execute_query(query, params if params else None)
-        return results if results else []
+        # Summed from cached per-day cells; only uncached days hit the warehouse.
+        # ROAS stays unrounded, as SUM(CONVERSION_VALUE) / NULLIF(SUM(SPEND), 0) returned it.
+        rows = [
+            {"PLATFORM": row["PLATFORM"], "ROAS": ratio(row["REVENUE"], row["SPEND"])}
+            for row in campaign_performance_by_platform.aggregate(date_from, date_to)
+        ]
+        return sort_desc(rows, "ROAS")
 
 
 # Singleton instance for dependency injection
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import roas_by_platform_service
 from .models import ROASByPlatformResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -36,7 +38,8 @@ async def get_roas_by_platform(
 
     Data is aggregated from all advertising platforms (Google Ads, Meta Ads, etc.).
     """
-    return roas_by_platform_service.get_roas_by_platform(
+    return await run_in_executor(
+        roas_by_platform_service.get_roas_by_platform,
         date_from=date_from,
         date_to=date_to
     )
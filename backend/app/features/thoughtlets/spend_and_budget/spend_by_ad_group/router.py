@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import spend_by_ad_group_service
 from .models import SpendByAdGroupResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -38,7 +40,8 @@ async def get_spend_by_ad_group(
     - Conversions
     - ROAS (Return on Ad Spend)
     """
-    return spend_by_ad_group_service.get_spend_by_ad_group(
+    return await run_in_executor(
+        spend_by_ad_group_service.get_spend_by_ad_group,
         date_from=date_from,
         date_to=date_to
     )
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import spend_by_campaign_service
 from .models import SpendByCampaignResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -52,7 +54,8 @@ async def get_spend_by_campaign(
 
     Supports filtering by platform and status.
     """
-    return spend_by_campaign_service.get_spend_by_campaign(
+    return await run_in_executor(
+        spend_by_campaign_service.get_spend_by_campaign,
         date_from=date_from,
         date_to=date_to,
         platform=platform,
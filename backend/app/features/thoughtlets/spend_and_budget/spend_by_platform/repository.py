@@ -3,7 +3,8 @@ Thoughtlets Spend and Budget - Spend by Platform repository - Data access layer.
 """
 from datetime import date
 from typing import Optional
-from app.core.database import execute_query
+from app.core.daily_cells import campaign_performance_by_platform, sort_desc
+from app.core.semantic import derive
 
 
 class SpendByPlatformRepository:
@@ -24,33 +25,12 @@ class SpendByPlatformRepository:
         Returns:
             List of dictionaries with platform and spend data
         """
-        date_conditions = []
-        params = {}
-
-        if date_from:
-            date_conditions.append("DATE_DAY >= %(date_from)s")
-            params["date_from"] = date_from.isoformat()
-
-        if date_to:
-            date_conditions.append("DATE_DAY <= %(date_to)s")
-            params["date_to"] = date_to.isoformat()
-
-        date_filter = ""
-        if date_conditions:
-            date_filter = "WHERE " + " AND ".join(date_conditions)
-
-        query = f"""
-            SELECT
-                PLATFORM,
-                SUM(SPEND) AS SPEND
-            FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
-            {date_filter}
-            GROUP BY PLATFORM
-            ORDER BY SPEND DESC
-        """
-
-        results = execute_query(query, params if params else None)
-        return results if results else []
+        # Summed from cached per-day cells; only uncached days hit the warehouse.
+        rows = [
+            {"PLATFORM": row["PLATFORM"], **derive(row, ("SPEND",))}
+            for row in campaign_performance_by_platform.aggregate(date_from, date_to)
+        ]
+        return sort_desc(rows, "SPEND")
 
 
 # Singleton instance for dependency injection
@@ -5,10 +5,12 @@ from datetime import date
 from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.core.concurrency import run_in_executor
+from app.core.timing import TimedRoute
 from .service import spend_by_platform_service
 from .models import SpendByPlatformResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get(
@@ -37,7 +39,8 @@ async def get_spend_by_platform(
 
     Data is aggregated from all advertising platforms (Google Ads, Meta Ads, etc.).
     """
-    return spend_by_platform_service.get_spend_by_platform(
+    return await run_in_executor(
+        spend_by_platform_service.get_spend_by_platform,
         date_from=date_from,
         date_to=date_to
     )
@@ -1,20 +1,42 @@
 """
 Marketing IQ - FastAPI Application
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from app.core.cache import cache_scope, get_query_cache
+from app.core.concurrency import run_in_executor
+from app.core.database import close_pool, get_pool_stats, start_pool
+from app.core.freshness import get_freshness_tracker
+from app.core.singleflight import query_single_flight
+from app.core.timing import ServerTimingMiddleware
 
 # Import feature routers
+from app.features.dashboards import router as dashboards_router
 from app.features.marketing_platforms import router as marketing_platforms_router
 from app.features.thoughtlets import router as thoughtlets_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open warehouse connections before the first request; close them on shutdown."""
+    await run_in_executor(start_pool)
+    yield
+    close_pool()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Marketing IQ API",
     version="1.0.0",
     description="Multi-tenant marketing analytics API",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -26,6 +48,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request latency breakdown (Server-Timing header)
+app.add_middleware(ServerTimingMiddleware)
+
+
+@app.middleware("http")
+async def bind_cache_scope(request: Request, call_next):
+    """Attribute warehouse queries to the requested endpoint (for cache TTLs)."""
+    with cache_scope(request.url.path):
+        return await call_next(request)
+
 
 @app.get("/")
 async def root():
@@ -38,13 +70,46 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/pool")
+async def pool_health():
+    """Warehouse connection pool saturation statistics"""
+    stats = get_pool_stats()
+    return {**asdict(stats), "saturation": stats.saturation}
+
+
+@app.get("/health/cache")
+async def cache_health():
+    """Query result cache hit/miss statistics"""
+    stats = get_query_cache().stats()
+    return {**asdict(stats), "hit_ratio": stats.hit_ratio}
+
+
+@app.get("/health/single-flight")
+async def single_flight_health():
+    """Warehouse executions saved by coalescing identical in-flight queries"""
+    stats = query_single_flight.stats()
+    return {**asdict(stats), "saved_ratio": stats.saved_ratio}
+
+
+@app.get("/health/freshness")
+async def freshness_health():
+    """Last known data load per analytics table (drives cache invalidation)"""
+    return get_freshness_tracker().snapshot()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics (per-query timings, pool, cache and freshness state)"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Include feature routers with /api/v1 prefix
 app.include_router(marketing_platforms_router, prefix="/api/v1")
 app.include_router(thoughtlets_router, prefix="/api/v1")
+app.include_router(dashboards_router, prefix="/api/v1")
 
 # TODO: Include additional routers
-# from app.api import auth, tenants, dashboards, metrics
+# from app.api import auth, tenants, metrics
 # app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 # app.include_router(tenants.router, prefix="/tenants", tags=["Tenants"])
-# app.include_router(dashboards.router, prefix="/api/v1", tags=["Dashboards"])
 # app.include_router(metrics.router, prefix="/api/v1", tags=["Metrics"])
@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the API.
+
+See ``benchmarks.endpoints`` (every route against the offline warehouse) and
+``benchmarks.serialization`` (per-row cost of building and encoding responses).
+"""
@@ -0,0 +1,594 @@
+"""
+Endpoint benchmarks: latency, throughput and memory of every API route.
+
+Drives each GET route under ``/api/v1/marketing-platforms`` and
+``/api/v1/thoughtlets`` in-process (ASGI, no network) against the offline
+warehouse (``app.core.local_warehouse``) filled with synthetic marts, at
+several data scales and concurrency levels. For each (scale, concurrency,
+route) it records p50/p95/p99 latency, throughput and peak memory growth,
+writes the results as JSON and compares them with a stored baseline. Exit
+status: 1 when any route regressed beyond the threshold, 2 when the baseline
+was recorded with different options, 3 when there is no baseline (record one
+with ``--save-baseline``, or pass ``--allow-missing-baseline`` to only
+measure).
+
+Every scale runs in a fresh process, so caches and memory start clean.
+Query and daily-cell caches are off unless ``--warm`` is given, so the
+numbers measure the query path rather than cache lookups. Marts are
+generated on first use into ``backend/local/`` and reused until
+``app.core.synthetic_marts`` changes (or ``--regenerate`` is given).
+
+Usage (from backend/):
+    python -m benchmarks.endpoints --save-baseline      # on main
+    python -m benchmarks.endpoints                      # on a branch: exit 1 on regression
+    python -m benchmarks.endpoints --allow-missing-baseline   # measure only, no gate
+    python -m benchmarks.endpoints --scales small medium --concurrency 1 16
+    python -m benchmarks.endpoints --route 'thoughtlets/search-keywords/*' --requests 200
+
+Timings are noisy on shared machines, so each route's requests are spread
+over rounds interleaved with the other routes, timings are compared after
+factoring out the machine-wide drift (the median change over all routes,
+itself gated), and regressed routes are re-measured before they fail the
+run. Baselines are only comparable on the same machine with the same
+options; on busy CI runners raise ``--requests`` or ``--threshold``.
+"""
+import argparse
+import asyncio
+import fnmatch
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = BENCHMARKS_DIR.parent
+DATA_DIR = BACKEND_DIR / "local"
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results" / "latest.json"
+
+ROUTE_PREFIXES = ("/api/v1/marketing-platforms", "/api/v1/thoughtlets")
+API_PREFIX = "/api/v1/"
+
+MIB = 1024 * 1024
+
+
+@dataclass
+class RouteResult:
+    """Measurements of one route at one scale and concurrency level."""
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput_rps: float
+    peak_memory_mb: float
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline by more than the threshold."""
+    scale: str
+    concurrency: str
+    route: str
+    metric: str
+    baseline: float
+    current: float
+    # Median change of all routes, factored out of ``change``
+    drift: float = 1.0
+
+    @property
+    def change(self) -> float:
+        return self.current / self.drift / self.baseline - 1 if self.baseline else math.inf
+
+
+# Pseudo-route of regressions shared by every route (see compare)
+ALL_ROUTES = "(all routes)"
+
+# Gated metrics: (name, higher is worse, noise floor option)
+_GATED_METRICS = (
+    ("p50_ms", True, "min_delta_ms"),
+    ("p95_ms", True, "min_delta_ms"),
+    ("throughput_rps", False, None),
+    ("peak_memory_mb", True, "min_delta_mb"),
+)
+_TIMING_METRICS = {"p50_ms", "p95_ms", "throughput_rps"}
+
+
+# ---------------------------------------------------------------------------
+# Measurement (runs in the per-scale worker process)
+# ---------------------------------------------------------------------------
+
+def _rss_bytes() -> int:
+    """Current resident set size (peak so far where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemorySampler:
+    """Peak resident memory above the level at entry, sampled on a background thread."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.start = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "MemorySampler":
+        self.start = self.peak = _rss_bytes()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, name="memory-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_bytes())
+
+    @property
+    def growth_mb(self) -> float:
+        return (self.peak - self.start) / MIB
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _rss_bytes())
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+def discover_routes(app: Any, patterns: Optional[list[str]] = None) -> tuple[list[tuple[str, set[str]]], list[str]]:
+    """
+    Benchmarked routes and their query parameter names.
+
+    Returns:
+        (routes, skipped) where skipped lists routes with path parameters,
+        which have no generic value to fill in
+    """
+    routes, skipped = [], []
+    for path, operations in sorted(app.openapi()["paths"].items()):
+        operation = operations.get("get")
+        if operation is None or not path.startswith(ROUTE_PREFIXES):
+            continue
+        if patterns and not any(fnmatch.fnmatchcase(path.removeprefix(API_PREFIX), p) for p in patterns):
+            continue
+        if "{" in path:
+            skipped.append(path)
+            continue
+        routes.append((path, {p["name"] for p in operation.get("parameters", []) if p["in"] == "query"}))
+    return routes, skipped
+
+
+async def _drive(client: Any, path: str, params: dict[str, str], requests: int, concurrency: int) -> tuple[list[float], int, float]:
+    """Issue ``requests`` GETs from ``concurrency`` concurrent clients."""
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def client_loop() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(path, params=params)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def _date_params(parameters: set[str], date_from: date, date_to: date) -> dict[str, str]:
+    return {
+        name: value.isoformat()
+        for name, value in (("date_from", date_from), ("date_to", date_to))
+        if name in parameters
+    }
+
+
+def _split(total: int, parts: int) -> list[int]:
+    """``total`` requests as ``parts`` near-equal non-empty rounds."""
+    parts = max(1, min(parts, total))
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+
+class _Samples:
+    """Latencies, errors, busy time and memory growth of one route across rounds."""
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.errors = 0
+        self.elapsed = 0.0
+        self.peak_memory_mb = 0.0
+
+    def add(self, latencies: list[float], errors: int, elapsed: float, memory_mb: float) -> None:
+        self.latencies.extend(latencies)
+        self.errors += errors
+        self.elapsed += elapsed
+        self.peak_memory_mb = max(self.peak_memory_mb, memory_mb)
+
+    def result(self) -> RouteResult:
+        ordered = sorted(self.latencies)
+        return RouteResult(
+            requests=len(ordered),
+            errors=self.errors,
+            p50_ms=round(percentile(ordered, 0.50) * 1000, 3),
+            p95_ms=round(percentile(ordered, 0.95) * 1000, 3),
+            p99_ms=round(percentile(ordered, 0.99) * 1000, 3),
+            mean_ms=round(sum(ordered) / len(ordered) * 1000, 3),
+            throughput_rps=round(len(ordered) / self.elapsed, 2),
+            peak_memory_mb=round(self.peak_memory_mb, 2),
+        )
+
+
+async def _run_scale(args: argparse.Namespace) -> dict[str, dict[str, dict[str, Any]]]:
+    import httpx
+
+    from app.main import app
+
+    routes, skipped = discover_routes(app, args.route)
+    for path in skipped:
+        print(f"Skipping {path} (path parameters)", file=sys.stderr)
+
+    date_to = args.end_date
+    date_from = date_to - timedelta(days=args.window_days - 1)
+    results: dict[str, dict[str, dict[str, Any]]] = {}
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for concurrency in args.concurrency:
+            route_params = {path: _date_params(parameters, date_from, date_to) for path, parameters in routes}
+            samples = {path: _Samples() for path in route_params}
+            for path, params in route_params.items():
+                if args.warmup:
+                    await _drive(client, path, params, args.warmup, 1)
+            # Round-robin over routes so bursts of machine noise hit every route alike.
+            for round_requests in _split(args.requests, args.rounds):
+                for path, params in route_params.items():
+                    with MemorySampler() as memory:
+                        latencies, errors, elapsed = await _drive(client, path, params, round_requests, concurrency)
+                    samples[path].add(latencies, errors, elapsed, memory.growth_mb)
+            results[str(concurrency)] = {path: asdict(sample.result()) for path, sample in samples.items()}
+    return results
+
+
+def _worker(args: argparse.Namespace) -> int:
+    results = asyncio.run(_run_scale(args))
+    args.worker_output.write_text(json.dumps(results))
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Orchestration, reporting and the regression gate
+# ---------------------------------------------------------------------------
+
+def _marts_version() -> str:
+    """Short hash of app.core.synthetic_marts, which defines the marts' schema and data."""
+    from app.core import synthetic_marts
+
+    return hashlib.sha256(Path(synthetic_marts.__file__).read_bytes()).hexdigest()[:12]
+
+
+def ensure_marts(scale: str, seed: int, end_date: date, regenerate: bool = False) -> Path:
+    """Path of the synthetic marts for ``scale``, generating them if needed."""
+    from app.core.synthetic_marts import SCALES, generate_marts
+
+    # Versioned by the generator's source, so schema changes never reuse stale marts.
+    stem = f"benchmark-{scale}-seed{seed}-{end_date.isoformat()}"
+    path = DATA_DIR / f"{stem}-{_marts_version()}.duckdb"
+    for stale in DATA_DIR.glob(f"{stem}*.duckdb"):
+        if stale != path:
+            stale.unlink()
+    if regenerate or not path.exists():
+        print(f"Generating {scale} marts into {path} ...", file=sys.stderr)
+        started = time.perf_counter()
+        counts = generate_marts(path, SCALES[scale], seed=seed, end_date=end_date)
+        print(f"  {sum(counts.values()):,} rows in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return path
+
+
+def run_scale(
+    database: Path,
+    args: argparse.Namespace,
+    routes: Optional[list[str]] = None
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Benchmark one scale in a fresh worker process (only ``routes`` if given)."""
+    env = {
+        **os.environ,
+        "LOCAL_WAREHOUSE_PATH": str(database),
+        "REPLICA_ENABLED": "false",
+        "QUERY_CACHE_REDIS_ENABLED": "false",
+        # The synthetic marts include the rollups
+        "ROLLUP_ROUTING_ENABLED": "true",
+    }
+    if not args.warm:
+        env.update(QUERY_CACHE_ENABLED="false", DAILY_CELL_CACHE_ENABLED="false")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        output = Path(scratch) / "results.json"
+        command = [
+            sys.executable, "-m", "benchmarks.endpoints", "--worker",
+            "--worker-output", str(output),
+            "--end-date", args.end_date.isoformat(),
+            "--window-days", str(args.window_days),
+            "--requests", str(args.requests),
+            "--warmup", str(args.warmup),
+            "--rounds", str(args.rounds),
+            "--concurrency", *map(str, args.concurrency),
+        ]
+        patterns = [path.removeprefix(API_PREFIX) for path in routes] if routes else args.route
+        if patterns:
+            command += ["--route", *patterns]
+        subprocess.run(command, cwd=BACKEND_DIR, env=env, check=True)
+        return json.loads(output.read_text())
+
+
+def print_report(results: dict[str, Any], regressions: list[Regression]) -> None:
+    flagged = {(r.scale, r.concurrency, r.route) for r in regressions}
+    for scale, levels in results["results"].items():
+        for concurrency, routes in levels.items():
+            print(f"\n{scale} marts, concurrency {concurrency}")
+            print(f"  {'route':<68} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>9} {'mem MB':>8}")
+            for path, result in routes.items():
+                mark = " !" if (scale, concurrency, path) in flagged else ""
+                errors = f"  ({result['errors']} errors)" if result["errors"] else ""
+                print(
+                    f"  {path.removeprefix(API_PREFIX):<68} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                    f"{result['p99_ms']:>9.2f} {result['throughput_rps']:>9.1f} {result['peak_memory_mb']:>8.1f}"
+                    f"{errors}{mark}"
+                )
+
+
+def measure_drift(baseline: dict[str, Any], current: dict[str, Any]) -> dict[tuple[str, str, str], float]:
+    """
+    Machine-wide change of each timing metric, by (scale, concurrency, metric).
+
+    The median current/baseline ratio over all routes measured in both: a
+    slower or busier machine moves every route alike, a code change usually
+    moves a few.
+    """
+    drifts = {}
+    for scale, levels in current["results"].items():
+        for concurrency, routes in levels.items():
+            previous_routes = baseline["results"].get(scale, {}).get(concurrency, {})
+            for metric in _TIMING_METRICS:
+                ratios = [
+                    result[metric] / previous_routes[path][metric]
+                    for path, result in routes.items()
+                    if path in previous_routes and previous_routes[path][metric] and result[metric]
+                ]
+                if ratios:
+                    drifts[scale, concurrency, metric] = statistics.median(ratios)
+    return drifts
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float,
+    min_delta_ms: float,
+    min_delta_mb: float,
+    drifts: Optional[dict[tuple[str, str, str], float]] = None
+) -> list[Regression]:
+    """
+    Metrics that regressed beyond ``threshold`` (a fraction, 0.25 = 25%).
+
+    Timing metrics are first divided by their ``drifts`` (see
+    measure_drift), so a uniformly slower machine does not flag every route:
+    a route is flagged when it got worse relative to the others, and a drift
+    beyond the threshold is flagged on its own (as ALL_ROUTES), which
+    catches a change that slows every route alike.
+
+    Latency and memory must also worsen by more than their absolute noise
+    floor; a route with more errors than in the baseline always counts.
+    Routes, scales or levels missing from either side are not compared.
+    """
+    floors = {"min_delta_ms": min_delta_ms, "min_delta_mb": min_delta_mb}
+    drifts = drifts or {}
+    regressions = []
+    for scale, levels in current["results"].items():
+        for concurrency, routes in levels.items():
+            previous_routes = baseline["results"].get(scale, {}).get(concurrency, {})
+            paired = [(path, previous_routes[path], result) for path, result in routes.items() if path in previous_routes]
+            for path, old, new in paired:
+                if new["errors"] > old["errors"]:
+                    regressions.append(Regression(scale, concurrency, path, "errors", old["errors"], new["errors"]))
+
+            for metric, higher_is_worse, floor in _GATED_METRICS:
+                drift = drifts.get((scale, concurrency, metric), 1.0)
+                if _worsening(1.0, drift, higher_is_worse) > threshold:
+                    regressions.append(Regression(scale, concurrency, ALL_ROUTES, metric, 1.0, drift))
+                for path, old, new in paired:
+                    before, after = old[metric], new[metric] / drift
+                    worse = _worsening(before, after, higher_is_worse)
+                    if worse > (floors[floor] if floor else 0) and worse > threshold * abs(before):
+                        regressions.append(Regression(scale, concurrency, path, metric, before, new[metric], drift))
+    return regressions
+
+
+def _best_of(first: dict[str, Any], second: dict[str, Any]) -> dict[str, Any]:
+    """Best of two measurements of a route; errors from either still count."""
+    best = {metric: min(first[metric], second[metric]) for metric in ("p50_ms", "p95_ms", "p99_ms", "mean_ms", "peak_memory_mb")}
+    return {
+        **first,
+        **best,
+        "errors": max(first["errors"], second["errors"]),
+        "throughput_rps": max(first["throughput_rps"], second["throughput_rps"]),
+    }
+
+
+def _worsening(before: float, after: float, higher_is_worse: bool) -> float:
+    return after - before if higher_is_worse else before - after
+
+
+def _metadata(args: argparse.Namespace) -> dict[str, Any]:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": platform.node(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "end_date": args.end_date.isoformat(),
+        "window_days": args.window_days,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "cache": "warm" if args.warm else "cold",
+    }
+
+
+# Options that change what is measured; results with different values are not comparable.
+_COMPARABLE_OPTIONS = ("seed", "end_date", "window_days", "requests", "cache")
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    from app.core.synthetic_marts import DEFAULT_END_DATE, SCALES
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["tiny", "small"],
+                        help="Synthetic data scales (default: tiny small)")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8],
+                        help="Concurrent clients per route (default: 1 8)")
+    parser.add_argument("--requests", type=int, default=40, help="Measured requests per route and level (default: 40)")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Rounds the requests are split into, interleaved across routes (default: 5)")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured requests per route first (default: 2)")
+    parser.add_argument("--window-days", type=int, default=30, help="date_from..date_to span (default: 30)")
+    parser.add_argument("--route", nargs="+", help="Route globs relative to /api/v1/ (default: all)")
+    parser.add_argument("--warm", action="store_true", help="Keep the query and daily-cell caches enabled")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed (default: 0)")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=DEFAULT_END_DATE,
+                        help=f"Last day of synthetic data (default: {DEFAULT_END_DATE})")
+    parser.add_argument("--regenerate", action="store_true", help="Regenerate the marts even if present")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help=f"Results file (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help=f"Baseline file (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline instead of comparing")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="Exit 0 instead of 3 when there is no baseline to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed worsening of p50/p95, throughput and memory, as a fraction (default: 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                        help="Latency increases below this are noise, whatever the ratio (default: 2.0)")
+    parser.add_argument("--min-delta-mb", type=float, default=8.0,
+                        help="Memory increases below this are noise, whatever the ratio (default: 8.0)")
+    parser.add_argument("--confirm", type=int, default=2,
+                        help="Times to re-measure regressed routes, keeping the best result (default: 2)")
+    parser.add_argument("--no-normalize", action="store_true",
+                        help="Compare raw timings, without factoring out machine-wide drift (dedicated hardware)")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", type=Path, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.worker:
+        return _worker(args)
+
+    # Fail before measuring: without a baseline the gate cannot pass or fail.
+    if not args.save_baseline and not args.allow_missing_baseline and not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; record one on main with --save-baseline "
+              "(make bench-baseline), or pass --allow-missing-baseline", file=sys.stderr)
+        return 3
+
+    results: dict[str, Any] = {"meta": _metadata(args), "results": {}}
+    databases = {}
+    for scale in args.scales:
+        databases[scale] = ensure_marts(scale, args.seed, args.end_date, args.regenerate)
+        print(f"Benchmarking {scale} marts ...", file=sys.stderr)
+        results["results"][scale] = run_scale(databases[scale], args)
+
+    def write_results() -> None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+
+    write_results()
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print_report(results, [])
+        print(f"\nSaved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print_report(results, [])
+        print(f"\nNo baseline at {args.baseline}; not comparing (--allow-missing-baseline)")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    mismatched = [
+        option for option in _COMPARABLE_OPTIONS
+        if baseline["meta"].get(option) != results["meta"][option]
+    ]
+    if mismatched:
+        print_report(results, [])
+        print(f"\nBaseline was recorded with different {', '.join(mismatched)}; not comparing")
+        return 2
+
+    # Fixed from the full first pass: re-measured routes must not shift it.
+    drifts = {} if args.no_normalize else measure_drift(baseline, results)
+
+    def find_regressions() -> list[Regression]:
+        return compare(baseline, results, args.threshold, args.min_delta_ms, args.min_delta_mb, drifts)
+
+    regressions = find_regressions()
+    for _ in range(args.confirm):
+        suspects: dict[str, set[str]] = {}
+        for r in regressions:
+            if r.route != ALL_ROUTES:
+                suspects.setdefault(r.scale, set()).add(r.route)
+        if not suspects:
+            break
+        # A noisy neighbour can slow any route; only regressions that reproduce count.
+        print(f"Re-measuring {sum(map(len, suspects.values()))} route(s) to confirm regressions ...", file=sys.stderr)
+        for scale, routes in suspects.items():
+            rerun = run_scale(databases[scale], args, sorted(routes))
+            for concurrency, measured in rerun.items():
+                level = results["results"][scale][concurrency]
+                for path, result in measured.items():
+                    level[path] = _best_of(level[path], result)
+        regressions = find_regressions()
+    write_results()
+
+    print_report(results, regressions)
+    if not regressions:
+        print(f"\nNo regressions against {args.baseline} (threshold {args.threshold:.0%})")
+        return 0
+    print(f"\n{len(regressions)} regression(s) against {args.baseline} (threshold {args.threshold:.0%}):")
+    for r in regressions:
+        where = f"  [{r.scale}, c={r.concurrency}] {r.route.removeprefix(API_PREFIX)}"
+        if r.route == ALL_ROUTES:
+            print(f"{where} {r.metric}: median change {r.current - 1:+.0%}")
+        elif r.drift != 1.0:
+            print(f"{where} {r.metric}: {r.baseline:g} -> {r.current:g} ({r.change:+.0%} after {r.drift - 1:+.0%} drift)")
+        else:
+            print(f"{where} {r.metric}: {r.baseline:g} -> {r.current:g} ({r.change:+.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""
+Serialization benchmarks: per-row cost of building and encoding list responses.
+
+Runs the list-heavy services on in-memory rows (no warehouse), then encodes
+their results, twice: with FAST_JSON_ENABLED off (validated models, then
+FastAPI's response handling: response-model validation, conversion to plain
+objects and stdlib ``json``) and on (``app.core.serialization``: trusted
+models encoded by pydantic-core). Reports microseconds per row for each
+stage, so the gain is visible independent of query time.
+
+Usage (from backend/):
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --rows 50000 --repeat 10 --case keywords
+
+Each figure is the best of ``--repeat`` runs, which filters out most noise
+from other processes; compare runs on the same machine only.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import time
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.core.columnar import ColumnarResult
+from app.core.config import settings
+from app.core.serialization import fast_response
+from app.features.marketing_platforms.ga4_analytics.technology_breakdown.router import router as technology_router
+from app.features.marketing_platforms.ga4_analytics.technology_breakdown.service import GA4TechnologyBreakdownService
+from app.features.marketing_platforms.google_ads.keyword_performance.router import router as keyword_performance_router
+from app.features.marketing_platforms.google_ads.keyword_performance.service import KeywordPerformanceService
+from app.features.marketing_platforms.meta_ads.ad_creatives.router import router as ad_creatives_router
+from app.features.marketing_platforms.meta_ads.ad_creatives.service import MetaAdsCreativeService
+from app.features.thoughtlets.search_keywords.keywords.router import router as keywords_router
+from app.features.thoughtlets.search_keywords.keywords.service import KeywordsService
+
+MATCH_TYPES = ("EXACT", "PHRASE", "BROAD")
+
+
+@dataclass
+class CaseResult:
+    """Per-row cost in microseconds of one service, before and after."""
+    rows: int
+    build_before_us: float
+    build_after_us: float
+    encode_before_us: float
+    encode_after_us: float
+
+    @property
+    def speedup(self) -> float:
+        after = self.build_after_us + self.encode_after_us
+        return (self.build_before_us + self.encode_before_us) / after if after else 0.0
+
+
+class InMemoryRepository:
+    """Answers every repository method with the same prepared result."""
+
+    def __init__(self, result: Any):
+        self.result = result
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        return lambda *args, **kwargs: self.result
+
+
+@dataclass
+class Case:
+    """A service method over in-memory rows, and the route that serves it."""
+    route: APIRoute
+    service: Callable[[Any], Any]
+    call: Callable[[Any, int], Any]
+    make_rows: Callable[[int], Any]
+    # Rows mapped per call, as a multiple of the rows the repository returns
+    rows_factor: int = 1
+
+
+def _keyword_rows(rows: int) -> list[dict[str, Any]]:
+    # Snowflake returns NUMBER columns as Decimal (or int when the scale is 0).
+    return [
+        {
+            "KEYWORD": f"heirloom seeds {i}",
+            "MATCH": MATCH_TYPES[i % 3],
+            "IMPRESSIONS": 1000 + i,
+            "CLICKS": 40 + i % 97,
+            "CTR": Decimal("3.52"),
+            "CPC": Decimal("0.87"),
+            "SPEND": Decimal("41.30"),
+            "CONVERSIONS": Decimal("2.00"),
+            "CONV_RATE": Decimal("4.88"),
+        }
+        for i in range(rows)
+    ]
+
+
+def _technology_rows(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "SOURCE": f"source-{i}",
+            "SESSIONS": 500 + i,
+            "DEVICE_CATEGORY": ("desktop", "mobile", "tablet")[i % 3],
+            "BROWSER": f"browser-{i}",
+            "USERS": 300 + i,
+            "PERCENTAGE": Decimal("1.25"),
+        }
+        for i in range(rows)
+    ]
+
+
+def _keyword_columns(rows: int) -> ColumnarResult:
+    names = ["KEYWORD", "MATCH", "IMPRESSIONS", "CLICKS", "CTR", "CPC", "CONVERSIONS", "COST"]
+    values = [
+        (f"heirloom seeds {i}", MATCH_TYPES[i % 3], 1000 + i, 40 + i % 97,
+         Decimal("3.52"), Decimal("0.87"), 2, Decimal("41.30"))
+        for i in range(rows)
+    ]
+    try:
+        import pyarrow as pa
+    except ImportError:  # pragma: no cover - optional dependency
+        return ColumnarResult.from_rows(names, values)
+    return ColumnarResult.from_arrow(pa.Table.from_pylist([dict(zip(names, row)) for row in values]))
+
+
+def _creative_rows(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "AD_ID": str(120000000 + i),
+            "AD_NAME": f"Spring sale creative {i}",
+            "AD_TYPE": "IMAGE" if i % 2 else None,
+            "TOTAL_SPEND": Decimal("112.40"),
+            "TOTAL_IMPRESSIONS": 20000 + i,
+            "TOTAL_CLICKS": 300 + i % 50,
+            "TOTAL_CONVERSIONS": Decimal("7.00"),
+            "CTR": Decimal("1.50"),
+            "CPC": Decimal("0.37"),
+        }
+        for i in range(rows)
+    ]
+
+
+def _route(router: Any, path: str) -> APIRoute:
+    return next(route for route in router.routes if isinstance(route, APIRoute) and route.path == path)
+
+
+def build_cases() -> dict[str, Case]:
+    """The benchmarked list endpoints."""
+    return {
+        "keywords": Case(
+            route=_route(keywords_router, "/keywords"),
+            service=KeywordsService,
+            call=lambda service, rows: service.get_keywords_performance(limit=rows),
+            make_rows=_keyword_rows,
+        ),
+        "technology_breakdown": Case(
+            route=_route(technology_router, "/technology-breakdown"),
+            service=GA4TechnologyBreakdownService,
+            call=lambda service, rows: service.get_technology_breakdown(),
+            make_rows=_technology_rows,
+            # Traffic sources, devices and browsers each map every row.
+            rows_factor=3,
+        ),
+        "keyword_performance": Case(
+            route=_route(keyword_performance_router, "/keyword-performance"),
+            service=KeywordPerformanceService,
+            call=lambda service, rows: service.get_keyword_performance(),
+            make_rows=_keyword_columns,
+        ),
+        "ad_creatives": Case(
+            route=_route(ad_creatives_router, "/ad-creatives"),
+            service=MetaAdsCreativeService,
+            call=lambda service, rows: service.get_creatives(),
+            make_rows=_creative_rows,
+        ),
+    }
+
+
+async def _fastapi_encode(route: APIRoute, result: Any) -> bytes:
+    """What FastAPI does with a returned model: validate, convert, json.dumps."""
+    content = await serialize_response(field=route.response_field, response_content=result)
+    return JSONResponse(content).body
+
+
+async def _fast_encode(route: APIRoute, result: Any) -> bytes:
+    return fast_response(result).body
+
+
+async def _best(repeat: int, measure: Callable[[], Awaitable[Any]]) -> tuple[float, Any]:
+    """Fastest of ``repeat`` runs in seconds, and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await measure()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+async def run_case(case: Case, rows: int, repeat: int) -> CaseResult:
+    """Measure one case with the fast path off and on."""
+    service = case.service(InMemoryRepository(case.make_rows(rows)))
+
+    async def build() -> Any:
+        result = case.call(service, rows)
+        return await result if inspect.isawaitable(result) else result
+
+    timings: dict[bool, tuple[float, float]] = {}
+    bodies: dict[bool, bytes] = {}
+    for fast in (False, True):
+        settings.FAST_JSON_ENABLED = fast
+        build_time, result = await _best(repeat, build)
+        encode_path = _fast_encode if fast else _fastapi_encode
+        encode_time, bodies[fast] = await _best(repeat, lambda: encode_path(case.route, result))
+        timings[fast] = (build_time, encode_time)
+
+    if json.loads(bodies[False]) != json.loads(bodies[True]):
+        raise AssertionError(f"{case.route.path}: fast path changed the response body")
+
+    mapped = rows * case.rows_factor
+    per_row = 1e6 / mapped
+    return CaseResult(
+        rows=mapped,
+        build_before_us=round(timings[False][0] * per_row, 3),
+        build_after_us=round(timings[True][0] * per_row, 3),
+        encode_before_us=round(timings[False][1] * per_row, 3),
+        encode_after_us=round(timings[True][1] * per_row, 3),
+    )
+
+
+def print_report(results: dict[str, CaseResult]) -> None:
+    print(f"{'case':<22} {'rows':>7}   {'build us/row':>15}   {'encode us/row':>15}   {'total':>15}  speedup")
+    for name, result in results.items():
+        total_before = result.build_before_us + result.encode_before_us
+        total_after = result.build_after_us + result.encode_after_us
+        print(
+            f"{name:<22} {result.rows:>7}   "
+            f"{result.build_before_us:>6.2f} -> {result.build_after_us:<5.2f}   "
+            f"{result.encode_before_us:>6.2f} -> {result.encode_after_us:<5.2f}   "
+            f"{total_before:>6.2f} -> {total_after:<5.2f}  {result.speedup:.1f}x"
+        )
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows returned by each repository call (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the fastest counts (default: 5)")
+    parser.add_argument("--case", nargs="+", help="Cases to run (default: all)")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> dict[str, CaseResult]:
+    cases = build_cases()
+    unknown = set(args.case or []) - set(cases)
+    if unknown:
+        raise SystemExit(f"Unknown case(s): {', '.join(sorted(unknown))}; choose from {', '.join(cases)}")
+
+    results = {}
+    enabled = settings.FAST_JSON_ENABLED
+    try:
+        for name, case in cases.items():
+            if not args.case or name in args.case:
+                results[name] = await run_case(case, args.rows, args.repeat)
+    finally:
+        settings.FAST_JSON_ENABLED = enabled
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(_run(args))
+    print_report(results)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({name: asdict(result) for name, result in results.items()}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,11 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.cache import configure_query_cache
+from app.core.database import close_pool
+from app.core.freshness import configure_freshness_tracker
+from app.core.local_warehouse import use_local_warehouse
+from app.core.synthetic_marts import SCALES, generate_marts
 from app.main import app
 
 
@@ -8,3 +13,36 @@ from app.main import app
 def client():
     """Test client fixture."""
     return TestClient(app)
+
+
+@pytest.fixture
+def query_cache():
+    """Query cache whose shared tier is an in-memory fake Redis."""
+    import fakeredis
+
+    yield configure_query_cache(redis_client=fakeredis.FakeRedis())
+    configure_query_cache(redis_client=None)
+
+
+@pytest.fixture(scope="session")
+def marts_path(tmp_path_factory):
+    """Tiny synthetic marts, generated once per test session."""
+    path = tmp_path_factory.mktemp("marts") / "marts.duckdb"
+    generate_marts(path, SCALES["tiny"])
+    return path
+
+
+@pytest.fixture
+def warehouse(marts_path):
+    """Point app.core.database at the synthetic marts instead of Snowflake."""
+    yield use_local_warehouse(marts_path)
+    close_pool()
+
+
+@pytest.fixture
+def watermarks():
+    """Table watermarks read by the freshness tracker; change one to simulate a load."""
+    marks = {}
+    configure_freshness_tracker(loader=lambda: dict(marks), refresh_interval=0)
+    yield marks
+    configure_freshness_tracker()
@@ -0,0 +1,85 @@
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.database import execute_query
+from app.features.thoughtlets.revenue_lifetime_value.cohort_retention.service import CohortRetentionService
+
+# The matrix as the self-join over every order computed it before the mart
+ORDER_HISTORY_COHORTS = """
+    WITH orders AS (
+        SELECT p.PERSON_ID, o.ORDER_DATE_DAY
+        FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_MAGENTO_ORDER o
+        JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_PERSON p ON p.EMAIL = o.CUSTOMER_EMAIL
+    ),
+    cohort_base AS (
+        SELECT PERSON_ID, DATE_TRUNC('MONTH', MIN(ORDER_DATE_DAY))::DATE AS COHORT_MONTH
+        FROM orders
+        GROUP BY PERSON_ID
+    )
+    SELECT
+        c.COHORT_MONTH,
+        DATEDIFF('MONTH', c.COHORT_MONTH, DATE_TRUNC('MONTH', o.ORDER_DATE_DAY)) AS MONTHS_SINCE,
+        COUNT(DISTINCT c.PERSON_ID) AS ACTIVE_CUSTOMERS
+    FROM cohort_base c
+    JOIN orders o ON o.PERSON_ID = c.PERSON_ID
+    GROUP BY 1, 2
+"""
+
+
+class CellsRepository:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def get_cohort_retention(self, date_from=None, date_to=None, limit=12):
+        return self.rows
+
+
+def test_cells_match_the_order_history(warehouse, watermarks):
+    expected = {
+        (row["COHORT_MONTH"], row["MONTHS_SINCE"]): row["ACTIVE_CUSTOMERS"]
+        for row in execute_query(ORDER_HISTORY_COHORTS, use_cache=False)
+    }
+
+    response = CohortRetentionService().get_cohort_retention(limit=100)
+
+    cells = {(cell.cohort_month, cell.months_since): cell for cell in response.cohorts}
+    assert cells.keys() == expected.keys()
+    for (cohort_month, months_since), active in expected.items():
+        cell = cells[(cohort_month, months_since)]
+        initial_size = expected[(cohort_month, 0)]
+        assert (cell.active_customers, cell.initial_size) == (active, initial_size)
+        assert cell.retention_rate == round(100.0 * active / initial_size, 2)
+
+
+def test_limit_keeps_whole_cohorts(warehouse, watermarks):
+    service = CohortRetentionService()
+    everything = service.get_cohort_retention(limit=100)
+
+    latest = service.get_cohort_retention(limit=2)
+
+    months = sorted({cell.cohort_month for cell in everything.cohorts}, reverse=True)[:2]
+    assert [row.cohort_month for row in latest.matrix] == months
+    assert latest.cohorts == [cell for cell in everything.cohorts if cell.cohort_month in months]
+
+
+def test_months_without_activity_are_filled_with_zero():
+    cohort = date(2024, 10, 1)
+    service = CohortRetentionService(CellsRepository([
+        {"COHORT_MONTH": cohort, "INITIAL_SIZE": 10, "MONTHS_SINCE": 0, "ACTIVE_CUSTOMERS": 10, "RETENTION_RATE": 100.0},
+        {"COHORT_MONTH": cohort, "INITIAL_SIZE": 10, "MONTHS_SINCE": 2, "ACTIVE_CUSTOMERS": 4, "RETENTION_RATE": 40.0},
+    ]))
+
+    response = service.get_cohort_retention()
+
+    assert response.matrix[0].active_customers == [10, 0, 4]
+    assert response.matrix[0].retention_rates == [100.0, 0.0, 40.0]
+    assert response.max_months_since == 2
+
+
+def test_inverted_range_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        CohortRetentionService(CellsRepository([])).get_cohort_retention(date(2024, 12, 1), date(2024, 11, 1))
+
+    assert error.value.status_code == 400
@@ -0,0 +1,61 @@
+from decimal import Decimal
+
+import pytest
+
+from app.core.columnar import ColumnarResult
+from app.core.config import settings
+from app.core.database import execute_query, execute_query_columns
+
+NAMES = ["KEYWORD", "CLICKS", "SPEND"]
+ROWS = [
+    ("heirloom seeds", 40, Decimal("12.50")),
+    (None, None, None),
+    ("", 7, Decimal("0.99")),
+]
+
+KEYWORD_TOTALS = """
+    SELECT KEYWORD_ID, SUM(CLICKS) AS CLICKS, SUM(SPEND) AS SPEND
+    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE
+    GROUP BY KEYWORD_ID
+    ORDER BY KEYWORD_ID
+"""
+
+
+@pytest.fixture(params=["arrow", "rows"])
+def result(request):
+    if request.param == "rows":
+        return ColumnarResult.from_rows(NAMES, ROWS)
+    pa = pytest.importorskip("pyarrow")
+    return ColumnarResult.from_arrow(pa.Table.from_pylist([dict(zip(NAMES, row)) for row in ROWS]))
+
+
+def test_columns_are_coerced_with_null_defaults(result):
+    assert len(result) == 3
+    assert result.strs("KEYWORD", default="unknown") == ["heirloom seeds", "unknown", "unknown"]
+    assert result.ints("CLICKS") == [40, 0, 7]
+    assert result.floats("SPEND") == [12.5, 0.0, 0.99]
+
+
+def test_missing_column_reads_as_defaults(result):
+    assert result.ints("IMPRESSIONS") == [0, 0, 0]
+    assert result.raw("IMPRESSIONS") == [None, None, None]
+
+
+def test_round_trip_to_rows(result):
+    assert result.to_rows() == [dict(zip(NAMES, row)) for row in ROWS]
+
+
+def test_empty_results():
+    assert len(ColumnarResult.from_arrow(None)) == 0
+    assert ColumnarResult.from_rows(NAMES, []).ints("CLICKS") == []
+
+
+def test_columns_match_rows_from_the_warehouse(warehouse, watermarks, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    rows = execute_query(KEYWORD_TOTALS)
+    columns = execute_query_columns(KEYWORD_TOTALS)
+
+    assert rows
+    assert columns.column_names == ["KEYWORD_ID", "CLICKS", "SPEND"]
+    assert columns.ints("CLICKS") == [int(row["CLICKS"]) for row in rows]
+    assert columns.floats("SPEND") == pytest.approx([float(row["SPEND"]) for row in rows])
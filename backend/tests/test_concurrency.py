@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+from functools import partial
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.concurrency import fan_out, run_in_executor
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+def test_blocking_call_runs_off_the_event_loop():
+    async def main():
+        return threading.get_ident(), await run_in_executor(threading.get_ident)
+
+    loop_thread, worker_thread = asyncio.run(main())
+
+    assert worker_thread != loop_thread
+
+
+def test_arguments_and_context_reach_the_worker():
+    def describe(prefix, suffix=""):
+        return f"{prefix}{request_id.get()}{suffix}"
+
+    async def main():
+        request_id.set("req-42")
+        return await run_in_executor(describe, "id=", suffix="!")
+
+    assert asyncio.run(main()) == "id=req-42!"
+
+
+def test_event_loop_keeps_serving_during_a_blocking_call():
+    release = threading.Event()
+
+    async def main():
+        blocked = asyncio.ensure_future(run_in_executor(release.wait, 5))
+        # The loop still runs other coroutines while the worker blocks
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        release.set()
+        return await blocked
+
+    assert asyncio.run(main()) is True
+
+
+def test_fan_out_returns_results_in_call_order():
+    def slow(value, delay):
+        time.sleep(delay)
+        return value
+
+    results = asyncio.run(fan_out(partial(slow, "a", 0.03), partial(slow, "b", 0.0), partial(slow, "c", 0.01)))
+
+    assert results == ["a", "b", "c"]
+
+
+def test_fan_out_runs_calls_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    # Each call waits for the other two, so this only completes if all run at once
+    results = asyncio.run(fan_out(barrier.wait, barrier.wait, barrier.wait))
+
+    assert sorted(results) == [0, 1, 2]
+
+
+def test_fan_out_times_out_with_504_naming_the_call():
+    release = threading.Event()
+
+    def stuck_repository_call():
+        release.wait(5)
+
+    try:
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(fan_out(lambda: "fast", stuck_repository_call, timeout=0.05))
+    finally:
+        release.set()
+
+    assert error.value.status_code == 504
+    assert "stuck_repository_call" in error.value.detail
@@ -0,0 +1,67 @@
+from datetime import date
+
+import pytest
+
+from app.core.config import settings
+from app.core.daily_cells import campaign_performance_by_platform as cells
+
+WINDOWS = [
+    (date(2024, 11, 10), date(2024, 12, 10)),
+    # Overlaps the first window, so it is composed partly from cached days
+    (date(2024, 12, 1), date(2024, 12, 31)),
+    # Reaches past both ends of the data
+    (date(2024, 6, 1), date(2025, 3, 31)),
+    (None, None),
+]
+
+
+@pytest.fixture(params=[False, True], ids=["fact", "rollup"])
+def daily_cells(request, warehouse, watermarks, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "ROLLUP_ROUTING_ENABLED", request.param)
+    cells.clear()
+    yield cells
+    cells.clear()
+
+
+def _direct(date_from, date_to, group_by=None):
+    """The same sums aggregated in SQL, as served with the cell cache off."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(settings, "DAILY_CELL_CACHE_ENABLED", False)
+        return cells.aggregate(date_from, date_to, group_by)
+
+
+def _by_platform(rows):
+    return {row.get("PLATFORM"): {name: float(row[name] or 0) for name in cells.measure_names} for row in rows}
+
+
+@pytest.mark.parametrize("date_from, date_to", WINDOWS)
+def test_composed_sums_match_direct_sql(daily_cells, date_from, date_to):
+    for window in WINDOWS:
+        daily_cells.aggregate(*window)
+
+    composed = _by_platform(daily_cells.aggregate(date_from, date_to))
+    direct = _by_platform(_direct(date_from, date_to))
+
+    assert composed.keys() == direct.keys()
+    for platform, measures in direct.items():
+        assert composed[platform] == pytest.approx(measures)
+
+
+def test_grand_totals_match_direct_sql(daily_cells):
+    (composed,) = daily_cells.aggregate(*WINDOWS[0], group_by=())
+    (direct,) = _direct(*WINDOWS[0], group_by=())
+
+    assert _by_platform([composed])[None] == pytest.approx(_by_platform([direct])[None])
+
+
+def test_overlapping_window_reuses_cached_days(daily_cells):
+    daily_cells.aggregate(*WINDOWS[0])
+    fetched = daily_cells.days_fetched
+    hit = daily_cells.days_hit
+
+    daily_cells.aggregate(*WINDOWS[1])
+
+    # Dec 1-10 come from the cells; only Dec 11-31 are read
+    assert daily_cells.days_hit - hit == 10
+    assert daily_cells.days_fetched - fetched == 21
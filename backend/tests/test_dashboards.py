@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.features.dashboards.registry import DASHBOARDS, Dashboard, Widget
+from app.features.dashboards.service import DashboardService
+
+DASHBOARDS_URL = "/api/v1/dashboards"
+DECEMBER = {"date_from": "2024-12-01", "date_to": "2024-12-31"}
+
+
+def build_service(*widgets):
+    return DashboardService({"test": Dashboard("test", "Test", "Widgets under test", widgets)})
+
+
+def test_widgets_match_their_standalone_endpoints(client, warehouse, watermarks, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    dashboard = DASHBOARDS["core-performance"]
+
+    body = client.get(f"{DASHBOARDS_URL}/{dashboard.id}", params=DECEMBER).json()
+
+    assert [widget["widget"] for widget in body["widgets"]] == [widget.id for widget in dashboard.widgets]
+    for result, widget in zip(body["widgets"], dashboard.widgets):
+        assert result["error"] is None
+        assert result["data"] == client.get(widget.endpoint, params=DECEMBER).json()
+
+
+def test_identical_reads_run_once_per_dashboard(client, warehouse, watermarks, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+
+    stats = client.get(f"{DASHBOARDS_URL}/core-performance", params=DECEMBER).json()["stats"]
+
+    assert stats["widgets"] == len(DASHBOARDS["core-performance"].widgets)
+    assert 0 < stats["queries_executed"] < stats["queries_requested"]
+
+
+def test_widgets_of_one_service_method_share_a_call():
+    calls = []
+
+    def load(date_from=None, date_to=None):
+        calls.append((date_from, date_to))
+        return {"value": 1}
+
+    service = build_service(Widget("a", "A", "/a", load), Widget("b", "B", "/b", load))
+
+    response = asyncio.run(service.get_dashboard("test"))
+
+    assert len(calls) == 1
+    assert response.stats.calls == 1
+    assert [widget.data for widget in response.widgets] == [{"value": 1}, {"value": 1}]
+
+
+def test_failing_widgets_do_not_fail_the_dashboard(monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_FAN_OUT_TIMEOUT_SECONDS", 0.05)
+
+    def ok(date_from=None, date_to=None):
+        return {"value": 1}
+
+    def bad_request(date_from=None, date_to=None):
+        raise HTTPException(status_code=400, detail="limit must be positive")
+
+    def crashes(date_from=None, date_to=None):
+        raise RuntimeError("connection reset")
+
+    async def hangs(date_from=None, date_to=None):
+        await asyncio.sleep(5)
+
+    service = build_service(
+        Widget("ok", "OK", "/ok", ok),
+        Widget("bad_request", "Bad request", "/bad-request", bad_request),
+        Widget("crashes", "Crashes", "/crashes", crashes),
+        Widget("hangs", "Hangs", "/hangs", hangs),
+    )
+
+    widgets = {widget.widget: widget for widget in asyncio.run(service.get_dashboard("test")).widgets}
+
+    assert widgets["ok"].data == {"value": 1} and widgets["ok"].error is None
+    assert widgets["bad_request"].error.model_dump() == {"status_code": 400, "detail": "limit must be positive"}
+    assert widgets["crashes"].error.status_code == 500
+    assert "connection reset" not in widgets["crashes"].error.detail
+    assert widgets["hangs"].error.status_code == 504
+    assert "/hangs" in widgets["hangs"].error.detail
+    assert all(widgets[name].data is None for name in ("bad_request", "crashes", "hangs"))
+
+
+def test_undated_widgets_are_called_without_the_range():
+    seen = []
+    service = build_service(Widget("total", "Total", "/total", lambda: seen.append("called") or {}, dated=False))
+
+    asyncio.run(service.get_dashboard("test", *DECEMBER.values()))
+
+    assert seen == ["called"]
+
+
+def test_streamed_dashboard_ends_with_its_stats(client, warehouse, watermarks):
+    response = client.get(f"{DASHBOARDS_URL}/core-performance", params={**DECEMBER, "stream": "true"})
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    widget_ids = {widget.id for widget in DASHBOARDS["core-performance"].widgets}
+    assert {line["widget"] for line in lines[:-1]} == widget_ids
+    assert lines[-1]["dashboard_id"] == "core-performance"
+    assert lines[-1]["stats"]["widgets"] == len(widget_ids)
+
+
+@pytest.mark.parametrize("path, params, status_code", [
+    ("unknown", {}, 404),
+    ("core-performance", {"date_from": "2024-12-31", "date_to": "2024-12-01"}, 400),
+    ("core-performance", {"date_from": "2024-12-31", "date_to": "2024-12-01", "stream": "true"}, 400),
+])
+def test_invalid_requests_fail_before_any_widget_runs(client, path, params, status_code):
+    assert client.get(f"{DASHBOARDS_URL}/{path}", params=params).status_code == status_code
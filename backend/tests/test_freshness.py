@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+from app.core.freshness import FreshnessTracker, load_warehouse_watermarks, referenced_tables, to_generation
+
+LOADED_AT = datetime(2025, 1, 1, 6, tzinfo=timezone.utc)
+
+
+def test_referenced_tables_are_found_in_any_case():
+    query = """
+        SELECT *
+        FROM client_rare_seeds_db.public_analytics.fct_ga4_traffic t
+        JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_DATE d ON t.DATE_DAY = d.DATE_DAY
+        JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_GA4_TRAFFIC again ON TRUE
+    """
+
+    assert referenced_tables(query) == ("DIM_DATE", "FCT_GA4_TRAFFIC")
+
+
+def test_generation_moves_only_when_a_table_is_reloaded():
+    marks = {"FCT_GA4_TRAFFIC": LOADED_AT, "FCT_META_DELIVERY": LOADED_AT}
+    tracker = FreshnessTracker(lambda: dict(marks), refresh_interval=0)
+    before = tracker.generations(["FCT_GA4_TRAFFIC", "FCT_META_DELIVERY", "UNKNOWN"])
+
+    marks["FCT_GA4_TRAFFIC"] = LOADED_AT + timedelta(minutes=5)
+    after = tracker.generations(["FCT_GA4_TRAFFIC", "FCT_META_DELIVERY", "UNKNOWN"])
+
+    assert before["FCT_GA4_TRAFFIC"] == to_generation(LOADED_AT)
+    assert after["FCT_GA4_TRAFFIC"] > before["FCT_GA4_TRAFFIC"]
+    assert after["FCT_META_DELIVERY"] == before["FCT_META_DELIVERY"]
+    assert after["UNKNOWN"] == before["UNKNOWN"] == 0
+    assert tracker.bumps == 1
+
+
+def test_older_watermark_never_moves_the_generation_back():
+    marks = {"FCT_GA4_TRAFFIC": LOADED_AT}
+    tracker = FreshnessTracker(lambda: dict(marks), refresh_interval=0)
+    before = tracker.generations(["FCT_GA4_TRAFFIC"])
+
+    marks["FCT_GA4_TRAFFIC"] = LOADED_AT - timedelta(days=1)
+
+    assert tracker.generations(["FCT_GA4_TRAFFIC"]) == before
+
+
+def test_watermarks_are_reloaded_at_most_once_per_interval():
+    loads = []
+    tracker = FreshnessTracker(lambda: loads.append(1) or {}, refresh_interval=60)
+
+    for _ in range(5):
+        tracker.generations(["FCT_GA4_TRAFFIC"])
+
+    assert len(loads) == 1
+
+
+def test_failing_loader_keeps_the_last_generations():
+    marks = {"FCT_GA4_TRAFFIC": LOADED_AT}
+
+    def loader():
+        if not marks:
+            raise RuntimeError("warehouse unavailable")
+        return dict(marks)
+
+    tracker = FreshnessTracker(loader, refresh_interval=0)
+    before = tracker.generations(["FCT_GA4_TRAFFIC"])
+    marks.clear()
+
+    assert tracker.generations(["FCT_GA4_TRAFFIC"]) == before
+
+
+def test_naive_watermarks_are_read_as_utc():
+    assert to_generation(LOADED_AT.replace(tzinfo=None)) == to_generation(LOADED_AT)
+
+
+def test_warehouse_watermarks_cover_the_marts(warehouse):
+    watermarks = load_warehouse_watermarks()
+
+    assert "FCT_CAMPAIGN_PERFORMANCE" in watermarks
+    assert all(isinstance(value, datetime) for value in watermarks.values())
@@ -0,0 +1,60 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.core.database import execute_query
+from app.core.instrumentation import record_query
+from app.features.marketing_platforms.google_ads.keyword_performance.repository import KeywordPerformanceRepository
+
+REPOSITORY_QUERY = "KeywordPerformanceRepository.get_keyword_performance"
+
+CAMPAIGN_COUNT = """
+    SELECT COUNT(*) AS CAMPAIGNS
+    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_CAMPAIGN
+"""
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_query_is_labelled_with_the_repository_method(warehouse, watermarks, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    queries = sample("warehouse_queries_total", query=REPOSITORY_QUERY, outcome="ok")
+    rows = sample("warehouse_query_rows_sum", query=REPOSITORY_QUERY)
+
+    result = KeywordPerformanceRepository.get_keyword_performance()
+
+    assert sample("warehouse_queries_total", query=REPOSITORY_QUERY, outcome="ok") == queries + 1
+    assert sample("warehouse_query_rows_sum", query=REPOSITORY_QUERY) == rows + len(result)
+    for phase in ("connect", "execute", "fetch"):
+        assert sample("warehouse_query_phase_seconds_count", query=REPOSITORY_QUERY, phase=phase) > 0
+
+
+def test_failed_query_is_counted_as_an_error():
+    errors = sample("warehouse_queries_total", query="test.failing", outcome="error")
+
+    with pytest.raises(RuntimeError):
+        with record_query("test.failing"):
+            raise RuntimeError("warehouse unavailable")
+
+    assert sample("warehouse_queries_total", query="test.failing", outcome="error") == errors + 1
+
+
+def test_results_are_counted_by_source(warehouse, watermarks, query_cache):
+    served = {source: sample("warehouse_query_results_total", source=source) for source in ("warehouse", "cache")}
+
+    execute_query(CAMPAIGN_COUNT)
+    execute_query(CAMPAIGN_COUNT)
+
+    assert sample("warehouse_query_results_total", source="warehouse") == served["warehouse"] + 1
+    assert sample("warehouse_query_results_total", source="cache") == served["cache"] + 1
+
+
+def test_metrics_endpoint_exports_runtime_state(client, warehouse):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    for metric in ("warehouse_pool_size", "warehouse_pool_saturation", "query_cache_lookups_total",
+                   "query_single_flight_executions_total", "data_freshness_generation_bumps_total"):
+        assert metric in response.text
@@ -0,0 +1,51 @@
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.features.thoughtlets.search_keywords.keywords.service import KeywordsService
+
+DATE_FROM = date(2024, 11, 15)
+DATE_TO = date(2024, 12, 31)
+
+
+@pytest.fixture
+def service(warehouse, watermarks, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    return KeywordsService()
+
+
+def _walk(service: KeywordsService, limit: int, **filters) -> list[list[tuple]]:
+    pages = []
+    cursor = None
+    while True:
+        response = service.get_keywords_performance(limit=limit, cursor=cursor, **filters)
+        pages.append([(item.keyword, item.match_type, item.impressions) for item in response.keywords])
+        cursor = response.next_cursor
+        if cursor is None:
+            return pages
+
+
+def test_page_walk_covers_the_list_once_in_order(service):
+    (everything,) = _walk(service, limit=500, date_from=DATE_FROM, date_to=DATE_TO)
+    pages = _walk(service, limit=7, date_from=DATE_FROM, date_to=DATE_TO)
+
+    assert len(everything) > 7
+    assert [row for page in pages for row in page] == everything
+    assert all(len(page) == 7 for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= 7
+
+
+def test_cursor_is_rejected_for_other_filters(service):
+    first = service.get_keywords_performance(limit=5, date_from=DATE_FROM, date_to=DATE_TO)
+
+    with pytest.raises(HTTPException) as error:
+        service.get_keywords_performance(limit=5, date_from=DATE_FROM, cursor=first.next_cursor)
+    assert error.value.status_code == 400
+
+
+def test_malformed_cursor_is_rejected(service):
+    with pytest.raises(HTTPException) as error:
+        service.get_keywords_performance(limit=5, cursor="not-a-cursor")
+    assert error.value.status_code == 400
@@ -0,0 +1,173 @@
+import threading
+import time
+
+import pytest
+
+from app.core.pool import ConnectionPool, PoolExhaustedError
+
+
+class FakeConnection:
+    """DB-API connection whose health check can be made to fail."""
+
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+
+    def cursor(self):
+        return self
+
+    def execute(self, query):
+        if self.broken:
+            raise RuntimeError("connection reset")
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+
+@pytest.fixture
+def opened():
+    return []
+
+
+@pytest.fixture
+def make_pool(opened):
+    pools = []
+
+    def connect():
+        connection = FakeConnection()
+        opened.append(connection)
+        return connection
+
+    def make(**options):
+        pool = ConnectionPool(connect, **options)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+def test_connections_are_reused(make_pool, opened):
+    pool = make_pool(min_size=0, max_size=2)
+
+    for _ in range(5):
+        with pool.connection():
+            pass
+
+    assert len(opened) == 1
+    stats = pool.stats()
+    assert (stats.borrowed_total, stats.created_total, stats.in_use, stats.idle) == (5, 1, 0, 1)
+
+
+def test_warm_opens_min_size_connections(make_pool, opened):
+    pool = make_pool(min_size=3, max_size=5)
+
+    pool.warm()
+    pool.warm()
+
+    assert len(opened) == 3
+    assert pool.stats().idle == 3
+
+
+def test_acquire_times_out_when_exhausted(make_pool):
+    pool = make_pool(min_size=0, max_size=1, acquire_timeout=0.05)
+
+    with pool.connection():
+        with pytest.raises(PoolExhaustedError):
+            pool.acquire()
+
+    assert pool.stats().timeouts == 1
+
+
+def test_waiter_gets_a_released_connection(make_pool, opened):
+    pool = make_pool(min_size=0, max_size=1, acquire_timeout=5)
+    held = pool.acquire()
+    borrowed = []
+
+    waiter = threading.Thread(target=lambda: borrowed.append(pool.acquire()))
+    waiter.start()
+    pool.release(held)
+    waiter.join(5)
+
+    assert borrowed[0] is held
+    assert len(opened) == 1
+
+
+def test_prune_keeps_min_size_idle_connections(make_pool, opened):
+    pool = make_pool(min_size=1, max_size=4, max_idle_seconds=0)
+    connections = [pool.acquire() for _ in range(3)]
+    for pooled in connections:
+        pool.release(pooled)
+
+    pool.prune()
+
+    assert pool.stats().size == 1
+    assert sum(connection.closed for connection in opened) == 2
+
+
+def test_idle_connection_at_min_size_is_kept(make_pool, opened):
+    pool = make_pool(min_size=1, max_size=2, max_idle_seconds=0, health_check_interval=60)
+    pool.warm()
+
+    with pool.connection():
+        pass
+
+    assert len(opened) == 1
+    assert not opened[0].closed
+
+
+def test_connection_failing_health_check_is_replaced(make_pool, opened):
+    pool = make_pool(min_size=0, max_size=2, health_check_interval=0)
+    with pool.connection():
+        pass
+    opened[0].broken = True
+
+    with pool.connection() as connection:
+        assert connection is opened[1]
+
+    assert opened[0].closed
+    assert pool.stats().failed_health_checks == 1
+
+
+def test_connection_closed_by_an_error_is_discarded(make_pool, opened):
+    pool = make_pool(min_size=0, max_size=2)
+
+    with pytest.raises(RuntimeError):
+        with pool.connection() as connection:
+            connection.close()
+            raise RuntimeError("query failed")
+
+    stats = pool.stats()
+    assert (stats.size, stats.in_use, stats.recycled_total) == (0, 0, 1)
+
+
+def test_maintenance_rewarms_after_lifetime_expiry(make_pool, opened):
+    pool = make_pool(min_size=2, max_size=4, max_lifetime_seconds=0)
+    pool.warm()
+
+    pool.start_maintenance(0.01)
+    deadline = time.monotonic() + 5
+    while len(opened) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # The expired pair was pruned and replaced to keep min_size open
+    assert len(opened) >= 4
+    assert opened[0].closed and opened[1].closed
+
+
+def test_closed_pool_refuses_borrows(make_pool):
+    pool = make_pool(min_size=1, max_size=1)
+    pool.warm()
+
+    pool.close()
+
+    with pytest.raises(PoolExhaustedError):
+        pool.acquire()
+    assert pool.stats().size == 0
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+from app.core.database import execute_query
+
+SPEND_BY_PLATFORM = """
+    SELECT PLATFORM, SUM(SPEND) AS SPEND
+    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
+    GROUP BY PLATFORM
+    ORDER BY PLATFORM
+"""
+
+KEYWORD_COUNT = """
+    SELECT COUNT(*) AS KEYWORDS
+    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_KEYWORD
+"""
+
+LOADED_AT = datetime(2025, 1, 1, 6, tzinfo=timezone.utc)
+
+
+def test_repeated_query_is_served_from_cache(warehouse, query_cache, watermarks):
+    first = execute_query(SPEND_BY_PLATFORM)
+    second = execute_query(SPEND_BY_PLATFORM)
+
+    assert first
+    assert second == first
+    stats = query_cache.stats()
+    assert (stats.misses, stats.stores, stats.local_hits) == (1, 1, 1)
+
+
+def test_shared_tier_serves_other_workers(warehouse, query_cache, watermarks):
+    first = execute_query(SPEND_BY_PLATFORM)
+    # Another API worker: same Redis, empty local tier
+    query_cache.local.clear()
+
+    assert execute_query(SPEND_BY_PLATFORM) == first
+    stats = query_cache.stats()
+    assert (stats.shared_hits, stats.stores) == (1, 1)
+
+
+def test_table_load_invalidates_only_queries_reading_it(warehouse, query_cache, watermarks):
+    watermarks.update(FCT_CAMPAIGN_PERFORMANCE=LOADED_AT, DIM_KEYWORD=LOADED_AT)
+    execute_query(SPEND_BY_PLATFORM)
+    execute_query(KEYWORD_COUNT)
+
+    watermarks["FCT_CAMPAIGN_PERFORMANCE"] = LOADED_AT + timedelta(hours=1)
+    execute_query(SPEND_BY_PLATFORM)
+    execute_query(KEYWORD_COUNT)
+
+    stats = query_cache.stats()
+    # The reload misses and is stored again; the keyword count stays warm.
+    assert (stats.misses, stats.stores, stats.local_hits) == (3, 3, 1)
+
+
+def test_bypassing_the_cache_stores_nothing(warehouse, query_cache, watermarks):
+    execute_query(SPEND_BY_PLATFORM, use_cache=False)
+
+    stats = query_cache.stats()
+    assert (stats.misses, stats.stores) == (0, 0)
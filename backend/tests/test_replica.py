@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.core.database import execute_query, execute_query_columns
+from app.core.replica import LocalReplica, configure_replica, snapshot_marts
+
+pytest.importorskip("pyarrow")
+
+SNAPSHOT_TABLES = ["FCT_CAMPAIGN_PERFORMANCE", "AGG_SEGMENT_DAILY_SKETCHES"]
+
+SPEND_BY_PLATFORM = """
+    SELECT PLATFORM, SUM(SPEND) AS SPEND, COUNT(*) AS ROWS_READ
+    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
+    WHERE DATE_DAY >= %(date_from)s
+    GROUP BY PLATFORM
+    ORDER BY PLATFORM
+"""
+PARAMS = {"date_from": "2024-12-01"}
+
+
+@pytest.fixture
+def snapshot_root(tmp_path, warehouse, watermarks):
+    snapshot_marts(tmp_path, patterns=SNAPSHOT_TABLES)
+    return tmp_path
+
+
+@pytest.fixture
+def replica(snapshot_root):
+    return LocalReplica(snapshot_root, refresh_interval=0)
+
+
+def test_snapshot_publishes_the_requested_tables(snapshot_root, replica):
+    replica.fetch(SPEND_BY_PLATFORM, PARAMS)
+
+    stats = replica.stats()
+    assert stats.snapshot == (snapshot_root / "CURRENT").read_text()
+    assert stats.tables == len(SNAPSHOT_TABLES)
+
+
+def test_replica_answers_like_the_warehouse(replica):
+    expected = execute_query(SPEND_BY_PLATFORM, PARAMS, use_cache=False)
+
+    assert replica.fetch(SPEND_BY_PLATFORM, PARAMS) == expected
+    assert replica.fetch(SPEND_BY_PLATFORM, PARAMS, columns=True).to_rows() == expected
+    assert replica.stats().served == 2
+
+
+def test_table_missing_from_the_snapshot_goes_to_the_warehouse(replica):
+    query = "SELECT COUNT(*) AS N FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_CAMPAIGN"
+
+    assert replica.fetch(query) is None
+    assert replica.stats().fallbacks == 1
+
+
+def test_table_reloaded_after_the_snapshot_goes_to_the_warehouse(replica, watermarks):
+    watermarks["FCT_CAMPAIGN_PERFORMANCE"] = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+    assert replica.fetch(SPEND_BY_PLATFORM, PARAMS) is None
+    assert replica.stats().stale_fallbacks == 1
+
+
+def test_query_duckdb_cannot_run_is_remembered(replica):
+    # The replica has no sketch functions; Snowflake answers these
+    query = """
+        SELECT HLL_ESTIMATE(HLL_COMBINE(ACTIVE_PEOPLE_SKETCH)) AS CUSTOMERS
+        FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.AGG_SEGMENT_DAILY_SKETCHES
+    """
+
+    assert replica.fetch(query) is None
+    assert replica.fetch(query) is None
+    stats = replica.stats()
+    assert (stats.served, stats.fallbacks, stats.unsupported_queries) == (0, 2, 1)
+
+
+@pytest.mark.parametrize("direction, null_position", [("ASC", -1), ("DESC", 0)])
+def test_nulls_sort_like_snowflake(replica, direction, null_position):
+    query = f"""
+        SELECT DISTINCT NULLIF(PLATFORM, 'meta') AS PLATFORM
+        FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
+        ORDER BY PLATFORM {direction}
+    """
+
+    rows = replica.fetch(query)
+
+    assert len(rows) > 1
+    assert rows[null_position]["PLATFORM"] is None
+
+
+def test_enabled_replica_serves_repository_queries(snapshot_root, monkeypatch):
+    monkeypatch.setattr(settings, "REPLICA_ENABLED", True)
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    configure_replica(snapshot_root, refresh_interval=0)
+    served = REGISTRY.get_sample_value("warehouse_query_results_total", {"source": "replica"}) or 0.0
+
+    execute_query(SPEND_BY_PLATFORM, PARAMS)
+    execute_query_columns(SPEND_BY_PLATFORM, PARAMS)
+
+    assert REGISTRY.get_sample_value("warehouse_query_results_total", {"source": "replica"}) == served + 2
@@ -0,0 +1,51 @@
+from datetime import date
+
+import pytest
+
+from app.core.config import settings
+from app.core.rollups import CAMPAIGN_PERFORMANCE_FACT, campaign_performance_source, is_monthly_rollup
+from app.core.shared_scan import campaign_performance_monthly
+
+SCHEMA = "CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS"
+DECEMBER = (date(2024, 12, 1), date(2024, 12, 31))
+
+
+@pytest.fixture
+def routing(monkeypatch):
+    monkeypatch.setattr(settings, "ROLLUP_ROUTING_ENABLED", True)
+
+
+def test_routing_is_off_by_default():
+    assert campaign_performance_source({"PLATFORM", "SPEND"}, *DECEMBER, needs_days=False) == CAMPAIGN_PERFORMANCE_FACT
+
+
+@pytest.mark.parametrize("columns, window, needs_days, table", [
+    ({"PLATFORM", "SPEND"}, DECEMBER, False, "AGG_MONTHLY_PERFORMANCE"),
+    ({"platform", "spend"}, (None, None), False, "AGG_MONTHLY_PERFORMANCE"),
+    ({"PLATFORM", "SPEND"}, DECEMBER, True, "AGG_DAILY_PERFORMANCE"),
+    ({"PLATFORM", "SPEND"}, (date(2024, 12, 2), date(2024, 12, 31)), False, "AGG_DAILY_PERFORMANCE"),
+    ({"PLATFORM", "SPEND"}, (date(2024, 12, 1), date(2024, 12, 30)), False, "AGG_DAILY_PERFORMANCE"),
+    ({"CAMPAIGN_NAME", "CLICKS"}, DECEMBER, False, "AGG_DAILY_CAMPAIGN_PERFORMANCE"),
+    ({"DEVICE", "CLICKS"}, DECEMBER, False, "FCT_CAMPAIGN_PERFORMANCE"),
+])
+def test_coarsest_table_with_every_column_is_chosen(routing, columns, window, needs_days, table):
+    assert campaign_performance_source(columns, *window, needs_days=needs_days) == f"{SCHEMA}.{table}"
+
+
+def test_only_the_monthly_rollup_is_read_per_month():
+    assert is_monthly_rollup(f"{SCHEMA}.AGG_MONTHLY_PERFORMANCE")
+    assert not is_monthly_rollup(f"{SCHEMA}.AGG_DAILY_PERFORMANCE")
+    assert not is_monthly_rollup(CAMPAIGN_PERFORMANCE_FACT)
+
+
+@pytest.mark.parametrize("window", [DECEMBER, (date(2024, 11, 10), date(2024, 12, 20))])
+def test_rollups_answer_like_the_fact_table(warehouse, watermarks, monkeypatch, window):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    from_fact = campaign_performance_monthly.rows(*window)
+    monkeypatch.setattr(settings, "ROLLUP_ROUTING_ENABLED", True)
+    from_rollup = campaign_performance_monthly.rows(*window)
+
+    assert [row["MONTH"] for row in from_rollup] == [row["MONTH"] for row in from_fact]
+    for rolled_up, fact in zip(from_rollup, from_fact):
+        for name in campaign_performance_monthly.measure_names:
+            assert float(rolled_up[name]) == pytest.approx(float(fact[name])), name
@@ -0,0 +1,63 @@
+from datetime import date
+
+import pytest
+
+from app.core.database import execute_query
+from app.features.thoughtlets.revenue_lifetime_value.churn_distribution.service import ChurnDistributionService
+from app.features.thoughtlets.revenue_lifetime_value.customer_segments.service import CustomerSegmentsService
+
+# Distinct customers per segment with an order in the window, counted over the order history
+ACTIVE_BY_SEGMENT = """
+    SELECT p.{segment} AS SEGMENT, COUNT(DISTINCT p.PERSON_ID) AS CUSTOMERS
+    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_MAGENTO_ORDER o
+    JOIN CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.DIM_PERSON p ON p.EMAIL = o.CUSTOMER_EMAIL
+    WHERE o.ORDER_DATE_DAY BETWEEN %(date_from)s AND %(date_to)s
+    GROUP BY 1
+"""
+
+WINDOWS = [
+    (date(2024, 12, 15), date(2024, 12, 15)),
+    (date(2024, 11, 20), date(2024, 12, 10)),
+    (date(2024, 1, 1), date(2024, 12, 31)),
+]
+
+
+def active_by_segment(segment, date_from, date_to):
+    rows = execute_query(
+        ACTIVE_BY_SEGMENT.format(segment=segment),
+        {"date_from": date_from.isoformat(), "date_to": date_to.isoformat()},
+        use_cache=False,
+    )
+    return {row["SEGMENT"]: row["CUSTOMERS"] for row in rows}
+
+
+@pytest.mark.parametrize("date_from, date_to", WINDOWS)
+def test_churn_counts_match_the_order_history(warehouse, watermarks, date_from, date_to):
+    response = ChurnDistributionService().get_churn_distribution(date_from, date_to)
+
+    counts = {item.risk_level: item.customer_count for item in response.distribution}
+    assert counts == active_by_segment("CHURN_RISK_SEGMENT", date_from, date_to)
+    assert not response.approximate and response.error_bound_pct is None
+
+
+@pytest.mark.parametrize("date_from, date_to", WINDOWS)
+def test_clv_counts_match_the_order_history(warehouse, watermarks, date_from, date_to):
+    response = CustomerSegmentsService().get_customer_segments(date_from, date_to)
+
+    counts = {item.segment_name: item.customer_count for item in response.segments}
+    assert counts == active_by_segment("CLV_SEGMENT", date_from, date_to)
+
+
+def test_open_ended_range_counts_every_later_order(warehouse, watermarks):
+    response = ChurnDistributionService().get_churn_distribution(date_from=date(2024, 12, 1))
+
+    counts = {item.risk_level: item.customer_count for item in response.distribution}
+    assert counts == active_by_segment("CHURN_RISK_SEGMENT", date(2024, 12, 1), date(2024, 12, 31))
+
+
+def test_segments_are_in_risk_order(warehouse, watermarks):
+    response = ChurnDistributionService().get_churn_distribution(date(2024, 11, 2), date(2024, 12, 31))
+
+    order = ["Low Risk", "Healthy", "Medium Risk", "High Risk"]
+    levels = [item.risk_level for item in response.distribution]
+    assert levels == sorted(levels, key=order.index)
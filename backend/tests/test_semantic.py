@@ -0,0 +1,78 @@
+import pytest
+
+from app.core.database import execute_query
+from app.core.semantic import CONVERSIONS, MetricQuery, base_measures, derive, get_metric, sql_round
+
+CAMPAIGN_PERFORMANCE = "CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE f"
+RATIOS = ("CTR", "CPC", "CPM", "ROAS", "CONV_RATE", "COST_PER_CONVERSION")
+
+
+def test_sql_round_rounds_half_away_from_zero():
+    assert sql_round(2.675, 2) == 2.68
+    assert sql_round(0.5) == 1.0
+    assert sql_round(-0.5) == -1.0
+    assert sql_round(None, 2) is None
+
+
+def test_derive_recomputes_ratios_from_measures():
+    totals = {"CLICKS": 120, "IMPRESSIONS": 4000, "SPEND": 310.5}
+
+    assert derive(totals, ("CTR", "CPC", "SPEND")) == {"CTR": 3.0, "CPC": 2.59, "SPEND": 310.5}
+    assert derive(totals, ("CONV_RATE",), aliases={"CONV_RATE": "CVR"}) == {"CVR": 0.0}
+
+
+def test_ratio_over_zero_is_null():
+    assert derive({"SPEND": 50.0, "CLICKS": 0}, ("CPC",)) == {"CPC": None}
+
+
+def test_conversions_are_not_rounded():
+    assert CONVERSIONS.sql() == "SUM(f.CONVERSIONS)"
+    assert derive({"CONVERSIONS": 12.4}, ("CONVERSIONS",)) == {"CONVERSIONS": 12.4}
+
+
+def test_each_measure_is_selected_once():
+    assert [measure.name for measure in base_measures(("CTR", "CPC", "CLICKS", "CPM"))] == [
+        "CLICKS", "IMPRESSIONS", "SPEND",
+    ]
+
+
+def test_unknown_metric_is_rejected():
+    with pytest.raises(ValueError, match="Unknown metric: ROI"):
+        get_metric("ROI")
+
+
+def test_query_compiles_every_clause():
+    sql = MetricQuery(
+        source=CAMPAIGN_PERFORMANCE,
+        metrics=("CLICKS", "CTR"),
+        dimensions=(("f.PLATFORM", "PLATFORM"),),
+        where=("f.DATE_DAY >= %(date_from)s", "f.SPEND > 0"),
+        order_by="CLICKS DESC",
+        limit="%(limit)s",
+        aliases={"CTR": "CLICK_RATE"},
+    ).sql()
+
+    assert "f.PLATFORM AS PLATFORM" in sql
+    assert "SUM(f.CLICKS) AS CLICKS" in sql
+    assert "ROUND(SUM(f.CLICKS) * 100.0 / NULLIF(SUM(f.IMPRESSIONS), 0), 2) AS CLICK_RATE" in sql
+    assert "WHERE f.DATE_DAY >= %(date_from)s\n                AND f.SPEND > 0" in sql
+    assert sql.index("GROUP BY f.PLATFORM") < sql.index("ORDER BY CLICKS DESC") < sql.index("LIMIT %(limit)s")
+
+
+def test_unrounded_query_refuses_ratios():
+    with pytest.raises(ValueError, match="CTR is a ratio"):
+        MetricQuery(source=CAMPAIGN_PERFORMANCE, metrics=("CTR",), rounded=False).sql()
+
+
+def test_python_ratios_match_the_warehouse(warehouse, watermarks):
+    dimensions = (("f.PLATFORM", "PLATFORM"),)
+    from_sql = execute_query(MetricQuery(CAMPAIGN_PERFORMANCE, RATIOS, dimensions, order_by="PLATFORM").sql())
+    measures = tuple(measure.name for measure in base_measures(RATIOS))
+    summed = execute_query(
+        MetricQuery(CAMPAIGN_PERFORMANCE, measures, dimensions, order_by="PLATFORM", rounded=False).sql()
+    )
+
+    assert len(from_sql) == len(summed) > 0
+    for sql_row, measure_row in zip(from_sql, summed):
+        derived = derive(measure_row, RATIOS)
+        assert derived == {name: None if sql_row[name] is None else float(sql_row[name]) for name in RATIOS}
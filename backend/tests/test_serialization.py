@@ -0,0 +1,77 @@
+import json
+from datetime import date
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.core.serialization import FastJSONResponse, construct, fast_response
+
+
+class Item(BaseModel):
+    name: str
+    clicks: int
+    ctr: Optional[float] = None
+    day: Optional[date] = None
+
+
+class Page(BaseModel):
+    items: list[Item]
+    total: int = Field(..., description="Number of items")
+
+
+ENDPOINTS = [
+    "/api/v1/marketing-platforms/google-ads/keyword-performance",
+    "/api/v1/marketing-platforms/meta-ads/ad-creatives",
+    "/api/v1/marketing-platforms/ga4-analytics/technology-breakdown",
+    "/api/v1/thoughtlets/search-keywords/keywords",
+]
+
+
+def test_constructed_model_equals_the_validated_one():
+    values = {"name": "heirloom seeds", "clicks": 40, "ctr": 3.25, "day": date(2024, 12, 1)}
+
+    built, validated = construct(Item, **values), Item(**values)
+
+    assert built == validated
+    assert built.model_dump_json() == validated.model_dump_json()
+    assert built.model_fields_set == validated.model_fields_set
+
+
+def test_missing_fields_fall_back_to_their_defaults():
+    built = construct(Item, name="tomato", clicks=3)
+
+    assert (built.ctr, built.day) == (None, None)
+    assert built.model_dump_json() == Item(name="tomato", clicks=3).model_dump_json()
+
+
+def test_disabled_fast_path_validates(monkeypatch):
+    monkeypatch.setattr(settings, "FAST_JSON_ENABLED", False)
+    page = Page(items=[], total=0)
+
+    assert construct(Item, name="tomato", clicks="3").clicks == 3
+    assert fast_response(page) is page
+
+
+def test_fast_response_encodes_like_pydantic():
+    page = construct(Page, items=[construct(Item, name="kale", clicks=7, ctr=None, day=date(2024, 12, 31))], total=1)
+
+    response = fast_response(page)
+
+    assert isinstance(response, FastJSONResponse)
+    assert json.loads(response.body) == json.loads(page.model_dump_json())
+    assert FastJSONResponse({"day": date(2024, 12, 31)}).body == b'{"day":"2024-12-31"}'
+
+
+@pytest.mark.parametrize("url", ENDPOINTS)
+def test_fast_and_validated_endpoints_return_the_same_body(client, warehouse, watermarks, monkeypatch, url):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    params = {"date_from": "2024-12-01", "date_to": "2024-12-31"}
+    fast = client.get(url, params=params)
+    monkeypatch.setattr(settings, "FAST_JSON_ENABLED", False)
+
+    validated = client.get(url, params=params)
+
+    assert fast.status_code == validated.status_code == 200
+    assert fast.json() == validated.json()
@@ -0,0 +1,63 @@
+from datetime import date
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.database import execute_query
+from app.core.shared_scan import campaign_performance_monthly
+from app.features.thoughtlets.core_performance.conversions_trend.repository import ConversionsTrendRepository
+from app.features.thoughtlets.core_performance.overview.repository import CorePerformanceOverviewRepository
+from app.features.thoughtlets.core_performance.revenue_vs_spend.repository import RevenueVsSpendRepository
+from app.features.thoughtlets.spend_and_budget.monthly_spend_trend.repository import MonthlySpendTrendRepository
+
+DATE_FROM = date(2024, 12, 1)
+DATE_TO = date(2024, 12, 31)
+
+DECEMBER_TOTALS = """
+    SELECT SUM(SPEND) AS SPEND, SUM(CONVERSIONS) AS CONVERSIONS, SUM(CLICKS) AS CLICKS
+    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_CAMPAIGN_PERFORMANCE
+    WHERE DATE_DAY BETWEEN '2024-12-01' AND '2024-12-31'
+"""
+
+
+def warehouse_results():
+    return REGISTRY.get_sample_value("warehouse_query_results_total", {"source": "warehouse"}) or 0.0
+
+
+def test_rows_keep_only_the_requested_measures(warehouse, watermarks):
+    rows = campaign_performance_monthly.rows(DATE_FROM, DATE_TO, measures=("CONVERSIONS",))
+
+    assert [row["MONTH"] for row in rows] == ["Dec 2024"]
+    assert set(rows[0]) == {"MONTH", "CONVERSIONS"}
+
+
+def test_unknown_measure_is_rejected():
+    with pytest.raises(ValueError, match="ROAS"):
+        campaign_performance_monthly.rows(measures=("SPEND", "ROAS"))
+
+
+def test_totals_roll_up_the_grouped_rows(warehouse, watermarks):
+    totals = campaign_performance_monthly.totals(DATE_FROM, DATE_TO)
+    expected = execute_query(DECEMBER_TOTALS, use_cache=False)[0]
+
+    assert set(totals) == set(campaign_performance_monthly.measure_names)
+    for name in ("SPEND", "CONVERSIONS", "CLICKS"):
+        assert totals[name] == pytest.approx(float(expected[name]))
+
+
+def test_every_window_builds_the_same_query():
+    first = campaign_performance_monthly.build_query(DATE_FROM, DATE_TO)
+    second = campaign_performance_monthly.build_query(date(2024, 12, 1), date(2024, 12, 31))
+
+    assert first == second
+
+
+def test_repositories_share_one_warehouse_scan(warehouse, watermarks, query_cache):
+    before = warehouse_results()
+
+    RevenueVsSpendRepository.get_revenue_vs_spend(DATE_FROM, DATE_TO)
+    ConversionsTrendRepository.get_conversions_trend(DATE_FROM, DATE_TO)
+    MonthlySpendTrendRepository.get_monthly_spend_trend(DATE_FROM, DATE_TO)
+    CorePerformanceOverviewRepository.get_overview(DATE_FROM, DATE_TO)
+
+    assert warehouse_results() == before + 1
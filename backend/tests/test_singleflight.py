@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+CALLERS = 8
+
+
+def _wait_for_followers(single_flight: SingleFlight, followers: int) -> None:
+    deadline = time.monotonic() + 5
+    while single_flight.stats().coalesced < followers:
+        assert time.monotonic() < deadline, "callers did not coalesce"
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_execution():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def load():
+        executions.append(threading.get_ident())
+        release.wait(5)
+        return ["row"]
+
+    with ThreadPoolExecutor(CALLERS) as pool:
+        futures = [pool.submit(single_flight.do, "query", load) for _ in range(CALLERS)]
+        _wait_for_followers(single_flight, CALLERS - 1)
+        release.set()
+        results = [future.result(5) for future in futures]
+
+    assert len(executions) == 1
+    assert all(result is results[0] for result in results)
+    stats = single_flight.stats()
+    assert (stats.executions, stats.coalesced, stats.in_flight) == (1, CALLERS - 1, 0)
+
+
+def test_followers_receive_the_leaders_error():
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def load():
+        release.wait(5)
+        raise RuntimeError("warehouse unavailable")
+
+    with ThreadPoolExecutor(CALLERS) as pool:
+        futures = [pool.submit(single_flight.do, "query", load) for _ in range(CALLERS)]
+        _wait_for_followers(single_flight, CALLERS - 1)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="warehouse unavailable"):
+                future.result(5)
+
+    assert single_flight.stats().in_flight == 0
+
+
+def test_calls_after_completion_execute_again():
+    single_flight = SingleFlight()
+    calls = []
+
+    for _ in range(3):
+        single_flight.do("query", lambda: calls.append(1))
+
+    assert len(calls) == 3
+    assert single_flight.stats().coalesced == 0
@@ -0,0 +1,39 @@
+import pytest
+
+from app.core.sketches import HLL_ERROR_PCT, hll_estimate_sql
+
+BASE_URL = "/api/v1/thoughtlets/revenue-lifetime-value"
+WINDOW = {"date_from": "2024-11-20", "date_to": "2024-12-10"}
+
+
+def counts(body, items, label):
+    return {item[label]: item["customer_count"] for item in body[items]}
+
+
+def test_estimate_merges_the_sketches_before_counting():
+    assert hll_estimate_sql("ACTIVE_PEOPLE_SKETCH") == "HLL_ESTIMATE(HLL_COMBINE(ACTIVE_PEOPLE_SKETCH))"
+
+
+@pytest.mark.parametrize("path, items, label", [
+    ("churn-distribution", "distribution", "risk_level"),
+    ("customer-segments", "segments", "segment_name"),
+])
+def test_approximate_counts_are_within_the_error_bound(client, warehouse, watermarks, path, items, label):
+    exact = client.get(f"{BASE_URL}/{path}", params=WINDOW).json()
+    approx = client.get(f"{BASE_URL}/{path}", params={**WINDOW, "approx": "true"}).json()
+
+    assert (exact["approximate"], exact["error_bound_pct"]) == (False, None)
+    assert (approx["approximate"], approx["error_bound_pct"]) == (True, HLL_ERROR_PCT)
+    exact_counts, approx_counts = counts(exact, items, label), counts(approx, items, label)
+    assert approx_counts.keys() == exact_counts.keys()
+    for segment, count in exact_counts.items():
+        # Several standard errors, so the check holds for real sketches too
+        assert approx_counts[segment] == pytest.approx(count, rel=5 * HLL_ERROR_PCT / 100, abs=2)
+
+
+def test_counts_without_a_range_stay_exact(client, warehouse, watermarks):
+    exact = client.get(f"{BASE_URL}/churn-distribution").json()
+    approx = client.get(f"{BASE_URL}/churn-distribution", params={"approx": "true"}).json()
+
+    assert approx == exact
+    assert approx["approximate"] is False
@@ -0,0 +1,91 @@
+import json
+
+from pydantic import BaseModel
+
+from app.core.columnar import iter_column_batches
+from app.core.config import settings
+from app.core.database import execute_query, get_pool_stats, stream_query
+from app.core.streaming import ndjson_lines
+
+KEYWORD_DAYS = """
+    SELECT KEYWORD_ID, DATE_DAY, CLICKS
+    FROM CLIENT_RARE_SEEDS_DB.PUBLIC_ANALYTICS.FCT_KEYWORD_PERFORMANCE
+    ORDER BY KEYWORD_ID, DATE_DAY
+"""
+
+STREAM_URL = "/api/v1/marketing-platforms/google-ads/keyword-performance"
+
+
+class RowCursor:
+    """Cursor without Arrow support, as some connectors are."""
+
+    description = [("ID",), ("NAME",)]
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def test_batches_fall_back_to_fetchmany():
+    cursor = RowCursor((i, f"row-{i}") for i in range(7))
+
+    batches = list(iter_column_batches(cursor, batch_size=3))
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [value for batch in batches for value in batch.ints("ID")] == list(range(7))
+
+
+def test_stream_yields_the_whole_result(warehouse, watermarks):
+    rows = execute_query(KEYWORD_DAYS, use_cache=False)
+
+    streamed = [row for batch in stream_query(KEYWORD_DAYS) for row in batch.to_rows()]
+
+    assert len(streamed) == len(rows) > 0
+    assert streamed == rows
+
+
+def test_abandoned_stream_returns_its_connection(warehouse, watermarks):
+    stream = stream_query(KEYWORD_DAYS)
+    next(stream)
+    assert get_pool_stats().in_use == 1
+
+    stream.close()
+
+    assert get_pool_stats().in_use == 0
+
+
+def test_ndjson_has_one_line_per_item_and_skips_empty_batches():
+    batches = [[Item(id=1, name="a"), Item(id=2, name="b")], [], [Item(id=3, name="c")]]
+
+    chunks = list(ndjson_lines(batches))
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [item.model_dump() for batch in batches for item in batch]
+
+
+def test_streamed_endpoint_matches_the_list_endpoint(client, warehouse, watermarks, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+    params = {"date_from": "2024-12-01", "date_to": "2024-12-31"}
+
+    listed = client.get(STREAM_URL, params=params).json()["items"]
+    response = client.get(f"{STREAM_URL}/stream", params=params)
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+    key = lambda item: (item["keyword"], item["match"])
+    assert sorted(streamed, key=key) == sorted(listed, key=key)
+
+
+def test_stream_rejects_an_inverted_range_before_streaming(client):
+    response = client.get(f"{STREAM_URL}/stream", params={"date_from": "2024-12-31", "date_to": "2024-12-01"})
+
+    assert response.status_code == 400
@@ -0,0 +1,63 @@
+from app.core.config import settings
+from app.core.instrumentation import QueryRecord
+from app.core.timing import RequestTiming
+
+KEYWORDS_URL = "/api/v1/marketing-platforms/google-ads/keyword-performance"
+
+
+def server_timing(response):
+    """Parse a Server-Timing header into {name: {"dur": ..., "desc": ...}}."""
+    entries = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, *params = entry.split(";")
+        entries[name] = dict(param.split("=", 1) for param in params)
+    return entries
+
+
+def test_overlapping_queries_count_once_towards_db():
+    timing = RequestTiming()
+    timing.intervals = [(0.0, 2.0), (1.0, 3.0), (5.0, 6.0)]
+
+    assert timing.db == 4.0
+
+
+def test_header_lists_each_query():
+    timing = RequestTiming(started=0.0)
+    timing.add_query(QueryRecord("Repo.get_a", connect=0.001, execute=0.01, fetch=0.002))
+
+    header = timing.header(now=0.5)
+
+    assert header.startswith('db;dur=')
+    assert 'desc="1 queries"' in header
+    assert "total;dur=500.0" in header
+    assert header.endswith('q1;dur=13.0;desc="Repo.get_a"')
+
+
+def test_endpoint_response_has_a_phase_breakdown(client, warehouse, watermarks, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_CACHE_ENABLED", False)
+
+    response = client.get(KEYWORDS_URL, params={"date_from": "2024-12-01", "date_to": "2024-12-31"})
+
+    entries = server_timing(response)
+    assert {"validate", "db", "mapping", "serialize", "total", "q1"} <= entries.keys()
+    assert entries["db"]["desc"] == '"1 queries"'
+    assert entries["q1"]["desc"] == '"KeywordPerformanceRepository.get_keyword_performance"'
+    assert float(entries["total"]["dur"]) >= float(entries["db"]["dur"])
+
+
+def test_cached_response_reports_no_queries(client, warehouse, watermarks, query_cache):
+    params = {"date_from": "2024-12-01", "date_to": "2024-12-31"}
+    client.get(KEYWORDS_URL, params=params)
+
+    entries = server_timing(client.get(KEYWORDS_URL, params=params))
+
+    assert entries["db"]["desc"] == '"0 queries"'
+    assert "q1" not in entries
+
+
+def test_header_is_omitted_when_disabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_TIMING_ENABLED", False)
+
+    response = client.get("/health")
+
+    assert "server-timing" not in response.headers
@@ -0,0 +1,51 @@
+{{
+    config(
+        materialized='table',
+        tags=['aggregates', 'cohorts']
+    )
+}}
+
+/*
+    Cohort Retention Matrix
+    Grain: Cohort month × Months since first order
+    Source: agg_customer_month_activity
+
+    One cell per cohort and month offset, with the number of the cohort's
+    customers who ordered in that month. Rebuilt in full from the
+    person-month table on every run: a backfilled earlier order moves its
+    person to an earlier cohort, which also changes the old cohort, and the
+    input is already aggregated, so a full rebuild is cheap.
+*/
+
+with
+cells as (
+    select
+        a.cohort_month,
+        a.months_since,
+        count(*) as active_customers,
+        sum(a.orders) as orders,
+        sum(a.revenue) as revenue,
+        max(a.last_synced) as last_synced
+    from {{ ref('agg_customer_month_activity') }} a
+    group by a.cohort_month, a.months_since
+),
+
+sized as (
+    select
+        *,
+        max(case when months_since = 0 then active_customers end)
+            over (partition by cohort_month) as cohort_size
+    from cells
+)
+
+select
+    {{ dbt_utils.generate_surrogate_key(['cohort_month', 'months_since']) }} as cohort_retention_sk,
+    cohort_month,
+    months_since,
+    cohort_size,
+    active_customers,
+    round(active_customers * 100.0 / nullif(cohort_size, 0), 2) as retention_rate,
+    orders,
+    revenue,
+    last_synced
+from sized
@@ -0,0 +1,62 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='person_id',
+        cluster_by=['cohort_month'],
+        tags=['aggregates', 'cohorts']
+    )
+}}
+
+/*
+    Customer Monthly Activity
+    Grain: Person × Activity month (months with at least one order)
+    Source: fct_order_details
+
+    cohort_month is the month of the person's first order. Incremental runs
+    rebuild every row of the people with orders synced since the last run,
+    so a backfilled earlier order moves its person to the right cohort.
+*/
+
+with
+{% if is_incremental() %}
+changed_people as (
+    select distinct person_id
+    from {{ ref('fct_order_details') }}
+    where last_synced > (select max(last_synced) from {{ this }})
+),
+{% endif %}
+
+orders as (
+    select
+        o.person_id,
+        o.order_month,
+        o.order_value,
+        o.last_synced
+    from {{ ref('fct_order_details') }} o
+    {% if is_incremental() %}
+    inner join changed_people p on o.person_id = p.person_id
+    {% endif %}
+    where o.person_id is not null
+),
+
+cohorts as (
+    select
+        person_id,
+        min(order_month) as cohort_month
+    from orders
+    group by person_id
+)
+
+select
+    {{ dbt_utils.generate_surrogate_key(['o.person_id', 'o.order_month']) }} as customer_month_activity_sk,
+    o.person_id,
+    c.cohort_month,
+    o.order_month as activity_month,
+    datediff(month, c.cohort_month, o.order_month) as months_since,
+    count(*) as orders,
+    sum(o.order_value) as revenue,
+    max(o.last_synced) as last_synced
+from orders o
+inner join cohorts c on o.person_id = c.person_id
+group by o.person_id, c.cohort_month, o.order_month
@@ -0,0 +1,44 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='date_day',
+        cluster_by=['platform', 'date_day'],
+        tags=['aggregates', 'daily']
+    )
+}}
+
+/*
+    Daily Campaign Performance Rollup
+    Grain: Date × Platform × Campaign (device and ad network type summed out)
+    Source: fct_campaign_performance
+
+    Incremental runs rebuild every day from rollup_lookback_days before the
+    latest loaded day, so late conversion restatements are picked up.
+*/
+
+select
+    {{ dbt_utils.generate_surrogate_key(['date_day', 'platform', 'campaign_id']) }} as daily_campaign_performance_sk,
+    date_day,
+    platform,
+    account_id,
+    campaign_id,
+    campaign_name,
+    status,
+    campaign_type,
+
+    -- Additive metrics (ratios are derived at query time)
+    sum(impressions) as impressions,
+    sum(clicks) as clicks,
+    sum(spend) as spend,
+    sum(conversions) as conversions,
+    sum(conversion_value) as conversion_value,
+    sum(view_through_conversions) as view_through_conversions,
+
+    count(*) as source_rows,
+    max(last_synced) as last_synced
+from {{ ref('fct_campaign_performance') }}
+{% if is_incremental() %}
+where date_day >= (select dateadd(day, -{{ var('rollup_lookback_days') }}, max(date_day)) from {{ this }})
+{% endif %}
+group by date_day, platform, account_id, campaign_id, campaign_name, status, campaign_type
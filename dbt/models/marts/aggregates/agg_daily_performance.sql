@@ -0,0 +1,39 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='date_day',
+        tags=['aggregates', 'daily']
+    )
+}}
+
+/*
+    Daily Platform Performance Rollup
+    Grain: Date × Platform
+    Source: agg_daily_campaign_performance
+
+    Incremental runs rebuild every day from rollup_lookback_days before the
+    latest loaded day.
+*/
+
+select
+    {{ dbt_utils.generate_surrogate_key(['date_day', 'platform']) }} as daily_performance_sk,
+    date_day,
+    platform,
+
+    -- Additive metrics (ratios are derived at query time)
+    sum(impressions) as impressions,
+    sum(clicks) as clicks,
+    sum(spend) as spend,
+    sum(conversions) as conversions,
+    sum(conversion_value) as conversion_value,
+    sum(view_through_conversions) as view_through_conversions,
+
+    count(distinct campaign_id) as active_campaigns,
+    sum(source_rows) as source_rows,
+    max(last_synced) as last_synced
+from {{ ref('agg_daily_campaign_performance') }}
+{% if is_incremental() %}
+where date_day >= (select dateadd(day, -{{ var('rollup_lookback_days') }}, max(date_day)) from {{ this }})
+{% endif %}
+group by date_day, platform
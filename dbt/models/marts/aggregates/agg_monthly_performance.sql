@@ -0,0 +1,66 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='date_month',
+        on_schema_change='append_new_columns',
+        tags=['aggregates', 'monthly']
+    )
+}}
+
+/*
+    Monthly Platform Performance Rollup
+    Grain: Month × Platform
+    Source: agg_daily_performance
+
+    date_day repeats date_month (the first day of the month), so queries
+    written against the daily grain - DATE_TRUNC('MONTH', date_day), or
+    date_day filters on month-aligned ranges - run unchanged.
+    active_days counts the platform's days; month_active_days counts days
+    with activity on any platform, repeated on every platform row of the
+    month, for queries that group by month across platforms.
+    Incremental runs rebuild every month touched by the lookback window.
+*/
+
+with daily as (
+    select *
+    from {{ ref('agg_daily_performance') }}
+    {% if is_incremental() %}
+    where date_day >= date_trunc(
+        month,
+        (select dateadd(day, -{{ var('rollup_lookback_days') }}, max(last_date_day)) from {{ this }})
+    )
+    {% endif %}
+),
+
+-- Days with activity on any platform; not the sum of the per-platform counts
+month_days as (
+    select
+        date_trunc(month, date_day)::date as date_month,
+        count(distinct date_day) as month_active_days
+    from daily
+    group by date_trunc(month, date_day)
+)
+
+select
+    {{ dbt_utils.generate_surrogate_key(['date_trunc(month, daily.date_day)', 'daily.platform']) }} as monthly_performance_sk,
+    date_trunc(month, daily.date_day)::date as date_month,
+    date_trunc(month, daily.date_day)::date as date_day,
+    daily.platform,
+
+    -- Additive metrics (ratios are derived at query time)
+    sum(daily.impressions) as impressions,
+    sum(daily.clicks) as clicks,
+    sum(daily.spend) as spend,
+    sum(daily.conversions) as conversions,
+    sum(daily.conversion_value) as conversion_value,
+    sum(daily.view_through_conversions) as view_through_conversions,
+
+    count(distinct daily.date_day) as active_days,
+    max(month_days.month_active_days) as month_active_days,
+    max(daily.date_day) as last_date_day,
+    max(daily.last_synced) as last_synced
+from daily
+inner join month_days
+    on month_days.date_month = date_trunc(month, daily.date_day)::date
+group by date_trunc(month, daily.date_day), daily.platform
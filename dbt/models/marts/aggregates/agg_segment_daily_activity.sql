@@ -0,0 +1,60 @@
+{{
+    config(
+        materialized='table',
+        cluster_by=['date_day'],
+        tags=['aggregates', 'customer']
+    )
+}}
+
+/*
+    Daily Active Customers by Segment (bitmap index)
+    Grain: Date × Churn risk segment × CLV segment × Bitmap bucket
+    Source: fct_order_details, dim_person
+
+    Each row holds a Snowflake BITMAP of the customers in the segment who
+    ordered that day. Customers are numbered densely for the build
+    (person_number), split into 32,768-bit buckets. Distinct customers
+    active over any date range are counted exactly by OR-ing the daily
+    bitmaps of each bucket and summing BITMAP_COUNT, without touching the
+    order history:
+
+        select churn_risk_segment, sum(bitmap_count(active_people))
+        from (
+            select churn_risk_segment, bitmap_bucket, bitmap_or_agg(active_people) as active_people
+            from agg_segment_daily_activity
+            where date_day between ... and ...
+            group by churn_risk_segment, bitmap_bucket
+        )
+        group by churn_risk_segment
+
+    Rebuilt in full with dim_person, so every day reflects the customers'
+    current segments (as the segment endpoints report them).
+*/
+
+with people as (
+    select
+        person_id,
+        churn_risk_segment,
+        clv_segment,
+        row_number() over (order by person_id) as person_number
+    from {{ ref('dim_person') }}
+),
+
+daily_activity as (
+    select distinct
+        o.order_date as date_day,
+        o.person_id
+    from {{ ref('fct_order_details') }} o
+    where o.person_id is not null
+)
+
+select
+    a.date_day,
+    p.churn_risk_segment,
+    p.clv_segment,
+    bitmap_bucket_number(p.person_number) as bitmap_bucket,
+    bitmap_construct_agg(bitmap_bit_position(p.person_number)) as active_people,
+    count(*) as active_customers
+from daily_activity a
+inner join people p on a.person_id = p.person_id
+group by a.date_day, p.churn_risk_segment, p.clv_segment, bitmap_bucket_number(p.person_number)
@@ -1,6 +1,9 @@
 {{
     config(
-        materialized='table',
+        materialized='incremental',
+        incremental_strategy='merge',
+        unique_key='ad_performance_sk',
+        cluster_by=['platform', 'date_day'],
         tags=['facts', 'core']
     )
 }}
@@ -9,8 +12,18 @@
     Unified ad performance fact table
     Combines Google Ads and Facebook Ads ad-level data
     Source: GOOGLE_ADS.AD_STATS, FACEBOOK_ADS.BASIC_AD
+
+    Incremental runs re-merge every day from fact_lookback_days before each
+    platform's latest loaded day, so late-arriving stats are picked up.
 */
 
+{% set google_ads_since %}
+    (select dateadd(day, -{{ var('fact_lookback_days') }}, max(date_day)) from {{ this }} where platform = 'google_ads')
+{% endset %}
+{% set meta_since %}
+    (select dateadd(day, -{{ var('fact_lookback_days') }}, max(date_day)) from {{ this }} where platform = 'meta')
+{% endset %}
+
 with google_ads_stats as (
     select
         date as date_day,
@@ -28,6 +41,9 @@ with google_ads_stats as (
         sum(view_through_conversions) as view_through_conversions,
         max(_fivetran_synced) as last_synced
     from {{ source('google_ads', 'ad_stats') }}
+    {% if is_incremental() %}
+    where date >= {{ google_ads_since }}
+    {% endif %}
     group by date, customer_id, campaign_id, ad_group_id, ad_id, device, ad_network_type
 ),
 
@@ -92,6 +108,9 @@ facebook_ads as (
         null as view_through_conversions,
         _fivetran_synced as last_synced
     from {{ source('meta_ads', 'basic_ad') }}
+    {% if is_incremental() %}
+    where date >= {{ meta_since }}
+    {% endif %}
 ),
 
 combined as (
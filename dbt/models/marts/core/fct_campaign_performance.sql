@@ -1,6 +1,9 @@
 {{
     config(
-        materialized='table',
+        materialized='incremental',
+        incremental_strategy='merge',
+        unique_key='performance_sk',
+        cluster_by=['platform', 'date_day'],
         tags=['facts', 'core']
     )
 }}
@@ -9,8 +12,20 @@
     Unified campaign performance fact table
     Combines Google Ads and Facebook Ads campaign data
     Source: GOOGLE_ADS.CAMPAIGN_STATS, FACEBOOK_ADS.BASIC_AD
+
+    Incremental runs re-merge every day from fact_lookback_days before each
+    platform's latest loaded day, so late-arriving stats and conversion
+    restatements are picked up. Campaign renames outside that window need
+    a --full-refresh.
 */
 
+{% set google_ads_since %}
+    (select dateadd(day, -{{ var('fact_lookback_days') }}, max(date_day)) from {{ this }} where platform = 'google_ads')
+{% endset %}
+{% set meta_since %}
+    (select dateadd(day, -{{ var('fact_lookback_days') }}, max(date_day)) from {{ this }} where platform = 'meta')
+{% endset %}
+
 with google_ads_stats as (
     select
         date as date_day,
@@ -26,6 +41,9 @@ with google_ads_stats as (
         sum(view_through_conversions) as view_through_conversions,
         max(_fivetran_synced) as last_synced
     from {{ source('google_ads', 'campaign_stats') }}
+    {% if is_incremental() %}
+    where date >= {{ google_ads_since }}
+    {% endif %}
     group by date, customer_id, id, device, ad_network_type
 ),
 
@@ -79,6 +97,9 @@ meta_campaign_conversions as (
         sum(case when action_type = 'purchase' then value else 0 end) as conversions
     from {{ source('meta_ads', 'basic_campaign_actions') }}
     where action_type = 'purchase'
+    {% if is_incremental() %}
+    and date >= {{ meta_since }}
+    {% endif %}
     group by campaign_id, date
 ),
 
@@ -91,6 +112,9 @@ meta_ad_conversion_values as (
     from {{ source('meta_ads', 'basic_ad_action_values') }} v
     left join {{ source('meta_ads', 'ad_history') }} a on v.ad_id = a.id
     where v.action_type = 'purchase'
+    {% if is_incremental() %}
+    and v.date >= {{ meta_since }}
+    {% endif %}
     group by a.campaign_id, v.date
 ),
 
@@ -105,6 +129,9 @@ facebook_ads_stats as (
         max(b._fivetran_synced) as last_synced
     from {{ source('meta_ads', 'basic_ad') }} b
     left join {{ source('meta_ads', 'ad_history') }} a on b.ad_id = a.id
+    {% if is_incremental() %}
+    where b.date >= {{ meta_since }}
+    {% endif %}
     group by b.date, a.campaign_id, b.account_id
 ),
 
@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='ad_group_performance_sk',
+        cluster_by=['date_day'],
         tags=['facts', 'daily']
     )
 }}
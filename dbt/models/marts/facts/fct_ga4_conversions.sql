@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='ga4_conversion_sk',
+        cluster_by=['date_day'],
         tags=['facts', 'daily', 'ga4']
     )
 }}
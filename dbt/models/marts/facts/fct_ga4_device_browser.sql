@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='device_browser_sk',
+        cluster_by=['date_day'],
         tags=['facts', 'ga4', 'device', 'browser', 'tech']
     )
 }}
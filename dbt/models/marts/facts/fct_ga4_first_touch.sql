@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='first_touch_sk',
+        cluster_by=['date_day'],
         tags=['facts', 'ga4', 'attribution']
     )
 }}
@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='ga4_geo_sk',
+        cluster_by=['geo_level', 'date_day'],
         tags=['facts', 'ga4', 'geography', 'traffic']
     )
 }}
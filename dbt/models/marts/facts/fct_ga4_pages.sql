@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='ga4_page_sk',
+        cluster_by=['date_day'],
         tags=['facts', 'ga4', 'pages']
     )
 }}
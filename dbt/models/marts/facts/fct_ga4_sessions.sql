@@ -1,6 +1,7 @@
 {{
     config(
         materialized='table',
+        cluster_by=['date_day'],
         tags=['facts', 'ga4', 'sessions', 'traffic']
     )
 }}
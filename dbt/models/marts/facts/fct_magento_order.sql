@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='order_id',
+        cluster_by=['order_date_day'],
         tags=['facts', 'magento']
     )
 }}
@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='meta_conversion_sk',
+        cluster_by=['date_day'],
         tags=['facts', 'meta', 'conversions']
     )
 }}
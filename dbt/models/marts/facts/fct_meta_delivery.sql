@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='delivery_sk',
+        cluster_by=['dimension_type', 'date_day'],
         tags=['facts', 'meta', 'delivery']
     )
 }}
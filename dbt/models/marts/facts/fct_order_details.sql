@@ -2,6 +2,7 @@
     config(
         materialized='incremental',
         unique_key='order_sk',
+        cluster_by=['order_date'],
         tags=['facts', 'klaviyo', 'orders', 'revenue']
     )
 }}
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+"""
+Compare dbt clustering keys with the columns the backend filters on.
+
+Reads the clustering configuration of every mart model from the dbt manifest
+(``dbt/target/manifest.json``, written by ``dbt parse``), or from the
+models' ``config()`` blocks when no manifest has been built. It then scans
+the backend's SQL for predicates such as ``f.DATE_DAY >= %(date_from)s`` or
+``PLATFORM = 'google_ads'`` and attributes each one to the table it filters:
+through its alias when qualified, otherwise to every table of the module
+whose model defines the column (date filters are often shared by several
+CTEs of one query). Only facts and rollups are reported; dimensions are too
+small for clustering to matter.
+
+A fact is flagged when:
+- it is queried with filters but has no ``cluster_by``
+- its most frequently filtered column is not among its clustering keys
+- a clustering key is never filtered on by the backend
+
+Columns a model sets to a single literal (``'ga4' as platform``) are shown
+but ignored: filtering on them never prunes anything.
+
+Usage:
+    python scripts/clustering_report.py
+    python scripts/clustering_report.py --manifest dbt/target/manifest.json --json
+    python scripts/clustering_report.py --strict   # exit 1 if anything is flagged
+"""
+import argparse
+import ast
+import json
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+BACKEND = ROOT / "backend" / "app"
+MODELS = ROOT / "dbt" / "models" / "marts"
+DEFAULT_MANIFEST = ROOT / "dbt" / "target" / "manifest.json"
+
+TABLE_RE = re.compile(r"PUBLIC_ANALYTICS\.([A-Z][A-Z0-9_]*)(?:\s+(?:AS\s+)?([a-z]\w*))?")
+# column <op> bind parameter, literal, number or IN-list; column-to-column
+# (join) conditions are deliberately not matched.
+PREDICATE_RE = re.compile(
+    r"(?<!WHEN )(?<![\w.])(?:([a-z]\w*)\.)?([A-Z][A-Z0-9_]*)\s*"
+    r"(?:=|>=|<=|<>|!=|<|>|\bIN\b|\bBETWEEN\b|\bI?LIKE\b)\s*(?=%\(|'|\d|\()"
+)
+CLUSTER_BY_RE = re.compile(r"cluster_by\s*=\s*(\[[^\]]*\]|'[^']*')")
+IDENTIFIER_RE = re.compile(r"[a-z_][a-z0-9_]*")
+LITERAL_COLUMN_RE = re.compile(r"'([^']*)'(?:::\w+)?\s+as\s+([a-z_][a-z0-9_]*)")
+SQL_KEYWORDS = frozenset({"AND", "OR", "NOT", "IS", "WHERE", "ON", "WHEN", "THEN", "ELSE", "CASE"})
+REPORTED_PREFIXES = ("FCT_", "AGG_")
+
+# Modules that read a table through a constant or router instead of its name.
+INDIRECT_TABLES = {
+    "campaign_performance_source": "FCT_CAMPAIGN_PERFORMANCE",
+    "CAMPAIGN_PERFORMANCE_FACT": "FCT_CAMPAIGN_PERFORMANCE",
+}
+
+
+def load_models(manifest: Path) -> dict[str, dict]:
+    """
+    Map upper-cased table name -> {"cluster_by", "identifiers", "constants"}.
+
+    Identifiers are every lower-case word of the model's SQL (a superset of
+    its columns, used to attribute unqualified filters); constants are the
+    upper-cased columns the model only ever sets to one literal.
+    """
+    models = {}
+    if manifest.exists():
+        for node in json.loads(manifest.read_text())["nodes"].values():
+            if node["resource_type"] != "model" or "marts" not in node["fqn"]:
+                continue
+            name = (node.get("alias") or node["name"]).upper()
+            models[name] = _model_info(node["config"].get("cluster_by") or [], node.get("raw_code", ""))
+        return models
+
+    for path in sorted(MODELS.rglob("*.sql")):
+        code = path.read_text()
+        match = CLUSTER_BY_RE.search(code)
+        models[path.stem.upper()] = _model_info(ast.literal_eval(match.group(1)) if match else [], code)
+    return models
+
+
+def _model_info(cluster_by, code: str) -> dict:
+    code = code.lower()
+    literals: dict[str, set[str]] = defaultdict(set)
+    for value, column in LITERAL_COLUMN_RE.findall(code):
+        literals[column].add(value)
+    return {
+        "cluster_by": _upper_keys(cluster_by),
+        "identifiers": set(IDENTIFIER_RE.findall(code)),
+        "constants": {column.upper() for column, values in literals.items() if len(values) == 1},
+    }
+
+
+def _upper_keys(keys) -> list[str]:
+    if isinstance(keys, str):
+        keys = [keys]
+    return [key.upper() for key in keys]
+
+
+def _string_literals(source: str) -> list[str]:
+    """Every string constant in a module, with f-strings flattened."""
+    literals = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            literals.append(node.value)
+    return literals
+
+
+def scan_backend(root: Path, models: dict[str, dict]) -> dict[str, Counter]:
+    """Map upper-cased table name -> Counter of filtered columns."""
+    filters: dict[str, Counter] = defaultdict(Counter)
+    for path in sorted(root.rglob("*.py")):
+        source = path.read_text()
+        sql = "\n".join(_string_literals(source))
+
+        aliases: dict[str, str] = {}
+        tables: list[str] = []
+        for table, alias in TABLE_RE.findall(sql):
+            tables.append(table)
+            if alias:
+                aliases[alias] = table
+        for name, table in INDIRECT_TABLES.items():
+            if re.search(rf"\b{name}\b", source):
+                tables.append(table)
+                aliases.setdefault("f", table)
+        if not tables:
+            continue
+
+        for alias, column in PREDICATE_RE.findall(sql):
+            if column in SQL_KEYWORDS:
+                continue
+            if alias and alias in aliases:
+                filters[aliases[alias]][column] += 1
+                continue
+            owners = [
+                table for table in dict.fromkeys(tables)
+                if column.lower() in models.get(table, {}).get("identifiers", ())
+            ]
+            for table in owners or tables[:1]:
+                filters[table][column] += 1
+    return filters
+
+
+def build_report(models: dict[str, dict], filters: dict[str, Counter]) -> list[dict]:
+    report = []
+    for table in sorted(filters):
+        if not table.startswith(REPORTED_PREFIXES):
+            continue
+        counts = filters[table]
+        model = models.get(table)
+        keys = model["cluster_by"] if model else None
+        constants = model["constants"] if model else set()
+        selective = [column for column, _ in counts.most_common() if column not in constants]
+        issues = []
+        if keys is None:
+            issues.append("no dbt model found")
+        elif not keys:
+            issues.append("not clustered")
+        else:
+            if selective and not any(_key_uses(key, selective[0]) for key in keys):
+                issues.append(f"most filtered column {selective[0]} is not a clustering key")
+            unused = [key for key in keys if not any(_key_uses(key, column) for column in counts)]
+            if unused:
+                issues.append(f"clustering keys never filtered on: {', '.join(unused)}")
+        report.append({
+            "table": table,
+            "cluster_by": keys or [],
+            "filters": dict(counts.most_common()),
+            "constant_filters": sorted(set(counts) & constants),
+            "issues": issues,
+        })
+    return report
+
+
+def _key_uses(key: str, column: str) -> bool:
+    """True if a clustering key (a column or expression) is on ``column``."""
+    return column.lower() in IDENTIFIER_RE.findall(key.lower())
+
+
+def print_report(report: list[dict]) -> None:
+    for entry in report:
+        status = "FLAG" if entry["issues"] else "ok"
+        print(f"[{status:>4}] {entry['table']}")
+        print(f"       cluster_by: {', '.join(entry['cluster_by']) or '-'}")
+        print("       filters:    " + ", ".join(f"{column} x{count}" for column, count in entry["filters"].items()))
+        if entry["constant_filters"]:
+            print(f"       constant:   {', '.join(entry['constant_filters'])}")
+        for issue in entry["issues"]:
+            print(f"       ! {issue}")
+    flagged = sum(1 for entry in report if entry["issues"])
+    print(f"\n{len(report)} tables queried with filters, {flagged} flagged")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST, help="dbt manifest.json")
+    parser.add_argument("--backend", type=Path, default=BACKEND, help="Backend source root to scan")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 if any table is flagged")
+    args = parser.parse_args()
+
+    models = load_models(args.manifest)
+    report = build_report(models, scan_backend(args.backend, models))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 1 if args.strict and any(entry["issues"] for entry in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
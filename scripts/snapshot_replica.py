@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Snapshot the API-facing marts to Parquet for the local analytics replica.
+
+Run after every dbt run (e.g. ``dbt run && python scripts/snapshot_replica.py``).
+Copies each PUBLIC_ANALYTICS table matching REPLICA_TABLES from Snowflake into
+a new directory under REPLICA_PATH and publishes it; API workers with
+REPLICA_ENABLED pick it up within REPLICA_REFRESH_SECONDS. See
+``backend/app/core/replica.py``.
+
+Usage:
+    python scripts/snapshot_replica.py
+    python scripts/snapshot_replica.py --path /data/replica --table 'FCT_GA4_*' --table 'DIM_*'
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.core.replica import snapshot_marts  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--path", type=Path, help="Snapshot directory (default: REPLICA_PATH)")
+    parser.add_argument("--table", action="append", help="Table glob to copy (default: REPLICA_TABLES); repeatable")
+    parser.add_argument("--keep", type=int, help="Snapshots to retain (default: REPLICA_KEEP_SNAPSHOTS)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    directory = snapshot_marts(args.path, args.table, args.keep)
+    print(f"Published replica snapshot {directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())